@@ -1,6 +1,15 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
 
 
 class AccountsConfig(AppConfig):
     name = "account"
     verbose_name = "Account"
+
+    def ready(self) -> None:
+        # Keep the shared principal cache in step with User writes.
+        from account.models import User  # noqa: WPS433
+        from account.services.principal_cache import evict_principal  # noqa: WPS433
+
+        post_save.connect(evict_principal, sender=User, dispatch_uid="account.evict_principal.save")
+        post_delete.connect(evict_principal, sender=User, dispatch_uid="account.evict_principal.delete")
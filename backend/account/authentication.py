@@ -13,7 +13,9 @@ from django.contrib.auth import get_user_model
 from rest_framework.authentication import BaseAuthentication
 from rest_framework.exceptions import AuthenticationFailed
 
+from account.services.principal_cache import load_principal
 from account.services.token_provider import TokenProvider
+from account.services.token_revocation import revocation_store
 from config import jwt_config
 
 logger = logging.getLogger(__name__)
@@ -70,17 +72,22 @@ class JWTCookieAuthentication(BaseAuthentication):  # noqa: WPS338
 
         Raises:
             jwt.InvalidTokenError: If token signature/format invalid.
-            ValueError: If token payload invalid or user inactive.
+            ValueError: If token payload invalid, token revoked or user inactive.
             User.DoesNotExist: If user not found.
         """
         payload = self.token_provider.decode_token(token)
 
+        jti = payload.get("jti")
+        if jti and revocation_store.is_revoked(jti):
+            msg = "Token has been revoked"
+            raise ValueError(msg)
+
         user_id = payload.get("user_id")
         if not user_id:
             msg = "Token payload missing user_id"
             raise ValueError(msg)
 
-        user = User.objects.get(id=user_id)
+        user = load_principal(user_id)
 
         if not user.is_active:
             msg = "User account is disabled"
@@ -35,3 +35,11 @@ class InvalidCredentialsError(Exception):
     def __init__(self, message: str = "Invalid username or password.") -> None:
         super().__init__(message)
         self.message = message
+
+
+class PasswordHashingBusyError(Exception):
+    """Raised when too many password hashes are already running or queued."""
+
+    def __init__(self, message: str = "Too many login attempts in progress. Retry shortly.") -> None:
+        super().__init__(message)
+        self.message = message
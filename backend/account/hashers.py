@@ -0,0 +1,46 @@
+"""Password hashers whose cost comes from settings.
+
+``manage.py calibrate_hasher`` measures the cost on the target host and
+prints the values to put in ``PASSWORD_PBKDF2_ITERATIONS`` and
+``PASSWORD_SCRYPT_WORK_FACTOR``. The algorithm names are unchanged, so
+existing hashes still verify; ``PasswordHashingPool.check_password``
+rehashes them on the next successful login once the cost differs.
+"""
+from __future__ import annotations
+
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher, ScryptPasswordHasher
+
+SCRYPT_BYTES_PER_BLOCK = 128
+
+
+class CalibratedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """PBKDF2-SHA256 with ``settings.PASSWORD_PBKDF2_ITERATIONS`` iterations."""
+
+    @property
+    def iterations(self) -> int:  # type: ignore[override]
+        """Configured iteration count, or Django's default."""
+        return settings.PASSWORD_PBKDF2_ITERATIONS or PBKDF2PasswordHasher.iterations
+
+
+class CalibratedScryptPasswordHasher(ScryptPasswordHasher):
+    """Scrypt with ``settings.PASSWORD_SCRYPT_WORK_FACTOR`` as ``N``.
+
+    Memory use per hash is ``128 * N * block_size`` bytes; ``maxmem`` is
+    raised to match, since OpenSSL otherwise caps scrypt at 32 MiB.
+    """
+
+    @property
+    def work_factor(self) -> int:  # type: ignore[override]
+        """Configured work factor, or Django's default."""
+        return settings.PASSWORD_SCRYPT_WORK_FACTOR or ScryptPasswordHasher.work_factor
+
+    @property
+    def maxmem(self) -> int:  # type: ignore[override]
+        """Memory limit passed to ``hashlib.scrypt`` for the configured cost."""
+        return scrypt_memory(self.work_factor, self.block_size) * 2
+
+
+def scrypt_memory(work_factor: int, block_size: int) -> int:
+    """Bytes of memory one scrypt hash needs."""
+    return SCRYPT_BYTES_PER_BLOCK * work_factor * block_size
@@ -0,0 +1,7 @@
+"""Cache invalidation handlers of the account app (see ``core.invalidation``)."""
+from __future__ import annotations
+
+from account.services.principal_cache import PRINCIPAL_NAMESPACE, drop_principals
+from core.invalidation import invalidation_handler
+
+invalidation_handler(PRINCIPAL_NAMESPACE)(drop_principals)
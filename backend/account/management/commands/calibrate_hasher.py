@@ -0,0 +1,115 @@
+"""Measure password hashing cost on this host and recommend settings.
+
+Run on the production hardware, then set the printed values in the
+environment:
+
+    python manage.py calibrate_hasher --target-ms 250
+
+PBKDF2 cost grows linearly with iterations, so one probe is extrapolated.
+Scrypt is probed at doubling work factors up to ``--max-memory-mb``, because
+its memory use, multiplied by ``PASSWORD_HASHING_WORKERS``, must fit the host.
+"""
+from __future__ import annotations
+
+import statistics
+import time
+from collections.abc import Callable
+from typing import Any
+
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher, ScryptPasswordHasher
+from django.core.management.base import BaseCommand, CommandParser
+
+from account.hashers import scrypt_memory
+
+_PROBE_PASSWORD = "calibrate-hasher-probe"  # noqa: S105
+_PROBE_SALT = "calibrationsalt"
+_PBKDF2_PROBE_ITERATIONS = 50_000
+_PBKDF2_ROUNDING = 10_000
+_SCRYPT_MIN_WORK_FACTOR = 4096
+_BYTES_PER_MB = 1024 * 1024
+_DEFAULT_TARGET_MS = 250
+_DEFAULT_MAX_MEMORY_MB = 64
+_MS_PER_SECOND = 1000
+
+
+class Command(BaseCommand):
+    """Benchmark PBKDF2 iterations and scrypt work factor against a time budget."""
+
+    help = "Recommend password hasher cost settings for a target hashing time."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command options."""
+        parser.add_argument(
+            "--target-ms",
+            type=float,
+            default=_DEFAULT_TARGET_MS,
+            help="Wall time one hash should take on this host.",
+        )
+        parser.add_argument(
+            "--samples",
+            type=int,
+            default=3,
+            help="Timed runs per probe; the median is used.",
+        )
+        parser.add_argument(
+            "--max-memory-mb",
+            type=int,
+            default=_DEFAULT_MAX_MEMORY_MB,
+            help="Upper bound for scrypt memory per hash.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Print the measurements and the recommended settings."""
+        self._samples = max(1, options["samples"])
+        target = options["target_ms"]
+        iterations = self._calibrate_pbkdf2(target)
+        work_factor = self._calibrate_scrypt(target, options["max_memory_mb"] * _BYTES_PER_MB)
+        self.stdout.write("Recommended settings:")
+        self.stdout.write(f"  PASSWORD_PBKDF2_ITERATIONS={iterations}")
+        self.stdout.write(f"  PASSWORD_SCRYPT_WORK_FACTOR={work_factor}")
+        self.stdout.write(
+            "Existing hashes are upgraded on each user's next login "
+            f"(hashing pool: {settings.PASSWORD_HASHING_WORKERS} workers).",
+        )
+
+    def _calibrate_pbkdf2(self, target_ms: float) -> int:
+        hasher = PBKDF2PasswordHasher()
+        elapsed = self._time_ms(
+            hasher.encode, _PROBE_PASSWORD, _PROBE_SALT, _PBKDF2_PROBE_ITERATIONS,
+        )
+        per_iteration = elapsed / _PBKDF2_PROBE_ITERATIONS
+        iterations = int(target_ms / per_iteration) // _PBKDF2_ROUNDING * _PBKDF2_ROUNDING
+        iterations = max(_PBKDF2_ROUNDING, iterations)
+        self.stdout.write(
+            f"pbkdf2_sha256: {elapsed:.1f} ms per {_PBKDF2_PROBE_ITERATIONS} iterations "
+            f"-> {iterations} iterations for {target_ms:.0f} ms",
+        )
+        return iterations
+
+    def _calibrate_scrypt(self, target_ms: float, max_memory: int) -> int:
+        hasher = ScryptPasswordHasher()
+        best = _SCRYPT_MIN_WORK_FACTOR
+        work_factor = _SCRYPT_MIN_WORK_FACTOR
+        while scrypt_memory(work_factor, hasher.block_size) <= max_memory:
+            elapsed = self._time_ms(self._scrypt, hasher, work_factor)
+            memory_mb = scrypt_memory(work_factor, hasher.block_size) // _BYTES_PER_MB
+            self.stdout.write(f"scrypt: N={work_factor} {memory_mb} MB {elapsed:.1f} ms")
+            if elapsed > target_ms:
+                break
+            best = work_factor
+            work_factor *= 2
+        return best
+
+    @staticmethod
+    def _scrypt(hasher: ScryptPasswordHasher, work_factor: int) -> None:
+        hasher.maxmem = scrypt_memory(work_factor, hasher.block_size) * 2
+        hasher.encode(_PROBE_PASSWORD, _PROBE_SALT, n=work_factor)
+
+    def _time_ms(self, probe: Callable[..., Any], *args: Any) -> float:
+        timings = []
+        for _ in range(self._samples):
+            started = time.perf_counter()
+            probe(*args)
+            timings.append((time.perf_counter() - started) * _MS_PER_SECOND)
+        return statistics.median(timings)
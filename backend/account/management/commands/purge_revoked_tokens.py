@@ -0,0 +1,25 @@
+"""Delete revocation entries of tokens that have expired anyway.
+
+Safe to run at any time, e.g. daily from cron:
+
+    python manage.py purge_revoked_tokens
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from account.models import RevokedToken
+
+
+class Command(BaseCommand):
+    """Purge expired RevokedToken rows."""
+
+    help = "Delete RevokedToken rows whose tokens have expired."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Delete expired rows and report how many were removed."""
+        deleted, _ = RevokedToken.objects.filter(expires_at__lte=timezone.now()).delete()
+        self.stdout.write(f"Purged {deleted} revoked tokens.")
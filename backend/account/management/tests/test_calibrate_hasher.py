@@ -0,0 +1,29 @@
+"""Tests for calibrate_hasher management command."""
+from __future__ import annotations
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+
+class CalibrateHasherCommandTests(SimpleTestCase):
+    """Test calibrate_hasher prints usable settings."""
+
+    def test_prints_recommended_settings(self) -> None:
+        """Both cost settings are recommended within the given bounds."""
+        out = StringIO()
+
+        call_command(
+            "calibrate_hasher",
+            "--target-ms", "5",
+            "--samples", "1",
+            "--max-memory-mb", "8",
+            stdout=out,
+        )
+
+        lines = out.getvalue().splitlines()
+        iterations = next(line for line in lines if "PASSWORD_PBKDF2_ITERATIONS=" in line)
+        work_factor = next(line for line in lines if "PASSWORD_SCRYPT_WORK_FACTOR=" in line)
+        assert int(iterations.split("=")[1]) >= 10_000
+        assert int(work_factor.split("=")[1]) <= 8192
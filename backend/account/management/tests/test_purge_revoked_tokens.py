@@ -0,0 +1,27 @@
+"""Tests for purge_revoked_tokens management command."""
+from __future__ import annotations
+
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from account.models import RevokedToken
+
+
+class PurgeRevokedTokensCommandTests(TestCase):
+    """Test purge_revoked_tokens removes only expired rows."""
+
+    def test_purges_expired_rows(self) -> None:
+        """Rows of expired tokens are deleted, live ones kept."""
+        now = timezone.now()
+        RevokedToken.objects.create(jti="expired", expires_at=now - timedelta(minutes=1))
+        RevokedToken.objects.create(jti="live", expires_at=now + timedelta(hours=1))
+        out = StringIO()
+
+        call_command("purge_revoked_tokens", stdout=out)
+
+        assert list(RevokedToken.objects.values_list("jti", flat=True)) == ["live"]
+        assert "Purged 1 revoked tokens." in out.getvalue()
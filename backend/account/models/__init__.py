@@ -1 +1,2 @@
+from account.models.revoked_token import RevokedToken
 from account.models.user import User
@@ -0,0 +1,27 @@
+"""RevokedToken model.
+
+Blocklist of JWT ids (``jti`` claim) invalidated before their expiry, e.g. on
+logout. Rows are only needed until the token would have expired anyway;
+``purge_revoked_tokens`` deletes them afterwards. Workers mirror the table in
+an in-memory Bloom filter (see ``TokenRevocationStore``) and catch up on new
+rows by ``revoked_at``.
+"""
+
+from __future__ import annotations
+
+from django.db import models
+
+JTI_MAX_LENGTH = 64
+
+
+class RevokedToken(models.Model):
+    jti = models.CharField(max_length=JTI_MAX_LENGTH, unique=True)
+    expires_at = models.DateTimeField(db_index=True)
+    revoked_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        verbose_name = "Revoked token"
+        verbose_name_plural = "Revoked tokens"
+
+    def __str__(self) -> str:  # pragma: no cover - trivial
+        return f"RevokedToken {self.jti}"
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 from account.exceptions import InvalidCredentialsError
 from account.models import User
+from account.services.password_hashing import hashing_pool
 from datastore.domains.account_dto import LoginCommand, UserRefDTO
 
 
@@ -39,6 +40,7 @@ class LoginService:
 
         Raises:
             InvalidCredentialsError: If user not found, password invalid, or inactive.
+            PasswordHashingBusyError: If the hashing pool is saturated.
         """
         try:
             user = User.objects.get(username=username)
@@ -49,7 +51,8 @@ class LoginService:
         if not user.is_active:
             raise InvalidCredentialsError()
 
-        if not user.check_password(password):
+        # Verified on the bounded hashing pool; outdated hashes are upgraded.
+        if not hashing_pool.check_password(user, password):
             raise InvalidCredentialsError()
 
         return user
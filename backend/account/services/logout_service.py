@@ -1,11 +1,15 @@
 """Service implementing user logout flow.
 
-Handles logout business logic: logging events, validation, and cleanup.
-Main responsibility is audit trail for tracking user logouts.
+Handles logout business logic: revoking the session token and logging the
+event for the audit trail.
 """
 from __future__ import annotations
 
 import logging
+from datetime import datetime, timezone
+
+from account.services.token_provider import TokenProvider
+from account.services.token_revocation import revocation_store
 
 logger = logging.getLogger(__name__)
 
@@ -13,23 +17,33 @@ logger = logging.getLogger(__name__)
 class LogoutService:
     """Coordinate the logout process for an authenticated user."""
 
-    def execute(self, user_id: int, username: str) -> None:
-        """Process logout and log the event.
+    def execute(self, user_id: int, username: str, token: str | None = None) -> None:
+        """Revoke the token and log the event.
 
         Args:
             user_id: Unique user identifier.
             username: User's username for audit logging.
+            token: The JWT used by the request; revoked by its ``jti`` so it is
+                rejected from now on even if the client keeps a copy.
 
         Returns:
             None (void operation).
-
-        Notes:
-            This is a thin service layer focused on logging. In the future,
-            this could be extended to:
-            - Invalidate tokens in Redis/token blacklist
-            - Log to audit system
-            - Trigger analytics events
-            - Clean up session data
         """
+        if token:
+            self._revoke(token)
+
         # Log logout event for audit trail
         logger.info(f"User {username} (ID: {user_id}) logged out")
+
+    @staticmethod
+    def _revoke(token: str) -> None:
+        """Add the token's ``jti`` to the revocation store until it expires.
+
+        Tokens issued without a ``jti`` cannot be revoked and simply expire.
+        """
+        payload = TokenProvider().decode_token(token)
+        jti = payload.get("jti")
+        if not jti:
+            return
+        expires_at = datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
+        revocation_store.revoke(jti, expires_at)
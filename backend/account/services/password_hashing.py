@@ -0,0 +1,69 @@
+"""Password hashing and verification on a bounded thread pool.
+
+PBKDF2 and scrypt take tens to hundreds of milliseconds of CPU per call. Run
+inline, a burst of logins occupies every request worker and every core, and
+catalog reads queue behind it. The pool caps the number of hashes computed at
+once at ``PASSWORD_HASHING_WORKERS`` (hashlib releases the GIL, so this is
+the number of cores hashing may use) and the number waiting at
+``PASSWORD_HASHING_MAX_PENDING``; beyond that, callers get
+``PasswordHashingBusyError`` immediately instead of piling up.
+
+Only pure hashing runs in the pool. Database work, such as saving a rehashed
+password, stays in the calling thread and its transaction.
+"""
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password, verify_password
+
+from account.exceptions import PasswordHashingBusyError
+from account.models import User
+
+ReturnT = TypeVar("ReturnT")
+
+
+class PasswordHashingPool:
+    """Bounded executor for password hashing."""
+
+    def __init__(self, workers: int, max_pending: int) -> None:
+        """Create the pool; threads are started lazily on first use."""
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="password-hashing",
+        )
+        self._slots = threading.BoundedSemaphore(workers + max_pending)
+
+    def make_password(self, raw_password: str) -> str:
+        """Return the encoded hash of ``raw_password`` with the default hasher."""
+        return self._run(make_password, raw_password)
+
+    def check_password(self, user: User, raw_password: str) -> bool:
+        """Verify ``raw_password`` and rehash it if the hasher settings changed.
+
+        Mirrors ``AbstractBaseUser.check_password``, including the upgrade of
+        outdated hashes, but keeps the hashing off the calling thread.
+        """
+        is_correct, must_update = self._run(verify_password, raw_password, user.password)
+        if is_correct and must_update:
+            user.password = self.make_password(raw_password)
+            user.save(update_fields=["password"])
+        return is_correct
+
+    def _run(self, func: Callable[..., ReturnT], *args: Any) -> ReturnT:
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHashingBusyError()
+        try:  # noqa: WPS501
+            return self._executor.submit(func, *args).result()
+        finally:
+            self._slots.release()
+
+
+hashing_pool = PasswordHashingPool(
+    workers=settings.PASSWORD_HASHING_WORKERS,
+    max_pending=settings.PASSWORD_HASHING_MAX_PENDING,
+)
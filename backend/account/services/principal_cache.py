@@ -0,0 +1,66 @@
+"""Cache of authenticated principals shared by the workers of a host.
+
+``JWTCookieAuthentication`` resolves the token's ``user_id`` on every
+authenticated request. :func:`load_principal` serves that lookup from the
+shared cache (``settings.PRINCIPAL_CACHE_ALIAS``) for
+``settings.PRINCIPAL_CACHE_TTL`` seconds. The alias holds principals only:
+a node that missed invalidations clears it as a whole. Saving or deleting a User evicts
+its entry on every node (through ``core.invalidation``), so deactivation
+takes effect on the next request. The loaded
+instance is also put in the request's identity map for later services.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import caches
+
+from account.models import User
+from core import identity_map
+from core.invalidation import invalidate
+
+PRINCIPAL_NAMESPACE = "principal"
+_KEY_PREFIX = "principal:"
+_DEFAULT_ALIAS = "principals"
+
+
+def load_principal(user_id: Any) -> User:
+    """Return the User with ``user_id``, from cache when possible.
+
+    Raises:
+        User.DoesNotExist: If no such user exists.
+    """
+    ttl = getattr(settings, "PRINCIPAL_CACHE_TTL", 0)
+    if not ttl:
+        return identity_map.load(User, user_id)
+    cache = _cache()
+    user = cache.get(_key(user_id))
+    if user is None:
+        user = identity_map.load(User, user_id)
+        cache.set(_key(user_id), user, timeout=ttl)
+    else:
+        identity_map.add(user)
+    return user
+
+
+def evict_principal(sender: type[User], instance: User, **kwargs: Any) -> None:
+    """Drop a saved or deleted User from the cache on all nodes (signal receiver)."""
+    if getattr(settings, "PRINCIPAL_CACHE_TTL", 0):
+        invalidate(PRINCIPAL_NAMESPACE, [instance.pk])
+
+
+def drop_principals(user_ids: list[str] | None) -> None:
+    """Delete cached principals; ``None`` clears the principal cache alias."""
+    if user_ids is None:
+        _cache().clear()
+        return
+    _cache().delete_many([_key(user_id) for user_id in user_ids])
+
+
+def _cache() -> Any:
+    return caches[getattr(settings, "PRINCIPAL_CACHE_ALIAS", _DEFAULT_ALIAS)]
+
+
+def _key(user_id: Any) -> str:
+    return f"{_KEY_PREFIX}{user_id}"
@@ -7,6 +7,7 @@ from django.utils.translation import gettext_lazy as _
 
 from account.exceptions import RegistrationConflictError, RegistrationValidationError
 from account.models import User
+from account.services.password_hashing import hashing_pool
 from datastore.domains.account_dto import RegisterUserCommand, UserProfileDTO
 
 
@@ -39,7 +40,7 @@ class RegistrationService:
 
     def _build_user(self, command: RegisterUserCommand) -> User:
         user = User(username=command.username, email=command.email)
-        user.set_password(command.password)
+        user.password = hashing_pool.make_password(command.password)
         return user
 
     def _validate_user(self, user: User) -> None:
@@ -4,9 +4,14 @@ from __future__ import annotations
 import logging
 from unittest.mock import patch
 
+import jwt
 from django.test import TestCase
 
+from account.models import RevokedToken
 from account.services.logout_service import LogoutService
+from account.services.token_provider import TokenProvider
+from account.services.token_revocation import revocation_store
+from config import jwt_config
 
 
 class LogoutServiceTests(TestCase):
@@ -56,3 +61,26 @@ class LogoutServiceTests(TestCase):
         call_args = mock_logger.info.call_args[0][0]
         assert different_username in call_args
         assert str(different_user_id) in call_args
+
+    def test_execute_revokes_token_until_expiry(self) -> None:
+        """execute() stores the token's jti with the token's expiry."""
+        token = TokenProvider().generate_token(self.user_id, self.username)
+        payload = TokenProvider().decode_token(token)
+
+        self.service.execute(user_id=self.user_id, username=self.username, token=token)
+
+        revoked = RevokedToken.objects.get(jti=payload["jti"])
+        assert int(revoked.expires_at.timestamp()) == payload["exp"]
+        assert revocation_store.is_revoked(payload["jti"])
+
+    def test_execute_ignores_token_without_jti(self) -> None:
+        """Legacy tokens without jti cannot be revoked and just expire."""
+        token = jwt.encode(
+            {"user_id": self.user_id, "exp": 2_000_000_000},
+            jwt_config.SECRET_KEY,
+            algorithm=jwt_config.ALGORITHM,
+        )
+
+        self.service.execute(user_id=self.user_id, username=self.username, token=token)
+
+        assert not RevokedToken.objects.exists()
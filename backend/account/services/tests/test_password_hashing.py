@@ -0,0 +1,75 @@
+"""Tests for the bounded password hashing pool and calibrated hashers."""
+from __future__ import annotations
+
+import threading
+
+from django.contrib.auth.hashers import identify_hasher
+from django.test import TestCase, override_settings
+from model_bakery import baker
+
+from account.exceptions import PasswordHashingBusyError
+from account.models import User
+from account.services.password_hashing import PasswordHashingPool
+
+_PASSWORD = "SecurePass123!"  # noqa: S105
+_ITERATIONS = 1000
+
+
+@override_settings(PASSWORD_PBKDF2_ITERATIONS=_ITERATIONS)
+class PasswordHashingPoolTests(TestCase):
+    """Test verification, transparent rehash and load shedding."""
+
+    def setUp(self) -> None:
+        """Create a pool and a user with a current hash."""
+        self.pool = PasswordHashingPool(workers=1, max_pending=0)
+        self.user = baker.make(User)
+        self.user.password = self.pool.make_password(_PASSWORD)
+        self.user.save()
+
+    def test_make_password_uses_configured_iterations(self) -> None:
+        """Hashes are PBKDF2 with the iteration count from settings."""
+        hasher = identify_hasher(self.user.password)
+
+        assert hasher.decode(self.user.password)["iterations"] == _ITERATIONS
+
+    def test_check_password_accepts_only_the_right_password(self) -> None:
+        """Verification matches Django's semantics."""
+        assert self.pool.check_password(self.user, _PASSWORD)
+        assert not self.pool.check_password(self.user, "wrong-password")
+
+    def test_check_password_rehashes_after_cost_change(self) -> None:
+        """A successful login upgrades a hash made with the old cost."""
+        with override_settings(PASSWORD_PBKDF2_ITERATIONS=_ITERATIONS * 2):
+            assert self.pool.check_password(self.user, _PASSWORD)
+
+        self.user.refresh_from_db()
+        decoded = identify_hasher(self.user.password).decode(self.user.password)
+        assert decoded["iterations"] == _ITERATIONS * 2
+
+    def test_wrong_password_never_rehashes(self) -> None:
+        """Failed logins leave the stored hash alone."""
+        old_hash = self.user.password
+
+        with override_settings(PASSWORD_PBKDF2_ITERATIONS=_ITERATIONS * 2):
+            assert not self.pool.check_password(self.user, "wrong-password")
+
+        self.user.refresh_from_db()
+        assert self.user.password == old_hash
+
+    def test_saturated_pool_sheds_load(self) -> None:
+        """Callers fail fast once every slot is taken."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def occupy() -> None:  # noqa: WPS430
+            started.set()
+            release.wait()
+
+        busy = threading.Thread(target=self.pool._run, args=(occupy,))
+        busy.start()
+        self.addCleanup(busy.join)
+        self.addCleanup(release.set)
+        started.wait()
+
+        with self.assertRaises(PasswordHashingBusyError):
+            self.pool.make_password(_PASSWORD)
@@ -0,0 +1,68 @@
+"""Tests for the shared principal cache."""
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.test import TestCase, override_settings
+from model_bakery import baker
+
+from account.models import User
+from account.services.principal_cache import drop_principals, load_principal
+
+
+@override_settings(PRINCIPAL_CACHE_TTL=60)
+class PrincipalCacheTests(TestCase):
+    """Test cached principal lookups and their eviction on writes."""
+
+    def setUp(self) -> None:
+        """Create a user and start from an empty cache."""
+        self.cache = caches[settings.PRINCIPAL_CACHE_ALIAS]
+        self.cache.clear()
+        self.addCleanup(self.cache.clear)
+        self.user = baker.make(User, username="principal")
+
+    def test_second_lookup_uses_cache(self) -> None:
+        """Repeated lookups do not query the database."""
+        load_principal(self.user.pk)
+
+        with self.assertNumQueries(0):
+            user = load_principal(self.user.pk)
+
+        assert user.username == "principal"
+
+    def test_save_evicts_cached_user(self) -> None:
+        """Deactivating a user is seen by the next lookup."""
+        load_principal(self.user.pk)
+        self.user.is_active = False
+        self.user.save()
+
+        assert not load_principal(self.user.pk).is_active
+
+    def test_delete_evicts_cached_user(self) -> None:
+        """Deleted users are no longer returned."""
+        load_principal(self.user.pk)
+        user_id = self.user.pk
+        self.user.delete()
+
+        with self.assertRaises(User.DoesNotExist):
+            load_principal(user_id)
+
+    def test_reset_keeps_other_cached_values(self) -> None:
+        """Dropping every principal leaves the default cache (rate limits) alone."""
+        load_principal(self.user.pk)
+        cache.set("ratelimit:login:test", 3)
+        self.addCleanup(cache.delete, "ratelimit:login:test")
+
+        drop_principals(None)
+
+        assert cache.get("ratelimit:login:test") == 3
+        with self.assertNumQueries(1):
+            load_principal(self.user.pk)
+
+    @override_settings(PRINCIPAL_CACHE_TTL=0)
+    def test_disabled_cache_always_queries(self) -> None:
+        """With a zero TTL every lookup reads the database."""
+        load_principal(self.user.pk)
+
+        with self.assertNumQueries(1):
+            load_principal(self.user.pk)
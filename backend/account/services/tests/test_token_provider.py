@@ -48,6 +48,14 @@ class TestTokenProvider:
         assert "exp" in decoded
         assert "iat" in decoded
 
+    def test_each_token_has_unique_jti(self, provider: TokenProvider) -> None:
+        """Tokens carry a distinct jti so they can be revoked one by one."""
+        first = provider.decode_token(provider.generate_token(TEST_USER_ID, TEST_USERNAME))
+        second = provider.decode_token(provider.generate_token(TEST_USER_ID, TEST_USERNAME))
+
+        assert first["jti"]
+        assert first["jti"] != second["jti"]
+
     def test_token_contains_required_claims(self, provider: TokenProvider) -> None:
         """Test that token includes all required claims."""
         token = provider.generate_token(
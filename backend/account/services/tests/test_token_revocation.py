@@ -0,0 +1,70 @@
+"""Tests for TokenRevocationStore."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from account.models import RevokedToken
+from account.services.token_revocation import TokenRevocationStore
+from config import jwt_config
+
+
+class FakeClock:
+    """Monotonic clock advanced by hand."""
+
+    def __init__(self) -> None:
+        """Start at zero."""
+        self.now = float(0)
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+class TokenRevocationStoreTests(TestCase):
+    """Test the Bloom filter fast path and refresh across processes."""
+
+    def setUp(self) -> None:
+        """Create two stores standing in for two worker processes."""
+        self.clock = FakeClock()
+        self.local = TokenRevocationStore(clock=self.clock)
+        self.remote = TokenRevocationStore(clock=self.clock)
+        self.expires_at = timezone.now() + timedelta(hours=1)
+
+    def test_revoked_token_is_rejected_by_revoking_process(self) -> None:
+        """The revoking worker sees the revocation immediately."""
+        self.local.revoke("abc", self.expires_at)
+
+        assert self.local.is_revoked("abc")
+        assert RevokedToken.objects.filter(jti="abc").exists()
+
+    def test_unrevoked_token_needs_no_query_between_refreshes(self) -> None:
+        """The fast path answers from memory once the filter is fresh."""
+        self.local.is_revoked("warm-up")
+
+        with self.assertNumQueries(0):
+            assert not self.local.is_revoked("valid")
+
+    def test_other_process_catches_up_after_refresh_interval(self) -> None:
+        """Another worker learns the revocation at its next refresh."""
+        self.remote.is_revoked("warm-up")
+        self.local.revoke("abc", self.expires_at)
+
+        assert not self.remote.is_revoked("abc")
+        self.clock.now += jwt_config.REVOCATION_REFRESH_SECONDS
+
+        assert self.remote.is_revoked("abc")
+
+    def test_expired_revocation_is_ignored(self) -> None:
+        """Entries of expired tokens no longer count as revoked."""
+        self.local.revoke("old", timezone.now() - timedelta(seconds=1))
+
+        assert not self.local.is_revoked("old")
+
+    def test_rebuild_loads_existing_revocations(self) -> None:
+        """A fresh process builds its filter from the table."""
+        RevokedToken.objects.create(jti="abc", expires_at=self.expires_at)
+
+        assert TokenRevocationStore(clock=self.clock).is_revoked("abc")
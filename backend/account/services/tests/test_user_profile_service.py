@@ -109,12 +109,8 @@ class UserProfileServiceTests(TestCase):
         )
         self.assertLess(time_diff, 1)
 
-    def test_fetch_user_only_selects_required_fields(self) -> None:
-        """Verify database query uses .only() for optimization.
-
-        This test ensures the query fetches only required fields,
-        not all columns (select *), reducing memory and network overhead.
-        """
+    def test_profile_dto_exposes_only_required_fields(self) -> None:
+        """Verify the DTO carries only the public profile fields."""
         profile_dto = self.service.execute(self.test_user.id)
 
         # DTO should contain only selected fields
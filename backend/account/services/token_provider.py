@@ -1,10 +1,12 @@
 """JWT token generation and validation.
 
 This module provides the TokenProvider class for generating signed JWT tokens
-and decoding/validating them. Tokens are used for stateless authentication.
+and decoding/validating them. Tokens are used for stateless authentication;
+each carries a unique ``jti`` so it can be revoked before it expires.
 """
 from __future__ import annotations
 
+import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -47,6 +49,7 @@ class TokenProvider:
             "username": username,
             "exp": expiration,
             "iat": now,
+            "jti": uuid.uuid4().hex,
         }
 
         return jwt.encode(
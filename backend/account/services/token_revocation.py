@@ -0,0 +1,105 @@
+"""Revocation of JWTs by their ``jti`` claim.
+
+Revoked ids are stored in ``RevokedToken`` until the token expires. Each
+worker process keeps a Bloom filter of the table so that checking a token that
+was never revoked (nearly every request) needs no query:
+
+- the filter catches up with rows revoked since the last sync at most every
+  ``REVOCATION_REFRESH_SECONDS``, and is rebuilt from the unexpired rows every
+  ``REVOCATION_REBUILD_SECONDS`` to drop expired ids;
+- a filter hit is confirmed against the table, so false positives never
+  reject a valid token.
+
+A token revoked on another worker is therefore accepted here for at most the
+refresh interval.
+"""
+from __future__ import annotations
+
+import datetime
+import threading
+import time
+from collections.abc import Callable
+
+from django.utils import timezone
+
+from account.models import RevokedToken
+from config import jwt_config
+from core.bloom import BloomFilter
+
+# Re-read rows revoked slightly before the last sync, so inserts committed
+# late or stamped by a worker with a lagging clock are not missed.
+_CATCH_UP_OVERLAP_SECONDS = 30
+_CATCH_UP_OVERLAP = datetime.timedelta(seconds=_CATCH_UP_OVERLAP_SECONDS)
+_NEVER = float("-inf")
+
+
+class TokenRevocationStore:
+    """Per-process revocation check backed by ``RevokedToken``."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """Start with an empty filter that is built on first use."""
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._filter = BloomFilter(
+            jwt_config.REVOCATION_FILTER_CAPACITY,
+            jwt_config.REVOCATION_FILTER_ERROR_RATE,
+        )
+        self._synced_at: datetime.datetime | None = None
+        self._refreshed_at = _NEVER
+        self._rebuilt_at = _NEVER
+
+    def revoke(self, jti: str, expires_at: datetime.datetime) -> None:
+        """Revoke token ``jti`` until ``expires_at``."""
+        RevokedToken.objects.get_or_create(jti=jti, defaults={"expires_at": expires_at})
+        with self._lock:
+            self._filter.add(jti)
+
+    def is_revoked(self, jti: str) -> bool:
+        """Return whether token ``jti`` has been revoked."""
+        self._refresh_if_stale()
+        if not self._filter.might_contain(jti):
+            return False
+        return RevokedToken.objects.filter(jti=jti, expires_at__gt=timezone.now()).exists()
+
+    def _refresh_if_stale(self) -> None:
+        now = self._clock()
+        if now - self._refreshed_at < jwt_config.REVOCATION_REFRESH_SECONDS:
+            return
+        with self._lock:
+            if now - self._refreshed_at < jwt_config.REVOCATION_REFRESH_SECONDS:
+                return
+            if now - self._rebuilt_at >= jwt_config.REVOCATION_REBUILD_SECONDS:
+                self._rebuild()
+                self._rebuilt_at = now
+            else:
+                self._catch_up()
+            self._refreshed_at = now
+
+    def _rebuild(self) -> None:
+        started_at = timezone.now()
+        live = RevokedToken.objects.filter(expires_at__gt=started_at)
+        jtis = list(live.values_list("jti", flat=True))
+        bloom = BloomFilter(
+            max(jwt_config.REVOCATION_FILTER_CAPACITY, len(jtis) * 2),
+            jwt_config.REVOCATION_FILTER_ERROR_RATE,
+        )
+        for jti in jtis:
+            bloom.add(jti)
+        self._filter = bloom
+        self._synced_at = started_at
+
+    def _catch_up(self) -> None:
+        started_at = timezone.now()
+        recent = RevokedToken.objects.filter(
+            revoked_at__gte=self._synced_at - _CATCH_UP_OVERLAP,
+            expires_at__gt=started_at,
+        )
+        for jti in recent.values_list("jti", flat=True).iterator():
+            self._filter.add(jti)
+        self._synced_at = started_at
+        if self._filter.count > self._filter.capacity:
+            # Too many ids for the error rate: rebuild at the next refresh.
+            self._rebuilt_at = _NEVER
+
+
+revocation_store = TokenRevocationStore()
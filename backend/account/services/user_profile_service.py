@@ -5,6 +5,7 @@ Handles fetching user profile data and mapping to DTO.
 from __future__ import annotations
 
 from account.models import User
+from core import identity_map
 from datastore.domains.account_dto import UserProfileDTO
 
 
@@ -28,10 +29,10 @@ class UserProfileService:
 
     @staticmethod
     def _fetch_user(user_id: int) -> User:
-        """Fetch user from database with only required fields.
+        """Fetch user through the request's identity map.
 
-        Query optimization: only select fields needed for profile DTO
-        to minimize database load and memory footprint.
+        The authentication class has usually loaded the same row already,
+        in which case no query is issued.
 
         Args:
             user_id: ID of the user to fetch.
@@ -42,12 +43,7 @@ class UserProfileService:
         Raises:
             User.DoesNotExist: If user not found.
         """
-        return User.objects.only(
-            "id",
-            "username",
-            "email",
-            "created_at",
-        ).get(id=user_id)
+        return identity_map.load(User, user_id)
 
     @staticmethod
     def _build_user_profile_dto(user: User) -> UserProfileDTO:
@@ -1,33 +1,38 @@
-"""Throttling classes for rate limiting API endpoints."""
+"""Throttling classes for rate limiting API endpoints.
+
+Counters are shared by all worker processes (see ``core.throttling``); rates
+are configured in ``REST_FRAMEWORK['DEFAULT_THROTTLE_RATES']``.
+"""
 from __future__ import annotations
 
-from rest_framework.throttling import SimpleRateThrottle
+from typing import Any
 
+from rest_framework.request import Request
 
-class LoginRateThrottle(SimpleRateThrottle):
-    """Rate limiting for login endpoint.
+from core.throttling import SlidingWindowThrottle
 
-    Limits:
-    - 5 requests per minute per IP address
-    - 10 requests per minute per username (if provided in request)
-    """
+
+class LoginRateThrottle(SlidingWindowThrottle):
+    """Limit login attempts per client IP address (scope ``login``)."""
 
     scope = "login"
 
-    def get_cache_key(self) -> str | None:
-        """Generate cache key based on IP or username.
+    def get_ident_key(self, request: Request, view: Any) -> str | None:
+        """Count by client IP (honours ``NUM_PROXIES`` for X-Forwarded-For)."""
+        return self.get_ident(request)
 
-        Returns cache key for throttling based on IP address.
-        For per-username limiting, a custom backend would be needed.
 
-        Returns:
-            Cache key string or None if unable to determine.
-        """
-        if self.request.user and self.request.user.is_authenticated:
-            # If user is authenticated, throttle by user ID
-            scope = self.scope
-            user_id = self.request.user.id
-            return f"throttle_{scope}_user_{user_id}"
+class LoginUsernameRateThrottle(SlidingWindowThrottle):
+    """Limit login attempts per target username (scope ``login_username``).
+
+    Stops password guessing against one account spread over many IPs.
+    """
+
+    scope = "login_username"
 
-        # Throttle by IP address
-        return self.get_ident(self.request)
+    def get_ident_key(self, request: Request, view: Any) -> str | None:
+        """Count by the submitted username; skip requests without one."""
+        username = request.data.get("username") if hasattr(request.data, "get") else None
+        if not isinstance(username, str) or not username:
+            return None
+        return username
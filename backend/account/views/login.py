@@ -9,10 +9,11 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from account.exceptions import InvalidCredentialsError
+from account.exceptions import InvalidCredentialsError, PasswordHashingBusyError
 from account.serializers.login import LoginSerializer
 from account.services.login_service import LoginService
 from account.services.token_provider import TokenProvider
+from account.throttling import LoginRateThrottle, LoginUsernameRateThrottle
 from config import jwt_config
 
 
@@ -25,6 +26,7 @@ class LoginView(APIView):
 
     authentication_classes = []
     permission_classes = [AllowAny]
+    throttle_classes = [LoginRateThrottle, LoginUsernameRateThrottle]
     serializer_class = LoginSerializer
     service_class = LoginService
     token_provider_class = TokenProvider
@@ -37,7 +39,7 @@ class LoginView(APIView):
 
         Returns:
             Response with 200 and user data + HttpOnly cookie on success,
-            or appropriate error response (400, 401).
+            or appropriate error response (400, 401, 503 while hashing is saturated).
         """
         serializer = self.serializer_class(data=request.data)
         if not serializer.is_valid():
@@ -53,6 +55,12 @@ class LoginView(APIView):
                 {"detail": exc.message},
                 status=status.HTTP_401_UNAUTHORIZED,
             )
+        except PasswordHashingBusyError as exc:
+            return Response(
+                {"detail": exc.message},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={"Retry-After": "1"},
+            )
 
         token = self.token_provider_class().generate_token(
             user_id=user_ref.id,
@@ -15,7 +15,7 @@ class LogoutView(APIView):
     """Handle user logout via POST /api/v1/auth/logout.
 
     Requires authentication (IsAuthenticated permission).
-    Logs the logout event and deletes the JWT cookie from client.
+    Revokes the JWT, logs the logout event and deletes the cookie from client.
     """
 
     permission_classes = [IsAuthenticated]
@@ -33,13 +33,14 @@ class LogoutView(APIView):
         Notes:
             - Returns 204 No Content (no response body).
             - Deletes JWT cookie by setting Max-Age=0 and empty value.
-            - Delegates logout logic to LogoutService for audit/logging.
+            - Delegates logout logic to LogoutService (token revocation, audit).
         """
-        # Delegate to service for logout logic (audit logging, etc.)
+        # Delegate to service for logout logic (token revocation, audit logging)
         service = self.service_class()
         service.execute(
             user_id=request.user.id,
             username=request.user.username,
+            token=request.auth,
         )
 
         # Create response with 204 No Content status
@@ -10,7 +10,11 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from account.serializers import RegisterUserSerializer
-from account.exceptions import RegistrationConflictError, RegistrationValidationError
+from account.exceptions import (
+    PasswordHashingBusyError,
+    RegistrationConflictError,
+    RegistrationValidationError,
+)
 from account.services import RegistrationService
 
 
@@ -35,6 +39,12 @@ class RegisterUserView(APIView):
             return Response({
                 "detail": exc.message, "field": exc.field
             }, status=status.HTTP_409_CONFLICT)
+        except PasswordHashingBusyError as exc:
+            return Response(
+                {"detail": exc.message},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={"Retry-After": "1"},
+            )
 
         # Dataclasses convert cleanly to JSON-ready primitives for Response.
         payload = asdict(user_profile)
@@ -1,12 +1,16 @@
 """Tests for login rate limiting/throttling."""
 from __future__ import annotations
 
+from unittest import mock
+
 from django.urls import reverse_lazy
 from model_bakery import baker
 from rest_framework import status
+from rest_framework.settings import api_settings
 from rest_framework.test import APIRequestFactory, APITestCase
 
 from account.views.login import LoginView
+from core.rate_limit import limiter
 
 TEST_USERNAME = "testuser"
 TEST_EMAIL = "test@example.com"
@@ -29,6 +33,8 @@ class TestLoginRateThrottling(APITestCase):
         )
         self.user.set_password(TEST_PASSWORD)
         self.user.save()
+        limiter.reset()
+        self.addCleanup(limiter.reset)
 
     def test_successful_login_within_rate_limit(self) -> None:
         """Test that login succeeds within rate limit."""
@@ -79,3 +85,39 @@ class TestLoginRateThrottling(APITestCase):
             status.HTTP_200_OK,
             status.HTTP_429_TOO_MANY_REQUESTS,
         ]
+
+    def test_username_limit_applies_across_ip_addresses(self) -> None:
+        """Attempts against one username are counted whatever the client IP."""
+        rates = {"login": "100/min", "login_username": "2/min"}
+        payload = {"username": TEST_USERNAME, "password": "WrongPassword!"}
+
+        with mock.patch.dict(api_settings.DEFAULT_THROTTLE_RATES, rates):
+            responses = [
+                self.view(self.factory.post(self.url, payload, format="json", REMOTE_ADDR=address))
+                for address in ("10.0.0.1", "10.0.0.2", "10.0.0.3")
+            ]
+
+        assert [response.status_code for response in responses] == [
+            status.HTTP_401_UNAUTHORIZED,
+            status.HTTP_401_UNAUTHORIZED,
+            status.HTTP_429_TOO_MANY_REQUESTS,
+        ]
+        assert "Retry-After" in responses[-1]
+
+    def test_ip_limit_applies_across_usernames(self) -> None:
+        """Attempts from one IP are counted whatever the username."""
+        rates = {"login": "2/min", "login_username": "100/min"}
+
+        with mock.patch.dict(api_settings.DEFAULT_THROTTLE_RATES, rates):
+            responses = [
+                self.view(
+                    self.factory.post(
+                        self.url,
+                        {"username": username, "password": "WrongPassword!"},
+                        format="json",
+                    ),
+                )
+                for username in ("first", "second", "third")
+            ]
+
+        assert responses[-1].status_code == status.HTTP_429_TOO_MANY_REQUESTS
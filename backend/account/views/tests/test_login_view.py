@@ -4,11 +4,15 @@ Tests cover successful login, validation errors, and authentication failures.
 """
 from __future__ import annotations
 
+from unittest import mock
+
 from django.urls import reverse_lazy
 from model_bakery import baker
 from rest_framework import status
 from rest_framework.test import APIRequestFactory, APITestCase
 
+from account.exceptions import PasswordHashingBusyError
+from account.services.password_hashing import hashing_pool
 from account.views.login import LoginView
 from config import jwt_config
 
@@ -237,3 +241,18 @@ class TestLoginView(APITestCase):
         assert "email" in user_data
         assert "created_at" not in user_data
         assert "updated_at" not in user_data
+
+    def test_saturated_hashing_pool_returns_service_unavailable(self) -> None:
+        """Test login is shed with 503 when the hashing pool is full."""
+        payload = {"username": TEST_USERNAME, "password": TEST_PASSWORD}
+        saturated = mock.patch.object(
+            hashing_pool,
+            "check_password",
+            side_effect=PasswordHashingBusyError(),
+        )
+
+        with saturated:
+            response = self.client.post(self.url, payload, format="json")
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response["Retry-After"] == "1"
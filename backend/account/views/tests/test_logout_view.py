@@ -12,6 +12,7 @@ from rest_framework.test import APIRequestFactory, APITestCase, force_authentica
 import jwt
 
 from account.services.logout_service import LogoutService
+from account.services.token_provider import TokenProvider
 from account.views.logout import LogoutView
 from config import jwt_config
 
@@ -171,3 +172,16 @@ class LogoutViewIntegrationTests(APITestCase):  # noqa: WPS338
         response = self.client.post("/api/v1/auth/logout")
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_token_is_rejected_after_logout(self) -> None:
+        """Integration test: a logged-out token no longer authenticates."""
+        token = TokenProvider().generate_token(self.user.id, self.user.username)
+        self.client.cookies[jwt_config.COOKIE_NAME] = token
+
+        assert self.client.get("/api/v1/auth/me").status_code == status.HTTP_200_OK
+        self.client.post("/api/v1/auth/logout")
+        self.client.cookies[jwt_config.COOKIE_NAME] = token
+
+        response = self.client.get("/api/v1/auth/me")
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
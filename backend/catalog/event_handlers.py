@@ -0,0 +1,34 @@
+"""Subscribers of the catalog app to domain events (see ``core.events``)."""
+from __future__ import annotations
+
+from django.conf import settings
+
+from catalog.events import BrickSetCreated, BrickSetDeleted, BrickSetUpdated
+from catalog.read_model import read_model
+from catalog.surrogate_keys import LIST_KEY, brickset_key
+from core.events import subscribe
+from core.invalidation import invalidate
+from core.response_cache import SURROGATE_NAMESPACE
+
+
+@subscribe(BrickSetCreated, BrickSetUpdated, BrickSetDeleted)
+def purge_cached_responses(events: list) -> None:
+    """Purge the list generation and the detail pages of the touched bricksets on all nodes.
+
+    Valuation events are handled by ``valuation.event_handlers``, after the
+    counters they change.
+    """
+    if not settings.RESPONSE_CACHE_ENABLED:
+        return
+    invalidate(SURROGATE_NAMESPACE, [LIST_KEY, *(brickset_key(event.brickset_id) for event in events)])
+
+
+@subscribe(BrickSetCreated, BrickSetUpdated, BrickSetDeleted)
+def refresh_read_model(events: list) -> None:
+    """Let this worker's read model pick up its own writes on the next list query.
+
+    Valuation events are handled by ``valuation.event_handlers``, after the
+    counters they change.
+    """
+    if settings.CATALOG_READ_MODEL_ENABLED:
+        read_model.mark_stale()
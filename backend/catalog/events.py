@@ -0,0 +1,30 @@
+"""Domain events published by catalog services (see ``core.events``)."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from core.events import DomainEvent
+
+
+@dataclass(frozen=True, slots=True)
+class BrickSetCreated(DomainEvent):
+    """A user added a BrickSet to the catalog."""
+
+    brickset_id: int
+    owner_id: int
+
+
+@dataclass(frozen=True, slots=True)
+class BrickSetUpdated(DomainEvent):
+    """An owner changed attributes of a BrickSet."""
+
+    brickset_id: int
+    owner_id: int
+
+
+@dataclass(frozen=True, slots=True)
+class BrickSetDeleted(DomainEvent):
+    """An owner deleted a BrickSet together with its valuations and likes."""
+
+    brickset_id: int
+    owner_id: int
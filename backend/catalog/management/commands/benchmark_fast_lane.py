@@ -0,0 +1,94 @@
+"""Measure per-request overhead of the public BrickSet endpoints.
+
+Each endpoint is requested through the full in-process handler (all
+middleware) with ``FAST_LANE_ENABLED`` off and on, and the latency
+distribution of both runs is reported side by side.
+
+Usage:
+    python manage.py benchmark_fast_lane --requests 500
+"""
+from __future__ import annotations
+
+import statistics
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from catalog.models import BrickSet
+
+_MICROSECONDS = 1_000_000
+_WARMUP_REQUESTS = 5
+_DEFAULT_REQUESTS = 200
+_P95 = 0.95
+
+
+class Command(BaseCommand):
+    """Benchmark GET /bricksets and GET /bricksets/{id} with and without the fast lane."""
+
+    help = "Compare per-request latency of public BrickSet endpoints with the fast lane off and on."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command options."""
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=_DEFAULT_REQUESTS,
+            help="Measured requests per endpoint and mode.",
+        )
+        parser.add_argument("--brickset-id", type=int, help="BrickSet used for the detail endpoint.")
+        parser.add_argument("--host", default="localhost", help="Host header sent with each request.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Run the benchmark and print mean/p50/p95 latencies in microseconds."""
+        client = Client(HTTP_HOST=options["host"])
+        paths = (
+            reverse("catalog:brickset-list"),
+            reverse("catalog:brickset-detail", kwargs={"pk": self._resolve_brickset_id(options)}),
+        )
+        for path in paths:
+            baseline = self._measure(client, path, enabled=False, count=options["requests"])
+            fast_lane = self._measure(client, path, enabled=True, count=options["requests"])
+            self._report(path, baseline, fast_lane)
+
+    def _report(self, path: str, baseline: list[float], fast_lane: list[float]) -> None:
+        self.stdout.write(path)
+        self.stdout.write(self._format_row("full stack", baseline))
+        self.stdout.write(self._format_row("fast lane", fast_lane))
+        saved = statistics.fmean(baseline) - statistics.fmean(fast_lane)
+        self.stdout.write(f"  saved per request: {saved:.0f} us")
+
+    @staticmethod
+    def _resolve_brickset_id(options: dict[str, Any]) -> int:
+        if options["brickset_id"]:
+            return options["brickset_id"]
+        brickset_id = BrickSet.bricksets.values_list("id", flat=True).first()
+        if brickset_id is None:
+            raise CommandError("No BrickSet found; create one or pass --brickset-id.")
+        return brickset_id
+
+    @staticmethod
+    def _measure(client: Client, path: str, *, enabled: bool, count: int) -> list[float]:
+        with override_settings(FAST_LANE_ENABLED=enabled):
+            for _ in range(_WARMUP_REQUESTS):
+                client.get(path)
+            timings = []
+            for _ in range(count):
+                started = time.perf_counter()
+                client.get(path)
+                timings.append((time.perf_counter() - started) * _MICROSECONDS)
+        return timings
+
+    @staticmethod
+    def _format_row(label: str, timings: list[float]) -> str:
+        ordered = sorted(timings)
+        last_index = len(ordered) - 1
+        p95_index = min(last_index, int(len(ordered) * _P95))
+        return "  {0:<10} mean={1:.0f} us  p50={2:.0f} us  p95={3:.0f} us".format(
+            label,
+            statistics.fmean(ordered),
+            statistics.median(ordered),
+            ordered[p95_index],
+        )
@@ -0,0 +1,33 @@
+"""Tests for benchmark_fast_lane management command."""
+from __future__ import annotations
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from model_bakery import baker
+
+from catalog.models import BrickSet
+
+
+class BenchmarkFastLaneCommandTests(TestCase):
+    """Test benchmark_fast_lane output."""
+
+    def test_reports_both_modes_for_each_endpoint(self) -> None:
+        """Output lists full-stack and fast-lane timings per endpoint."""
+        brickset = baker.make(BrickSet, number=10001)
+        out = StringIO()
+
+        call_command("benchmark_fast_lane", "--requests", "2", "--host", "testserver", stdout=out)
+
+        output = out.getvalue()
+        assert "/api/v1/bricksets\n" in output
+        assert f"/api/v1/bricksets/{brickset.id}\n" in output
+        assert output.count("fast lane") == 2
+        assert output.count("saved per request") == 2
+
+    def test_requires_brickset(self) -> None:
+        """Empty catalog raises CommandError."""
+        with self.assertRaises(CommandError):
+            call_command("benchmark_fast_lane", "--requests", "1")
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:05
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    atomic = False
+
+    dependencies = [
+        ('catalog', '0003_alter_brickset_managers'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='brickset',
+            index=models.Index(fields=['owner', '-created_at'], name='brickset_owner_created_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-19 07:32
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # DROP INDEX CONCURRENTLY cannot run inside a transaction block.
+    atomic = False
+
+    dependencies = [
+        ('catalog', '0004_brickset_owner_created_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # Leading column of brickset_owner_created_idx.
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    'DROP INDEX CONCURRENTLY IF EXISTS "catalog_brickset_owner_id_d0b33779"',
+                    reverse_sql='CREATE INDEX CONCURRENTLY "catalog_brickset_owner_id_d0b33779" ON "catalog_brickset" ("owner_id")',
+                ),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name='brickset',
+                    name='owner',
+                    field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='bricksets', to=settings.AUTH_USER_MODEL),
+                ),
+            ],
+        ),
+    ]
@@ -56,6 +56,8 @@ class BrickSet(models.Model):
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
         related_name="bricksets",
+        # Leading column of brickset_owner_created_idx.
+        db_index=False,
     )
     number = models.PositiveIntegerField(
         validators=[validators.MaxValueValidator(MAX_SET_NUMBER)],
@@ -121,6 +123,8 @@ class BrickSet(models.Model):
         ]
         indexes = [
             models.Index(fields=["number"], name="brickset_number_idx"),
+            # Owned bricksets, newest first.
+            models.Index(fields=["owner", "-created_at"], name="brickset_owner_created_idx"),
         ]
 
     def __str__(self) -> str:  # pragma: no cover - trivial
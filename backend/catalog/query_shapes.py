@@ -0,0 +1,7 @@
+"""Query shapes of the catalog services, audited by ``manage.py index_report``."""
+from __future__ import annotations
+
+from catalog.models import BrickSet
+from core.index_advisor import register_query_shape
+
+register_query_shape("catalog.owned_brickset_list", BrickSet, "owner", "-created_at")
@@ -0,0 +1,394 @@
+"""In-process columnar read model of the public BrickSet list.
+
+``BrickSet`` is narrow: an integer number, two enums, three booleans and a
+handful of aggregates. When ``settings.CATALOG_READ_MODEL_ENABLED`` is set,
+each worker keeps the whole catalog, with the list aggregates, the top
+valuation summary and the valuation statistics, in NumPy column arrays
+(roughly 180 bytes per BrickSet).
+``BrickSetListService`` then evaluates filters as vectorized boolean masks
+and orderings with ``argsort``; only the requested page is turned into DTOs.
+
+The model is refreshed incrementally from the change log (``changefeed``):
+at most every ``CATALOG_READ_MODEL_SYNC_INTERVAL`` seconds a query reads the
+changes after the model's cursor, and only the touched bricksets are
+reloaded. Writes committed by this worker mark the model stale, so the next
+read syncs at once. Counters changed outside the services (e.g.
+``reconcile_counters``) are picked up by a full reload every
+``CATALOG_READ_MODEL_RELOAD_INTERVAL`` seconds.
+
+Every refresh builds new arrays and swaps them in, so readers never lock.
+While the first load is running in another thread, or for an ordering the
+model does not know, :meth:`CatalogReadModel.query` returns None and the
+database query is used.
+"""
+from __future__ import annotations
+
+import dataclasses
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Any
+
+import numpy as np
+from django.conf import settings
+from django.db import DatabaseError
+
+from catalog.models import BrickSet, Completeness, ProductionStatus
+from catalog.services.brickset_list_service import BrickSetListService
+from changefeed.services import ChangeFeedService
+from core import sharding
+from datastore.domains.catalog_dto import BrickSetListItemDTO, TopValuationSummaryDTO, ValuationStatisticsDTO
+from datastore.domains.changefeed_dto import ChangeCursor
+from valuation.models import Valuation
+from valuation.services.brickset_statistics import BrickSetStatisticsService
+from valuation.services.like_counter import LikeCounter
+
+logger = logging.getLogger(__name__)
+
+_EPOCH = datetime.fromtimestamp(0, tz=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+_MAX_INCREMENTAL_CHANGES = 5000
+_CHANGES_LIMIT = _MAX_INCREMENTAL_CHANGES + 1  # one more tells a reload is due
+_LOAD_CHUNK_SIZE = 2000
+_NUMBER_WIDTH = 7  # MAX_SET_NUMBER has seven digits
+_CURRENCY_WIDTH = 3
+_LAST = np.iinfo(np.int64).max
+
+# Column names not derived from the DTO fields below.
+_ID = "id"
+_NUMBER_TEXT = "number_text"
+_OWNER_ESTIMATE = "owner_initial_estimate"
+_CREATED_AT = "created_at"
+_TOTAL_LIKES = "total_likes"
+_CURRENCY = "currency"
+_LIKES_COUNT = "likes_count"
+_MEAN_VALUE = "mean_value"
+_MIN_VALUE = "min_value"
+_CONSENSUS_VALUE = "consensus_value"
+
+# BrickSet fields stored and returned as they are.
+_BRICKSET_FIELDS = (_ID, "number", "owner_id", "valuations_count")
+_BOOLEAN_FILTERS = ("has_instructions", "has_box", "is_factory_sealed")
+# Enum fields, stored as the index of their value.
+_CHOICE_FILTERS = MappingProxyType({
+    "production_status": tuple(ProductionStatus.values),
+    "completeness": tuple(Completeness.values),
+})
+# Copied between BrickSet, columns and DTO as they are.
+_COPIED_FIELDS = (*_BRICKSET_FIELDS, *_BOOLEAN_FILTERS)
+_TOP_FIELDS = (_ID, "value", _CURRENCY, _LIKES_COUNT, "user_id")
+_STATISTICS = tuple(field.name for field in dataclasses.fields(ValuationStatisticsDTO))
+_RANGE_FILTERS = MappingProxyType({
+    "min_consensus_value": (_CONSENSUS_VALUE, np.greater_equal),
+    "max_consensus_value": (_CONSENSUS_VALUE, np.less_equal),
+})
+_ORDER_COLUMNS = frozenset((_CREATED_AT, "valuations_count", _TOTAL_LIKES, _CONSENSUS_VALUE))
+_NULLS_LAST = frozenset((_CONSENSUS_VALUE,))  # 0 (None) sorts last both ways
+_TOP_COLUMNS = MappingProxyType({field: f"top_{field}" for field in _TOP_FIELDS})
+
+# Column name -> dtype. Nullable integers use 0 for None: estimates, values
+# and ids start at 1. Statistics columns are 0 for unvalued bricksets.
+_COLUMNS = MappingProxyType({
+    **dict.fromkeys(_BRICKSET_FIELDS, np.int64),
+    **dict.fromkeys(_BOOLEAN_FILTERS, np.bool_),
+    **dict.fromkeys(_CHOICE_FILTERS, np.int8),
+    _NUMBER_TEXT: f"<U{_NUMBER_WIDTH}",
+    _OWNER_ESTIMATE: np.int64,
+    _CREATED_AT: np.int64,
+    _TOTAL_LIKES: np.int64,
+    **dict.fromkeys(_TOP_COLUMNS.values(), np.int64),
+    _TOP_COLUMNS[_CURRENCY]: f"<U{_CURRENCY_WIDTH}",
+    **dict.fromkeys(_STATISTICS, np.int64),
+    _MEAN_VALUE: np.float64,
+})
+
+Columns = dict[str, np.ndarray]
+Change = tuple[int, int, int]  # txid, change id, brickset id
+
+
+class CatalogSnapshot:
+    """Immutable column arrays of every BrickSet plus the change log cursor."""
+
+    __slots__ = ("columns", "cursor")
+
+    def __init__(self, columns: Columns, cursor: ChangeCursor) -> None:
+        """Wrap arrays that must not be modified afterwards."""
+        self.columns = columns
+        self.cursor = cursor
+
+    @property
+    def size(self) -> int:
+        """Number of bricksets in the snapshot."""
+        return len(self.columns[_ID])
+
+    def replace(self, brickset_ids: Iterable[int], fresh: Columns, cursor: ChangeCursor) -> CatalogSnapshot:
+        """Return a copy with ``brickset_ids`` replaced by the ``fresh`` rows.
+
+        Ids missing from ``fresh`` were deleted and are dropped.
+        """
+        replaced = np.fromiter(brickset_ids, dtype=np.int64)
+        keep = ~np.isin(self.columns[_ID], replaced)
+        columns = {
+            name: np.concatenate((column[keep], fresh[name]))
+            for name, column in self.columns.items()
+        }
+        return CatalogSnapshot(columns, cursor)
+
+    def select(self, filters: dict, ordering: str) -> np.ndarray:
+        """Return row positions matching ``filters``, sorted by ``ordering``."""
+        positions = np.flatnonzero(self._mask(filters))
+        order = np.argsort(self._sort_keys(ordering, positions), kind="stable")
+        return positions[order]
+
+    def to_dto(self, position: int) -> BrickSetListItemDTO:
+        """Build the list DTO of the row at ``position``."""
+        columns = self.columns
+        row = {name: column.item(position) for name, column in columns.items()}
+        return BrickSetListItemDTO(
+            **{name: row[name] for name in _COPIED_FIELDS},
+            **{name: choices[row[name]] for name, choices in _CHOICE_FILTERS.items()},
+            owner_initial_estimate=row[_OWNER_ESTIMATE] or None,
+            total_likes=row[_TOTAL_LIKES],
+            top_valuation=self._top_valuation(row),
+            statistics=self._statistics(row),
+        )
+
+    def _mask(self, filters: dict) -> np.ndarray:
+        """Return which rows match ``filters``."""
+        mask = self._search_mask(filters.get("q"))
+        for name, choices in _CHOICE_FILTERS.items():
+            choice = filters.get(name)
+            if choice:
+                code = choices.index(choice) if choice in choices else -1
+                mask &= self.columns[name] == code
+        for name in _BOOLEAN_FILTERS:
+            if filters.get(name) is not None:
+                mask &= self.columns[name] == bool(filters[name])
+        return mask & self._range_mask(filters)
+
+    def _search_mask(self, query: str | None) -> np.ndarray:
+        """Return which set numbers contain ``query``; all rows without one."""
+        if not query:
+            return np.ones(self.size, dtype=np.bool_)
+        numbers = self.columns[_NUMBER_TEXT]
+        found = np.char.find(numbers, str(query).lower())
+        return found >= 0
+
+    def _range_mask(self, filters: dict) -> np.ndarray:
+        """Return which rows match the range ``filters``; unvalued bricksets never do."""
+        mask = np.ones(self.size, dtype=np.bool_)
+        for name, (column, compare) in _RANGE_FILTERS.items():
+            if filters.get(name) is not None:
+                column_values = self.columns[column]
+                mask &= (column_values > 0) & compare(column_values, filters[name])
+        return mask
+
+    def _sort_keys(self, ordering: str, positions: np.ndarray) -> np.ndarray:
+        """Return the keys of the rows at ``positions`` whose ascending order is ``ordering``."""
+        name = ordering.lstrip("-")
+        keys = self.columns[name][positions]
+        if ordering.startswith("-"):
+            return -keys
+        if name in _NULLS_LAST:
+            return np.where(keys == 0, _LAST, keys)
+        return keys
+
+    @staticmethod
+    def _top_valuation(row: dict[str, Any]) -> TopValuationSummaryDTO | None:
+        if not row[_TOP_COLUMNS[_ID]]:
+            return None
+        summary = {field: row[column] for field, column in _TOP_COLUMNS.items()}
+        return TopValuationSummaryDTO(**summary)
+
+    @staticmethod
+    def _statistics(row: dict[str, Any]) -> ValuationStatisticsDTO | None:
+        if not row[_MIN_VALUE]:
+            return None
+        return ValuationStatisticsDTO(**{name: row[name] for name in _STATISTICS})
+
+
+class CatalogRows:
+    """Ordered result of a read model query, paginated like a QuerySet."""
+
+    def __init__(self, snapshot: CatalogSnapshot, positions: np.ndarray) -> None:
+        """Keep the snapshot the positions refer to."""
+        self._snapshot = snapshot
+        self._positions = positions
+
+    def count(self) -> int:
+        """Return the number of matching bricksets."""
+        return len(self._positions)
+
+    def __len__(self) -> int:
+        """Return the number of matching bricksets."""
+        return self.count()
+
+    def __getitem__(self, key: int | slice) -> BrickSetListItemDTO | list[BrickSetListItemDTO]:
+        """Return the DTO at ``key``, or a list of DTOs for a slice."""
+        if isinstance(key, slice):
+            return [self._snapshot.to_dto(position) for position in self._positions[key]]
+        return self._snapshot.to_dto(self._positions[key])
+
+    def __iter__(self) -> Iterator[BrickSetListItemDTO]:
+        """Iterate over all matching DTOs in order."""
+        return (self._snapshot.to_dto(position) for position in self._positions)
+
+
+class CatalogReadModel:
+    """Per-process holder of the current snapshot and its refresh policy."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """Start empty; the first query loads the catalog."""
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._snapshot: CatalogSnapshot | None = None
+        self._synced_at: float = 0
+        self._loaded_at: float = 0
+        self._stale = False
+        self._touched: set[int] = set()
+        self._touched_lock = threading.Lock()
+
+    def query(self, filters: dict, ordering: str) -> CatalogRows | None:
+        """Return matching rows, or None if the database must answer."""
+        if ordering.lstrip("-") not in _ORDER_COLUMNS:
+            return None
+        snapshot = self.current()
+        if snapshot is None:
+            return None
+        return CatalogRows(snapshot, snapshot.select(filters, ordering))
+
+    def current(self) -> CatalogSnapshot | None:
+        """Return an up-to-date snapshot, refreshing it when due."""
+        if self._snapshot is not None and not self._refresh_due():
+            return self._snapshot
+        # Concurrent readers keep using the previous snapshot (or the database).
+        if self._lock.acquire(blocking=False):
+            try:
+                self._refresh()
+            except DatabaseError:
+                logger.exception("Failed to refresh the catalog read model")
+            finally:
+                self._lock.release()
+        return self._snapshot
+
+    def mark_stale(self, brickset_ids: Iterable[int] = ()) -> None:
+        """Sync on the next query (after a write committed by this process).
+
+        That sync also reloads ``brickset_ids`` when the change log holds no
+        new entry for them: counters updated after the commit of their write
+        may miss a sync that already read its entry.
+        """
+        with self._touched_lock:
+            self._touched.update(brickset_ids)
+        self._stale = True
+
+    def reset(self) -> None:
+        """Drop the snapshot; the next query reloads everything."""
+        with self._lock:
+            self._snapshot = None
+
+    def _refresh_due(self) -> bool:
+        sync_interval = settings.CATALOG_READ_MODEL_SYNC_INTERVAL
+        return self._stale or self._clock() - self._synced_at >= sync_interval
+
+    def _refresh(self) -> None:
+        now = self._clock()
+        self._stale = False
+        with self._touched_lock:
+            touched = self._touched
+            self._touched = set()
+        reload_interval = settings.CATALOG_READ_MODEL_RELOAD_INTERVAL
+        if self._snapshot is None or now - self._loaded_at >= reload_interval:
+            self._reload(now)
+            return
+        visible = ChangeFeedService().visible_changes(self._snapshot.cursor)
+        changes = list(visible.values_list("txid", _ID, "brickset_id")[:_CHANGES_LIMIT])
+        if len(changes) > _MAX_INCREMENTAL_CHANGES:
+            self._reload(now)
+            return
+        self._sync(changes, touched)
+        self._synced_at = now
+
+    def _sync(self, changes: list[Change], touched: set[int]) -> None:
+        """Reload the bricksets of ``changes`` and ``touched``; move the cursor past ``changes``."""
+        brickset_ids = touched | {brickset_id for _, _, brickset_id in changes}
+        if not brickset_ids:
+            return
+        cursor = self._snapshot.cursor
+        if changes:
+            txid, change_id, _ = changes[-1]
+            cursor = ChangeCursor(txid, change_id)
+        self._snapshot = self._snapshot.replace(brickset_ids, _load_columns(brickset_ids), cursor)
+
+    def _reload(self, now: float) -> None:
+        # Read the cursor first: changes committed during the load are replayed.
+        cursor = ChangeFeedService().head_cursor()
+        self._snapshot = CatalogSnapshot(_load_columns(None), cursor)
+        self._synced_at = now
+        self._loaded_at = now
+
+
+def _load_columns(brickset_ids: set[int] | None) -> Columns:
+    """Load the list rows of ``brickset_ids`` (all when None) as columns."""
+    queryset = BrickSetListService().build_queryset({})
+    if brickset_ids is not None:
+        queryset = queryset.filter(id__in=brickset_ids)
+    bricksets: list[BrickSet] = list(queryset.iterator(chunk_size=_LOAD_CHUNK_SIZE))
+    return _RowBuilder(bricksets).columns()
+
+
+class _RowBuilder:
+    """Turn bricksets into column values, with live like counts."""
+
+    def __init__(self, bricksets: list[BrickSet]) -> None:
+        """Load the top valuations of ``bricksets``."""
+        self._bricksets = bricksets
+        self._counter = LikeCounter()
+        self._top_ids = BrickSetListService.top_valuation_ids(bricksets)
+        valuations = self._counter.annotate_valuations(Valuation.valuations.only(*_TOP_FIELDS))
+        top_valuations = sharding.filter_ids(valuations, self._top_ids.values())
+        self._top_valuations = {valuation.id: valuation for valuation in top_valuations}
+
+    def columns(self) -> Columns:
+        """Return the column arrays of the bricksets, in their order."""
+        rows = [self._row(brickset) for brickset in self._bricksets]
+        columns = {}
+        for name, dtype in _COLUMNS.items():
+            column = [row[name] for row in rows]
+            columns[name] = np.array(column, dtype=dtype)
+        return columns
+
+    def _row(self, brickset: BrickSet) -> dict[str, Any]:
+        """Return the column values of ``brickset``."""
+        row = {name: getattr(brickset, name) or 0 for name in _COPIED_FIELDS}
+        for name, choices in _CHOICE_FILTERS.items():
+            row[name] = choices.index(getattr(brickset, name))
+        row[_NUMBER_TEXT] = str(brickset.number)
+        row[_OWNER_ESTIMATE] = brickset.owner_initial_estimate or 0
+        row[_CREATED_AT] = (brickset.created_at - _EPOCH) // _MICROSECOND
+        row[_TOTAL_LIKES] = self._counter.live_total_likes(brickset)
+        top = self._top_valuations.get(self._top_ids.get(brickset.id))
+        row.update(self._top_columns(top))
+        row.update(self._statistics_columns(brickset))
+        return row
+
+    def _top_columns(self, top: Valuation | None) -> dict[str, Any]:
+        """Return the top valuation columns: zeros and no currency without one."""
+        if top is None:
+            summary = dict.fromkeys(_TOP_FIELDS, 0)
+            summary[_CURRENCY] = ""
+        else:
+            summary = {field: getattr(top, field) for field in _TOP_FIELDS}
+            summary[_LIKES_COUNT] = self._counter.live_likes(top)
+        return {_TOP_COLUMNS[field]: field_value for field, field_value in summary.items()}
+
+    @staticmethod
+    def _statistics_columns(brickset: BrickSet) -> dict[str, Any]:
+        statistics = BrickSetStatisticsService.to_dto(BrickSetStatisticsService.of(brickset))
+        return {name: getattr(statistics, name) if statistics else 0 for name in _STATISTICS}
+
+
+read_model = CatalogReadModel()
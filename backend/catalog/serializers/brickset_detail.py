@@ -3,6 +3,8 @@ from __future__ import annotations
 
 from rest_framework import serializers
 
+from catalog.serializers.brickset_list import ValuationStatisticsSerializer
+
 
 class ValuationInlineSerializer(serializers.Serializer):
     """Serialize ValuationInlineDTO to JSON for nested valuation objects.
@@ -50,3 +52,7 @@ class BrickSetDetailSerializer(serializers.Serializer):
     total_likes = serializers.IntegerField(read_only=True)
     created_at = serializers.DateTimeField(read_only=True)
     updated_at = serializers.DateTimeField(read_only=True)
+    statistics = ValuationStatisticsSerializer(
+        read_only=True,
+        allow_null=True,
+    )
@@ -23,6 +23,8 @@ class BrickSetFilterSerializer(serializers.Serializer):
         "-valuations_count",
         "total_likes",
         "-total_likes",
+        "consensus_value",
+        "-consensus_value",
     ]
 
     page = serializers.IntegerField(
@@ -67,6 +69,16 @@ class BrickSetFilterSerializer(serializers.Serializer):
         allow_null=True,
         help_text="Filter by seal state.",
     )
+    min_consensus_value = serializers.IntegerField(
+        min_value=1,
+        required=False,
+        help_text="Only sets whose consensus value is at least this.",
+    )
+    max_consensus_value = serializers.IntegerField(
+        min_value=1,
+        required=False,
+        help_text="Only sets whose consensus value is at most this.",
+    )
     ordering = serializers.ChoiceField(
         choices=ORDERING_CHOICES,
         required=False,
@@ -99,6 +111,21 @@ class TopValuationSummarySerializer(serializers.Serializer):
     user_id = serializers.IntegerField(read_only=True)
 
 
+class ValuationStatisticsSerializer(serializers.Serializer):
+    """Serialize ValuationStatisticsDTO to JSON.
+
+    Running statistics of a brickset's valuations in list and detail responses.
+    """
+
+    mean_value = serializers.FloatField(read_only=True)
+    consensus_value = serializers.IntegerField(read_only=True)
+    min_value = serializers.IntegerField(read_only=True)
+    max_value = serializers.IntegerField(read_only=True)
+    p10_value = serializers.IntegerField(read_only=True)
+    median_value = serializers.IntegerField(read_only=True)
+    p90_value = serializers.IntegerField(read_only=True)
+
+
 class BrickSetListItemSerializer(serializers.Serializer):
     """Serialize BrickSetListItemDTO to JSON for list responses.
 
@@ -124,3 +151,7 @@ class BrickSetListItemSerializer(serializers.Serializer):
         read_only=True,
         allow_null=True,
     )
+    statistics = ValuationStatisticsSerializer(
+        read_only=True,
+        allow_null=True,
+    )
@@ -3,8 +3,12 @@ from __future__ import annotations
 
 from django.db import IntegrityError, transaction
 
+from catalog.events import BrickSetCreated
 from catalog.exceptions import BrickSetDuplicateError
 from catalog.models import BrickSet
+from changefeed.models import ChangeEntity, ChangeOperation
+from changefeed.services.change_log import record_change
+from core.events import publish
 from datastore.domains.catalog_dto import (
     CreateBrickSetCommand,
     BrickSetListItemDTO,
@@ -45,12 +49,15 @@ class CreateBrickSetService:
     def _persist_brickset(self, brickset: BrickSet) -> None:
         """Persist BrickSet to database within transaction.
 
-        Catches IntegrityError for unique constraint violations only.
-        Other IntegrityError types (foreign key, check constraints) are re-raised.
+        Logs the change and publishes BrickSetCreated. Catches IntegrityError
+        for unique constraint violations only. Other IntegrityError types
+        (foreign key, check constraints) are re-raised.
         """
         try:
             with transaction.atomic():
                 brickset.save()
+                record_change(ChangeEntity.BRICKSET, brickset.id, ChangeOperation.CREATED, brickset.id)
+                publish(BrickSetCreated(brickset_id=brickset.id, owner_id=brickset.owner_id))
         except IntegrityError as exc:
             # Check which constraint was violated by examining error message
             error_message = str(exc).lower()
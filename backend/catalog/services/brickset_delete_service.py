@@ -1,11 +1,16 @@
 """Service implementing BrickSet delete (DELETE) flow."""
 from __future__ import annotations
 
-from django.db import transaction
 from django.contrib.auth import get_user_model
 
+from catalog.events import BrickSetDeleted
 from catalog.exceptions import BrickSetNotFoundError, BrickSetEditForbiddenError
 from catalog.models import BrickSet
+from changefeed.models import ChangeEntity, ChangeOperation
+from changefeed.services.change_log import record_change
+from core import sharding
+from core.events import publish
+from valuation.services.like_counter import LikeCounter
 
 User = get_user_model()
 
@@ -43,7 +48,7 @@ class DeleteBrickSetService:  # noqa: WPS338
         """
         # Fetch BrickSet with related valuations
         try:
-            brickset = BrickSet.bricksets.prefetch_related("valuations").get(
+            brickset = BrickSet.bricksets.prefetch_related(LikeCounter().prefetch_valuations()).get(
                 pk=brickset_id,
             )
         except BrickSet.DoesNotExist as exc:
@@ -92,7 +97,7 @@ class DeleteBrickSetService:  # noqa: WPS338
             ),
             None,
         )
-        if owner_valuation and owner_valuation.likes_count > 0:
+        if owner_valuation and LikeCounter().live_likes(owner_valuation) > 0:
             raise BrickSetEditForbiddenError("owner_valuation_has_likes")
 
     @staticmethod
@@ -100,10 +105,18 @@ class DeleteBrickSetService:  # noqa: WPS338
         """Delete BrickSet instance with CASCADE handling.
 
         Wrapped in transaction.atomic() for atomicity. CASCADE delete via Django ORM
-        automatically removes related Valuations and their Likes.
+        automatically removes related Valuations and their Likes. Logs the
+        change (clients drop the valuations with it) and publishes
+        BrickSetDeleted for after-commit subscribers. With sharded valuations
+        the cascade cannot reach the shard, so they are deleted there first.
 
         Args:
             brickset: BrickSet instance to delete
         """
-        with transaction.atomic():
+        brickset_id = brickset.id
+        with sharding.atomic(sharding.shard_for_brickset(brickset_id)):
+            if sharding.enabled():
+                brickset.valuations.all().delete()
             brickset.delete()
+            record_change(ChangeEntity.BRICKSET, brickset_id, ChangeOperation.DELETED, brickset_id)
+            publish(BrickSetDeleted(brickset_id=brickset_id, owner_id=brickset.owner_id))
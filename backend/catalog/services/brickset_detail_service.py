@@ -7,6 +7,8 @@ from datastore.domains.catalog_dto import (
     ValuationInlineDTO,
     BrickSetDetailDTO,
 )
+from valuation.services.brickset_statistics import BrickSetStatisticsService
+from valuation.services.like_counter import LikeCounter
 
 
 class BrickSetDetailService:  # noqa: WPS338
@@ -31,10 +33,11 @@ class BrickSetDetailService:  # noqa: WPS338
         Raises:
             BrickSetNotFoundError: If BrickSet with given id doesn't exist
         """
+        like_counter = LikeCounter()
         try:
-            brickset = BrickSet.bricksets.prefetch_related("valuations").get(
-                pk=brickset_id,
-            )
+            brickset = BrickSet.bricksets.select_related("statistics").prefetch_related(
+                like_counter.prefetch_valuations(),
+            ).get(pk=brickset_id)
         except BrickSet.DoesNotExist as exc:
             raise BrickSetNotFoundError(brickset_id) from exc
 
@@ -46,7 +49,7 @@ class BrickSetDetailService:  # noqa: WPS338
                 value=valuation.value,
                 currency=valuation.currency,
                 comment=valuation.comment,
-                likes_count=valuation.likes_count,
+                likes_count=like_counter.live_likes(valuation),
                 created_at=valuation.created_at,
             )
             for valuation in brickset.valuations.all()
@@ -72,4 +75,5 @@ class BrickSetDetailService:  # noqa: WPS338
             total_likes=total_likes,
             created_at=brickset.created_at,
             updated_at=brickset.updated_at,
+            statistics=BrickSetStatisticsService.to_dto(BrickSetStatisticsService.of(brickset)),
         )
@@ -1,23 +1,26 @@
 """Service implementing BrickSet listing with filters, aggregations and sorting."""
 from __future__ import annotations
 
-from django.db.models import (
-    Count,
-    IntegerField,
-    OuterRef,
-    QuerySet,
-    Subquery,
-    Sum,
-    Value,
-)
-from django.db.models.functions import Coalesce
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.db import models
 
 from catalog.models import BrickSet
+from core import sharding
 from datastore.domains.catalog_dto import (
     TopValuationSummaryDTO,
     BrickSetListItemDTO,
 )
 from valuation.models import Valuation
+from valuation.services.brickset_statistics import BrickSetStatisticsService
+from valuation.services.like_counter import LikeCounter
+
+if TYPE_CHECKING:
+    from catalog.read_model import CatalogRows
+
+_TOP_VALUATION_ORDER = ("-likes_count", "-created_at")
 
 
 class BrickSetListService:  # noqa: WPS338
@@ -30,26 +33,49 @@ class BrickSetListService:  # noqa: WPS338
         "-valuations_count",
         "total_likes",
         "-total_likes",
+        "consensus_value",
+        "-consensus_value",
     ]
 
     DEFAULT_ORDERING = "-created_at"
 
-    def get_queryset(self, filters: dict) -> QuerySet:
+    def get_queryset(self, filters: dict) -> models.QuerySet | CatalogRows:
+        """Return the filtered, annotated and ordered bricksets.
+
+        When ``settings.CATALOG_READ_MODEL_ENABLED`` is set and the in-process
+        read model can answer, its rows are returned instead of a QuerySet:
+        they support ``count()`` and slicing and are already
+        BrickSetListItemDTOs. Otherwise the database QuerySet is returned.
+        """
+        if getattr(settings, "CATALOG_READ_MODEL_ENABLED", False):
+            from catalog.read_model import read_model  # noqa: WPS433 - it imports this module
+
+            rows = read_model.query(filters, filters.get("ordering", self.DEFAULT_ORDERING))
+            if rows is not None:
+                return rows
+        return self.build_queryset(filters)
+
+    def build_queryset(self, filters: dict) -> models.QuerySet:
         """Build and return optimized QuerySet with filters and annotations.
 
         Flow:
         1. Start with base QuerySet
         2. Apply text search filter (q parameter)
         3. Apply boolean and choice filters
-        4. Add count annotations (valuations_count, total_likes)
-        5. Add subquery for top valuation
-        6. Apply ordering
+        4. Apply consensus value range filters
+        5. Add count annotations (valuations_count, total_likes)
+        6. Add subquery for top valuation
+        7. Apply ordering
+
+        Valuation statistics are joined from BrickSetStatistics, which is
+        maintained on write, so they need no aggregation here.
         """
-        queryset = BrickSet.bricksets.all()
+        queryset = BrickSet.bricksets.select_related("statistics")
 
         # Apply filters
         queryset = self._apply_search_filter(queryset, filters.get("q"))
         queryset = self._apply_status_filters(queryset, filters)
+        queryset = self._apply_value_filters(queryset, filters)
 
         # Add aggregations and annotations
         queryset = self._add_aggregations(queryset)
@@ -60,13 +86,13 @@ class BrickSetListService:  # noqa: WPS338
 
         return queryset
 
-    def _apply_search_filter(self, queryset: QuerySet, query: str | None) -> QuerySet:
+    def _apply_search_filter(self, queryset: models.QuerySet, query: str | None) -> models.QuerySet:
         """Filter bricksets by partial match on set number."""
         if query:
             queryset = queryset.filter(number__icontains=query)
         return queryset
 
-    def _apply_status_filters(self, queryset: QuerySet, filters: dict) -> QuerySet:
+    def _apply_status_filters(self, queryset: models.QuerySet, filters: dict) -> models.QuerySet:
         """Apply production_status, completeness and boolean condition filters."""
         production_status = filters.get("production_status")
         if production_status:
@@ -87,77 +113,98 @@ class BrickSetListService:  # noqa: WPS338
 
         return queryset
 
-    def _add_aggregations(self, queryset: QuerySet) -> QuerySet:
+    def _apply_value_filters(self, queryset: models.QuerySet, filters: dict) -> models.QuerySet:
+        """Filter by the consensus value range; unvalued sets never match."""
+        if filters.get("min_consensus_value") is not None:
+            queryset = queryset.filter(statistics__consensus_value__gte=filters["min_consensus_value"])
+        if filters.get("max_consensus_value") is not None:
+            queryset = queryset.filter(statistics__consensus_value__lte=filters["max_consensus_value"])
+        return queryset
+
+    def _add_aggregations(self, queryset: models.QuerySet) -> models.QuerySet:
         """Add annotations for valuations_count, total_likes and top_valuation.
 
         Optimizations:
-        - valuations_count: Count('valuations')
-        - total_likes: Coalesce(Sum('valuations__likes_count'), 0) to handle no valuations
-        - top_valuation_id: Subquery selecting valuation with max likes_count
+        - valuations_count, total_likes: see BrickSetStatisticsService.annotate_counts
+        - top_valuation_id: Subquery selecting the non-outlier valuation with max likes_count,
+          unless valuations are sharded (see top_valuation_ids)
         """
-        top_valuation_subquery = self._get_top_valuation_subquery()
-
-        queryset = queryset.annotate(
-            valuations_count=Count("valuations", distinct=True),
-            total_likes=Coalesce(
-                Sum("valuations__likes_count", output_field=IntegerField()),
-                Value(0),
-                output_field=IntegerField(),
-            ),
-            top_valuation_id=Subquery(top_valuation_subquery),
-        )
+        queryset = BrickSetStatisticsService.annotate_counts(queryset)
+        if sharding.enabled():
+            return queryset
+        return queryset.annotate(top_valuation_id=self._get_top_valuation_subquery())
 
-        return queryset
+    @classmethod
+    def top_valuation_ids(cls, bricksets: Iterable[BrickSet]) -> dict[int, int]:
+        """Map the bricksets that have a top valuation to its id.
+
+        Read from the ``top_valuation_id`` annotation, or, when valuations are
+        sharded and the subquery cannot join them, from each brickset's shard.
+        """
+        if sharding.enabled():
+            return cls._shard_top_valuation_ids([brickset.id for brickset in bricksets])
+        top_ids = {brickset.id: getattr(brickset, "top_valuation_id", None) for brickset in bricksets}
+        return {brickset_id: top_id for brickset_id, top_id in top_ids.items() if top_id}
+
+    @staticmethod
+    def _shard_top_valuation_ids(brickset_ids: list[int]) -> dict[int, int]:
+        """Query the top valuation ids of ``brickset_ids``, one query per shard."""
+        top_ids: dict[int, int] = {}
+        for alias, shard_brickset_ids in sharding.group_bricksets_by_shard(brickset_ids).items():
+            valuations = Valuation.valuations.using(alias).inliers().filter(brickset_id__in=shard_brickset_ids)
+            top_ids.update(
+                valuations.order_by("brickset_id", *_TOP_VALUATION_ORDER)
+                .distinct("brickset_id")
+                .values_list("brickset_id", "id"),
+            )
+        return top_ids
 
     @staticmethod
-    def _get_top_valuation_subquery() -> Subquery:
+    def _get_top_valuation_subquery() -> models.Subquery:
         """Build subquery to fetch ID of valuation with max likes for each brickset.
 
         Returns the ID of the valuation with the highest likes_count for each
-        brickset. If no valuations exist, returns None.
+        brickset, skipping outliers. If no valuations exist, returns None.
         """
+        inliers = Valuation.valuations.inliers()
         top_valuation = (
-            Valuation.valuations.filter(brickset=OuterRef("pk"))
-            .order_by("-likes_count", "-created_at")
+            inliers.filter(brickset=models.OuterRef("pk"))
+            .order_by(*_TOP_VALUATION_ORDER)
             .values("id")[:1]
         )
-        return Subquery(top_valuation, output_field=IntegerField())
+        return models.Subquery(top_valuation, output_field=models.IntegerField())
 
-    def _apply_ordering(self, queryset: QuerySet, ordering: str) -> QuerySet:
-        """Apply ordering by the specified field."""
-        if ordering in self.ALLOWED_ORDERINGS:
-            queryset = queryset.order_by(ordering)
-        return queryset
+    def _apply_ordering(self, queryset: models.QuerySet, ordering: str) -> models.QuerySet:
+        """Apply ordering by the specified field.
 
-    def map_to_dto(self, brickset: BrickSet) -> BrickSetListItemDTO:
+        Unvalued sets have no consensus value and come last in both directions.
+        """
+        if ordering not in self.ALLOWED_ORDERINGS:
+            return queryset
+        if ordering.lstrip("-") == "consensus_value":
+            consensus = models.F("statistics__consensus_value")
+            if ordering.startswith("-"):
+                return queryset.order_by(consensus.desc(nulls_last=True))
+            return queryset.order_by(consensus.asc(nulls_last=True))
+        return queryset.order_by(ordering)
+
+    def map_to_dto(self, brickset: BrickSet | BrickSetListItemDTO) -> BrickSetListItemDTO:
         """Map a BrickSet instance to BrickSetListItemDTO.
 
         Expects the queryset to have been annotated with valuations_count,
         total_likes, and top_valuation_id. If top_valuation_id exists,
         fetches the related Valuation to build TopValuationSummaryDTO.
+        Rows of the read model are already DTOs and are returned as is.
         """
-        top_valuation_dto = None
-
-        # Check if top_valuation_id was annotated and exists
-        if hasattr(brickset, "top_valuation_id") and brickset.top_valuation_id:
-            top_val = Valuation.valuations.filter(
-                id=brickset.top_valuation_id
-            ).first()
-            if top_val:
-                top_valuation_dto = TopValuationSummaryDTO(
-                    id=top_val.id,
-                    value=top_val.value,
-                    currency=top_val.currency,
-                    likes_count=top_val.likes_count,
-                    user_id=top_val.user_id,
-                )
+        if isinstance(brickset, BrickSetListItemDTO):
+            return brickset
+        like_counter = LikeCounter()
+        top_valuation_dto = self._top_valuation_dto(brickset, like_counter)
 
         valuations_count = (
             getattr(brickset, "valuations_count", 0) or 0
         )
-        total_likes = (
-            getattr(brickset, "total_likes", 0) or 0
-        )
+        total_likes = like_counter.live_total_likes(brickset)
 
         return BrickSetListItemDTO(
             id=brickset.id,
@@ -172,4 +219,22 @@ class BrickSetListService:  # noqa: WPS338
             valuations_count=valuations_count,
             total_likes=total_likes,
             top_valuation=top_valuation_dto,
+            statistics=BrickSetStatisticsService.to_dto(BrickSetStatisticsService.of(brickset)),
+        )
+
+    def _top_valuation_dto(self, brickset: BrickSet, like_counter: LikeCounter) -> TopValuationSummaryDTO | None:
+        """Summarize the top valuation of ``brickset``; None when it has none."""
+        top_valuation_id = self.top_valuation_ids([brickset]).get(brickset.id)
+        if top_valuation_id is None:
+            return None
+        valuations = Valuation.valuations.db_manager(hints=sharding.for_pk(top_valuation_id))
+        top_val = like_counter.annotate_valuations(valuations.filter(id=top_valuation_id)).first()
+        if top_val is None:
+            return None
+        return TopValuationSummaryDTO(
+            id=top_val.id,
+            value=top_val.value,
+            currency=top_val.currency,
+            likes_count=like_counter.live_likes(top_val),
+            user_id=top_val.user_id,
         )
@@ -4,13 +4,19 @@ from __future__ import annotations
 from django.db import transaction
 from django.contrib.auth import get_user_model
 
+from catalog.events import BrickSetUpdated
 from catalog.exceptions import BrickSetNotFoundError, BrickSetEditForbiddenError
 from catalog.models import BrickSet
+from changefeed.models import ChangeEntity, ChangeOperation
+from changefeed.services.change_log import record_change
+from core.events import publish
 from datastore.domains.catalog_dto import (
     UpdateBrickSetCommand,
     BrickSetDetailDTO,
     ValuationInlineDTO,
 )
+from valuation.services.brickset_statistics import BrickSetStatisticsService
+from valuation.services.like_counter import LikeCounter
 
 User = get_user_model()
 
@@ -50,9 +56,9 @@ class UpdateBrickSetService:  # noqa: WPS338
         """
         # Fetch BrickSet with related valuations
         try:
-            brickset = BrickSet.bricksets.prefetch_related("valuations").get(
-                pk=brickset_id,
-            )
+            brickset = BrickSet.bricksets.select_related("statistics").prefetch_related(
+                LikeCounter().prefetch_valuations(),
+            ).get(pk=brickset_id)
         except BrickSet.DoesNotExist as exc:
             raise BrickSetNotFoundError(brickset_id) from exc
 
@@ -102,7 +108,7 @@ class UpdateBrickSetService:  # noqa: WPS338
             ),
             None,
         )
-        if owner_valuation and owner_valuation.likes_count > 0:
+        if owner_valuation and LikeCounter().live_likes(owner_valuation) > 0:
             raise BrickSetEditForbiddenError("owner_valuation_has_likes")
 
     @staticmethod
@@ -110,7 +116,8 @@ class UpdateBrickSetService:  # noqa: WPS338
         """Apply command updates to BrickSet model fields.
 
         Only updates provided command fields (has_box, owner_initial_estimate).
-        Wrapped in transaction.atomic() for atomicity.
+        Wrapped in transaction.atomic() for atomicity; logs the change and
+        publishes BrickSetUpdated.
 
         Args:
             brickset: BrickSet instance to update
@@ -131,6 +138,8 @@ class UpdateBrickSetService:  # noqa: WPS338
         if update_fields:
             with transaction.atomic():
                 brickset.save(update_fields=update_fields)
+                record_change(ChangeEntity.BRICKSET, brickset.id, ChangeOperation.UPDATED, brickset.id)
+                publish(BrickSetUpdated(brickset_id=brickset.id, owner_id=brickset.owner_id))
 
     @staticmethod
     def _build_detail_dto(brickset: BrickSet) -> BrickSetDetailDTO:
@@ -152,7 +161,7 @@ class UpdateBrickSetService:  # noqa: WPS338
                 value=valuation.value,
                 currency=valuation.currency,
                 comment=valuation.comment,
-                likes_count=valuation.likes_count,
+                likes_count=LikeCounter().live_likes(valuation),
                 created_at=valuation.created_at,
             )
             for valuation in brickset.valuations.all()
@@ -178,4 +187,5 @@ class UpdateBrickSetService:  # noqa: WPS338
             total_likes=total_likes,
             created_at=brickset.created_at,
             updated_at=brickset.updated_at,
+            statistics=BrickSetStatisticsService.to_dto(BrickSetStatisticsService.of(brickset)),
         )
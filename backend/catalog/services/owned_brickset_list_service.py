@@ -5,17 +5,12 @@ and ordering. Includes RB-01 business rule evaluation for editable flag.
 """
 from __future__ import annotations
 
-from django.db.models import (
-    Count,
-    IntegerField,
-    QuerySet,
-    Sum,
-    Value,
-)
-from django.db.models.functions import Coalesce
+from django.db.models import QuerySet
 
 from catalog.models import BrickSet
 from datastore.domains.catalog_dto import OwnedBrickSetListItemDTO
+from valuation.services.brickset_statistics import BrickSetStatisticsService
+from valuation.services.like_counter import LikeCounter
 
 
 class OwnedBrickSetListService:  # noqa: WPS338
@@ -62,10 +57,8 @@ class OwnedBrickSetListService:  # noqa: WPS338
     def _add_aggregations(queryset: QuerySet) -> QuerySet:
         """Add annotations for valuations_count and total_likes.
 
-        Optimizations:
-        - valuations_count: Count('valuations', distinct=True)
-        - total_likes: Coalesce(Sum('valuations__likes_count'), 0)
-          to handle no valuations gracefully
+        Aggregated over the valuations, or read from BrickSetStatistics when
+        valuations are sharded (see BrickSetStatisticsService.annotate_counts).
 
         Args:
             queryset: Input QuerySet
@@ -73,15 +66,7 @@ class OwnedBrickSetListService:  # noqa: WPS338
         Returns:
             Annotated QuerySet
         """
-        queryset = queryset.annotate(
-            valuations_count=Count("valuations", distinct=True),
-            total_likes=Coalesce(
-                Sum("valuations__likes_count", output_field=IntegerField()),
-                Value(0),
-                output_field=IntegerField(),
-            ),
-        )
-        return queryset
+        return BrickSetStatisticsService.annotate_counts(queryset)
 
     def _apply_ordering(self, queryset: QuerySet, ordering: str) -> QuerySet:
         """Apply ordering by the specified field with validation.
@@ -113,7 +98,7 @@ class OwnedBrickSetListService:  # noqa: WPS338
         """
         # Get aggregation counts (with fallback for non-annotated instances)
         valuations_count = getattr(brickset, "valuations_count", 0) or 0
-        total_likes = getattr(brickset, "total_likes", 0) or 0
+        total_likes = LikeCounter().live_total_likes(brickset)
 
         # Evaluate RB-01 rule for editable flag
         editable = self._is_editable(brickset)
@@ -159,7 +144,7 @@ class OwnedBrickSetListService:  # noqa: WPS338
             user_id=brickset.owner_id,
         ).first()
 
-        if owner_valuation and owner_valuation.likes_count > 0:
+        if owner_valuation and LikeCounter().live_likes(owner_valuation) > 0:
             return False
 
         return True
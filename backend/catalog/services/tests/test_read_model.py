@@ -0,0 +1,165 @@
+"""Tests for the in-process columnar catalog read model.
+
+TransactionTestCase is required: the model follows the change log, whose
+entries only become readable once their transaction has committed.
+"""
+from __future__ import annotations
+
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TransactionTestCase, override_settings
+from model_bakery import baker
+
+from catalog.models import BrickSet, Completeness, ProductionStatus
+from catalog.read_model import CatalogReadModel, CatalogRows, _load_columns, read_model
+from catalog.services.brickset_delete_service import DeleteBrickSetService
+from catalog.services.brickset_list_service import BrickSetListService
+from datastore.domains.valuation_dto import CreateLikeCommand, CreateValuationCommand
+from valuation.models import Valuation
+from valuation.services.brickset_statistics import BrickSetStatisticsService
+from valuation.services.like_counter import LikeCounter
+from valuation.services.like_valuation_service import LikeValuationService
+from valuation.services.valuation_create_service import CreateValuationService
+
+User = get_user_model()
+_record = LikeCounter.record
+
+
+def _sync_then_record(counter: LikeCounter, valuation_id: int, delta: int) -> None:
+    """Serve a list query after the like's commit but before its counter update."""
+    read_model.query({}, "-created_at")
+    _record(counter, valuation_id, delta)
+
+
+@override_settings(CATALOG_READ_MODEL_SYNC_INTERVAL=0)
+class CatalogReadModelTests(TransactionTestCase):
+    """Test that the read model answers like the database and stays fresh."""
+
+    def setUp(self) -> None:
+        """Create bricksets with distinct aggregates."""
+        self.service = BrickSetListService()
+        self.owner = baker.make(User)
+        self.active = baker.make(
+            BrickSet,
+            owner=self.owner,
+            number=12345,
+            production_status=ProductionStatus.ACTIVE,
+            completeness=Completeness.COMPLETE,
+            has_box=True,
+            owner_initial_estimate=350,
+        )
+        self.retired = baker.make(
+            BrickSet,
+            owner=self.owner,
+            number=67890,
+            production_status=ProductionStatus.RETIRED,
+            completeness=Completeness.INCOMPLETE,
+            has_box=False,
+            owner_initial_estimate=None,
+        )
+        self.sealed = baker.make(
+            BrickSet,
+            owner=self.owner,
+            number=11234,
+            production_status=ProductionStatus.ACTIVE,
+            completeness=Completeness.COMPLETE,
+            is_factory_sealed=True,
+        )
+        baker.make(Valuation, brickset=self.active, value=400, likes_count=7, _quantity=2)
+        baker.make(Valuation, brickset=self.retired, value=200, likes_count=1)
+        BrickSetStatisticsService().rebuild()
+        self.model = CatalogReadModel()
+
+    def _from_model(self, filters: dict, ordering: str = "-created_at") -> list:
+        rows = self.model.query(filters, ordering)
+        assert isinstance(rows, CatalogRows)
+        return list(rows)
+
+    def _from_database(self, filters: dict, ordering: str = "-created_at") -> list:
+        queryset = self.service.build_queryset({**filters, "ordering": ordering})
+        return [self.service.map_to_dto(brickset) for brickset in queryset]
+
+    def test_filters_and_orderings_match_database(self) -> None:
+        """Masks and argsort return the same DTOs in the same order."""
+        cases = [
+            ({}, "-created_at"),
+            ({}, "created_at"),
+            ({}, "-valuations_count"),
+            ({}, "total_likes"),
+            ({"q": "234"}, "-created_at"),
+            ({"production_status": ProductionStatus.ACTIVE}, "-total_likes"),
+            ({"completeness": Completeness.INCOMPLETE}, "-created_at"),
+            ({"has_box": True, "is_factory_sealed": False}, "-created_at"),
+            ({"is_factory_sealed": True}, "created_at"),
+            ({}, "consensus_value"),
+            ({}, "-consensus_value"),
+            ({"min_consensus_value": 300}, "-created_at"),
+            ({"max_consensus_value": 300}, "consensus_value"),
+        ]
+
+        for filters, ordering in cases:
+            expected = self._from_database(filters, ordering)
+            assert self._from_model(filters, ordering) == expected, (filters, ordering)
+
+    def test_fresh_snapshot_is_queried_without_database(self) -> None:
+        """Pages are served from memory between syncs."""
+        self.model.query({}, "-created_at")
+
+        with override_settings(CATALOG_READ_MODEL_SYNC_INTERVAL=60), self.assertNumQueries(0):
+            rows = self.model.query({"has_box": True}, "-total_likes")
+            page = rows[:1]
+
+        assert rows.count() == 1
+        assert page[0].id == self.active.id
+        assert page[0].top_valuation.likes_count == 7
+
+    def test_writes_reload_only_touched_bricksets(self) -> None:
+        """New valuations and deletions are applied from the change log."""
+        unvalued = baker.make(BrickSet, owner=self.owner, number=55555)
+        self.model.query({}, "-created_at")
+        CreateValuationService().execute(
+            CreateValuationCommand(brickset_id=self.sealed.id, value=900),
+            baker.make(User),
+        )
+        DeleteBrickSetService().execute(unvalued.id, self.owner)
+
+        with mock.patch("catalog.read_model._load_columns", wraps=_load_columns) as load:
+            rows = self._from_model({}, "-total_likes")
+            load.assert_called_once_with({self.sealed.id, unvalued.id})
+
+        listed = [dto.id for dto in rows]
+        assert listed == [self.active.id, self.retired.id, self.sealed.id]
+        assert rows[2].top_valuation.value == 900
+
+    def test_unknown_ordering_falls_back_to_database(self) -> None:
+        """Orderings the model does not index are answered by PostgreSQL."""
+        assert self.model.query({}, "number") is None
+
+    @override_settings(CATALOG_READ_MODEL_ENABLED=True)
+    def test_service_serves_list_from_read_model(self) -> None:
+        """get_queryset returns read model rows that map_to_dto passes through."""
+        read_model.reset()
+        self.addCleanup(read_model.reset)
+
+        rows = self.service.get_queryset({"ordering": "-created_at"})
+
+        assert isinstance(rows, CatalogRows)
+        page = [self.service.map_to_dto(row) for row in rows[:3]]
+        assert page == self._from_database({})
+
+    @override_settings(CATALOG_READ_MODEL_ENABLED=True)
+    def test_like_is_listed_with_updated_counters(self) -> None:
+        """A sync between a like's commit and its counter update is repaired."""
+        read_model.reset()
+        self.addCleanup(read_model.reset)
+        read_model.query({}, "-created_at")
+        valuation = Valuation.valuations.get(brickset=self.retired)
+        command = CreateLikeCommand(valuation_id=valuation.id, user_id=baker.make(User).id)
+
+        with mock.patch.object(LikeCounter, "record", autospec=True, side_effect=_sync_then_record):
+            LikeValuationService().execute(command)
+        rows = read_model.query({"production_status": ProductionStatus.RETIRED}, "-created_at")
+
+        assert rows[0].total_likes == 2
+        assert rows[0].top_valuation.likes_count == 2
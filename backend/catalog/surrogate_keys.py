@@ -0,0 +1,26 @@
+"""Surrogate keys of cached catalog responses (see ``core.response_cache``).
+
+Every list page shows aggregates of many bricksets, so all list pages share
+one generation key that any catalog write purges. Detail pages are keyed by
+their BrickSet id and purged only when that set or its valuations change.
+"""
+from __future__ import annotations
+
+from django.http import HttpRequest
+
+LIST_KEY = "bricksets"
+
+
+def brickset_key(brickset_id: int) -> str:
+    """Return the surrogate key of one BrickSet's detail page."""
+    return f"brickset:{brickset_id}"
+
+
+def brickset_list_keys(request: HttpRequest) -> list[str]:
+    """Keys of GET /api/v1/bricksets."""
+    return [LIST_KEY]
+
+
+def brickset_detail_keys(request: HttpRequest, pk: int) -> list[str]:
+    """Keys of GET /api/v1/bricksets/{id}."""
+    return [brickset_key(pk)]
@@ -1,13 +1,19 @@
 """URL configuration for catalog app."""
 from django.urls import path
 
+from catalog.views.async_lists import AsyncBrickSetListView, AsyncOwnedBrickSetListView
 from catalog.views.brickset_list import BrickSetListView
 from catalog.views.brickset_detail_update import BrickSetDetailUpdateView
 from catalog.views.owned_brickset_list import OwnedBrickSetListView
+from core.async_views import async_get_route
 
 app_name = "catalog"
 urlpatterns = [
-    path("bricksets", BrickSetListView.as_view(), name="brickset-list"),
+    path(
+        "bricksets",
+        async_get_route(BrickSetListView.as_view(), AsyncBrickSetListView.as_view()),
+        name="brickset-list",
+    ),
     # GET detail and PATCH update on same route (DRF handles methods)
     path(
         "bricksets/<int:pk>",
@@ -17,7 +23,7 @@ urlpatterns = [
     # GET owned bricksets for authenticated user
     path(
         "users/me/bricksets",
-        OwnedBrickSetListView.as_view(),
+        async_get_route(OwnedBrickSetListView.as_view(), AsyncOwnedBrickSetListView.as_view()),
         name="owned-brickset-list",
     ),
 ]
@@ -0,0 +1,62 @@
+"""Async variants of the catalog list endpoints.
+
+Served for GET when ``settings.ASYNC_LIST_VIEWS`` is enabled (ASGI). The
+``COUNT(*)`` and the page query run concurrently on separate connections;
+filtering, ordering, DTO mapping and serialization are shared with the DRF
+views so both variants return identical payloads.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from django.http import HttpRequest
+
+from catalog.serializers.brickset_list import (
+    BrickSetFilterSerializer,
+    BrickSetListItemSerializer,
+)
+from catalog.serializers.owned_brickset_list import OwnedBrickSetListItemSerializer
+from catalog.services.brickset_list_service import BrickSetListService
+from catalog.services.owned_brickset_list_service import OwnedBrickSetListService
+from catalog.views.brickset_list import BrickSetPagination
+from catalog.views.owned_brickset_list import OwnedBrickSetPagination
+from core.async_views import AsyncReadView
+from core.pagination import PageWindowPaginator
+
+
+class AsyncBrickSetListView(AsyncReadView):
+    """Handle GET /api/v1/bricksets asynchronously (public)."""
+
+    requires_authentication = False
+    paginator = PageWindowPaginator(BrickSetPagination)
+
+    async def build_payload(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+        """Validate filters, then count and fetch the page concurrently."""
+        filter_serializer = BrickSetFilterSerializer(data=request.GET)
+        filter_serializer.is_valid(raise_exception=True)
+
+        service = BrickSetListService()
+        queryset = service.get_queryset(filter_serializer.to_filter_dict())
+        return await self.paginator.paginate_async(
+            request,
+            queryset,
+            service.map_to_dto,
+            BrickSetListItemSerializer,
+        )
+
+
+class AsyncOwnedBrickSetListView(AsyncReadView):
+    """Handle GET /api/v1/users/me/bricksets asynchronously."""
+
+    paginator = PageWindowPaginator(OwnedBrickSetPagination)
+
+    async def build_payload(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+        """Count and fetch the authenticated user's bricksets concurrently."""
+        service = OwnedBrickSetListService()
+        queryset = service.get_queryset(request.user.id, request.GET.get("ordering"))
+        return await self.paginator.paginate_async(
+            request,
+            queryset,
+            service.map_to_dto,
+            OwnedBrickSetListItemSerializer,
+        )
@@ -0,0 +1,49 @@
+"""Fast-lane handlers for the public BrickSet read endpoints.
+
+Registered in ``settings.FAST_LANE_ROUTES`` and called by
+``core.fast_lane.FastLaneMiddleware`` for anonymous JSON GET requests. They
+share services, serializers and pagination settings with the DRF views so
+responses stay identical.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from django.http import HttpRequest
+from rest_framework.exceptions import NotFound
+
+from catalog.exceptions import BrickSetNotFoundError
+from catalog.serializers.brickset_detail import BrickSetDetailSerializer
+from catalog.serializers.brickset_list import (
+    BrickSetFilterSerializer,
+    BrickSetListItemSerializer,
+)
+from catalog.services.brickset_detail_service import BrickSetDetailService
+from catalog.services.brickset_list_service import BrickSetListService
+from catalog.views.brickset_detail_update import BrickSetDetailUpdateView
+from catalog.views.brickset_list import BrickSetListView, BrickSetPagination
+from core.fast_lane import fast_lane_endpoint
+from core.pagination import PageWindowPaginator
+
+_PAGINATOR = PageWindowPaginator(BrickSetPagination)
+
+
+@fast_lane_endpoint(BrickSetListView)
+def brickset_list(request: HttpRequest) -> Any:
+    """Serve GET /api/v1/bricksets."""
+    filter_serializer = BrickSetFilterSerializer(data=request.GET)
+    filter_serializer.is_valid(raise_exception=True)
+
+    service = BrickSetListService()
+    queryset = service.get_queryset(filter_serializer.to_filter_dict())
+    return _PAGINATOR.paginate(request, queryset, service.map_to_dto, BrickSetListItemSerializer)
+
+
+@fast_lane_endpoint(BrickSetDetailUpdateView)
+def brickset_detail(request: HttpRequest, pk: int) -> Any:
+    """Serve GET /api/v1/bricksets/{id}."""
+    try:
+        brickset_dto = BrickSetDetailService().execute(pk)
+    except BrickSetNotFoundError as exc:
+        raise NotFound(exc.message) from exc
+    return BrickSetDetailSerializer(brickset_dto).data
@@ -0,0 +1,109 @@
+"""Tests for async catalog list views.
+
+TransactionTestCase is required: the count and page queries run on worker
+threads with their own connections, which cannot see data inside a test
+transaction.
+"""
+from __future__ import annotations
+
+import json
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory
+from django.urls import reverse
+from model_bakery import baker
+from rest_framework.test import APITransactionTestCase
+
+from account.services.token_provider import TokenProvider
+from catalog.models import BrickSet
+from catalog.views.async_lists import AsyncBrickSetListView, AsyncOwnedBrickSetListView
+from config import jwt_config
+
+User = get_user_model()
+
+
+class TestAsyncBrickSetListView(APITransactionTestCase):
+    """Test AsyncBrickSetListView returns the DRF payload."""
+
+    def setUp(self) -> None:
+        """Create bricksets and request factory."""
+        self.factory = RequestFactory()
+        self.url = reverse("catalog:brickset-list")
+        self.owner = baker.make(User)
+        baker.make(
+            BrickSet,
+            owner=self.owner,
+            number=iter(range(10001, 10004)),
+            _quantity=3,
+        )
+
+    def _get_async(self, params: dict) -> tuple[int, dict]:
+        request = self.factory.get(self.url, params)
+        response = async_to_sync(AsyncBrickSetListView.as_view())(request)
+        return response.status_code, json.loads(response.content)
+
+    def test_payload_matches_drf_view(self) -> None:
+        """Async payload equals the synchronous DRF payload."""
+        params = {"page_size": "2", "page": "2", "ordering": "-created_at"}
+
+        status_code, payload = self._get_async(params)
+
+        assert status_code == 200
+        assert payload == self.client.get(self.url, params).json()
+        assert payload["count"] == 3
+        assert len(payload["results"]) == 1
+
+    def test_invalid_filter_returns_validation_errors(self) -> None:
+        """Invalid filters produce the same 400 body as the DRF view."""
+        params = {"ordering": "bogus"}
+
+        status_code, payload = self._get_async(params)
+
+        assert status_code == 400
+        assert payload == self.client.get(self.url, params).json()
+
+    def test_page_out_of_range_returns_not_found(self) -> None:
+        """Page past the last returns 404 Invalid page."""
+        status_code, payload = self._get_async({"page": "5"})
+
+        assert status_code == 404
+        assert payload == {"detail": "Invalid page."}
+
+
+class TestAsyncOwnedBrickSetListView(APITransactionTestCase):
+    """Test AsyncOwnedBrickSetListView authentication and payload."""
+
+    def setUp(self) -> None:
+        """Create owner with bricksets and another user's brickset."""
+        self.factory = RequestFactory()
+        self.url = reverse("catalog:owned-brickset-list")
+        self.owner = baker.make(User)
+        baker.make(
+            BrickSet,
+            owner=self.owner,
+            number=iter(range(10001, 10003)),
+            _quantity=2,
+        )
+        baker.make(BrickSet, owner=baker.make(User), number=20001)
+
+    def test_requires_authentication(self) -> None:
+        """Anonymous request returns 401."""
+        response = async_to_sync(AsyncOwnedBrickSetListView.as_view())(self.factory.get(self.url))
+
+        assert response.status_code == 401
+
+    def test_payload_matches_drf_view(self) -> None:
+        """Authenticated payload lists only owned bricksets, same as DRF."""
+        request = self.factory.get(self.url)
+        request.COOKIES[jwt_config.COOKIE_NAME] = TokenProvider().generate_token(
+            self.owner.id, self.owner.username,
+        )
+
+        response = async_to_sync(AsyncOwnedBrickSetListView.as_view())(request)
+
+        self.client.force_authenticate(user=self.owner)
+        payload = json.loads(response.content)
+        assert response.status_code == 200
+        assert payload == self.client.get(self.url).json()
+        assert payload["count"] == 2
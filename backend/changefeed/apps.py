@@ -0,0 +1,6 @@
+from django.apps import AppConfig
+
+
+class ChangeFeedConfig(AppConfig):
+    name = "changefeed"
+    verbose_name = "Change feed"
@@ -0,0 +1,14 @@
+"""Background job handlers of the changefeed app (see ``core.job_queue``)."""
+from __future__ import annotations
+
+from typing import Any
+
+from changefeed.services.change_log import PRUNE_CHANGES_JOB, prune_changes, schedule_pruning
+from core.job_queue import job_handler
+
+
+@job_handler(PRUNE_CHANGES_JOB)
+def prune_change_log(payload: dict[str, Any]) -> None:
+    """Delete expired changes, then schedule the next run."""
+    prune_changes()
+    schedule_pruning()
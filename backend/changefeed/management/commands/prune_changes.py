@@ -0,0 +1,36 @@
+"""Delete change log rows older than CHANGE_LOG_RETENTION_DAYS.
+
+The ``changefeed.prune_changes`` job does this daily once scheduled; run
+this by hand or from cron when no worker is running:
+
+    python manage.py prune_changes
+    python manage.py prune_changes --schedule  # also start the daily job
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from changefeed.services.change_log import prune_changes, schedule_pruning
+
+
+class Command(BaseCommand):
+    """Prune the change log."""
+
+    help = "Delete change log rows older than CHANGE_LOG_RETENTION_DAYS."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command options."""
+        parser.add_argument(
+            "--schedule",
+            action="store_true",
+            help="Also enqueue the daily changefeed.prune_changes job.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Delete expired rows and report how many were removed."""
+        deleted = prune_changes()
+        if options["schedule"]:
+            schedule_pruning()
+        self.stdout.write(f"Pruned {deleted} changes.")
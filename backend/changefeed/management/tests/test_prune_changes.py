@@ -0,0 +1,37 @@
+"""Tests for prune_changes management command."""
+from __future__ import annotations
+
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from changefeed.models import Change, ChangeEntity, ChangeOperation
+from changefeed.services.change_log import PRUNE_CHANGES_JOB
+from core.models import Job
+
+
+class PruneChangesCommandTests(TestCase):
+    """Test prune_changes deletes expired rows and can start the daily job."""
+
+    def test_prunes_and_schedules(self) -> None:
+        """Rows past the retention are deleted and the job is enqueued once."""
+        change = Change.objects.create(
+            txid=1,
+            entity=ChangeEntity.BRICKSET,
+            entity_id=1,
+            operation=ChangeOperation.CREATED,
+            brickset_id=1,
+        )
+        created_at = timezone.now() - timedelta(days=30)
+        Change.objects.filter(pk=change.pk).update(created_at=created_at)
+        out = StringIO()
+
+        call_command("prune_changes", "--schedule", stdout=out)
+        call_command("prune_changes", "--schedule", stdout=StringIO())
+
+        assert not Change.objects.exists()
+        assert "Pruned 1 changes." in out.getvalue()
+        assert Job.objects.filter(name=PRUNE_CHANGES_JOB).count() == 1
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-19 05:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Change',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('txid', models.BigIntegerField(help_text='Id of the writing transaction.')),
+                ('entity', models.CharField(choices=[('brickset', 'BrickSet'), ('valuation', 'Valuation')], max_length=20)),
+                ('entity_id', models.BigIntegerField()),
+                ('operation', models.CharField(choices=[('created', 'Created'), ('updated', 'Updated'), ('deleted', 'Deleted'), ('likes_changed', 'Likes changed')], max_length=20)),
+                ('brickset_id', models.BigIntegerField(help_text='BrickSet the entity belongs to (or is).')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Change',
+                'verbose_name_plural': 'Changes',
+                'indexes': [models.Index(fields=['txid', 'id'], name='change_cursor_idx')],
+            },
+        ),
+    ]
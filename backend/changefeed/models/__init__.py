@@ -0,0 +1 @@
+from changefeed.models.change import Change, ChangeEntity, ChangeOperation
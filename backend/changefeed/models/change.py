@@ -0,0 +1,50 @@
+"""Change model.
+
+Append-only log of catalog and valuation changes, written by the write
+services in the same transaction as the change itself. Clients page through
+it with ``GET /api/v1/changes?since=<cursor>``.
+
+Rows are ordered by ``(txid, id)``, where ``txid`` is the PostgreSQL id of
+the writing transaction. Ids are allocated before commit, so ordering by id
+alone would let a client skip a row that commits after a later id was read;
+reading only transactions older than the oldest one still running (the
+snapshot ``xmin``) makes the order stable.
+"""
+
+from __future__ import annotations
+
+from django.db import models
+
+CHOICE_MAX_LENGTH = 20
+
+
+class ChangeEntity(models.TextChoices):
+    BRICKSET = "brickset", "BrickSet"
+    VALUATION = "valuation", "Valuation"
+
+
+class ChangeOperation(models.TextChoices):
+    CREATED = "created", "Created"
+    UPDATED = "updated", "Updated"
+    DELETED = "deleted", "Deleted"
+    LIKES_CHANGED = "likes_changed", "Likes changed"
+
+
+class Change(models.Model):
+    id = models.BigAutoField(primary_key=True)
+    txid = models.BigIntegerField(help_text="Id of the writing transaction.")
+    entity = models.CharField(max_length=CHOICE_MAX_LENGTH, choices=ChangeEntity.choices)
+    entity_id = models.BigIntegerField()
+    operation = models.CharField(max_length=CHOICE_MAX_LENGTH, choices=ChangeOperation.choices)
+    brickset_id = models.BigIntegerField(help_text="BrickSet the entity belongs to (or is).")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Change"
+        verbose_name_plural = "Changes"
+        indexes = [
+            models.Index(fields=["txid", "id"], name="change_cursor_idx"),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - trivial
+        return f"{self.entity} {self.entity_id} {self.operation}"
@@ -0,0 +1,7 @@
+"""Query shapes of the change feed, audited by ``manage.py index_report``."""
+from __future__ import annotations
+
+from changefeed.models import Change
+from core.index_advisor import register_query_shape
+
+register_query_shape("changefeed.changes_after_cursor", Change, "txid", "id")
@@ -0,0 +1,68 @@
+"""Serializers for the change feed endpoint."""
+from __future__ import annotations
+
+import re
+
+from rest_framework import serializers
+
+from datastore.domains.changefeed_dto import ChangeCursor, ChangeFeedQuery
+
+_CURSOR_PATTERN = re.compile(r"^(\d+)-(\d+)$")
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 500
+
+
+class ChangeFeedQuerySerializer(serializers.Serializer):
+    """Validate query parameters for GET /api/v1/changes."""
+
+    since = serializers.CharField(
+        required=False,
+        help_text="Cursor returned as next_cursor by the previous call.",
+    )
+    limit = serializers.IntegerField(
+        min_value=1,
+        max_value=MAX_LIMIT,
+        required=False,
+        help_text=f"Maximum number of changes (default {DEFAULT_LIMIT}, max {MAX_LIMIT}).",
+    )
+
+    def validate_since(self, since: str) -> ChangeCursor:
+        """Parse the opaque cursor string."""
+        match = _CURSOR_PATTERN.match(since)
+        if match is None:
+            raise serializers.ValidationError("Invalid cursor.")
+        txid, row_id = match.groups()
+        return ChangeCursor(txid=int(txid), id=int(row_id))
+
+    def to_query(self) -> ChangeFeedQuery:
+        """Build the service query from validated data."""
+        return ChangeFeedQuery(
+            since=self.validated_data.get("since"),
+            limit=self.validated_data.get("limit", DEFAULT_LIMIT),
+        )
+
+
+class ChangeSerializer(serializers.Serializer):
+    """Read-only serializer for ChangeDTO."""
+
+    entity = serializers.CharField(read_only=True, help_text="'brickset' or 'valuation'.")
+    entity_id = serializers.IntegerField(read_only=True, help_text="Id of the changed row.")
+    operation = serializers.CharField(
+        read_only=True,
+        help_text="'created', 'updated', 'deleted' or 'likes_changed'.",
+    )
+    brickset_id = serializers.IntegerField(read_only=True, help_text="BrickSet the row belongs to.")
+    changed_at = serializers.DateTimeField(read_only=True, help_text="When the change was made.")
+    likes_count = serializers.IntegerField(
+        read_only=True,
+        allow_null=True,
+        help_text="Current like count for 'likes_changed' entries.",
+    )
+
+
+class ChangeFeedPageSerializer(serializers.Serializer):
+    """Read-only serializer for ChangeFeedPageDTO."""
+
+    changes = ChangeSerializer(many=True, read_only=True)
+    next_cursor = serializers.CharField(read_only=True, help_text="Pass as 'since' on the next call.")
+    has_more = serializers.BooleanField(read_only=True, help_text="Whether to poll again right away.")
@@ -0,0 +1,3 @@
+"""Change feed services package."""
+from changefeed.services.change_feed_service import ChangeFeedService
+from changefeed.services.change_log import prune_changes, record_change, schedule_pruning
@@ -0,0 +1,93 @@
+"""Service implementing incremental reads of the change log."""
+from __future__ import annotations
+
+from django.db import models
+
+from changefeed.models import Change, ChangeEntity, ChangeOperation
+from changefeed.services.change_log import visible_horizon
+from core import sharding
+from datastore.domains.changefeed_dto import (
+    ChangeCursor,
+    ChangeDTO,
+    ChangeFeedPageDTO,
+    ChangeFeedQuery,
+)
+from valuation.models import Valuation
+from valuation.services.like_counter import LikeCounter
+
+_START = ChangeCursor(txid=0, id=0)
+
+
+class ChangeFeedService:
+    """Return the changes committed after a cursor, oldest first."""
+
+    def execute(self, query: ChangeFeedQuery) -> ChangeFeedPageDTO:
+        """Read one page of the change log.
+
+        Only changes of transactions older than every transaction still in
+        progress are returned, so a change can never appear behind a cursor
+        a client already holds. Without ``since`` the page is empty and
+        ``next_cursor`` points at the current end of the log.
+
+        Args:
+            query: ChangeFeedQuery with optional cursor and page size.
+
+        Returns:
+            ChangeFeedPageDTO with changes, next cursor and has_more flag.
+        """
+        if query.since is None:
+            cursor = self.head_cursor()
+            return ChangeFeedPageDTO(changes=[], next_cursor=cursor.encode(), has_more=False)
+
+        since = query.since
+        rows = list(self.visible_changes(since)[:query.limit + 1])
+        has_more = len(rows) > query.limit
+        rows = rows[:query.limit]
+        cursor = since
+        if rows:
+            cursor = ChangeCursor(rows[-1].txid, rows[-1].id)
+        return ChangeFeedPageDTO(
+            changes=self._build_dtos(rows),
+            next_cursor=cursor.encode(),
+            has_more=has_more,
+        )
+
+    def head_cursor(self) -> ChangeCursor:
+        """Return the cursor of the newest change safe to have read."""
+        newest_first = self._visible().order_by("-txid", "-id")
+        head = newest_first.only("txid", "id").first()
+        return _START if head is None else ChangeCursor(head.txid, head.id)
+
+    def visible_changes(self, since: ChangeCursor) -> models.QuerySet:
+        """Return the changes after ``since`` that are safe to read, oldest first."""
+        later_transactions = models.Q(txid__gt=since.txid)
+        later_in_same_transaction = models.Q(txid=since.txid, id__gt=since.id)
+        return self._visible().filter(later_transactions | later_in_same_transaction).order_by("txid", "id")
+
+    def _visible(self) -> models.QuerySet:
+        return Change.objects.filter(txid__lt=visible_horizon())
+
+    @staticmethod
+    def _build_dtos(rows: list[Change]) -> list[ChangeDTO]:
+        """Map rows to DTOs, adding current like counts in one query."""
+        liked_ids = {
+            row.entity_id
+            for row in rows
+            if row.entity == ChangeEntity.VALUATION and row.operation == ChangeOperation.LIKES_CHANGED
+        }
+        likes: dict[int, int] = {}
+        if liked_ids:
+            counter = LikeCounter()
+            valuations = sharding.filter_ids(counter.annotate_valuations(Valuation.valuations.all()), liked_ids)
+            likes = {valuation.id: counter.live_likes(valuation) for valuation in valuations}
+        return [
+            ChangeDTO(
+                entity=row.entity,
+                entity_id=row.entity_id,
+                operation=row.operation,
+                brickset_id=row.brickset_id,
+                changed_at=row.created_at,
+                likes_count=likes.get(row.entity_id) if row.operation == ChangeOperation.LIKES_CHANGED else None,
+            )
+            for row in rows
+        ]
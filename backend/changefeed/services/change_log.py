@@ -0,0 +1,89 @@
+"""Append entries to the change log from inside write transactions, and prune it.
+
+Rows are kept for ``settings.CHANGE_LOG_RETENTION_DAYS``; the
+``changefeed.prune_changes`` job deletes older ones daily. Clients whose
+cursor is older than that have to re-fetch the lists they mirror.
+"""
+from __future__ import annotations
+
+import datetime
+
+from django.conf import settings
+from django.db import connection, models
+from django.utils import timezone
+
+from changefeed.models import Change, ChangeEntity, ChangeOperation
+from core.job_queue import enqueue
+
+PRUNE_CHANGES_JOB = "changefeed.prune_changes"
+PRUNE_INTERVAL = datetime.timedelta(days=1)
+DEFAULT_RETENTION_DAYS = 7
+_PRUNE_BATCH_SIZE = 10_000
+
+
+class CurrentTransactionId(models.Func):
+    """``pg_current_xact_id()`` of the inserting transaction as a bigint."""
+
+    template = "pg_current_xact_id()::text::bigint"
+    output_field = models.BigIntegerField()
+
+
+def record_change(
+    entity: ChangeEntity,
+    entity_id: int,
+    operation: ChangeOperation,
+    brickset_id: int,
+) -> None:
+    """Log a change; call inside the transaction that makes it.
+
+    Args:
+        entity: Kind of the changed row.
+        entity_id: Primary key of the changed row.
+        operation: What happened to it.
+        brickset_id: BrickSet the row belongs to (or is).
+    """
+    Change.objects.create(
+        txid=CurrentTransactionId(),
+        entity=entity,
+        entity_id=entity_id,
+        operation=operation,
+        brickset_id=brickset_id,
+    )
+
+
+def visible_horizon() -> int:
+    """Return the oldest transaction id that may still commit."""
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint")
+        return cursor.fetchone()[0]
+
+
+def prune_changes(retention: datetime.timedelta | None = None, now: datetime.datetime | None = None) -> int:
+    """Delete changes older than ``retention``; return how many were deleted.
+
+    Only rows below the visible horizon go, so a change is never deleted
+    before every reader could have seen it. Rows are deleted in batches in
+    cursor order to keep each statement short.
+
+    Args:
+        retention: How long changes are kept; defaults to
+            ``settings.CHANGE_LOG_RETENTION_DAYS``.
+        now: Current time, for tests.
+    """
+    if retention is None:
+        retention = datetime.timedelta(days=getattr(settings, "CHANGE_LOG_RETENTION_DAYS", DEFAULT_RETENTION_DAYS))
+    expired = Change.objects.filter(
+        txid__lt=visible_horizon(),
+        created_at__lt=(now or timezone.now()) - retention,
+    ).order_by("txid", "id")
+    deleted = 0
+    while True:
+        batch = list(expired.values_list("id", flat=True)[:_PRUNE_BATCH_SIZE])
+        if not batch:
+            return deleted
+        deleted += Change.objects.filter(id__in=batch).delete()[0]
+
+
+def schedule_pruning(delay: datetime.timedelta | None = PRUNE_INTERVAL) -> None:
+    """Enqueue the next run of the change log pruning job."""
+    enqueue(PRUNE_CHANGES_JOB, dedup_key=PRUNE_CHANGES_JOB, delay=delay)
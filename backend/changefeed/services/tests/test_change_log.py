@@ -0,0 +1,40 @@
+"""Tests for change log pruning."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from changefeed.models import Change, ChangeEntity, ChangeOperation
+from changefeed.services.change_log import CurrentTransactionId, prune_changes
+
+_RETENTION = timedelta(days=7)
+
+
+class PruneChangesTests(TestCase):
+    """Test that pruning keeps recent and not yet visible changes."""
+
+    def _change(self, txid: int | CurrentTransactionId, age: timedelta) -> Change:
+        change = Change.objects.create(
+            txid=txid,
+            entity=ChangeEntity.BRICKSET,
+            entity_id=1,
+            operation=ChangeOperation.UPDATED,
+            brickset_id=1,
+        )
+        created_at = timezone.now() - age
+        Change.objects.filter(pk=change.pk).update(created_at=created_at)
+        return change
+
+    def test_deletes_only_expired_visible_changes(self) -> None:
+        """Old committed rows go; recent rows and rows of running transactions stay."""
+        self._change(1, _RETENTION * 2)
+        recent = self._change(1, timedelta(hours=1))
+        running = self._change(CurrentTransactionId(), _RETENTION * 2)
+
+        deleted = prune_changes(_RETENTION)
+
+        assert deleted == 1
+        remaining = Change.objects.values_list("pk", flat=True)
+        assert set(remaining) == {recent.pk, running.pk}
@@ -0,0 +1,13 @@
+"""URL configuration for changefeed app."""
+from django.urls import path
+
+from changefeed.views.change_feed import ChangeFeedView
+
+app_name = "changefeed"
+urlpatterns = [
+    path(
+        "changes",
+        ChangeFeedView.as_view(),
+        name="change-feed",
+    ),
+]
@@ -0,0 +1,52 @@
+"""API view for the incremental change feed."""
+from __future__ import annotations
+
+from rest_framework import status
+from rest_framework.generics import GenericAPIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from changefeed.serializers.change_feed import ChangeFeedPageSerializer, ChangeFeedQuerySerializer
+from changefeed.services import ChangeFeedService
+
+
+class ChangeFeedView(GenericAPIView):  # noqa: WPS338
+    """Handle GET /api/v1/changes."""
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = ChangeFeedPageSerializer
+
+    def get(self, request: Request) -> Response:
+        """Return the changes committed after ``since``.
+
+        Query parameters:
+        - since (string): next_cursor of the previous call; omit it to get
+          the current cursor without changes
+        - limit (int): Maximum number of changes (default 100, max 500)
+
+        Clients load their lists once, keep the returned cursor and then poll
+        with it; when has_more is true they poll again immediately.
+
+        Response body (200 OK):
+            {
+                "changes": [
+                    {
+                        "entity": "valuation",
+                        "entity_id": 77,
+                        "operation": "likes_changed",
+                        "brickset_id": 10,
+                        "changed_at": "2025-10-25T11:42:00.000Z",
+                        "likes_count": 9
+                    }
+                ],
+                "next_cursor": "81234-5678",
+                "has_more": false
+            }
+        """
+        query_serializer = ChangeFeedQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+
+        page = ChangeFeedService().execute(query_serializer.to_query())
+
+        return Response(self.get_serializer(page).data, status=status.HTTP_200_OK)
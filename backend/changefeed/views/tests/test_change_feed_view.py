@@ -0,0 +1,108 @@
+"""Tests for ChangeFeedView API endpoint.
+
+TransactionTestCase is required: changes only become visible once their
+transaction has committed and no older transaction is still running, which
+never happens inside a test transaction.
+"""
+from __future__ import annotations
+
+from django.db import transaction
+from django.urls import reverse
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APITransactionTestCase
+
+from account.models import User
+from catalog.models import BrickSet
+from changefeed.models import ChangeEntity, ChangeOperation
+from changefeed.services import record_change
+from core.rate_limit import limiter
+from valuation.models import Valuation
+
+
+class ChangeFeedViewTests(APITransactionTestCase):
+    """Test cases for GET /api/v1/changes endpoint."""
+
+    def setUp(self) -> None:
+        """Create a user, a brickset with a valuation and authenticate."""
+        limiter.reset()
+        self.url = reverse("changefeed:change-feed")
+        self.user = baker.make(User)
+        self.brickset = baker.make(BrickSet, number=10001)
+        self.valuation = baker.make(Valuation, brickset=self.brickset, value=100)
+        self.client.force_authenticate(user=self.user)
+
+    def _record(self, entity_id: int, operation: str = ChangeOperation.UPDATED) -> None:
+        with transaction.atomic():
+            record_change(ChangeEntity.BRICKSET, entity_id, operation, entity_id)
+
+    def _page(self, since: str, **params: int) -> dict:
+        return self.client.get(self.url, {"since": since, **params}).data
+
+    def test_without_cursor_returns_head(self) -> None:
+        """The first call returns no changes and a cursor past existing ones."""
+        self._record(self.brickset.id)
+
+        response = self.client.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["changes"] == []
+        cursor = response.data["next_cursor"]
+        assert self._page(cursor)["changes"] == []
+
+    def test_returns_changes_after_cursor_in_commit_order(self) -> None:
+        """Changes committed after the cursor are returned oldest first."""
+        cursor = self.client.get(self.url).data["next_cursor"]
+        self._record(self.brickset.id)
+        self._record(self.brickset.id, ChangeOperation.DELETED)
+
+        response = self.client.get(self.url, {"since": cursor})
+
+        assert [change["operation"] for change in response.data["changes"]] == ["updated", "deleted"]
+        assert response.data["changes"][0]["brickset_id"] == self.brickset.id
+        assert response.data["has_more"] is False
+
+    def test_limit_pages_through_changes(self) -> None:
+        """has_more is set until the client has caught up."""
+        cursor = self.client.get(self.url).data["next_cursor"]
+        for _ in range(3):
+            self._record(self.brickset.id)
+
+        first = self._page(cursor, limit=2)
+        second = self._page(first["next_cursor"], limit=2)
+
+        assert len(first["changes"]) == 2
+        assert first["has_more"] is True
+        assert len(second["changes"]) == 1
+        assert second["has_more"] is False
+
+    def test_like_reports_current_likes_count(self) -> None:
+        """Liking a valuation appears as likes_changed with the new count."""
+        cursor = self.client.get(self.url).data["next_cursor"]
+        like_url = reverse(
+            "valuation:valuation-like",
+            kwargs={"valuation_id": self.valuation.id},
+        )
+        self.client.post(like_url)
+
+        change = self._page(cursor)["changes"][0]
+
+        assert change["entity"] == "valuation"
+        assert change["entity_id"] == self.valuation.id
+        assert change["operation"] == "likes_changed"
+        assert change["likes_count"] == 1
+
+    def test_invalid_cursor_returns_bad_request(self) -> None:
+        """Malformed cursors are rejected."""
+        response = self.client.get(self.url, {"since": "latest"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "since" in response.data
+
+    def test_unauthenticated_request_is_rejected(self) -> None:
+        """The feed requires authentication."""
+        self.client.force_authenticate(user=None)
+
+        response = self.client.get(self.url)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -12,5 +12,9 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+# Serve list endpoints with async views (concurrent count and page queries).
+os.environ.setdefault('ASYNC_LIST_VIEWS', '1')
+# Serve the Server-Sent Events streams of live valuation updates.
+os.environ.setdefault('LIVE_EVENTS_ENABLED', '1')
 
 application = get_asgi_application()
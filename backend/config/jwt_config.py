@@ -22,3 +22,13 @@ COOKIE_MAX_AGE = EXPIRATION_SECONDS
 COOKIE_SECURE = getattr(settings, "SECURE_SSL_REDIRECT", False)  # True in production
 COOKIE_HTTP_ONLY = True
 COOKIE_SAME_SITE = "Strict"
+
+# Token revocation (logout). Each worker mirrors revoked token ids in a Bloom
+# filter and catches up with the RevokedToken table at most every
+# REVOCATION_REFRESH_SECONDS, so a revocation reaches other workers within
+# that delay. The filter is rebuilt every REVOCATION_REBUILD_SECONDS to drop
+# expired ids.
+REVOCATION_REFRESH_SECONDS = getattr(settings, "TOKEN_REVOCATION_REFRESH_SECONDS", 1.0)
+REVOCATION_REBUILD_SECONDS = 600
+REVOCATION_FILTER_CAPACITY = 100_000
+REVOCATION_FILTER_ERROR_RATE = 0.001
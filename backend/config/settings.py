@@ -11,9 +11,11 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 import os
-
+import tempfile
 from pathlib import Path
 
+from django.core.cache import DEFAULT_CACHE_ALIAS
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -43,14 +45,19 @@ INSTALLED_APPS = (
     'django.contrib.staticfiles',
     'rest_framework',
     'corsheaders',
+    'core',
     'account',
     'catalog',
     'valuation',
+    'changefeed',
 )
 
 MIDDLEWARE = (
     'django.middleware.security.SecurityMiddleware',
     'corsheaders.middleware.CorsMiddleware',
+    'core.response_cache.ResponseCacheMiddleware',
+    'core.fast_lane.FastLaneMiddleware',
+    'core.identity_map.IdentityMapMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -93,6 +100,38 @@ DATABASES = {  # noqa: WPS407
     },
 }
 
+# Valuation sharding
+# Valuations, likes and like deltas are spread over the databases below by
+# brickset_id; users, bricksets and the rest stay on 'default' (see
+# core.sharding). VALUATION_SHARD_HOSTS lists one host:port per shard, all
+# sharing the default credentials and database name; empty keeps everything
+# on 'default'. Run `manage.py migrate --database shard_N` for each shard.
+_shard_addresses = os.environ.get('VALUATION_SHARD_HOSTS', '').split(',')
+_shard_hosts = [address.partition(':') for address in _shard_addresses if address]
+VALUATION_SHARDS = tuple(f'shard_{index}' for index in range(len(_shard_hosts)))
+DATABASES.update({
+    alias: {**DATABASES['default'], 'HOST': host, 'PORT': port or '5432'}
+    for alias, (host, _, port) in zip(VALUATION_SHARDS, _shard_hosts)
+})
+DATABASE_ROUTERS = ['core.sharding.ShardRouter']
+
+
+# Password hashing
+# Hashers read their cost from the settings below (see `manage.py
+# calibrate_hasher`); hashes made with another cost are upgraded on login.
+# Hashing runs on a bounded pool so login bursts cannot take every core.
+PASSWORD_HASHERS = (
+    'account.hashers.CalibratedPBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'account.hashers.CalibratedScryptPasswordHasher',
+)
+PASSWORD_PBKDF2_ITERATIONS = int(os.environ.get('PASSWORD_PBKDF2_ITERATIONS', '0'))  # noqa: WPS226
+PASSWORD_SCRYPT_WORK_FACTOR = int(os.environ.get('PASSWORD_SCRYPT_WORK_FACTOR', '0'))
+PASSWORD_HASHING_WORKERS = int(os.environ.get('PASSWORD_HASHING_WORKERS', '2'))
+PASSWORD_HASHING_MAX_PENDING = int(os.environ.get('PASSWORD_HASHING_MAX_PENDING', '32'))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -142,11 +181,145 @@ REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'account.authentication.JWTCookieAuthentication',
     ],
+    # Sliding-window limits shared by all workers (core.throttling).
+    'DEFAULT_THROTTLE_RATES': {
+        'login': os.environ.get('THROTTLE_LOGIN', '20/min'),
+        'login_username': os.environ.get('THROTTLE_LOGIN_USERNAME', '10/min'),
+        'valuation_create': os.environ.get('THROTTLE_VALUATION_CREATE', '30/min'),
+        'like': os.environ.get('THROTTLE_LIKE', '60/min'),
+    },
 }
+RATE_LIMIT_ENABLED = os.environ.get('RATE_LIMIT_ENABLED', '1') == '1'  # noqa: WPS226
+# 'database' shares counters across hosts; 'cache' keeps them in the shared
+# memory cache (per host, no query per request).
+RATE_LIMIT_STORE = os.environ.get('RATE_LIMIT_STORE', 'database')
+RATE_LIMIT_CACHE_ALIAS = 'default'
 
 # Custom user model
 AUTH_USER_MODEL = "account.User"
 
+# Async list views
+# GET list endpoints are served by async views that run the COUNT(*) and the
+# page query concurrently. Enabled by config/asgi.py; WSGI keeps the DRF views.
+ASYNC_LIST_VIEWS = os.environ.get('ASYNC_LIST_VIEWS', '0') == '1'
+
+# Live events
+# GET /bricksets/{id}/events streams new valuations and like counts as
+# Server-Sent Events, fed by one LISTEN connection per process (see
+# core.live_events). Enabled by config/asgi.py; under WSGI each stream would
+# hold a worker thread.
+LIVE_EVENTS_ENABLED = os.environ.get('LIVE_EVENTS_ENABLED', '0') == '1'
+LIVE_EVENTS_HEARTBEAT = int(os.environ.get('LIVE_EVENTS_HEARTBEAT', '15'))
+
+# Fast lane
+# Anonymous JSON GETs on the routes below are answered by FastLaneMiddleware
+# right after security/CORS, skipping the remaining middleware and DRF dispatch.
+# Off unless FAST_LANE_ENABLED=1, since it bypasses the DRF middleware stack.
+FAST_LANE_ENABLED = os.environ.get('FAST_LANE_ENABLED', '0') == '1'
+FAST_LANE_ROUTES = {
+    'catalog:brickset-list': 'catalog.views.fast_lane.brickset_list',
+    'catalog:brickset-detail': 'catalog.views.fast_lane.brickset_detail',
+}
+
+# Caches
+# Memory-mapped files shared by every worker process of the host (see
+# core.shared_memory_cache). 'default' holds small values such as rate-limit
+# counters; 'principals' holds authenticated users and is cleared wholesale
+# when a node missed invalidations, so it must not share a file with the
+# counters; 'responses' has slots large enough for whole list pages.
+SHARED_CACHE_DIR = os.environ.get(
+    'SHARED_CACHE_DIR',
+    '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir(),  # noqa: S108
+)
+SHARED_CACHE_SIZE = int(os.environ.get('SHARED_CACHE_SIZE', '16777216'))  # 16 MiB
+SHARED_PRINCIPAL_CACHE_SIZE = int(os.environ.get('SHARED_PRINCIPAL_CACHE_SIZE', '4194304'))  # 4 MiB
+SHARED_RESPONSE_CACHE_SIZE = int(os.environ.get('SHARED_RESPONSE_CACHE_SIZE', '33554432'))  # 32 MiB
+SHARED_RESPONSE_SLOT_SIZE = 65536  # 64 KiB
+_SHARED_CACHES = (
+    # alias, size, slot size, ways
+    (DEFAULT_CACHE_ALIAS, SHARED_CACHE_SIZE, 1024, 8),
+    ('principals', SHARED_PRINCIPAL_CACHE_SIZE, 1024, 8),
+    ('responses', SHARED_RESPONSE_CACHE_SIZE, SHARED_RESPONSE_SLOT_SIZE, 4),
+)
+CACHES = {
+    alias: {
+        'BACKEND': 'core.shared_memory_cache.SharedMemoryCache',
+        'LOCATION': os.path.join(SHARED_CACHE_DIR, f'bricks-valuation-{alias}'),
+        'OPTIONS': {'SIZE': size, 'SLOT_SIZE': slot_size, 'WAYS': ways},
+    }
+    for alias, size, slot_size, ways in _SHARED_CACHES
+}
+# Writes evict cache entries on every node through PostgreSQL NOTIFY; run
+# `manage.py listen_invalidations` once per node (see core.invalidation).
+CACHE_INVALIDATION_BROADCAST = os.environ.get('CACHE_INVALIDATION_BROADCAST', '1') == '1'
+CACHE_NODE_ID = os.environ.get('CACHE_NODE_ID', '')
+# Cache authenticated users for this many seconds (0 disables); User writes evict.
+PRINCIPAL_CACHE_TTL = int(os.environ.get('PRINCIPAL_CACHE_TTL', '0'))
+PRINCIPAL_CACHE_ALIAS = 'principals'
+
+# Response cache
+# Full responses of anonymous GETs on the routes below are cached and purged
+# by surrogate key (see core.response_cache). The route value returns the
+# keys of a request. Entries are fresh for RESPONSE_CACHE_TTL seconds, then
+# served stale while one request rebuilds them for RESPONSE_CACHE_STALE_TTL.
+RESPONSE_CACHE_ENABLED = os.environ.get('RESPONSE_CACHE_ENABLED', '0') == '1'
+RESPONSE_CACHE_ALIAS = 'responses'
+RESPONSE_CACHE_TTL = int(os.environ.get('RESPONSE_CACHE_TTL', '30'))
+RESPONSE_CACHE_STALE_TTL = int(os.environ.get('RESPONSE_CACHE_STALE_TTL', '300'))
+RESPONSE_CACHE_ROUTES = {
+    'catalog:brickset-list': 'catalog.surrogate_keys.brickset_list_keys',
+    'catalog:brickset-detail': 'catalog.surrogate_keys.brickset_detail_keys',
+}
+
+# Change feed
+# Change log rows older than this are deleted daily by the
+# changefeed.prune_changes job (`manage.py prune_changes --schedule` starts it).
+CHANGE_LOG_RETENTION_DAYS = int(os.environ.get('CHANGE_LOG_RETENTION_DAYS', '7'))
+
+# Catalog read model
+# Each worker answers GET /bricksets from NumPy column arrays of the whole
+# catalog (see catalog.read_model). The change log is polled at most every
+# SYNC_INTERVAL seconds; everything is reloaded every RELOAD_INTERVAL seconds.
+CATALOG_READ_MODEL_ENABLED = os.environ.get('CATALOG_READ_MODEL_ENABLED', '0') == '1'
+CATALOG_READ_MODEL_SYNC_INTERVAL = float(os.environ.get('CATALOG_READ_MODEL_SYNC_INTERVAL', '1'))
+CATALOG_READ_MODEL_RELOAD_INTERVAL = float(os.environ.get('CATALOG_READ_MODEL_RELOAD_INTERVAL', '300'))
+
+# Like counters
+# 'sync' updates Valuation.likes_count on every like/unlike. 'buffered' appends
+# deltas to LikeCountDelta and `manage.py flush_like_deltas` folds them in
+# batches; reads add pending deltas so displayed counts stay exact.
+LIKE_COUNTER_MODE = os.environ.get('LIKE_COUNTER_MODE', 'sync')
+
+# Table storage
+# Storage parameters of model tables, applied by the AlterStorageParameters
+# migration operation and re-applied by `manage.py apply_storage_parameters`
+# (see core.storage). Valuation rows are updated in place (likes_count, edits):
+# free space left by fillfactor keeps new row versions on their page. Likes are
+# only inserted and deleted; vacuuming after fewer changes keeps the visibility
+# map current for the index-only scans of like_valuation_created_idx.
+TABLE_STORAGE_PARAMETERS = {
+    'valuation.Valuation': {
+        'fillfactor': int(os.environ.get('VALUATION_FILLFACTOR', '85')),
+        'autovacuum_vacuum_scale_factor': float(os.environ.get('VALUATION_AUTOVACUUM_SCALE_FACTOR', '0.02')),
+        'autovacuum_analyze_scale_factor': float(os.environ.get('VALUATION_AUTOANALYZE_SCALE_FACTOR', '0.05')),
+    },
+    'valuation.Like': {
+        'fillfactor': int(os.environ.get('LIKE_FILLFACTOR', '100')),
+        'autovacuum_vacuum_scale_factor': float(os.environ.get('LIKE_AUTOVACUUM_SCALE_FACTOR', '0.05')),
+        'autovacuum_vacuum_insert_scale_factor': float(
+            os.environ.get('LIKE_AUTOVACUUM_INSERT_SCALE_FACTOR', '0.05'),
+        ),
+    },
+}
+
+# Table partitioning
+# Models that `manage.py partition_table` may convert to monthly created_at
+# range partitions (see core.partitioning). Once converted, the
+# core.maintain_partitions job keeps PARTITION_MONTHS_AHEAD months of empty
+# partitions ahead of time.
+PARTITIONED_MODELS = ('valuation.Like',)
+PARTITION_MONTHS_AHEAD = int(os.environ.get('PARTITION_MONTHS_AHEAD', '3'))
+
 
 # CORS Configuration
 # Allow requests from frontend development server
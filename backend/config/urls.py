@@ -17,9 +17,12 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import include, path
 
+API_PREFIX = 'api/v1/'
+
 urlpatterns = [
     path('admin/', admin.site.urls),
-    path('api/v1/', include('account.urls')),
-    path('api/v1/', include('catalog.urls')),
-    path('api/v1/', include('valuation.urls')),
+    path(API_PREFIX, include('account.urls')),
+    path(API_PREFIX, include('catalog.urls')),
+    path(API_PREFIX, include('valuation.urls')),
+    path(API_PREFIX, include('changefeed.urls')),
 ]
@@ -0,0 +1 @@
+"""Cross-cutting infrastructure shared by the domain apps."""
@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
+
+
+class CoreConfig(AppConfig):
+    name = "core"
+    verbose_name = "Core"
+
+    def ready(self) -> None:
+        # Register job handlers, event subscribers, cache invalidation
+        # handlers and index audit query shapes declared by each app.
+        autodiscover_modules("jobs", "event_handlers", "invalidation_handlers", "query_shapes")
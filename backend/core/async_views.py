@@ -0,0 +1,124 @@
+"""Async read-only views that reuse the DRF contract without DRF's sync stack.
+
+DRF ``APIView.dispatch`` is synchronous, so the list endpoints cannot await
+ORM work. ``AsyncReadView`` keeps the pieces that define the response
+contract - configured authentication classes, ``IsAuthenticated`` semantics,
+``APIException`` to JSON mapping and ``JSONRenderer`` output - and lets
+subclasses await concurrent queries.
+
+``async_get_route`` mounts such a view next to the existing DRF view on the
+same URL: GET goes to the async view, every other method to the DRF view.
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from typing import Any
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import exceptions, status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+_DETAIL_KEY = "detail"
+
+
+class AsyncReadView(View, ABC):
+    """Base class for async GET endpoints returning DRF-compatible JSON.
+
+    Subclasses implement :meth:`build_payload` and may raise any DRF
+    ``APIException`` (``ValidationError``, ``NotFound``...) to produce the same
+    error bodies the DRF views return.
+    """
+
+    http_method_names = ("get",)
+    requires_authentication = True
+
+    async def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        """Authenticate, build the payload and render it as JSON."""
+        try:
+            payload = await self._handle(request, *args, **kwargs)
+        except exceptions.APIException as exc:
+            return self._render_exception(exc)
+        return self.render(payload, status.HTTP_200_OK)
+
+    @abstractmethod
+    async def build_payload(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+        """Return the response body for a successful request."""
+
+    @staticmethod
+    def render(payload: Any, status_code: int) -> HttpResponse:
+        """Render ``payload`` exactly like DRF's ``JSONRenderer`` would."""
+        return render_json(payload, status_code)
+
+    async def _handle(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+        request.user = await self._authenticate(request)
+        if self.requires_authentication and not request.user.is_authenticated:
+            raise exceptions.NotAuthenticated()
+        return await self.build_payload(request, *args, **kwargs)
+
+    @staticmethod
+    async def _authenticate(request: HttpRequest) -> Any:
+        drf_request = Request(
+            request,
+            authenticators=[auth() for auth in api_settings.DEFAULT_AUTHENTICATION_CLASSES],
+        )
+        return await sync_to_async(lambda: drf_request.user)()
+
+    @staticmethod
+    def _render_exception(exc: exceptions.APIException) -> HttpResponse:
+        return render_exception(exc)
+
+
+def render_json(payload: Any, status_code: int) -> HttpResponse:
+    """Render ``payload`` exactly like DRF's ``JSONRenderer`` would."""
+    response = HttpResponse(
+        JSONRenderer().render(payload),
+        status=status_code,
+        content_type="application/json",
+    )
+    response["Vary"] = "Accept"
+    return response
+
+
+def exception_payload(exc: exceptions.APIException) -> Any:
+    """Return the body DRF's exception handler sends for ``exc``."""
+    if isinstance(exc.detail, (list, dict)):
+        return exc.detail
+    return {_DETAIL_KEY: exc.detail}
+
+
+def render_exception(exc: exceptions.APIException) -> HttpResponse:
+    """Render ``exc`` with the status, body and headers DRF would use."""
+    response = render_json(exception_payload(exc), exc.status_code)
+    if exc.status_code == status.HTTP_401_UNAUTHORIZED:
+        response["WWW-Authenticate"] = "Bearer"
+    return response
+
+
+def async_get_route(
+    sync_view: Callable[..., HttpResponse],
+    async_view: Callable[..., Any],
+) -> Callable[..., Any]:
+    """Route GET to ``async_view`` and other methods to ``sync_view``.
+
+    Only active when ``settings.ASYNC_LIST_VIEWS`` is enabled (set by
+    ``config/asgi.py``); otherwise the DRF view is returned unchanged so WSGI
+    deployments keep the plain synchronous stack.
+    """
+    if not getattr(settings, "ASYNC_LIST_VIEWS", False):
+        return sync_view
+
+    delegate = sync_to_async(sync_view)
+
+    async def route(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:  # noqa: WPS430
+        if request.method == "GET":
+            return await async_view(request, *args, **kwargs)
+        return await delegate(request, *args, **kwargs)
+
+    return csrf_exempt(route)
@@ -0,0 +1,53 @@
+"""Fixed-size Bloom filter for in-process membership fast paths.
+
+``might_contain`` never returns ``False`` for an added key; it returns ``True``
+for an absent key with probability close to the configured ``error_rate``
+while at most ``capacity`` keys have been added. Keys cannot be removed;
+rebuild the filter to drop them.
+"""
+from __future__ import annotations
+
+import hashlib
+import math
+
+_BITS_PER_BYTE = 8
+_HALF_DIGEST = 8
+_LN2 = math.log(2)
+
+
+class BloomFilter:
+    """Bit array probed at ``hash_count`` positions per key (double hashing)."""
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        """Size the bit array for ``capacity`` keys at ``error_rate``."""
+        capacity = max(1, capacity)
+        self.capacity = capacity
+        bits = -capacity * math.log(error_rate) / _LN2 ** 2
+        self.size = max(_BITS_PER_BYTE, math.ceil(bits))
+        self.hash_count = max(1, round(self.size / capacity * _LN2))
+        self.count = 0
+        self._bits = bytearray(math.ceil(self.size / _BITS_PER_BYTE))
+
+    def add(self, key: str) -> None:
+        """Insert ``key``; ``count`` only grows for keys not already present."""
+        if self.might_contain(key):
+            return
+        for position in self._positions(key):
+            self._bits[position // _BITS_PER_BYTE] |= 1 << (position % _BITS_PER_BYTE)
+        self.count += 1
+
+    def might_contain(self, key: str) -> bool:
+        """Return ``False`` if ``key`` was certainly never added."""
+        return all(
+            self._bits[position // _BITS_PER_BYTE] & (1 << (position % _BITS_PER_BYTE))
+            for position in self._positions(key)
+        )
+
+    def _positions(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=_HALF_DIGEST * 2).digest()
+        first = int.from_bytes(digest[:_HALF_DIGEST], "little")
+        second = int.from_bytes(digest[_HALF_DIGEST:], "little") | 1
+        return [
+            (first + index * second) % self.size
+            for index in range(self.hash_count)
+        ]
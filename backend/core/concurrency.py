@@ -0,0 +1,58 @@
+"""Helpers for running ORM work concurrently from async views.
+
+Django binds database connections to threads. Async ORM calls and
+``sync_to_async`` with the default ``thread_sensitive=True`` all funnel into
+one thread and therefore one connection, so independent queries still run one
+after the other. ``run_isolated`` executes the callable in a pooled worker
+thread instead, which gives it its own connection and lets several queries be
+in flight at the same time.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
+
+ReturnT = TypeVar("ReturnT")
+
+
+async def run_isolated(func: Callable[..., ReturnT], *args: Any) -> ReturnT:
+    """Run ``func(*args)`` in a worker thread with its own DB connection.
+
+    The connection is released afterwards according to ``CONN_MAX_AGE`` so
+    pooled threads do not keep idle connections open when persistent
+    connections are disabled.
+
+    Args:
+        func: Synchronous callable performing ORM work.
+        *args: Positional arguments passed to ``func``.
+
+    Returns:
+        Whatever ``func`` returns.
+    """
+    return await sync_to_async(_call_and_release, thread_sensitive=False)(func, *args)
+
+
+async def gather_in_order(*awaitables: Awaitable[Any]) -> list[Any]:
+    """Await all awaitables concurrently and re-raise failures in argument order.
+
+    ``asyncio.gather`` surfaces whichever exception happens first in time.
+    Checking outcomes in argument order keeps error precedence identical to
+    the sequential code path (e.g. a missing parent object wins over an
+    invalid page number).
+    """
+    outcomes = await asyncio.gather(*awaitables, return_exceptions=True)
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            raise outcome
+    return outcomes
+
+
+def _call_and_release(func: Callable[..., ReturnT], *args: Any) -> ReturnT:
+    try:  # noqa: WPS501
+        return func(*args)
+    finally:
+        close_old_connections()
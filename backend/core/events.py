@@ -0,0 +1,164 @@
+"""In-process domain event bus dispatched after commit.
+
+Services call :func:`publish` with typed events (frozen dataclasses deriving from
+:class:`DomainEvent`) inside their transaction. Nothing runs until the
+transaction commits, so handlers never extend the lock hold time of the write
+path; if it rolls back, the events are dropped. All events published at the
+same savepoint level are delivered as one batch, and each handler is called
+once per batch with the events it subscribed to, in publish order.
+
+Handlers are registered in an app's ``event_handlers`` module (autodiscovered
+by ``CoreConfig``) with :func:`subscribe`:
+
+- synchronous delivery (default) calls the handler right after commit, in the
+  committing thread;
+- deferred delivery (``deferred=True``) enqueues a ``core.deliver_events`` job
+  so ``run_worker`` calls the handler instead. Event fields must then be
+  JSON-serializable.
+
+A failing synchronous handler is logged and does not affect other handlers or
+the already committed request.
+"""
+from __future__ import annotations
+
+import dataclasses
+import logging
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from asgiref.local import Local
+from django.db import connection, transaction
+from django.utils.module_loading import import_string
+
+from core.job_queue import enqueue, job_handler
+
+logger = logging.getLogger(__name__)
+
+DELIVER_EVENTS_JOB = "core.deliver_events"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class DomainEvent:
+    """Base class of events published through the bus."""
+
+
+EventHandler = Callable[[list[DomainEvent]], None]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _Subscription:
+    handler: EventHandler
+    event_types: tuple[type[DomainEvent], ...]
+    deferred: bool
+
+    @property
+    def path(self) -> str:
+        return _dotted_path(self.handler)
+
+
+@dataclasses.dataclass(slots=True)
+class _Batch:
+    """Events of one savepoint level; called by ``on_commit`` to deliver them."""
+
+    bus: EventBus
+    level: tuple[str, ...]
+    events: list[DomainEvent] = dataclasses.field(default_factory=list)
+
+    def __call__(self) -> None:
+        self.bus.pending().pop(self.level, None)
+        self.bus.dispatch(self.events)
+
+
+class EventBus:
+    """Registry of subscriptions plus the per-connection pending batches."""
+
+    def __init__(self) -> None:
+        """Start with no subscribers."""
+        self._subscriptions: dict[str, _Subscription] = {}
+        self._local = Local()
+
+    def subscribe(
+        self,
+        *event_types: type[DomainEvent],
+        deferred: bool = False,
+    ) -> Callable[[EventHandler], EventHandler]:
+        """Register the decorated function for batches of ``event_types``."""
+        def decorator(handler: EventHandler) -> EventHandler:
+            subscription = _Subscription(handler, event_types, deferred)
+            self._subscriptions[subscription.path] = subscription
+            return handler
+        return decorator
+
+    def publish(self, event: DomainEvent) -> None:
+        """Queue ``event`` for delivery once the current transaction commits.
+
+        Outside a transaction the event is delivered immediately.
+        """
+        if not connection.in_atomic_block:
+            self.dispatch([event])
+            return
+        level = tuple(connection.savepoint_ids)
+        batch = self.pending().get(level)
+        if batch is None or not self._is_registered(batch):
+            batch = _Batch(self, level)
+            self.pending()[level] = batch
+            transaction.on_commit(batch)
+        batch.events.append(event)
+
+    def dispatch(self, events: Sequence[DomainEvent]) -> None:
+        """Deliver committed ``events`` to every matching subscriber."""
+        for subscription in list(self._subscriptions.values()):
+            matching = [event for event in events if isinstance(event, subscription.event_types)]
+            if not matching:
+                continue
+            if subscription.deferred:
+                enqueue(DELIVER_EVENTS_JOB, self._serialize(subscription, matching))
+                continue
+            try:
+                subscription.handler(matching)
+            except Exception:
+                logger.exception("Event handler %s failed", subscription.path)
+
+    def deliver(self, payload: dict[str, Any]) -> None:
+        """Call a deferred subscriber with events serialized by :meth:`dispatch`."""
+        subscription = self._subscriptions[payload["handler"]]
+        subscription.handler([
+            import_string(entry["type"])(**entry["fields"])
+            for entry in payload["events"]
+        ])
+
+    def pending(self) -> dict[tuple[str, ...], _Batch]:
+        """Uncommitted batches of the current connection, by savepoint level."""
+        if not hasattr(self._local, "batches"):
+            self._local.batches = {}
+        return self._local.batches
+
+    @staticmethod
+    def _is_registered(batch: _Batch) -> bool:
+        # A rollback discards the on_commit hook together with the batch's events.
+        return any(hook[1] is batch for hook in connection.run_on_commit)
+
+    @staticmethod
+    def _serialize(subscription: _Subscription, events: list[DomainEvent]) -> dict[str, Any]:
+        return {
+            "handler": subscription.path,
+            "events": [
+                {"type": _dotted_path(type(event)), "fields": dataclasses.asdict(event)}
+                for event in events
+            ],
+        }
+
+
+bus = EventBus()
+subscribe = bus.subscribe
+publish = bus.publish
+
+
+@job_handler(DELIVER_EVENTS_JOB)
+def deliver_deferred(payload: dict[str, Any]) -> None:
+    """Run a deferred subscriber from the job queue."""
+    bus.deliver(payload)
+
+
+def _dotted_path(obj: Any) -> str:
+    return f"{obj.__module__}.{obj.__qualname__}"
@@ -0,0 +1,100 @@
+"""Fast-lane routing for hot, public, read-only endpoints.
+
+``FastLaneMiddleware`` sits right after the security and CORS middleware and
+answers anonymous JSON GET requests for the routes listed in
+``settings.FAST_LANE_ROUTES`` directly. Sessions, CSRF, authentication,
+messages, clickjacking middleware and DRF dispatch (content negotiation,
+authenticator and permission instantiation, browsable renderer) are skipped.
+
+Any request the fast lane cannot answer byte for byte like the DRF view -
+non-GET, carrying the JWT cookie, asking for HTML or a ``format`` override,
+or using Accept parameters such as ``indent`` - falls through to the full
+stack.
+"""
+from __future__ import annotations
+
+import functools
+from collections.abc import Callable
+from typing import Any
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from django.urls import Resolver404, resolve
+from django.utils.module_loading import import_string
+from rest_framework import exceptions, status
+from rest_framework.views import APIView
+
+from config import jwt_config
+from core.async_views import exception_payload, render_exception, render_json
+
+FastLaneHandler = Callable[..., HttpResponse]
+
+_FORMAT_PARAM = "format"
+
+
+class FastLaneMiddleware:
+    """Serve registered public GET endpoints without the rest of the stack."""
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        """Import the handlers registered in ``settings.FAST_LANE_ROUTES``."""
+        self.get_response = get_response
+        self._handlers: dict[str, FastLaneHandler] = {
+            route_name: import_string(dotted_path)
+            for route_name, dotted_path in getattr(settings, "FAST_LANE_ROUTES", {}).items()
+        }
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Dispatch to a fast-lane handler or continue down the middleware chain."""
+        if not self._is_eligible(request):
+            return self.get_response(request)
+        try:
+            match = resolve(request.path_info)
+        except Resolver404:
+            return self.get_response(request)
+        handler = self._handlers.get(match.view_name)
+        if handler is None:
+            return self.get_response(request)
+        return handler(request, *match.args, **match.kwargs)
+
+    def _is_eligible(self, request: HttpRequest) -> bool:
+        if not getattr(settings, "FAST_LANE_ENABLED", False) or not self._handlers:
+            return False
+        if request.method != "GET" or jwt_config.COOKIE_NAME in request.COOKIES:
+            return False
+        if _FORMAT_PARAM in request.GET:
+            return False
+        accept = request.headers.get("Accept", "")
+        return "html" not in accept and ";" not in accept
+
+
+def fast_lane_endpoint(view_class: type[APIView]) -> Callable[[FastLaneHandler], FastLaneHandler]:
+    """Wrap a handler so its responses carry the same headers as ``view_class``.
+
+    The handler returns the payload (or raises a DRF ``APIException``); the
+    wrapper renders it with the ``core.async_views`` helpers and adds the
+    ``Allow`` header of the DRF view plus the headers normally set by the
+    skipped middleware.
+    """
+    view = view_class()
+    view.setup(None)  # adds the implicit HEAD handler, as as_view() does
+    allow = ", ".join(view.allowed_methods)
+
+    def decorator(handler: Callable[..., Any]) -> FastLaneHandler:
+        @functools.wraps(handler)
+        def wrapper(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+            try:
+                payload = handler(request, *args, **kwargs)
+            except exceptions.APIException as exc:
+                return _with_stack_headers(render_exception(exc), exception_payload(exc), allow)
+            return _with_stack_headers(render_json(payload, status.HTTP_200_OK), payload, allow)
+        return wrapper
+    return decorator
+
+
+def _with_stack_headers(response: HttpResponse, payload: Any, allow: str) -> HttpResponse:
+    """Add the headers the DRF view and the skipped middleware would set."""
+    response["Allow"] = allow
+    response["X-Frame-Options"] = getattr(settings, "X_FRAME_OPTIONS", "DENY").upper()
+    response["Content-Length"] = str(len(response.content))
+    response.data = payload  # parity with rest_framework.response.Response for API test clients
+    return response
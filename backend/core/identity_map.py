@@ -0,0 +1,114 @@
+"""Request-scoped identity map of rows already loaded in this request.
+
+``IdentityMapMiddleware`` opens a map for each request and discards it when
+the response is returned. While it is open, :func:`load` returns the instance
+loaded earlier in the same request for the same model and primary key instead
+of querying again - e.g. the ``User`` loaded by ``JWTCookieAuthentication``
+is reused by ``UserProfileService``. Outside a request (management commands,
+job handlers, tests calling services directly) :func:`load` simply queries.
+
+Writes invalidate entries: ``save()`` and ``delete()`` through the
+``post_save``/``post_delete`` signals, and bulk ``QuerySet.update()`` calls
+by explicit :func:`evict`. Only whole rows loaded through :func:`load` are
+stored, so deferred-field instances never leak into other services.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any, TypeVar
+
+from asgiref.local import Local
+from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.http import HttpRequest, HttpResponse
+
+ModelT = TypeVar("ModelT", bound=models.Model)
+
+_Key = tuple[str, Any]
+
+
+class IdentityMap:
+    """Instances keyed by model label and primary key, per request context."""
+
+    def __init__(self) -> None:
+        """Start with no open scope."""
+        self._local = Local()
+
+    @contextmanager
+    def scope(self) -> Iterator[None]:
+        """Open a map for the enclosed block; nested scopes share the outer one."""
+        if self._entries() is not None:
+            yield
+            return
+        self._local.entries = {}
+        try:
+            yield
+        finally:
+            del self._local.entries  # noqa: WPS420
+
+    @property
+    def active(self) -> bool:
+        """Whether a scope is open in the current context."""
+        return self._entries() is not None
+
+    def load(self, model: type[ModelT], pk: Any) -> ModelT:
+        """Return the row of ``model`` with ``pk``, querying only on a miss.
+
+        Raises:
+            model.DoesNotExist: If no such row exists.
+        """
+        entries = self._entries()
+        key = _key(model, pk)
+        if entries is not None and key in entries:
+            return entries[key]
+        # The pk hint lets core.sharding route rows of sharded models.
+        instance = model._default_manager.db_manager(hints={"pk": pk}).get(pk=pk)
+        if entries is not None:
+            entries[key] = instance
+        return instance
+
+    def add(self, instance: models.Model) -> None:
+        """Remember a whole row loaded elsewhere (e.g. from a shared cache)."""
+        entries = self._entries()
+        if entries is not None:
+            entries[_key(type(instance), instance.pk)] = instance
+
+    def evict(self, model: type[models.Model], pk: Any) -> None:
+        """Drop the cached row of ``model`` with ``pk`` (after a bulk update)."""
+        entries = self._entries()
+        if entries is not None:
+            entries.pop(_key(model, pk), None)
+
+    def _entries(self) -> dict[_Key, models.Model] | None:
+        return getattr(self._local, "entries", None)
+
+    def _on_write(self, sender: type[models.Model], instance: models.Model, **kwargs: Any) -> None:
+        self.evict(sender, instance.pk)
+
+
+class IdentityMapMiddleware:
+    """Open an identity map for the duration of each request."""
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        """Store the next handler of the chain."""
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Run the rest of the stack inside a fresh scope."""
+        with identity_map.scope():
+            return self.get_response(request)
+
+
+def _key(model: type[models.Model], pk: Any) -> _Key:
+    # Proxy and concrete models share rows, so key by the concrete model.
+    return model._meta.concrete_model._meta.label_lower, model._meta.pk.to_python(pk)
+
+
+identity_map = IdentityMap()
+load = identity_map.load
+add = identity_map.add
+evict = identity_map.evict
+
+post_save.connect(identity_map._on_write, dispatch_uid="core.identity_map.post_save")
+post_delete.connect(identity_map._on_write, dispatch_uid="core.identity_map.post_delete")
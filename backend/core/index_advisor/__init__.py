@@ -0,0 +1,22 @@
+"""Audit of PostgreSQL indexes against the query shapes services issue.
+
+Apps declare the shapes of their hot queries in a ``query_shapes`` module
+(autodiscovered by ``CoreConfig``) with :func:`register_query_shape`: the
+model and the fields an index must lead with, in filter-then-order order
+(``"-created_at"`` for descending). :func:`build_report` then compares the
+indexes of every model table, read from ``pg_index`` and
+``pg_stat_user_indexes``, with those shapes:
+
+- redundant: the key columns are a leading prefix of another index on the
+  same table (e.g. ``like_user_idx`` under ``like_unique_user_valuation``);
+- unused: scanned at most ``max_scans`` times since statistics were reset,
+  not backing a constraint and not serving a declared shape;
+- missing: no index leads with a declared shape's columns.
+
+:func:`render_migration` turns the findings of one app into a migration
+stub using concurrent index operations.
+"""
+from core.index_advisor.indexes import IndexInfo, collect_indexes
+from core.index_advisor.migration import findings_by_app, render_migration, stub_migration_name
+from core.index_advisor.report import MISSING, REDUNDANT, UNUSED, Finding, IndexReport, build_report
+from core.index_advisor.shapes import KeyColumn, QueryShape, query_shapes, register_query_shape
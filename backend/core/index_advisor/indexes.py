@@ -0,0 +1,122 @@
+"""Indexes of the model tables and the statements touching them, from PostgreSQL."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from django.apps import apps
+from django.db import connection
+
+from core.index_advisor.shapes import KeyColumn, QueryShape
+
+# Key count, columns and options end each row; the rest are IndexInfo fields.
+_INDEXES_SQL = """
+SELECT
+    c.relname,
+    i.relname,
+    ix.indisunique OR ix.indisprimary,
+    EXISTS (SELECT 1 FROM pg_constraint con WHERE con.conindid = ix.indexrelid),
+    am.amname = 'btree' AND ix.indpred IS NULL AND ix.indexprs IS NULL,
+    pg_relation_size(ix.indexrelid),
+    COALESCE(s.idx_scan, 0),
+    ix.indnkeyatts,
+    ARRAY(
+        SELECT a.attname
+        FROM unnest(ix.indkey::int2[]) WITH ORDINALITY AS k(attnum, position)
+        JOIN pg_attribute a ON a.attrelid = ix.indrelid AND a.attnum = k.attnum
+        ORDER BY k.position
+    ),
+    ix.indoption::int2[]
+FROM pg_index ix
+JOIN pg_class i ON i.oid = ix.indexrelid
+JOIN pg_class c ON c.oid = ix.indrelid
+JOIN pg_namespace n ON n.oid = c.relnamespace
+JOIN pg_am am ON am.oid = i.relam
+LEFT JOIN pg_stat_user_indexes s ON s.indexrelid = ix.indexrelid
+WHERE n.nspname = current_schema() AND c.relname = ANY(%s)
+ORDER BY c.relname, i.relname
+"""
+_KEY_COLUMNS = 3
+
+_STATEMENTS_SQL = """
+SELECT query, calls, total_exec_time, mean_exec_time
+FROM pg_stat_statements
+WHERE query ~* %s
+ORDER BY total_exec_time DESC
+LIMIT %s
+"""
+
+_DESC_OPTION = 1  # INDOPTION_DESC
+
+Statement = tuple[str, int, float, float]  # query, calls, total ms, mean ms
+
+
+@dataclass(frozen=True, slots=True)
+class IndexInfo:
+    """One index of a model table with its usage statistics."""
+
+    table: str
+    name: str
+    unique: bool
+    backs_constraint: bool
+    comparable: bool  # plain btree over columns: no predicate, no expressions
+    size: int
+    scans: int
+    key: tuple[KeyColumn, ...]
+
+    @classmethod
+    def from_row(cls, row: tuple) -> IndexInfo:
+        """Build from a row of ``_INDEXES_SQL``."""
+        key_count, columns, options = row[-_KEY_COLUMNS:]
+        descending = [bool(option & _DESC_OPTION) for option in options[:key_count]]
+        key = tuple(zip(columns[:key_count], descending))
+        return cls(*row[:-_KEY_COLUMNS], key=key)
+
+    def leads_with(self, key: tuple[KeyColumn, ...]) -> bool:
+        """Whether a scan of this index (either direction) yields ``key`` order."""
+        if not self.comparable:
+            return False
+        prefix = self.key[:len(key)]
+        reverse = tuple((column, not descending) for column, descending in key)
+        return prefix in {key, reverse}
+
+    def serves(self, shape: QueryShape) -> bool:
+        """Whether this index can serve queries of ``shape``."""
+        return shape.table == self.table and self.leads_with(shape.key)
+
+    def covering_index(self, table_indexes: list[IndexInfo]) -> IndexInfo | None:
+        """Return another index of the table whose key starts with this whole key."""
+        if self.unique or not self.comparable:
+            return None
+        covers = (other for other in table_indexes if other is not self and self._is_prefix_of(other))
+        return next(covers, None)
+
+    def _is_prefix_of(self, other: IndexInfo) -> bool:
+        prefix = other.key[:len(self.key)]
+        if not other.comparable or prefix != self.key:
+            return False
+        # Of two identical plain indexes keep the first by name.
+        return other.key != self.key or other.unique or other.name < self.name
+
+
+def collect_indexes() -> list[IndexInfo]:
+    """Read the indexes of every model table from the system catalogs."""
+    tables = [model._meta.db_table for model in apps.get_models() if model._meta.managed]
+    with connection.cursor() as cursor:
+        cursor.execute(_INDEXES_SQL, [tables])
+        return [IndexInfo.from_row(row) for row in cursor.fetchall()]
+
+
+def heaviest_statements(tables: list[str], limit: int) -> dict[str, list[Statement]]:
+    """Return the ``limit`` costliest statements naming each of ``tables``.
+
+    Empty when the ``pg_stat_statements`` extension is not installed.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT to_regclass('pg_stat_statements') IS NOT NULL")
+        if not cursor.fetchone()[0]:
+            return {}
+        statements = {}
+        for table in tables:
+            cursor.execute(_STATEMENTS_SQL, [rf"\m{table}\M", limit])
+            statements[table] = cursor.fetchall()
+        return statements
@@ -0,0 +1,119 @@
+"""Migration stubs applying the findings of the index audit concurrently."""
+from __future__ import annotations
+
+from collections import defaultdict
+
+from django.apps import apps
+from django.db import models
+from django.db.migrations.loader import MigrationLoader
+
+from core.index_advisor.report import MISSING, Finding
+
+_CONCURRENT_OPERATIONS = ("AddIndexConcurrently", "RemoveIndexConcurrently")
+_STUB_NAME_TEMPLATE = "{number:04d}_index_report"
+
+
+def render_migration(app_label: str, findings: list[Finding]) -> str:
+    """Render a migration stub applying ``findings`` of one app concurrently."""
+    body = "".join(_render_operation(finding) for finding in findings)
+    imports = [name for name in _CONCURRENT_OPERATIONS if f"{name}(" in body]
+    header = ""
+    if imports:
+        names = ", ".join(imports)
+        header = f"from django.contrib.postgres.operations import {names}\n"
+    leaf = _leaf_migration(app_label)
+    return _MIGRATION_TEMPLATE.format(
+        imports=header,
+        models=", models" if "models.Index(" in body else "",
+        dependencies=_DEPENDENCY_TEMPLATE.format(app_label=app_label, leaf=leaf) if leaf else "",
+        operations=body,
+    )
+
+
+def stub_migration_name(app_label: str) -> str:
+    """Return the name the next migration of ``app_label`` gets for a stub."""
+    leaf = _leaf_migration(app_label)
+    latest = int(leaf.partition("_")[0]) if leaf else 0
+    return _STUB_NAME_TEMPLATE.format(number=latest + 1)
+
+
+def findings_by_app(findings: list[Finding]) -> dict[str, list[Finding]]:
+    """Group findings by the app label owning their table."""
+    labels = {model._meta.db_table: model._meta.app_label for model in apps.get_models()}
+    grouped: dict[str, list[Finding]] = defaultdict(list)
+    for finding in findings:
+        grouped[labels[finding.table]].append(finding)
+    return dict(grouped)
+
+
+def _leaf_migration(app_label: str) -> str | None:
+    """Return the latest migration of ``app_label``; None without any (e.g. ``--nomigrations``)."""
+    leaves = MigrationLoader(None, ignore_no_migrations=True).graph.leaf_nodes(app_label)
+    if not leaves:
+        return None
+    _, name = max(leaves)
+    return name
+
+
+def _model_for(table: str) -> type[models.Model]:
+    return next(model for model in apps.get_models() if model._meta.db_table == table)
+
+
+def _render_operation(finding: Finding) -> str:
+    model = _model_for(finding.table)
+    context = {
+        "kind": finding.kind,
+        "reason": finding.reason,
+        "index": finding.index,
+        "model_name": model._meta.model_name,
+    }
+    if finding.kind == MISSING:
+        fields = ", ".join(repr(name) for name in finding.shape.fields)
+        return _ADD_INDEX_TEMPLATE.format(shape=finding.shape.name, fields=fields, **context)
+    if finding.index in {index.name for index in model._meta.indexes}:
+        return _REMOVE_INDEX_TEMPLATE.format(**context)
+    return _DROP_FIELD_INDEX_TEMPLATE.format(**context)
+
+
+_ADD_INDEX_TEMPLATE = """        # {shape}: {reason}.
+        AddIndexConcurrently(
+            model_name={model_name!r},
+            index=models.Index(fields=[{fields}], name={index!r}),
+        ),
+"""
+
+_REMOVE_INDEX_TEMPLATE = """        # {kind}: {reason}. Remove it from Meta.indexes too.
+        RemoveIndexConcurrently(
+            model_name={model_name!r},
+            name={index!r},
+        ),
+"""
+
+_DROP_FIELD_INDEX_TEMPLATE = """        # {kind}: {reason}. Created by a field option (db_index or
+        # ForeignKey): set db_index=False on the field and move the AlterField
+        # makemigrations generates into SeparateDatabaseAndState(state_operations).
+        migrations.RunSQL(
+            'DROP INDEX CONCURRENTLY IF EXISTS "{index}"',
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+"""
+
+_DEPENDENCY_TEMPLATE = """        ('{app_label}', '{leaf}'),
+"""
+
+_MIGRATION_TEMPLATE = """# Stub generated by `manage.py index_report`; review before applying.
+
+{imports}from django.db import migrations{models}
+
+
+class Migration(migrations.Migration):
+
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block.
+    atomic = False
+
+    dependencies = [
+{dependencies}    ]
+
+    operations = [
+{operations}    ]
+"""
@@ -0,0 +1,84 @@
+"""Findings of the index audit: redundant, unused and missing indexes."""
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from core.index_advisor.indexes import IndexInfo, Statement, collect_indexes, heaviest_statements
+from core.index_advisor.shapes import QueryShape, query_shapes
+
+REDUNDANT = "redundant"
+UNUSED = "unused"
+MISSING = "missing"
+
+_DEFAULT_STATEMENT_LIMIT = 5
+
+
+@dataclass(frozen=True, slots=True)
+class Finding:
+    """One recommendation of the report."""
+
+    kind: str
+    table: str
+    index: str
+    reason: str
+    shape: QueryShape | None = None
+
+
+@dataclass(slots=True)
+class IndexReport:
+    """Findings and the evidence they were derived from."""
+
+    indexes: list[IndexInfo]
+    redundant: list[Finding] = field(default_factory=list)
+    unused: list[Finding] = field(default_factory=list)
+    missing: list[Finding] = field(default_factory=list)
+    statements: dict[str, list[Statement]] = field(default_factory=dict)
+
+    @property
+    def findings(self) -> list[Finding]:
+        """All findings, removals first."""
+        return [*self.redundant, *self.unused, *self.missing]
+
+    def by_table(self) -> dict[str, list[IndexInfo]]:
+        """The indexes grouped by table."""
+        grouped: dict[str, list[IndexInfo]] = defaultdict(list)
+        for index in self.indexes:
+            grouped[index.table].append(index)
+        return grouped
+
+    def review_table(self, table_indexes: list[IndexInfo], shapes: list[QueryShape], max_scans: int) -> None:
+        """Report the redundant and unused ones among the indexes of one table."""
+        for index in table_indexes:
+            cover = index.covering_index(table_indexes)
+            if cover is not None:
+                reason = f"leading columns of {cover.name}"
+                self.redundant.append(Finding(REDUNDANT, index.table, index.name, reason))
+                continue
+            serves = any(index.serves(shape) for shape in shapes)
+            keeps_integrity = index.unique or index.backs_constraint
+            if index.scans <= max_scans and not keeps_integrity and not serves:
+                reason = f"{index.scans} scans, {index.size} bytes"
+                self.unused.append(Finding(UNUSED, index.table, index.name, reason))
+
+    def review_shape(self, shape: QueryShape) -> None:
+        """Report ``shape`` as missing when no index leads with its columns."""
+        if any(index.serves(shape) for index in self.indexes):
+            return
+        fields = ", ".join(shape.fields)
+        reason = f"no index leads with {fields}"
+        self.missing.append(Finding(MISSING, shape.table, shape.index_name, reason, shape))
+
+
+def build_report(max_scans: int = 0, statement_limit: int = _DEFAULT_STATEMENT_LIMIT) -> IndexReport:
+    """Collect indexes and statistics and derive the findings."""
+    report = IndexReport(indexes=collect_indexes())
+    shapes = query_shapes()
+    for table_indexes in report.by_table().values():
+        report.review_table(table_indexes, shapes, max_scans)
+    for shape in shapes:
+        report.review_shape(shape)
+    if statement_limit:
+        tables = sorted({finding.table for finding in report.findings})
+        report.statements = heaviest_statements(tables, statement_limit)
+    return report
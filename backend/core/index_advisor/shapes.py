@@ -0,0 +1,57 @@
+"""Query shapes declared by the apps' ``query_shapes`` modules."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from django.db import models
+
+_INDEX_NAME_LENGTH = 30  # Django's Index.max_name_length
+_INDEX_SUFFIX = "_idx"
+
+KeyColumn = tuple[str, bool]  # (column, descending)
+
+
+@dataclass(frozen=True, slots=True)
+class QueryShape:
+    """Columns an index must lead with to serve one service query."""
+
+    name: str
+    model: type[models.Model]
+    fields: tuple[str, ...]
+
+    @property
+    def table(self) -> str:
+        """Database table of the model."""
+        return self.model._meta.db_table
+
+    @property
+    def key(self) -> tuple[KeyColumn, ...]:
+        """Columns and directions of the shape."""
+        return tuple(self._key_column(name) for name in self.fields)
+
+    @property
+    def index_name(self) -> str:
+        """Name of an index serving the shape, within Django's length limit."""
+        model_name = self.model._meta.model_name
+        columns = "_".join(name.lstrip("-") for name in self.fields)
+        prefix = f"{model_name}_{columns}"[:_INDEX_NAME_LENGTH - len(_INDEX_SUFFIX)]
+        return f"{prefix}{_INDEX_SUFFIX}"
+
+    def _key_column(self, name: str) -> KeyColumn:
+        model_field = self.model._meta.get_field(name.lstrip("-"))
+        return model_field.column, name.startswith("-")
+
+
+_shapes: dict[str, QueryShape] = {}
+
+
+def register_query_shape(name: str, model: type[models.Model], *fields: str) -> QueryShape:
+    """Declare that a service filters/orders ``model`` by ``fields``."""
+    shape = QueryShape(name, model, fields)
+    _shapes[name] = shape
+    return shape
+
+
+def query_shapes() -> list[QueryShape]:
+    """Return the declared shapes sorted by name."""
+    return sorted(_shapes.values(), key=lambda shape: shape.name)
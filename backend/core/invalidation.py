@@ -0,0 +1,253 @@
+"""Cross-node cache invalidation over PostgreSQL ``LISTEN``/``NOTIFY``.
+
+Caches such as the shared-memory cache are per host, so a write handled by
+one node must evict entries on every other node. Writers call
+:func:`invalidate` with a namespace and the keys they touched:
+
+- the keys are evicted on this node right away, and again after commit;
+- after commit, all keys invalidated in the transaction are appended as one
+  ``CacheInvalidation`` row and announced with ``NOTIFY``;
+- ``manage.py listen_invalidations``, run once per node, receives the
+  notifications, merges those arriving within a short window and calls each
+  namespace's handler once per batch.
+
+Handlers are registered in an app's ``invalidation_handlers`` module
+(autodiscovered by ``CoreConfig``) with :func:`invalidation_handler`. A
+handler receives the keys to evict, or ``None`` when the node may have
+missed messages and must drop everything in its namespace.
+
+NOTIFY is not durable: after a disconnect the listener replays the log from
+shortly before its last successful poll, so no broker is needed. Replaying
+an invalidation twice is harmless. If the gap is longer than the log's
+retention, every namespace is reset.
+"""
+from __future__ import annotations
+
+import datetime
+import json
+import logging
+import select
+import socket
+import threading
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from functools import partial
+from typing import Any
+
+from asgiref.local import Local
+from django.conf import settings
+from django.db import DatabaseError, connection, transaction
+from django.utils import timezone
+
+from core.models import CacheInvalidation
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "cache_invalidation"
+DEFAULT_BATCH_WINDOW = 0.05
+DEFAULT_RETENTION = datetime.timedelta(days=1)
+CATCH_UP_MARGIN = datetime.timedelta(minutes=1)
+_MAX_NOTIFY_BYTES = 7900  # PostgreSQL rejects payloads of 8000 bytes or more
+_POLL_TIMEOUT = 5.0
+_RECONNECT_DELAY = 1.0
+_PRUNE_INTERVAL = datetime.timedelta(minutes=10)
+_ID_FIELD = "id"
+_NODE_FIELD = "node"
+_MESSAGES_FIELD = "messages"
+
+Messages = dict[str, list[str]]
+InvalidationHandler = Callable[[list[str] | None], None]
+
+_handlers: dict[str, InvalidationHandler] = {}
+
+
+def invalidation_handler(namespace: str) -> Callable[[InvalidationHandler], InvalidationHandler]:
+    """Register the decorated function as the evictor of ``namespace``."""
+    def decorator(handler: InvalidationHandler) -> InvalidationHandler:
+        _handlers[namespace] = handler
+        return handler
+    return decorator
+
+
+def node_id() -> str:
+    """Identify this node; its own broadcasts are already applied locally."""
+    return getattr(settings, "CACHE_NODE_ID", "") or socket.gethostname()
+
+
+def apply(messages: Messages) -> None:
+    """Call each namespace's handler with its keys; failures are logged."""
+    for namespace, keys in messages.items():
+        _call(namespace, sorted(set(keys)))
+
+
+def reset_all() -> None:
+    """Tell every handler to drop everything in its namespace."""
+    for namespace in list(_handlers):
+        _call(namespace, None)
+
+
+class InvalidationBus:
+    """Collect invalidations per transaction and broadcast them after commit."""
+
+    def __init__(self) -> None:
+        """Start without pending batches."""
+        self.local = Local()
+
+    def invalidate(self, namespace: str, keys: Iterable[Any]) -> None:
+        """Evict ``keys`` of ``namespace`` here now and on all nodes after commit."""
+        keys = [str(key) for key in keys]
+        if not keys:
+            return
+        apply({namespace: keys})
+        if not connection.in_atomic_block:
+            self.send({namespace: keys}, applied=True)
+            return
+        self._pending()[namespace].extend(keys)
+
+    def send(self, messages: Messages, applied: bool = False) -> None:
+        """Apply committed ``messages`` locally and broadcast them to other nodes."""
+        if not applied:
+            apply(messages)
+        if not getattr(settings, "CACHE_INVALIDATION_BROADCAST", True):
+            return
+        try:
+            with transaction.atomic():
+                row = CacheInvalidation.objects.create(messages=messages)
+                announcement = {_ID_FIELD: row.id, _NODE_FIELD: node_id()}
+                payload = json.dumps({**announcement, _MESSAGES_FIELD: messages})
+                if len(payload.encode()) > _MAX_NOTIFY_BYTES:
+                    payload = json.dumps(announcement)
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT pg_notify(%s, %s)", [CHANNEL, payload])
+        except DatabaseError:
+            # The write already committed; other nodes converge when TTLs expire.
+            logger.exception("Failed to broadcast cache invalidation")
+
+    def _pending(self) -> Messages:
+        """Return the messages of the current transaction, sent once it commits."""
+        batch = getattr(self.local, "batch", None)
+        registered = (callback for _, callback, _ in connection.run_on_commit)
+        if batch is None or not any(callback is batch for callback in registered):
+            batch = partial(self._send_batch, defaultdict(list))
+            self.local.batch = batch
+            transaction.on_commit(batch)
+        return batch.args[0]
+
+    def _send_batch(self, messages: Messages) -> None:
+        self.local.batch = None
+        self.send(dict(messages))
+
+
+class InvalidationListener:
+    """Apply invalidations broadcast by other nodes until stopped."""
+
+    def __init__(
+        self,
+        batch_window: float = DEFAULT_BATCH_WINDOW,
+        retention: datetime.timedelta = DEFAULT_RETENTION,
+        poll_timeout: float = _POLL_TIMEOUT,
+    ) -> None:
+        """Merge notifications arriving within ``batch_window`` seconds."""
+        self.batch_window = batch_window
+        self.retention = retention
+        self.poll_timeout = poll_timeout
+        self.applied_batches = 0
+        self._synced_at: datetime.datetime | None = None
+        self._pruned_at = timezone.now()
+
+    def run(self, stop: threading.Event) -> None:
+        """Listen, reconnecting (and catching up) after connection failures."""
+        while not stop.is_set():
+            try:
+                self.listen(stop)
+            except DatabaseError:
+                logger.exception("Invalidation listener lost its connection; reconnecting")
+                connection.close()
+                stop.wait(_RECONNECT_DELAY)
+
+    def listen(self, stop: threading.Event) -> None:
+        """Subscribe, replay missed invalidations, then apply notifications."""
+        connection.ensure_connection()
+        with connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {CHANNEL}")
+        self.catch_up()
+        raw = connection.connection
+        while not stop.is_set():
+            synced_at = timezone.now()
+            readable, _, _ = select.select([raw], [], [], self.poll_timeout)
+            if readable:
+                stop.wait(self.batch_window)
+                self.apply_notifications(self._drain(raw))
+            self._synced_at = synced_at
+            self._prune()
+
+    def catch_up(self) -> None:
+        """Replay the log since shortly before the last successful poll."""
+        now = timezone.now()
+        if self._synced_at is None or now - self._synced_at > self.retention:
+            # Missed messages cannot be replayed: drop everything.
+            reset_all()
+            self._synced_at = now
+            return
+        since = self._synced_at - CATCH_UP_MARGIN
+        rows = CacheInvalidation.objects.filter(created_at__gte=since).order_by("id")
+        self._apply_merged(row.messages for row in rows.iterator())
+
+    def apply_notifications(self, payloads: list[str]) -> None:
+        """Merge notification payloads and apply them as one batch."""
+        batches, missing_ids = [], []
+        for raw_payload in payloads:
+            payload = json.loads(raw_payload)
+            if payload.get(_NODE_FIELD) == node_id():
+                continue
+            messages = payload.get(_MESSAGES_FIELD)
+            if messages is None:
+                missing_ids.append(payload[_ID_FIELD])
+            else:
+                batches.append(messages)
+        if missing_ids:
+            batches.extend(self._logged_messages(missing_ids))
+        self._apply_merged(batches)
+
+    def _apply_merged(self, batches: Iterable[Messages]) -> None:
+        merged: Messages = defaultdict(list)
+        for messages in batches:
+            for namespace, keys in messages.items():
+                merged[namespace].extend(keys)
+        if merged:
+            apply(merged)
+            self.applied_batches += 1
+
+    @staticmethod
+    def _logged_messages(ids: list[int]) -> list[Messages]:
+        """Read messages too large for their notification from the log."""
+        rows = CacheInvalidation.objects.filter(id__in=ids)
+        return list(rows.values_list(_MESSAGES_FIELD, flat=True))
+
+    @staticmethod
+    def _drain(raw: Any) -> list[str]:
+        raw.poll()
+        payloads = [notification.payload for notification in raw.notifies]
+        raw.notifies.clear()
+        return payloads
+
+    def _prune(self) -> None:
+        now = timezone.now()
+        if now - self._pruned_at < _PRUNE_INTERVAL:
+            return
+        self._pruned_at = now
+        CacheInvalidation.objects.filter(created_at__lt=now - self.retention).delete()
+
+
+def _call(namespace: str, keys: list[str] | None) -> None:
+    handler = _handlers.get(namespace)
+    if handler is None:
+        return
+    try:
+        handler(keys)
+    except Exception:
+        logger.exception("Invalidation handler for %s failed", namespace)
+
+
+bus = InvalidationBus()
+invalidate = bus.invalidate
@@ -0,0 +1,14 @@
+"""Cache invalidation handlers of the core app (see ``core.invalidation``)."""
+from __future__ import annotations
+
+from core.invalidation import invalidation_handler
+from core.response_cache import SURROGATE_NAMESPACE, response_cache
+
+
+@invalidation_handler(SURROGATE_NAMESPACE)
+def purge_responses(keys: list[str] | None) -> None:
+    """Purge cached responses tagged with ``keys`` (all of them on reset)."""
+    if keys is None:
+        response_cache.backend.clear()
+        return
+    response_cache.purge(keys)
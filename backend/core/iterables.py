@@ -0,0 +1,18 @@
+"""Helpers for consuming large iterables in bounded pieces."""
+from __future__ import annotations
+
+import itertools
+from collections.abc import Iterable, Iterator
+from typing import TypeVar
+
+ItemT = TypeVar("ItemT")
+
+
+def batched(items: Iterable[ItemT], size: int) -> Iterator[list[ItemT]]:
+    """Yield lists of ``size`` consecutive items of ``items``; the last may be shorter.
+
+    ``itertools.batched`` only exists from Python 3.12 on.
+    """
+    iterator = iter(items)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
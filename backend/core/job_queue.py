@@ -0,0 +1,142 @@
+"""Durable background jobs stored in PostgreSQL.
+
+Producers call :func:`enqueue` inside their own transaction, so a job exists
+exactly when the change that caused it commits. Apps register handlers in a
+``jobs`` module (autodiscovered by ``CoreConfig``) with :func:`job_handler`;
+``manage.py run_worker`` executes them through :class:`JobRunner`.
+
+Delivery is at-least-once: handlers must be idempotent.
+"""
+from __future__ import annotations
+
+import datetime
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from core.models import Job, JobStatus
+from core.models.job import DEFAULT_MAX_ATTEMPTS
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[dict[str, Any]], None]
+
+DEFAULT_LEASE_SECONDS = 300
+RETRY_BASE_SECONDS = 5
+RETRY_MAX_SECONDS = 3600
+_CLAIMABLE = (JobStatus.PENDING, JobStatus.RUNNING)
+
+_handlers: dict[str, JobHandler] = {}
+
+
+def job_handler(name: str) -> Callable[[JobHandler], JobHandler]:
+    """Register the decorated function as the handler for jobs called ``name``."""
+    def decorator(handler: JobHandler) -> JobHandler:
+        _handlers[name] = handler
+        return handler
+    return decorator
+
+
+def enqueue(
+    name: str,
+    payload: dict[str, Any] | None = None,
+    *,
+    dedup_key: str | None = None,
+    delay: datetime.timedelta | None = None,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+) -> None:
+    """Persist a job; silently dropped if a pending job has the same ``dedup_key``."""
+    job = Job(
+        name=name,
+        payload=payload or {},
+        dedup_key=dedup_key,
+        max_attempts=max_attempts,
+        run_after=timezone.now() + (delay or datetime.timedelta()),
+    )
+    Job.objects.bulk_create([job], ignore_conflicts=True)
+
+
+class JobRunner:
+    """Claim due jobs, run their handlers and reschedule failures.
+
+    A job is leased for ``lease_seconds`` while it runs; if the worker dies,
+    the job becomes claimable again once the lease expires.
+    """
+
+    def __init__(self, lease_seconds: int = DEFAULT_LEASE_SECONDS) -> None:
+        """Store the lease length used when claiming jobs."""
+        self.lease_seconds = lease_seconds
+
+    def run_next(self) -> bool:
+        """Claim and run one due job. Returns ``False`` if no job was due."""
+        job = self._claim()
+        if job is None:
+            return False
+        try:
+            self._run(job)
+        except Exception as exc:
+            logger.exception("Job %s (%s) failed", job.pk, job.name)
+            self._schedule_retry(job, exc)
+        else:
+            job.delete()
+        return True
+
+    @staticmethod
+    def retry_delay(attempts: int) -> datetime.timedelta:
+        """Exponential backoff after ``attempts`` failed attempts, capped at an hour."""
+        seconds = min(RETRY_BASE_SECONDS * 2 ** (attempts - 1), RETRY_MAX_SECONDS)
+        return datetime.timedelta(seconds=seconds)
+
+    def _claim(self) -> Job | None:
+        while True:
+            with transaction.atomic():
+                job = (
+                    Job.objects.select_for_update(skip_locked=True)
+                    .filter(status__in=_CLAIMABLE, run_after__lte=timezone.now())
+                    .order_by("run_after", "id")
+                    .first()
+                )
+                if job is None:
+                    return None
+                if job.attempts < job.max_attempts:
+                    self._start(job)
+                    return job
+                # Only reachable when a worker died mid-run on the last attempt.
+                self._mark_failed(job, "Lease expired on final attempt.")
+
+    def _start(self, job: Job) -> None:
+        job.status = JobStatus.RUNNING
+        job.attempts += 1
+        job.run_after = timezone.now() + datetime.timedelta(seconds=self.lease_seconds)
+        job.save(update_fields=["status", "attempts", "run_after", "updated_at"])
+
+    @staticmethod
+    def _run(job: Job) -> None:
+        handler = _handlers.get(job.name)
+        if handler is None:
+            raise LookupError(f"No handler registered for job {job.name!r}.")
+        with transaction.atomic():
+            handler(job.payload)
+
+    def _schedule_retry(self, job: Job, exc: Exception) -> None:
+        if job.attempts >= job.max_attempts:
+            self._mark_failed(job, repr(exc))
+            return
+        job.status = JobStatus.PENDING
+        job.run_after = timezone.now() + self.retry_delay(job.attempts)
+        job.last_error = repr(exc)
+        try:
+            with transaction.atomic():
+                job.save(update_fields=["status", "run_after", "last_error", "updated_at"])
+        except IntegrityError:
+            # An identical job was enqueued meanwhile and will do the work.
+            job.delete()
+
+    @staticmethod
+    def _mark_failed(job: Job, error: str) -> None:
+        job.status = JobStatus.FAILED
+        job.last_error = error
+        job.save(update_fields=["status", "last_error", "updated_at"])
@@ -0,0 +1,21 @@
+"""Background job handlers of the core app (see ``core.job_queue``)."""
+from __future__ import annotations
+
+from typing import Any
+
+from core.job_queue import job_handler
+from core.partitioning import MAINTAIN_PARTITIONS_JOB, maintain_partitions, schedule_maintenance
+from core.rate_limit import PURGE_RATE_LIMITS_JOB, purge_expired_counters
+
+
+@job_handler(PURGE_RATE_LIMITS_JOB)
+def purge_rate_limits(payload: dict[str, Any]) -> None:
+    """Delete expired rate limit counters."""
+    purge_expired_counters()
+
+
+@job_handler(MAINTAIN_PARTITIONS_JOB)
+def maintain_table_partitions(payload: dict[str, Any]) -> None:
+    """Create upcoming partitions, then schedule the next run."""
+    maintain_partitions()
+    schedule_maintenance()
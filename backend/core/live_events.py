@@ -0,0 +1,226 @@
+"""Push of live events to streaming (Server-Sent Events) clients.
+
+Writers call :func:`notify` with a topic (e.g. ``brickset:42``), an event
+name and a JSON-serializable body, typically from an after-commit event
+handler. The event is sent with PostgreSQL ``NOTIFY``, so every process of
+every node receives it no matter which one handled the write.
+
+Each ASGI process runs one :class:`LiveEventHub` listener thread holding one
+database connection; the first subscriber starts it. The thread fans each
+notification out to the asyncio queues of the topic's subscribers, so
+thousands of idle SSE connections cost one connection per process instead of
+one each.
+
+Delivery is best effort. A subscriber whose queue overflows (a stalled
+client) is closed and the browser reconnects. After the listener loses its
+connection every subscriber receives a ``resync`` event, telling the client
+to re-fetch once because events may have been missed.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import select
+import threading
+from collections import defaultdict
+from collections.abc import AsyncIterator, Iterator
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from django.db import DatabaseError, connection
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "live_events"
+RESYNC_EVENT = "resync"
+_MAX_NOTIFY_BYTES = 7900  # PostgreSQL rejects payloads of 8000 bytes or more
+_QUEUE_SIZE = 100
+_POLL_TIMEOUT = 5.0
+_RECONNECT_DELAY = 1.0
+_EVENT_FIELDS = frozenset(("event", "data"))
+
+
+@dataclass(frozen=True, slots=True)
+class LiveEvent:
+    """One event pushed to the subscribers of a topic."""
+
+    name: str
+    data: dict[str, Any]
+
+    def encode(self) -> str:
+        """Render the event as a Server-Sent Events message."""
+        return f"event: {self.name}\ndata: {json.dumps(self.data)}\n\n"
+
+
+def notify(topic: str, name: str, data: dict[str, Any]) -> bool:
+    """Send an event to the subscribers of ``topic`` in every process.
+
+    Inside a transaction the event is sent on commit. Returns False if the
+    payload is too large or the database rejected it (logged).
+    """
+    payload = json.dumps({"topic": topic, "event": name, "data": data})
+    if len(payload.encode()) > _MAX_NOTIFY_BYTES:
+        logger.warning("Live event %s for %s is too large to send", name, topic)
+        return False
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_notify(%s, %s)", [CHANNEL, payload])
+    except DatabaseError:
+        logger.exception("Failed to send live event %s", name)
+        return False
+    return True
+
+
+class Subscription:
+    """Bounded queue of events for one streaming client."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Bind the queue to the event loop serving the client."""
+        self.loop = loop
+        self.queue: asyncio.Queue[LiveEvent] = asyncio.Queue(maxsize=_QUEUE_SIZE)
+        self.closed = False
+
+    def push(self, event: LiveEvent) -> None:
+        """Hand ``event`` over from the listener thread to the client's loop."""
+        try:
+            self.loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            # The loop has shut down; the hub drops us when the stream closes.
+            self.closed = True
+
+    async def events(self, heartbeat: float) -> AsyncIterator[LiveEvent | None]:
+        """Yield events as they arrive, or None after ``heartbeat`` idle seconds."""
+        while not self.closed:
+            try:
+                yield await asyncio.wait_for(self.queue.get(), heartbeat)
+            except asyncio.TimeoutError:
+                yield None
+
+    def _put(self, event: LiveEvent) -> None:
+        if self.closed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.closed = True
+
+
+class LiveEventHub:
+    """Per-process registry of subscribers fed by one listener thread."""
+
+    def __init__(self, poll_timeout: float = _POLL_TIMEOUT) -> None:
+        """Start without subscribers; the listener starts on first use."""
+        self.poll_timeout = poll_timeout
+        self._lock = threading.Lock()
+        self._subscribers: dict[str, set[Subscription]] = defaultdict(set)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._listened = False
+
+    @contextmanager
+    def subscribe(self, topic: str) -> Iterator[Subscription]:
+        """Receive the events of ``topic`` for the enclosed block.
+
+        Must be entered from the event loop serving the client.
+        """
+        subscription = Subscription(asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers[topic].add(subscription)
+            self._ensure_listener()
+        try:
+            yield subscription
+        finally:
+            self._unsubscribe(topic, subscription)
+
+    def subscriber_count(self, topic: str | None = None) -> int:
+        """Number of open subscriptions, of ``topic`` or in total."""
+        with self._lock:
+            if topic is not None:
+                return len(self._subscribers.get(topic, ()))
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def dispatch(self, topic: str, event: LiveEvent) -> None:
+        """Push ``event`` to every subscriber of ``topic``."""
+        with self._lock:
+            subscribers = list(self._subscribers.get(topic, ()))
+        for subscription in subscribers:
+            subscription.push(event)
+
+    def broadcast(self, event: LiveEvent) -> None:
+        """Push ``event`` to every subscriber of every topic."""
+        with self._lock:
+            subscribers = [sub for subs in self._subscribers.values() for sub in subs]
+        for subscription in subscribers:
+            subscription.push(event)
+
+    def stop(self) -> None:
+        """Stop the listener thread (it restarts on the next subscription)."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join()
+        self._thread = None
+
+    def run(self) -> None:
+        """Listen until stopped, reconnecting after connection failures."""
+        with closing(connection):  # the listener thread's own connection
+            while not self._stop.is_set():
+                self._listen_until_failure()
+
+    def listen(self) -> None:
+        """Subscribe to the channel and dispatch notifications."""
+        connection.ensure_connection()
+        with connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {CHANNEL}")
+        if self._listened:
+            self.broadcast(LiveEvent(RESYNC_EVENT, {}))
+        self._listened = True
+        raw = connection.connection
+        while not self._stop.is_set():
+            readable, _, _ = select.select([raw], [], [], self.poll_timeout)
+            if not readable:
+                continue
+            raw.poll()
+            payloads = [notification.payload for notification in raw.notifies]
+            raw.notifies.clear()
+            for raw_payload in payloads:
+                self._dispatch_payload(raw_payload)
+
+    def _unsubscribe(self, topic: str, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(topic, set())
+            subscribers.discard(subscription)
+            if not subscribers:
+                self._subscribers.pop(topic, None)
+
+    def _listen_until_failure(self) -> None:
+        try:
+            self.listen()
+        except DatabaseError:
+            logger.exception("Live event listener lost its connection; reconnecting")
+            connection.close()
+            self._stop.wait(_RECONNECT_DELAY)
+
+    def _ensure_listener(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name="live-events", daemon=True)
+        self._thread.start()
+
+    def _dispatch_payload(self, raw_payload: str) -> None:
+        try:
+            payload = json.loads(raw_payload)
+        except ValueError:
+            payload = None
+        is_event = isinstance(payload, dict) and _EVENT_FIELDS <= payload.keys()
+        if not is_event:
+            logger.warning("Ignoring malformed live event %r", raw_payload)
+            return
+        event = LiveEvent(payload["event"], payload["data"])
+        self.dispatch(payload.get("topic", ""), event)
+
+
+hub = LiveEventHub()
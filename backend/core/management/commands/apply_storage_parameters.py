@@ -0,0 +1,58 @@
+"""Re-apply ``settings.TABLE_STORAGE_PARAMETERS`` to the model tables.
+
+Migrations apply the parameters once; run this after changing them:
+
+    python manage.py apply_storage_parameters
+
+Partitioned tables take no storage parameters themselves; they are applied
+to each partition instead. See ``core.storage``.
+"""
+from __future__ import annotations
+
+import itertools
+from typing import Any
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from core.partitioning import is_partitioned, partitions
+from core.storage import StorageParameters, current_storage_parameters, set_storage_parameters
+
+_ASSIGNMENT = "{0}={1:g}"
+
+
+class Command(BaseCommand):
+    """Set the configured storage parameters and print the resulting ones."""
+
+    help = "Apply TABLE_STORAGE_PARAMETERS to the model tables."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Apply the parameters of each configured model."""
+        configured = self._configured_tables()
+        with connection.schema_editor() as schema_editor:
+            for table, parameters in configured.items():
+                set_storage_parameters(schema_editor, table, parameters)
+        for table in configured:
+            current = self._describe(current_storage_parameters(table))
+            self.stdout.write(f"{table}: {current}")
+
+    def _configured_tables(self) -> dict[str, StorageParameters]:
+        configured = {}
+        for label, parameters in getattr(settings, "TABLE_STORAGE_PARAMETERS", {}).items():
+            table = apps.get_model(label)._meta.db_table
+            configured.update(dict.fromkeys(self._storage_tables(table), parameters))
+        return configured
+
+    @staticmethod
+    def _describe(parameters: StorageParameters) -> str:
+        items = sorted(parameters.items())
+        assignments = ", ".join(itertools.starmap(_ASSIGNMENT.format, items))
+        return assignments or "defaults"
+
+    @staticmethod
+    def _storage_tables(table: str) -> list[str]:
+        if is_partitioned(table):
+            return [partition.name for partition in partitions(table)]
+        return [table]
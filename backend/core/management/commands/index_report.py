@@ -0,0 +1,108 @@
+"""Audit database indexes against the query shapes services issue.
+
+    python manage.py index_report
+    python manage.py index_report --max-scans 10 --write-stubs
+
+Run it against production (or a copy with production statistics): index
+usage is read from ``pg_stat_user_indexes`` and is only meaningful after the
+workload has run for a while since the last statistics reset. The heaviest
+statements touching each reported table are listed when the
+``pg_stat_statements`` extension is installed.
+
+Migration stubs are printed, or written to each app's migrations package
+with ``--write-stubs``; review them before applying (see
+``core.index_advisor``).
+"""
+from __future__ import annotations
+
+import textwrap
+from pathlib import Path
+from typing import Any
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandParser
+
+from core.index_advisor import (
+    Finding,
+    IndexReport,
+    build_report,
+    findings_by_app,
+    render_migration,
+    stub_migration_name,
+)
+from core.index_advisor.indexes import Statement
+
+_DEFAULT_STATEMENTS = 5
+_STATEMENT_WIDTH = 100
+_STATEMENT_LINE = "    {0} {1:.1f} {2:.2f} {3}"  # calls, total ms, mean ms, query
+
+
+class Command(BaseCommand):
+    """Report redundant, unused and missing indexes with migration stubs."""
+
+    help = "Audit indexes against registered query shapes and usage statistics."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command options."""
+        parser.add_argument(
+            "--max-scans",
+            type=int,
+            default=0,
+            help="Indexes scanned at most this many times are reported as unused.",
+        )
+        parser.add_argument(
+            "--statements",
+            type=int,
+            default=_DEFAULT_STATEMENTS,
+            help="pg_stat_statements entries listed per reported table (0 disables).",
+        )
+        parser.add_argument(
+            "--write-stubs",
+            action="store_true",
+            help="Write migration stubs into the apps instead of printing them.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Print the findings, the evidence and the migration stubs."""
+        report = build_report(max_scans=options["max_scans"], statement_limit=options["statements"])
+        self._write_section("Redundant indexes", report.redundant)
+        self._write_section("Unused indexes", report.unused)
+        self._write_section("Missing indexes", report.missing)
+        if options["statements"]:
+            self._write_statements(report)
+        if not report.findings:
+            self.stdout.write("No findings.")
+            return
+        for app_label, findings in findings_by_app(report.findings).items():
+            self._write_stub(app_label, findings, to_app=options["write_stubs"])
+
+    def _write_stub(self, app_label: str, findings: list[Finding], to_app: bool) -> None:
+        stub = render_migration(app_label, findings)
+        name = stub_migration_name(app_label)
+        if not to_app:
+            self.stdout.write(f"\n# {app_label}/migrations/{name}.py\n{stub}")
+            return
+        path = Path(apps.get_app_config(app_label).path) / "migrations" / f"{name}.py"
+        path.write_text(stub)
+        self.stdout.write(f"Wrote {path}")
+
+    def _write_section(self, title: str, findings: list[Finding]) -> None:
+        self.stdout.write(f"{title} ({len(findings)}):")
+        for finding in findings:
+            self.stdout.write(f"  {finding.table}.{finding.index}: {finding.reason}")
+
+    def _write_statements(self, report: IndexReport) -> None:
+        if not report.statements:
+            if report.findings:
+                self.stdout.write("pg_stat_statements is not installed; no statement evidence.")
+            return
+        self.stdout.write("Heaviest statements per table (calls, total ms, mean ms):")
+        for table, statements in report.statements.items():
+            self.stdout.write(f"  {table}:")
+            for statement in statements:
+                self._write_statement(statement)
+
+    def _write_statement(self, statement: Statement) -> None:
+        query, *figures = statement
+        text = textwrap.shorten(query, _STATEMENT_WIDTH)
+        self.stdout.write(_STATEMENT_LINE.format(*figures, text))
@@ -0,0 +1,58 @@
+"""Apply cache invalidations broadcast by other nodes.
+
+Run exactly one listener per node (the caches it evicts are shared by all
+workers of the host):
+
+    python manage.py listen_invalidations
+
+It reconnects after connection failures and replays the invalidation log
+for the time it was away (see ``core.invalidation``).
+"""
+from __future__ import annotations
+
+import datetime
+import threading
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connection
+
+from core.invalidation import DEFAULT_BATCH_WINDOW, DEFAULT_RETENTION, InvalidationListener
+
+_ONE_HOUR = datetime.timedelta(hours=1)
+
+
+class Command(BaseCommand):
+    """Listen for cache invalidation notifications until interrupted."""
+
+    help = "Evict local cache entries invalidated on other nodes."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command options."""
+        parser.add_argument(
+            "--batch-window",
+            type=float,
+            default=DEFAULT_BATCH_WINDOW,
+            help="Seconds to collect notifications before applying them together.",
+        )
+        parser.add_argument(
+            "--retention-hours",
+            type=float,
+            default=DEFAULT_RETENTION / _ONE_HOUR,
+            help="Hours the invalidation log is kept for catch-up before being pruned.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Run the listener in the foreground."""
+        listener = InvalidationListener(
+            batch_window=options["batch_window"],
+            retention=datetime.timedelta(hours=options["retention_hours"]),
+        )
+        stop = threading.Event()
+        try:
+            listener.run(stop)
+        except KeyboardInterrupt:
+            stop.set()
+        finally:
+            connection.close()
+        self.stdout.write(f"Applied {listener.applied_batches} invalidation batches.")
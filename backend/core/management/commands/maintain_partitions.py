@@ -0,0 +1,26 @@
+"""Create the upcoming monthly partitions of partitioned tables.
+
+The ``core.maintain_partitions`` job does this daily; run it by hand or from
+cron when no worker is running:
+
+    python manage.py maintain_partitions
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from core.partitioning import maintain_partitions
+
+
+class Command(BaseCommand):
+    """Create missing partitions up to PARTITION_MONTHS_AHEAD months ahead."""
+
+    help = "Create upcoming partitions of the tables in PARTITIONED_MODELS."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Print the partitions created per model."""
+        for label, created in maintain_partitions().items():
+            names = ", ".join(created) or "up to date"
+            self.stdout.write(f"{label}: {names}")
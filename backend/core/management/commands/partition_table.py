@@ -0,0 +1,40 @@
+"""Convert a model table into monthly ``created_at`` range partitions.
+
+    python manage.py partition_table valuation.Like
+
+Only models listed in ``settings.PARTITIONED_MODELS`` are accepted. The rows
+already stored stay in place as the ``<table>_legacy`` partition; the final
+swap holds an exclusive lock on the table for a moment, so run it outside
+peak hours. See ``core.partitioning`` for what changes in the schema.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from core.partitioning import is_partitioned, partition_model
+
+
+class Command(BaseCommand):
+    """Partition the table of one configured model."""
+
+    help = "Convert a model table into monthly created_at range partitions."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command options."""
+        parser.add_argument("model", help="Model label, e.g. valuation.Like.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Convert the table and list the partitions created ahead."""
+        label = options["model"]
+        if label not in getattr(settings, "PARTITIONED_MODELS", ()):
+            raise CommandError(f"{label} is not listed in PARTITIONED_MODELS.")
+        model = apps.get_model(label)
+        table = model._meta.db_table
+        if is_partitioned(table):
+            raise CommandError(f"{table} is already partitioned.")
+        created = ", ".join(partition_model(model, settings.PARTITION_MONTHS_AHEAD))
+        self.stdout.write(f"Partitioned {table}; created {created}.")
@@ -0,0 +1,92 @@
+"""Execute background jobs from the ``core.Job`` queue.
+
+Runs ``--concurrency`` worker threads, each with its own database connection,
+claiming jobs with ``FOR UPDATE SKIP LOCKED``:
+
+    python manage.py run_worker --concurrency 4
+
+``--burst`` drains the due jobs and exits, which suits cron and tests.
+"""
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import close_old_connections, connection
+
+from core.job_queue import DEFAULT_LEASE_SECONDS, JobRunner
+
+_DEFAULT_POLL_INTERVAL = 1.0
+
+
+class Command(BaseCommand):
+    """Run job queue workers until interrupted (or until drained with --burst)."""
+
+    help = "Execute queued background jobs."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command options."""
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=1,
+            help="Number of worker threads.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=_DEFAULT_POLL_INTERVAL,
+            help="Seconds an idle worker waits before polling again.",
+        )
+        parser.add_argument(
+            "--lease",
+            type=int,
+            default=DEFAULT_LEASE_SECONDS,
+            help="Seconds a claimed job stays reserved before another worker may retry it.",
+        )
+        parser.add_argument(
+            "--burst",
+            action="store_true",
+            help="Exit once no job is due instead of polling.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Start the worker threads and wait for them to finish."""
+        self._stop = threading.Event()
+        self._processed = 0
+        self._lock = threading.Lock()
+        runner = JobRunner(lease_seconds=options["lease"])
+        workers = [
+            threading.Thread(
+                target=self._work,
+                args=(runner, options["poll_interval"], options["burst"]),
+                name=f"job-worker-{index}",
+                daemon=True,
+            )
+            for index in range(max(1, options["concurrency"]))
+        ]
+        for worker in workers:
+            worker.start()
+        try:
+            for worker in workers:
+                worker.join()
+        except KeyboardInterrupt:
+            self._stop.set()
+            for worker in workers:
+                worker.join()
+        self.stdout.write(f"Processed {self._processed} jobs.")
+
+    def _work(self, runner: JobRunner, poll_interval: float, burst: bool) -> None:
+        try:  # noqa: WPS501
+            while not self._stop.is_set():
+                close_old_connections()
+                if runner.run_next():
+                    with self._lock:
+                        self._processed += 1
+                elif burst:
+                    return
+                else:
+                    self._stop.wait(poll_interval)
+        finally:
+            connection.close()
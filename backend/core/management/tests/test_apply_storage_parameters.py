@@ -0,0 +1,48 @@
+"""Tests for apply_storage_parameters and the storage parameter migration operation."""
+from __future__ import annotations
+
+from io import StringIO
+
+import pytest
+from django.apps import apps
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.state import ProjectState
+from django.test import TestCase, override_settings
+
+from core.storage import AlterStorageParameters, current_storage_parameters
+from valuation.models import Like, Valuation
+
+
+class ApplyStorageParametersCommandTests(TestCase):
+    """Test that configured parameters reach pg_class.reloptions."""
+
+    @override_settings(TABLE_STORAGE_PARAMETERS={
+        "valuation.Valuation": {"fillfactor": 85, "autovacuum_vacuum_scale_factor": 0.02},
+    })
+    def test_operation_applies_and_resets_configured_parameters(self) -> None:
+        """AlterStorageParameters sets the configured values; reversing it resets them."""
+        operation = AlterStorageParameters(model_name="valuation")
+        state = ProjectState.from_apps(apps)
+
+        with connection.schema_editor() as schema_editor:
+            operation.database_forwards("valuation", schema_editor, state, state)
+        applied = current_storage_parameters(Valuation._meta.db_table)
+        with connection.schema_editor() as schema_editor:
+            operation.database_backwards("valuation", schema_editor, state, state)
+
+        assert applied["fillfactor"] == 85
+        assert applied["autovacuum_vacuum_scale_factor"] == pytest.approx(0.02)
+        assert not current_storage_parameters(Valuation._meta.db_table)
+
+    @override_settings(TABLE_STORAGE_PARAMETERS={"valuation.Like": {"autovacuum_vacuum_scale_factor": 0.01}})
+    def test_command_reapplies_changed_settings(self) -> None:
+        """Changed settings are applied without a migration and printed."""
+        out = StringIO()
+
+        call_command("apply_storage_parameters", stdout=out)
+
+        parameters = current_storage_parameters(Like._meta.db_table)
+        assert parameters["autovacuum_vacuum_scale_factor"] == pytest.approx(0.01)
+        assert "valuation_like: " in out.getvalue()
+        assert "autovacuum_vacuum_scale_factor=0.01" in out.getvalue()
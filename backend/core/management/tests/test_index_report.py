@@ -0,0 +1,81 @@
+"""Tests for the index_report management command and the index advisor."""
+from __future__ import annotations
+
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from core.index_advisor import (
+    MISSING,
+    REDUNDANT,
+    QueryShape,
+    build_report,
+    render_migration,
+    stub_migration_name,
+)
+from valuation.models import Valuation
+
+
+class IndexReportCommandTests(TestCase):
+    """Test the findings against the real schema and the printed report."""
+
+    def test_prefix_index_is_redundant(self) -> None:
+        """like_user_idx is the leading column of the unique (user, valuation) index."""
+        report = build_report(statement_limit=0)
+
+        redundant = {finding.index: finding.reason for finding in report.redundant}
+        assert redundant["like_user_idx"] == "leading columns of like_unique_user_valuation"
+
+    def test_indexes_serving_shapes_are_not_unused(self) -> None:
+        """Unscanned indexes are kept when a registered shape needs them."""
+        report = build_report(statement_limit=0)
+
+        unused = {finding.index for finding in report.unused}
+        assert "valuation_brickset_likes_idx" not in unused
+        assert "like_valuation_created_idx" not in unused
+        assert not report.missing
+
+    def test_unindexed_shape_is_missing(self) -> None:
+        """A shape no index leads with is reported with an AddIndex stub."""
+        shape = QueryShape("valuation.by_currency", Valuation, ("currency", "-value"))
+
+        with mock.patch.dict("core.index_advisor.shapes._shapes", {shape.name: shape}):
+            report = build_report(statement_limit=0)
+
+        missing = [(finding.kind, finding.shape) for finding in report.missing]
+        assert missing == [(MISSING, shape)]
+        stub = render_migration("valuation", report.missing)
+        assert "AddIndexConcurrently(" in stub
+        assert "fields=['currency', '-value']" in stub
+        assert "atomic = False" in stub
+
+    def test_stub_depends_on_latest_migration(self) -> None:
+        """Stubs follow the app's leaf migration, or start the app's migrations."""
+        report = build_report(statement_limit=0)
+
+        with mock.patch("core.index_advisor.migration._leaf_migration", return_value="0008_likes"):
+            stub = render_migration("valuation", report.redundant)
+            name = stub_migration_name("valuation")
+        with mock.patch("core.index_advisor.migration._leaf_migration", return_value=None):
+            first_stub = render_migration("valuation", report.redundant)
+            first_name = stub_migration_name("valuation")
+
+        assert "        ('valuation', '0008_likes'),\n" in stub
+        assert name == "0009_index_report"
+        assert "dependencies = [\n    ]" in first_stub
+        assert first_name == "0001_index_report"
+
+    def test_command_prints_sections_and_stubs(self) -> None:
+        """Without --write-stubs the migration stubs are printed."""
+        out = StringIO()
+
+        call_command("index_report", "--statements", "0", stdout=out)
+
+        output = out.getvalue()
+        assert "Redundant indexes" in output
+        assert "like_user_idx: leading columns of like_unique_user_valuation" in output
+        assert "# valuation/migrations/" in output
+        assert "RemoveIndexConcurrently(" in output
+        assert REDUNDANT in output
@@ -0,0 +1,31 @@
+"""Tests for run_worker management command."""
+from __future__ import annotations
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TransactionTestCase
+from model_bakery import baker
+
+from catalog.models import BrickSet
+from core.job_queue import enqueue
+from core.models import Job
+from valuation.jobs import REFRESH_METRICS_JOB
+from valuation.models import SystemMetrics
+
+
+class RunWorkerCommandTests(TransactionTestCase):
+    """Test run_worker drains due jobs from several threads."""
+
+    def test_burst_drains_queue(self) -> None:
+        """Every due job runs exactly once and the queue ends up empty."""
+        baker.make(BrickSet, number=iter(range(10001, 10004)), _quantity=3)
+        enqueue(REFRESH_METRICS_JOB)
+        enqueue(REFRESH_METRICS_JOB)
+        out = StringIO()
+
+        call_command("run_worker", "--burst", "--concurrency", "2", stdout=out)
+
+        assert not Job.objects.exists()
+        assert SystemMetrics.objects.get(pk=1).total_sets == 3
+        assert "Processed 2 jobs." in out.getvalue()
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:42
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Job',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Registered handler name.', max_length=100)),
+                ('payload', models.JSONField(blank=True, default=dict)),
+                ('dedup_key', models.CharField(blank=True, help_text='Identical pending jobs share a key; duplicates are dropped on enqueue.', max_length=255, null=True)),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('RUNNING', 'Running'), ('FAILED', 'Failed')], default='PENDING', max_length=10)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('max_attempts', models.PositiveSmallIntegerField(default=5)),
+                ('run_after', models.DateTimeField(default=django.utils.timezone.now, help_text='Earliest run time while pending; lease expiry while running.')),
+                ('last_error', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Job',
+                'verbose_name_plural': 'Jobs',
+                'indexes': [models.Index(condition=models.Q(('status__in', ('PENDING', 'RUNNING'))), fields=['run_after', 'id'], name='job_claimable_run_after_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('status', 'PENDING')), fields=('dedup_key',), name='job_unique_pending_dedup_key')],
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RateLimitCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=200)),
+                ('window_start', models.BigIntegerField(help_text='Window start, Unix seconds.')),
+                ('hits', models.PositiveIntegerField(default=0)),
+                ('expires_at', models.BigIntegerField(db_index=True, help_text='Unix seconds after which the row no longer affects any limit.')),
+            ],
+            options={
+                'verbose_name': 'Rate limit counter',
+                'verbose_name_plural': 'Rate limit counters',
+                'constraints': [models.UniqueConstraint(fields=('key', 'window_start'), name='ratelimit_unique_key_window')],
+            },
+        ),
+        # Counters are disposable; skip WAL writes for them.
+        migrations.RunSQL(
+            sql='ALTER TABLE "core_ratelimitcounter" SET UNLOGGED;',
+            reverse_sql='ALTER TABLE "core_ratelimitcounter" SET LOGGED;',
+        ),
+    ]
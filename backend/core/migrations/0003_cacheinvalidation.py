@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-19 05:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_ratelimitcounter'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CacheInvalidation',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('messages', models.JSONField(help_text='Keys to evict, by namespace.')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+            options={
+                'verbose_name': 'Cache invalidation',
+                'verbose_name_plural': 'Cache invalidations',
+            },
+        ),
+    ]
@@ -0,0 +1,3 @@
+from core.models.job import Job, JobStatus
+from core.models.rate_limit import RateLimitCounter
+from core.models.cache_invalidation import CacheInvalidation
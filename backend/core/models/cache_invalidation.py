@@ -0,0 +1,24 @@
+"""CacheInvalidation model.
+
+Append-only log of cache invalidation batches published through
+``core.invalidation``. Every row is also announced with ``NOTIFY``; the log
+lets a node's listener catch up on batches sent while it was disconnected.
+Rows older than the retention period are pruned by the listener.
+"""
+
+from __future__ import annotations
+
+from django.db import models
+
+
+class CacheInvalidation(models.Model):
+    id = models.BigAutoField(primary_key=True)
+    messages = models.JSONField(help_text="Keys to evict, by namespace.")
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        verbose_name = "Cache invalidation"
+        verbose_name_plural = "Cache invalidations"
+
+    def __str__(self) -> str:  # pragma: no cover - trivial
+        return f"Invalidation {self.id}"
@@ -0,0 +1,69 @@
+"""Job model.
+
+A unit of deferred work stored in PostgreSQL. Workers claim due jobs with
+``SELECT ... FOR UPDATE SKIP LOCKED`` and lease them by moving ``run_after``
+forward while ``RUNNING``; a job whose worker died becomes claimable again
+when the lease expires. A job is deleted once its handler succeeds and marked
+``FAILED`` after ``max_attempts`` attempts. A partial unique index on
+``dedup_key`` keeps at most one identical pending job.
+"""
+
+from __future__ import annotations
+
+from django.db import models
+from django.utils import timezone
+
+DEFAULT_MAX_ATTEMPTS = 5
+DEDUP_KEY_MAX_LENGTH = 255
+
+
+class JobStatus(models.TextChoices):
+    PENDING = "PENDING", "Pending"
+    RUNNING = "RUNNING", "Running"
+    FAILED = "FAILED", "Failed"
+
+
+class Job(models.Model):
+    name = models.CharField(max_length=100, help_text="Registered handler name.")
+    payload = models.JSONField(default=dict, blank=True)
+    dedup_key = models.CharField(
+        max_length=DEDUP_KEY_MAX_LENGTH,
+        null=True,
+        blank=True,
+        help_text="Identical pending jobs share a key; duplicates are dropped on enqueue.",
+    )
+    status = models.CharField(
+        max_length=10,
+        choices=JobStatus.choices,
+        default=JobStatus.PENDING,
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=DEFAULT_MAX_ATTEMPTS)
+    run_after = models.DateTimeField(
+        default=timezone.now,
+        help_text="Earliest run time while pending; lease expiry while running.",
+    )
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Job"
+        verbose_name_plural = "Jobs"
+        constraints = [
+            models.UniqueConstraint(
+                fields=("dedup_key",),
+                condition=models.Q(status="PENDING"),
+                name="job_unique_pending_dedup_key",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["run_after", "id"],
+                condition=models.Q(status__in=("PENDING", "RUNNING")),
+                name="job_claimable_run_after_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - trivial
+        return f"Job {self.name} ({self.status})"
@@ -0,0 +1,36 @@
+"""RateLimitCounter model.
+
+Fixed-window hit counters shared by all worker processes; ``core.rate_limit``
+combines the current and previous window into a sliding-window estimate.
+The table is UNLOGGED: counters are disposable, so writes skip the WAL and a
+crash merely resets every limit.
+"""
+
+from __future__ import annotations
+
+from django.db import models
+
+RATE_LIMIT_KEY_MAX_LENGTH = 200
+
+
+class RateLimitCounter(models.Model):
+    key = models.CharField(max_length=RATE_LIMIT_KEY_MAX_LENGTH)
+    window_start = models.BigIntegerField(help_text="Window start, Unix seconds.")
+    hits = models.PositiveIntegerField(default=0)
+    expires_at = models.BigIntegerField(
+        db_index=True,
+        help_text="Unix seconds after which the row no longer affects any limit.",
+    )
+
+    class Meta:
+        verbose_name = "Rate limit counter"
+        verbose_name_plural = "Rate limit counters"
+        constraints = [
+            models.UniqueConstraint(
+                fields=("key", "window_start"),
+                name="ratelimit_unique_key_window",
+            ),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - trivial
+        return f"{self.key}@{self.window_start}: {self.hits}"
@@ -0,0 +1,178 @@
+"""Page-number pagination usable outside DRF's synchronous view machinery.
+
+Mirrors ``rest_framework.pagination.PageNumberPagination`` semantics (``page``
+and ``page_size`` parsing, ``Invalid page.`` errors, next/previous links) so
+the payload matches the DRF list views byte for byte. Unlike DRF, the count
+query and the page query are separate steps, which lets async callers run
+them concurrently on different connections.
+"""
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from django.db.models import QuerySet
+from django.http import HttpRequest
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.serializers import BaseSerializer
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from core.concurrency import gather_in_order, run_isolated
+
+INVALID_PAGE_MESSAGE = "Invalid page."
+
+
+@dataclass(slots=True)
+class PageRequest:
+    """Requested page number and size parsed from query parameters.
+
+    ``number`` is ``None`` when the client asked for the last page, which can
+    only be resolved once the total count is known.
+    """
+
+    number: int | None
+    size: int
+
+    def bounds(self, number: int) -> tuple[int, int]:
+        """Return ``(start, stop)`` slice offsets for the given page number."""
+        start = (number - 1) * self.size
+        return start, start + self.size
+
+
+class PageWindowPaginator:
+    """Paginate querysets using the settings of an existing DRF pagination class.
+
+    The DRF class (e.g. ``BrickSetPagination``) stays the single source of
+    truth for ``page_size``, ``page_size_query_param`` and ``max_page_size``.
+    """
+
+    def __init__(self, pagination_class: type[PageNumberPagination]) -> None:
+        """Read page size configuration from the DRF pagination class."""
+        self._config = pagination_class()
+
+    def parse(self, query_params: Mapping[str, str]) -> PageRequest:
+        """Parse ``page`` and ``page_size`` query parameters.
+
+        Raises:
+            NotFound: If the page number is not a positive integer.
+        """
+        size = self._page_size(query_params)
+        token = query_params.get(self._config.page_query_param) or "1"
+        if token in self._config.last_page_strings:
+            return PageRequest(number=None, size=size)
+        try:
+            number = int(token)
+        except ValueError:
+            raise NotFound(INVALID_PAGE_MESSAGE) from None
+        if number < 1:
+            raise NotFound(INVALID_PAGE_MESSAGE)
+        return PageRequest(number=number, size=size)
+
+    async def paginate_async(
+        self,
+        request: HttpRequest,
+        queryset: QuerySet,
+        map_row: Callable[[Any], Any],
+        serializer_class: type[BaseSerializer],
+    ) -> dict[str, Any]:
+        """Fetch count and page concurrently and build the paginated payload.
+
+        The page is fetched speculatively alongside the count; an out of range
+        page number is still reported as ``Invalid page.`` once both finish.
+        Mapped rows are serialized with ``serializer_class(many=True)``.
+        """
+        page_request = self.parse(request.GET)
+        if page_request.number is None:
+            count = await run_isolated(queryset.count)
+            number = self.num_pages(count, page_request.size)
+            rows = await run_isolated(self.fetch_page, queryset, page_request, number, map_row)
+        else:
+            number = page_request.number
+            count, rows = await gather_in_order(
+                run_isolated(queryset.count),
+                run_isolated(self.fetch_page, queryset, page_request, number, map_row),
+            )
+        results = serializer_class(rows, many=True).data
+        return self.build_payload(request, page_request, number, count, results)
+
+    def paginate(
+        self,
+        request: HttpRequest,
+        queryset: QuerySet,
+        map_row: Callable[[Any], Any],
+        serializer_class: type[BaseSerializer],
+    ) -> dict[str, Any]:
+        """Synchronous counterpart of :meth:`paginate_async`."""
+        page_request = self.parse(request.GET)
+        count = queryset.count()
+        number = page_request.number or self.num_pages(count, page_request.size)
+        rows = self.fetch_page(queryset, page_request, number, map_row)
+        results = serializer_class(rows, many=True).data
+        return self.build_payload(request, page_request, number, count, results)
+
+    @staticmethod
+    def fetch_page(
+        queryset: QuerySet,
+        page_request: PageRequest,
+        number: int,
+        map_row: Callable[[Any], Any],
+    ) -> list[Any]:
+        """Evaluate one page of the queryset and map every row."""
+        start, stop = page_request.bounds(number)
+        return [map_row(row) for row in queryset[start:stop]]
+
+    @staticmethod
+    def num_pages(count: int, size: int) -> int:
+        """Return the number of pages; an empty result still has one page."""
+        return max(1, math.ceil(count / size))
+
+    def build_payload(
+        self,
+        request: HttpRequest,
+        page_request: PageRequest,
+        number: int,
+        count: int,
+        rows: list[Any],
+    ) -> dict[str, Any]:
+        """Build the ``count/next/previous/results`` envelope used by DRF.
+
+        Raises:
+            NotFound: If ``number`` lies beyond the last page.
+        """
+        num_pages = self.num_pages(count, page_request.size)
+        if number > num_pages:
+            raise NotFound(INVALID_PAGE_MESSAGE)
+        url = request.build_absolute_uri()
+        return {
+            "count": count,
+            "next": self._next_link(url, number, num_pages),
+            "previous": self._previous_link(url, number),
+            "results": rows,
+        }
+
+    def _page_size(self, query_params: Mapping[str, str]) -> int:
+        raw_size = query_params.get(self._config.page_size_query_param or "")
+        try:
+            size = int(raw_size)  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            return self._config.page_size
+        if size <= 0:
+            return self._config.page_size
+        if self._config.max_page_size:
+            return min(size, self._config.max_page_size)
+        return size
+
+    def _next_link(self, url: str, number: int, num_pages: int) -> str | None:
+        if number >= num_pages:
+            return None
+        return replace_query_param(url, self._config.page_query_param, number + 1)
+
+    def _previous_link(self, url: str, number: int) -> str | None:
+        if number <= 1:
+            return None
+        if number == 2:
+            return remove_query_param(url, self._config.page_query_param)
+        return replace_query_param(url, self._config.page_query_param, number - 1)
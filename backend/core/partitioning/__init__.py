@@ -0,0 +1,41 @@
+"""Monthly range partitioning of append-mostly tables by ``created_at``.
+
+Tables such as ``valuation_like`` grow without bound, yet queries only read
+the rows of one valuation or user. As PostgreSQL range partitions, one per
+month, each partition keeps small indexes and old partitions, once frozen,
+cost vacuum almost nothing. Partitioning is optional per deployment:
+
+- ``manage.py partition_table valuation.Like`` converts a table in place
+  (:func:`partition_model`). The existing heap becomes the first partition,
+  bounded by the start of next month, without copying rows: a ``CHECK``
+  constraint is validated while writes continue, then a short transaction
+  swaps in the partitioned parent and attaches the old table to it.
+- The ``core.maintain_partitions`` job (see ``core.jobs``) re-enqueues itself
+  daily and creates the partitions of the next ``PARTITION_MONTHS_AHEAD``
+  months of every model in ``PARTITIONED_MODELS``; ``manage.py
+  maintain_partitions`` runs it by hand or from cron.
+- Queries bound ``created_at`` from below where the domain allows it (a like
+  is never older than its valuation), so the executor skips partitions
+  before the bound.
+
+PostgreSQL only allows unique indexes on a partitioned table if they include
+the partition key. The primary key therefore stays unique per partition and
+globally through the parent's identity sequence, and every other unique
+constraint of the model is enforced by triggers: inserts of one key are
+serialized with an advisory lock, and duplicates raise ``unique_violation``
+under the constraint's name, so callers catching ``IntegrityError`` keep
+working. Models referenced by foreign keys (such as ``Valuation``) cannot be
+partitioned this way, as the referencing key would have to include
+``created_at``.
+"""
+from core.partitioning.conversion import LEGACY_SUFFIX, PARTITION_FIELD, partition_model
+from core.partitioning.inspection import Partition, is_partitioned, partitioned_models, partitions
+from core.partitioning.maintenance import (
+    DEFAULT_MONTHS_AHEAD,
+    MAINTAIN_PARTITIONS_JOB,
+    MAINTENANCE_INTERVAL,
+    ensure_partitions,
+    maintain_partitions,
+    schedule_maintenance,
+)
+from core.partitioning.names import add_months, month_start, partition_name
@@ -0,0 +1,198 @@
+"""In-place conversion of a model table into monthly range partitions."""
+from __future__ import annotations
+
+import datetime
+
+from django.db import connection, models, transaction
+from django.db.backends.utils import CursorWrapper
+from django.utils import timezone
+
+from core.partitioning.inspection import is_partitioned
+from core.partitioning.maintenance import DEFAULT_MONTHS_AHEAD, ensure_partitions, schedule_maintenance
+from core.partitioning.names import add_months, month_start, quote, truncate
+
+PARTITION_FIELD = "created_at"
+LEGACY_SUFFIX = "_legacy"
+
+_FOREIGN_KEY = "f"
+_UNIQUE = "u"
+
+_INDEXES_SQL = """
+SELECT i.relname, pg_get_indexdef(ix.indexrelid)
+FROM pg_index ix
+JOIN pg_class i ON i.oid = ix.indexrelid
+WHERE ix.indrelid = to_regclass(%s)
+  AND NOT EXISTS (SELECT 1 FROM pg_constraint con WHERE con.conindid = ix.indexrelid)
+  AND NOT ix.indisunique
+ORDER BY i.relname
+"""
+
+_CONSTRAINTS_SQL = """
+SELECT con.conname, con.contype, pg_get_constraintdef(con.oid),
+    ARRAY(
+        SELECT a.attname
+        FROM unnest(con.conkey) WITH ORDINALITY AS k(attnum, position)
+        JOIN pg_attribute a ON a.attrelid = con.conrelid AND a.attnum = k.attnum
+        ORDER BY k.position
+    )
+FROM pg_constraint con
+WHERE con.conrelid = to_regclass(%s) AND con.contype IN ('f', 'u')
+ORDER BY con.conname
+"""
+
+_NEXT_ID_SQL = "SELECT nextval(pg_get_serial_sequence(%s, %s))"
+
+_BOUND_CHECK_SQL = """
+ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {check},
+ADD CONSTRAINT {check} CHECK ({column} IS NOT NULL AND {column} < %s) NOT VALID
+"""
+
+_PARENT_SQL = """
+CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS INCLUDING IDENTITY)
+PARTITION BY RANGE ({column})
+"""
+
+_GUARD_FUNCTION_SQL = """
+CREATE FUNCTION {function}() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtextextended('{constraint}:' || concat_ws(',', {new_columns}), 0));
+    IF EXISTS (SELECT 1 FROM {table} WHERE {matches}) THEN
+        RAISE unique_violation USING
+            MESSAGE = 'duplicate key value violates unique constraint "{constraint}"',
+            CONSTRAINT = '{constraint}',
+            TABLE = '{table}';
+    END IF;
+    RETURN NEW;
+END
+$$
+"""
+
+_GUARD_INSERT_SQL = """
+CREATE TRIGGER {insert_trigger} BEFORE INSERT ON {table}
+FOR EACH ROW EXECUTE FUNCTION {function}()
+"""
+
+_GUARD_UPDATE_SQL = """
+CREATE TRIGGER {update_trigger} BEFORE UPDATE ON {table}
+FOR EACH ROW WHEN ({changed}) EXECUTE FUNCTION {function}()
+"""
+
+
+def partition_model(
+    model: type[models.Model],
+    months_ahead: int = DEFAULT_MONTHS_AHEAD,
+    now: datetime.datetime | None = None,
+) -> list[str]:
+    """Convert the table of ``model`` into a partitioned table, in place.
+
+    The current table is renamed to ``<table>_legacy`` and attached as the
+    partition of all rows before the start of next month; ``months_ahead``
+    monthly partitions follow. Non-unique indexes and foreign keys are
+    recreated on the parent, where PostgreSQL adopts the existing ones of
+    the legacy partition instead of building them again. Returns the names
+    of the new partitions.
+
+    Raises:
+        ValueError: If the table is already partitioned.
+    """
+    table = model._meta.db_table
+    if is_partitioned(table):
+        raise ValueError(f"{table} is already partitioned.")
+    cutover = add_months(month_start(now or timezone.now()), 1)
+    conversion = _Conversion(model, cutover)
+    conversion.validate_bound()
+    with transaction.atomic(), connection.cursor() as cursor:
+        conversion.swap(cursor)
+        created = ensure_partitions(model, months_ahead, now)
+        schedule_maintenance(delay=None)
+    return created
+
+
+class _Conversion:
+    """The statements converting one table, with its names quoted once."""
+
+    def __init__(self, model: type[models.Model], cutover: datetime.datetime) -> None:
+        self.name = model._meta.db_table
+        self.cutover = cutover
+        self.table = quote(self.name)
+        self.legacy = quote(f"{self.name}{LEGACY_SUFFIX}")
+        self.column = quote(model._meta.get_field(PARTITION_FIELD).column)
+        self.pk_column = model._meta.pk.column
+
+    def validate_bound(self) -> None:
+        """Check that every row precedes the cutover.
+
+        Validating only takes SHARE UPDATE EXCLUSIVE: writes continue meanwhile.
+        """
+        check = quote(truncate(f"{self.name}_partition_bound"))
+        add_check = _BOUND_CHECK_SQL.format(table=self.table, check=check, column=self.column)
+        with connection.cursor() as cursor:
+            cursor.execute(add_check, [self.cutover])
+            cursor.execute(f"ALTER TABLE {self.table} VALIDATE CONSTRAINT {check}")
+
+    def swap(self, cursor: CursorWrapper) -> None:
+        """Replace the table by a partitioned parent with the old table as first partition."""
+        cursor.execute(f"LOCK TABLE {self.table} IN ACCESS EXCLUSIVE MODE")
+        indexes = _fetch(cursor, _INDEXES_SQL, [self.name])
+        constraints = _fetch(cursor, _CONSTRAINTS_SQL, [self.name])
+        cursor.execute(_NEXT_ID_SQL, [self.table, self.pk_column])
+        next_id = cursor.fetchone()[0]
+        self._rename_aside(cursor, [name for name, _ in indexes])
+        self._create_parent(cursor, next_id, [definition for _, definition in indexes])
+        self._attach_legacy(cursor, constraints)
+
+    def _rename_aside(self, cursor: CursorWrapper, index_names: list[str]) -> None:
+        cursor.execute(f"ALTER TABLE {self.table} RENAME TO {self.legacy}")
+        for name in index_names:
+            index = quote(name)
+            renamed = quote(truncate(f"{name}{LEGACY_SUFFIX}"))
+            cursor.execute(f"ALTER INDEX {index} RENAME TO {renamed}")
+
+    def _create_parent(self, cursor: CursorWrapper, next_id: int, index_definitions: list[str]) -> None:
+        pk_column = quote(self.pk_column)
+        create_parent = _PARENT_SQL.format(table=self.table, legacy=self.legacy, column=self.column)
+        cursor.execute(create_parent)
+        cursor.execute(f"ALTER TABLE {self.table} ALTER COLUMN {pk_column} RESTART WITH %s", [next_id])
+        # Ids now come from the parent's sequence only.
+        cursor.execute(f"ALTER TABLE {self.legacy} ALTER COLUMN {pk_column} DROP IDENTITY IF EXISTS")
+        for definition in index_definitions:
+            # The definition still names the original table, now the parent.
+            cursor.execute(definition)
+
+    def _attach_legacy(self, cursor: CursorWrapper, constraints: list[tuple]) -> None:
+        for name, kind, definition, _ in constraints:
+            if kind == _FOREIGN_KEY:
+                constraint = quote(name)
+                cursor.execute(f"ALTER TABLE {self.table} ADD CONSTRAINT {constraint} {definition}")
+        cursor.execute(
+            f"ALTER TABLE {self.table} ATTACH PARTITION {self.legacy} FOR VALUES FROM (MINVALUE) TO (%s)",
+            [self.cutover],
+        )
+        for name, kind, _, columns in constraints:
+            if kind == _UNIQUE:
+                _create_unique_guard(cursor, self.name, name, columns)
+
+
+def _fetch(cursor: CursorWrapper, sql: str, params: list) -> list[tuple]:
+    cursor.execute(sql, params)
+    return cursor.fetchall()
+
+
+def _create_unique_guard(cursor: CursorWrapper, table: str, constraint: str, columns: list[str]) -> None:
+    """Enforce a unique constraint across partitions with insert/update triggers."""
+    names = {
+        "constraint": constraint,
+        "table": quote(table),
+        "function": quote(truncate(f"{constraint}_guard")),
+        "insert_trigger": quote(truncate(f"{constraint}_insert")),
+        "update_trigger": quote(truncate(f"{constraint}_update")),
+    }
+    quoted = [quote(column) for column in columns]
+    cursor.execute(_GUARD_FUNCTION_SQL.format(
+        new_columns=", ".join(f"NEW.{column}" for column in quoted),
+        matches=" AND ".join(f"{column} = NEW.{column}" for column in quoted),
+        **names,
+    ))
+    cursor.execute(_GUARD_INSERT_SQL.format(**names))
+    changed = " OR ".join(f"OLD.{column} IS DISTINCT FROM NEW.{column}" for column in quoted)
+    cursor.execute(_GUARD_UPDATE_SQL.format(changed=changed, **names))
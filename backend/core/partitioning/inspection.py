@@ -0,0 +1,57 @@
+"""Partitioned tables and their partitions, from the system catalogs."""
+from __future__ import annotations
+
+import datetime
+import re
+from dataclasses import dataclass
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connection, models
+
+_UPPER_BOUND = re.compile(r"TO \('([^']+)'\)")
+
+_IS_PARTITIONED_SQL = "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s))"
+
+_PARTITIONS_SQL = """
+SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+FROM pg_inherits i
+JOIN pg_class c ON c.oid = i.inhrelid
+WHERE i.inhparent = to_regclass(%s)
+ORDER BY c.relname
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class Partition:
+    """One partition of a partitioned table."""
+
+    name: str
+    upper_bound: datetime.datetime | None  # None for MAXVALUE
+
+    @classmethod
+    def from_row(cls, row: tuple[str, str | None]) -> Partition:
+        """Build from a row of ``_PARTITIONS_SQL``."""
+        name, bound = row
+        match = _UPPER_BOUND.search(bound or "")
+        upper = datetime.datetime.fromisoformat(match.group(1)) if match else None
+        return cls(name, upper)
+
+
+def is_partitioned(table: str) -> bool:
+    """Whether ``table`` is a partitioned table."""
+    with connection.cursor() as cursor:
+        cursor.execute(_IS_PARTITIONED_SQL, [table])
+        return cursor.fetchone()[0]
+
+
+def partitions(table: str) -> list[Partition]:
+    """Return the partitions of ``table`` with their upper bounds."""
+    with connection.cursor() as cursor:
+        cursor.execute(_PARTITIONS_SQL, [table])
+        return [Partition.from_row(row) for row in cursor.fetchall()]
+
+
+def partitioned_models() -> list[type[models.Model]]:
+    """Return the models of ``settings.PARTITIONED_MODELS``."""
+    return [apps.get_model(label) for label in getattr(settings, "PARTITIONED_MODELS", ())]
@@ -0,0 +1,67 @@
+"""Creation of the upcoming monthly partitions, by hand or as a daily job."""
+from __future__ import annotations
+
+import datetime
+
+from django.conf import settings
+from django.db import connection, models, transaction
+from django.utils import timezone
+
+from core.job_queue import enqueue
+from core.partitioning.inspection import is_partitioned, partitioned_models, partitions
+from core.partitioning.names import add_months, month_start, month_starts, partition_name, quote
+from core.storage import set_storage_parameters, storage_parameters
+
+MAINTAIN_PARTITIONS_JOB = "core.maintain_partitions"
+MAINTENANCE_INTERVAL = datetime.timedelta(days=1)
+DEFAULT_MONTHS_AHEAD = 3
+
+_CREATE_PARTITION_SQL = "CREATE TABLE {partition} (LIKE {parent} INCLUDING DEFAULTS)"
+_PRIMARY_KEY_SQL = "ALTER TABLE {partition} ADD PRIMARY KEY ({column})"
+_ATTACH_PARTITION_SQL = "ALTER TABLE {parent} ATTACH PARTITION {partition} FOR VALUES FROM (%s) TO (%s)"
+
+
+def ensure_partitions(
+    model: type[models.Model],
+    months_ahead: int = DEFAULT_MONTHS_AHEAD,
+    now: datetime.datetime | None = None,
+) -> list[str]:
+    """Create the monthly partitions of ``model`` up to ``months_ahead`` months from now.
+
+    Partitions are created as plain tables and attached afterwards, which
+    only takes a ``SHARE UPDATE EXCLUSIVE`` lock on the parent; reads and
+    writes continue. Returns the names of the created partitions.
+    """
+    bounds = [partition.upper_bound for partition in partitions(model._meta.db_table)]
+    if not bounds or None in bounds:
+        return []
+    horizon = add_months(month_start(now or timezone.now()), months_ahead + 1)
+    return [_create_partition(model, start) for start in month_starts(max(bounds), horizon)]
+
+
+def maintain_partitions(now: datetime.datetime | None = None) -> dict[str, list[str]]:
+    """Create upcoming partitions of every partitioned model in settings."""
+    months_ahead = getattr(settings, "PARTITION_MONTHS_AHEAD", DEFAULT_MONTHS_AHEAD)
+    return {
+        model._meta.label: ensure_partitions(model, months_ahead, now)
+        for model in partitioned_models()
+        if is_partitioned(model._meta.db_table)
+    }
+
+
+def schedule_maintenance(delay: datetime.timedelta | None = MAINTENANCE_INTERVAL) -> None:
+    """Enqueue the next run of the partition maintenance job."""
+    enqueue(MAINTAIN_PARTITIONS_JOB, dedup_key=MAINTAIN_PARTITIONS_JOB, delay=delay)
+
+
+def _create_partition(model: type[models.Model], start: datetime.datetime) -> str:
+    name = partition_name(model._meta.db_table, start)
+    tables = {"partition": quote(name), "parent": quote(model._meta.db_table)}
+    primary_key = _PRIMARY_KEY_SQL.format(column=quote(model._meta.pk.column), **tables)
+    with transaction.atomic(), connection.schema_editor(atomic=False) as schema_editor:
+        schema_editor.execute(_CREATE_PARTITION_SQL.format(**tables))
+        schema_editor.execute(primary_key)
+        set_storage_parameters(schema_editor, name, storage_parameters(model._meta.label))
+        bounds = [start, add_months(start, 1)]
+        schema_editor.execute(_ATTACH_PARTITION_SQL.format(**tables), bounds)
+    return name
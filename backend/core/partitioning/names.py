@@ -0,0 +1,45 @@
+"""Monthly partition bounds and the names of partitions and their objects."""
+from __future__ import annotations
+
+import datetime
+from collections.abc import Iterator
+
+from django.db import connection
+
+_MONTHS_PER_YEAR = 12
+_NAME_LENGTH = 63  # PostgreSQL NAMEDATALEN - 1
+_PARTITION_NAME_TEMPLATE = "{table}_p{start:%Y%m}"
+
+
+def month_start(moment: datetime.datetime) -> datetime.datetime:
+    """Return the first instant (UTC) of the month containing ``moment``."""
+    moment = moment.astimezone(datetime.timezone.utc)
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(start: datetime.datetime, months: int) -> datetime.datetime:
+    """Return the month start ``months`` after the month start ``start``."""
+    year, month = divmod(start.month - 1 + months, _MONTHS_PER_YEAR)
+    return start.replace(year=start.year + year, month=month + 1)
+
+
+def month_starts(start: datetime.datetime, stop: datetime.datetime) -> Iterator[datetime.datetime]:
+    """Yield the month starts from the month start ``start`` until ``stop``."""
+    while start < stop:
+        yield start
+        start = add_months(start, 1)
+
+
+def partition_name(table: str, start: datetime.datetime) -> str:
+    """Name of the partition of ``table`` starting at ``start``."""
+    return _PARTITION_NAME_TEMPLATE.format(table=table, start=start)
+
+
+def quote(name: str) -> str:
+    """Quote a table, column or constraint name for SQL."""
+    return connection.ops.quote_name(name)
+
+
+def truncate(name: str) -> str:
+    """Cut ``name`` to the length PostgreSQL keeps of identifiers."""
+    return name[:_NAME_LENGTH]
@@ -0,0 +1,177 @@
+"""Sliding-window rate limiting shared by all worker processes.
+
+Hits are counted per key in fixed windows stored in ``RateLimitCounter``. A
+request is allowed while the sliding-window estimate
+
+    previous_window_hits * (1 - elapsed_fraction) + current_window_hits
+
+stays within the limit. Counting is one ``INSERT ... ON CONFLICT`` statement,
+so it is atomic across processes. With ``settings.RATE_LIMIT_STORE = "cache"``
+the counters live in the cache alias ``RATE_LIMIT_CACHE_ALIAS`` instead,
+which must be shared by the workers and have an atomic ``incr`` (e.g.
+``core.shared_memory_cache``); limits then apply per host, without a
+query. Once a key is over its limit, this process remembers until when, and
+rejects further requests for that key without any query: an abusive client
+costs the database one write per window, not one per request.
+"""
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+
+from core.job_queue import enqueue
+from core.models import RateLimitCounter
+
+PURGE_RATE_LIMITS_JOB = "core.purge_rate_limits"
+_PURGE_INTERVAL_SECONDS = 300
+_MAX_BLOCKED_KEYS = 10_000
+DATABASE_STORE = "database"
+CACHE_STORE = "cache"
+
+_HIT_SQL = """
+    WITH counted AS (
+        INSERT INTO {table} (key, window_start, hits, expires_at)
+        VALUES (%(key)s, %(window_start)s, 1, %(expires_at)s)
+        ON CONFLICT (key, window_start)
+        DO UPDATE SET hits = {table}.hits + 1
+        RETURNING hits
+    )
+    SELECT
+        (SELECT hits FROM counted),
+        COALESCE(
+            (SELECT hits FROM {table} WHERE key = %(key)s AND window_start = %(previous)s),
+            0
+        )
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class Rate:
+    """At most ``limit`` hits per ``window`` seconds."""
+
+    limit: int
+    window: int
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitResult:
+    """Outcome of one hit; ``retry_after`` is in seconds and 0 when allowed."""
+
+    allowed: bool
+    retry_after: float = 0
+
+
+class SlidingWindowLimiter:
+    """Count hits per key and decide whether each one is within its limit."""
+
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        """Use ``clock`` (Unix seconds, shared by all processes) for windows."""
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._blocked: dict[str, float] = {}
+        self._purged_at = float("-inf")
+
+    def hit(self, key: str, rate: Rate) -> RateLimitResult:
+        """Record a hit for ``key`` and check it against ``rate``."""
+        now = self._clock()
+        blocked_for = self._blocked.get(key, now) - now
+        if blocked_for > 0:
+            return RateLimitResult(allowed=False, retry_after=blocked_for)
+        window_start = int(now // rate.window) * rate.window
+        if getattr(settings, "RATE_LIMIT_STORE", DATABASE_STORE) == CACHE_STORE:
+            counts = self._count_in_cache(key, window_start, rate.window)
+        else:
+            counts = self._count(key, window_start, rate.window)
+        return self._decide(key, now, window_start, rate, counts)
+
+    def reset(self) -> None:
+        """Forget locally cached blocks (shared counters are kept)."""
+        with self._lock:
+            self._blocked.clear()
+
+    @staticmethod
+    def _count(key: str, window_start: int, window: int) -> tuple[int, int]:
+        statement = _HIT_SQL.format(table=RateLimitCounter._meta.db_table)
+        params = {
+            "key": key,
+            "window_start": window_start,
+            "previous": window_start - window,
+            "expires_at": window_start + 2 * window,
+        }
+        with connection.cursor() as cursor:
+            cursor.execute(statement, params)
+            return cursor.fetchone()
+
+    @staticmethod
+    def _count_in_cache(key: str, window_start: int, window: int) -> tuple[int, int]:
+        cache = caches[getattr(settings, "RATE_LIMIT_CACHE_ALIAS", "default")]
+        current_key = f"ratelimit:{key}:{window_start}"
+        cache.add(current_key, 0, timeout=2 * window)
+        try:
+            current = cache.incr(current_key)
+        except ValueError:
+            # Evicted between add and incr; count this hit alone.
+            current = 1
+        previous_start = window_start - window
+        previous = cache.get(f"ratelimit:{key}:{previous_start}", 0)
+        return current, previous
+
+    def _decide(
+        self,
+        key: str,
+        now: float,
+        window_start: int,
+        rate: Rate,
+        counts: tuple[int, int],
+    ) -> RateLimitResult:
+        current, previous = counts
+        elapsed = (now - window_start) / rate.window
+        if previous * (1 - elapsed) + current <= rate.limit:
+            self._schedule_purge(now)
+            return RateLimitResult(allowed=True)
+        retry_after = self._retry_after(current, previous, rate.limit, elapsed) * rate.window
+        self._block(key, now + retry_after)
+        return RateLimitResult(allowed=False, retry_after=retry_after)
+
+    @staticmethod
+    def _retry_after(current: int, previous: int, limit: int, elapsed: float) -> float:
+        """Fraction of a window until the estimate is back within ``limit``."""
+        if current < limit:
+            # The previous window's weight has to decay far enough.
+            return max(0, 1 - (limit - current) / previous - elapsed)
+        # Wait for the next window, where today's hits become the previous ones.
+        return 1 - elapsed + max(0, 1 - limit / current)
+
+    def _block(self, key: str, until: float) -> None:
+        with self._lock:
+            if len(self._blocked) >= _MAX_BLOCKED_KEYS:
+                now = self._clock()
+                self._blocked = {
+                    blocked: expiry for blocked, expiry in self._blocked.items() if expiry > now
+                }
+            self._blocked[key] = until
+
+    def _schedule_purge(self, now: float) -> None:
+        if getattr(settings, "RATE_LIMIT_STORE", DATABASE_STORE) == CACHE_STORE:
+            return
+        if now - self._purged_at < _PURGE_INTERVAL_SECONDS:
+            return
+        self._purged_at = now
+        enqueue(PURGE_RATE_LIMITS_JOB, dedup_key=PURGE_RATE_LIMITS_JOB)
+
+
+def purge_expired_counters(now: float | None = None) -> int:
+    """Delete counters that no longer affect any limit; return how many."""
+    cutoff = math.floor(time.time() if now is None else now)
+    deleted, _ = RateLimitCounter.objects.filter(expires_at__lt=cutoff).delete()
+    return deleted
+
+
+limiter = SlidingWindowLimiter()
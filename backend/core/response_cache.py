@@ -0,0 +1,207 @@
+"""Full-response cache for anonymous reads, purged by surrogate keys.
+
+``ResponseCacheMiddleware`` stores the complete response of anonymous JSON
+GET requests to the routes listed in ``settings.RESPONSE_CACHE_ROUTES``. Each
+route maps to a function returning the surrogate keys of a request (e.g. the
+BrickSet id of a detail page, or the generation key shared by all list
+pages). Writers call :func:`purge` with the keys they touched - usually from
+an after-commit event subscriber - and every entry tagged with any of them
+stops being served, in every process sharing the cache backend.
+
+Purges reach every node through ``core.invalidation`` (namespace
+``surrogate``). Purging is O(number of keys): each key has an opaque version token in the
+cache, an entry remembers the tokens it was built under and is ignored once
+any of them changed. Tokens are read *before* the response is built, so a
+write committed while a response is being rendered invalidates it as well.
+
+Entries are fresh for ``RESPONSE_CACHE_TTL`` seconds and may then be served
+stale for ``RESPONSE_CACHE_STALE_TTL`` more seconds: one request rebuilds the
+entry while concurrent ones get the stale copy, and if the rebuild fails
+with a server error (e.g. a statement timeout on an overloaded database) the
+stale copy is returned instead. Purged entries are never served.
+"""
+from __future__ import annotations
+
+import time
+import uuid
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpRequest, HttpResponse
+from django.urls import Resolver404, resolve
+from django.utils.module_loading import import_string
+from rest_framework import status
+
+from config import jwt_config
+
+SurrogateKeysFunc = Callable[..., Iterable[str]]
+
+_ENTRY_PREFIX = "response-cache:entry:"
+_KEY_PREFIX = "response-cache:key:"
+_LOCK_PREFIX = "response-cache:lock:"
+_FORMAT_PARAM = "format"
+_DEFAULT_TTL = 30
+_DEFAULT_STALE_TTL = 300
+
+
+@dataclass(frozen=True)
+class _Entry:
+    status: int
+    content: bytes
+    headers: tuple[tuple[str, str], ...]
+    versions: dict[str, str]
+    fresh_until: float
+
+    def to_response(self) -> HttpResponse:
+        response = HttpResponse(self.content, status=self.status)
+        for header, header_value in self.headers:
+            response[header] = header_value
+        return response
+
+
+class ResponseCache:
+    """Store, look up and purge responses in the configured cache alias."""
+
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        """Use ``clock`` (Unix seconds) to judge freshness."""
+        self._clock = clock
+
+    @property
+    def backend(self) -> Any:
+        """The Django cache named by ``settings.RESPONSE_CACHE_ALIAS``."""
+        return caches[getattr(settings, "RESPONSE_CACHE_ALIAS", "default")]
+
+    def purge(self, surrogate_keys: Iterable[str]) -> None:
+        """Invalidate every entry tagged with any of ``surrogate_keys``."""
+        tokens = {_KEY_PREFIX + key: uuid.uuid4().hex for key in set(surrogate_keys)}
+        if tokens:
+            self.backend.set_many(tokens, timeout=None)
+
+    def current_versions(self, surrogate_keys: Iterable[str]) -> dict[str, str]:
+        """Return the version token of each key, creating missing ones."""
+        keys = sorted(set(surrogate_keys))
+        found = self.backend.get_many([_KEY_PREFIX + key for key in keys])
+        versions = {}
+        for key in keys:
+            token = found.get(_KEY_PREFIX + key)
+            if token is None:
+                token = uuid.uuid4().hex
+                if not self.backend.add(_KEY_PREFIX + key, token, timeout=None):
+                    token = self.backend.get(_KEY_PREFIX + key)
+            versions[key] = token
+        return versions
+
+    def lookup(self, cache_key: str, versions: dict[str, str]) -> _Entry | None:
+        """Return the entry for ``cache_key`` unless it was purged."""
+        entry = self.backend.get(_ENTRY_PREFIX + cache_key)
+        if not isinstance(entry, _Entry) or entry.versions != versions:
+            return None
+        return entry
+
+    def is_fresh(self, entry: _Entry) -> bool:
+        """Whether ``entry`` may be served without revalidation."""
+        return self._clock() < entry.fresh_until
+
+    def claim_revalidation(self, cache_key: str) -> bool:
+        """Let exactly one request rebuild a stale entry at a time."""
+        timeout = getattr(settings, "RESPONSE_CACHE_TTL", _DEFAULT_TTL)
+        return self.backend.add(_LOCK_PREFIX + cache_key, 1, timeout=timeout)
+
+    def store(self, cache_key: str, response: HttpResponse, versions: dict[str, str]) -> None:
+        """Cache ``response`` as built under ``versions``."""
+        ttl = getattr(settings, "RESPONSE_CACHE_TTL", _DEFAULT_TTL)
+        stale_ttl = getattr(settings, "RESPONSE_CACHE_STALE_TTL", _DEFAULT_STALE_TTL)
+        entry = _Entry(
+            status=response.status_code,
+            content=response.content,
+            headers=tuple(response.items()),
+            versions=versions,
+            fresh_until=self._clock() + ttl,
+        )
+        self.backend.set(_ENTRY_PREFIX + cache_key, entry, timeout=ttl + stale_ttl)
+        self.backend.delete(_LOCK_PREFIX + cache_key)
+
+
+class ResponseCacheMiddleware:
+    """Answer registered anonymous GET routes from the response cache."""
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        """Import the surrogate key functions of ``settings.RESPONSE_CACHE_ROUTES``."""
+        self.get_response = get_response
+        self._routes: dict[str, SurrogateKeysFunc] = {
+            route_name: import_string(dotted_path)
+            for route_name, dotted_path in getattr(settings, "RESPONSE_CACHE_ROUTES", {}).items()
+        }
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Serve from cache, rebuild, or pass through."""
+        surrogate_keys = self._surrogate_keys(request)
+        if surrogate_keys is None:
+            return self.get_response(request)
+
+        cache_key = _normalized_key(request)
+        versions = response_cache.current_versions(surrogate_keys)
+        entry = response_cache.lookup(cache_key, versions)
+        if entry is not None and response_cache.is_fresh(entry):
+            return entry.to_response()
+        if entry is not None and not response_cache.claim_revalidation(cache_key):
+            return entry.to_response()
+        return self._rebuild(request, cache_key, versions, entry)
+
+    def _surrogate_keys(self, request: HttpRequest) -> Iterable[str] | None:
+        """Return the surrogate keys of a cacheable request, None for any other."""
+        if not self._is_eligible(request):
+            return None
+        try:
+            match = resolve(request.path_info)
+        except Resolver404:
+            return None
+        keys_func = self._routes.get(match.view_name)
+        if keys_func is None:
+            return None
+        return keys_func(request, *match.args, **match.kwargs)
+
+    def _rebuild(
+        self,
+        request: HttpRequest,
+        cache_key: str,
+        versions: dict[str, str],
+        stale: _Entry | None,
+    ) -> HttpResponse:
+        """Build the response and cache it; fall back to ``stale`` on server errors."""
+        response = self.get_response(request)
+        if stale is not None and status.is_server_error(response.status_code):
+            return stale.to_response()
+        if response.status_code == status.HTTP_200_OK and not response.streaming and not response.cookies:
+            response_cache.store(cache_key, response, versions)
+        return response
+
+    def _is_eligible(self, request: HttpRequest) -> bool:
+        if not getattr(settings, "RESPONSE_CACHE_ENABLED", False) or not self._routes:
+            return False
+        if request.method != "GET" or jwt_config.COOKIE_NAME in request.COOKIES:
+            return False
+        if _FORMAT_PARAM in request.GET:
+            return False
+        accept = request.headers.get("Accept", "")
+        return "html" not in accept and ";" not in accept
+
+
+def _normalized_key(request: HttpRequest) -> str:
+    """Scheme, host, path and query parameters sorted by name (repeated values keep their order).
+
+    Responses carry absolute ``next``/``previous`` links, so the same path
+    served under another host or scheme is another entry.
+    """
+    host = request.get_host()
+    query = urlencode(sorted(request.GET.lists()), doseq=True)
+    return f"{request.scheme}://{host}{request.path}?{query}"
+
+
+response_cache = ResponseCache()
+purge = response_cache.purge
+SURROGATE_NAMESPACE = "surrogate"
@@ -0,0 +1,41 @@
+"""Routing of valuations and likes to database shards by brickset.
+
+With ``settings.VALUATION_SHARDS`` set, the rows of ``Valuation``, ``Like``
+and ``LikeCountDelta`` live on those databases instead of ``default``: all
+valuations of a brickset, and the likes and like deltas of those
+valuations, on ``shards[brickset_id % len(shards)]``. Users, bricksets and
+everything else stay on ``default``. With no shards configured the router
+steps aside and every query goes to ``default`` as before.
+
+:class:`ShardRouter` picks the shard from query hints:
+
+- an instance: a ``BrickSet`` routes its related managers
+  (``brickset.valuations``) by its pk, a ``Valuation`` by ``brickset_id``,
+  likes and deltas by ``valuation_id``;
+- explicit hints passed through ``Manager.db_manager(hints=...)``:
+  :func:`for_brickset`, :func:`for_valuation` and :func:`for_pk`.
+
+Row ids encode their shard: migration ``valuation.0007`` makes the id
+sequences of shard ``k`` yield ``k + 1, k + 1 + SHARD_ID_STRIDE, ...``, so a
+valuation found by id alone (``/valuations/{id}/likes``) needs no lookup.
+A sharded query carrying neither hint raises :class:`UnroutableQuery`
+instead of silently reading ``default``; queries spanning shards go through
+:func:`filter_ids`, :func:`group_by_shard` or :class:`ShardedRows`.
+
+A write touching ``default`` and one shard is two transactions: :func:`atomic`
+commits the shard first, so a failure between the commits leaves a shard row
+without its change log entry rather than the other way around.
+"""
+from core.sharding.aliases import (
+    SHARD_ID_STRIDE,
+    databases,
+    enabled,
+    shard_aliases,
+    shard_for_brickset,
+    shard_for_id,
+    shard_index,
+)
+from core.sharding.hints import Hints, for_brickset, for_pk, for_valuation
+from core.sharding.queries import atomic, filter_ids, group_bricksets_by_shard, group_by_shard
+from core.sharding.router import SHARDED_MODELS, ShardRouter, UnroutableQuery
+from core.sharding.rows import ShardedRows
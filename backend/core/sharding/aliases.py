@@ -0,0 +1,43 @@
+"""The configured shards and the shard of a brickset or a row id."""
+from __future__ import annotations
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+SHARD_ID_STRIDE = 64  # upper bound of the number of shards
+
+
+def shard_aliases() -> tuple[str, ...]:
+    """Return the configured shard aliases (empty when sharding is off)."""
+    return tuple(getattr(settings, "VALUATION_SHARDS", ()))
+
+
+def enabled() -> bool:
+    """Whether valuations are sharded."""
+    return bool(shard_aliases())
+
+
+def databases() -> tuple[str, ...]:
+    """Return every database holding valuations: the shards, or ``default``."""
+    return shard_aliases() or (DEFAULT_DB_ALIAS,)
+
+
+def shard_for_brickset(brickset_id: int) -> str:
+    """Return the database holding the valuations of ``brickset_id``."""
+    shards = shard_aliases()
+    if not shards:
+        return DEFAULT_DB_ALIAS
+    return shards[int(brickset_id) % len(shards)]
+
+
+def shard_for_id(pk: int) -> str:
+    """Return the database holding the sharded row with id ``pk``."""
+    shards = shard_aliases()
+    if not shards:
+        return DEFAULT_DB_ALIAS
+    return shards[(int(pk) - 1) % SHARD_ID_STRIDE % len(shards)]
+
+
+def shard_index(alias: str) -> int:
+    """Return the position of ``alias`` in ``VALUATION_SHARDS``."""
+    return shard_aliases().index(alias)
@@ -0,0 +1,26 @@
+"""Query hints picking the shard, for ``Manager.db_manager(hints=...)``."""
+from __future__ import annotations
+
+from typing import Any
+
+Hints = dict[str, Any]
+
+BRICKSET_HINT = "brickset_id"
+VALUATION_HINT = "valuation_id"
+PK_HINT = "pk"
+INSTANCE_HINT = "instance"
+
+
+def for_brickset(brickset_id: int) -> Hints:
+    """Hints routing a query to the shard of ``brickset_id``."""
+    return {BRICKSET_HINT: brickset_id}
+
+
+def for_valuation(valuation_id: int) -> Hints:
+    """Hints routing a query to the shard of ``valuation_id``."""
+    return {VALUATION_HINT: valuation_id}
+
+
+def for_pk(pk: int) -> Hints:
+    """Hints routing a query by the id of the sharded row itself."""
+    return {PK_HINT: pk}
@@ -0,0 +1,47 @@
+"""Queries and transactions spanning the shards."""
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import ExitStack, contextmanager
+
+from django.db import DEFAULT_DB_ALIAS, models, transaction
+
+from core.sharding.aliases import shard_for_brickset, shard_for_id
+
+_CHUNK_SIZE = 2000
+
+_IdsByShard = dict[str, list[int]]
+
+
+def group_by_shard(ids: Iterable[int]) -> _IdsByShard:
+    """Group valuation (or like) ids by the database holding them."""
+    return _group(ids, shard_for_id)
+
+
+def group_bricksets_by_shard(brickset_ids: Iterable[int]) -> _IdsByShard:
+    """Group brickset ids by the database holding their valuations."""
+    return _group(brickset_ids, shard_for_brickset)
+
+
+def filter_ids(queryset: models.QuerySet, ids: Iterable[int]) -> Iterator[models.Model]:
+    """Stream the rows of ``queryset`` with an id in ``ids``, one query per database."""
+    for alias, shard_ids in group_by_shard(ids).items():
+        yield from queryset.using(alias).filter(id__in=shard_ids).iterator(chunk_size=_CHUNK_SIZE)
+
+
+@contextmanager
+def atomic(alias: str) -> Iterator[None]:
+    """Open transactions on ``default`` and ``alias``; the inner one, ``alias``, commits first."""
+    with ExitStack() as stack:
+        stack.enter_context(transaction.atomic())
+        if alias != DEFAULT_DB_ALIAS:
+            stack.enter_context(transaction.atomic(using=alias))
+        yield
+
+
+def _group(ids: Iterable[int], shard_of: Callable[[int], str]) -> _IdsByShard:
+    grouped: _IdsByShard = defaultdict(list)
+    for pk in ids:
+        grouped[shard_of(pk)].append(pk)
+    return dict(grouped)
@@ -0,0 +1,84 @@
+"""The database router sending sharded models to their shard."""
+from __future__ import annotations
+
+from typing import Any
+
+from django.db import DEFAULT_DB_ALIAS, models
+
+from core.sharding.aliases import enabled, shard_aliases, shard_for_brickset, shard_for_id
+from core.sharding.hints import BRICKSET_HINT, INSTANCE_HINT, PK_HINT, VALUATION_HINT, Hints
+
+SHARDED_MODELS = frozenset(("valuation.valuation", "valuation.like", "valuation.likecountdelta"))
+
+_BRICKSET_LABEL = "catalog.brickset"
+_VALUATION_LABEL = "valuation.valuation"
+
+
+class UnroutableQuery(Exception):
+    """A query on a sharded model carries nothing to pick its shard by."""
+
+    def __init__(self, label: str) -> None:
+        """Name the model of the query."""
+        self.label = label
+        super().__init__(f"Query on {label} needs a brickset, valuation or pk hint to pick a shard")
+
+
+class ShardRouter:
+    """Database router sending sharded models to their shard and the rest to ``default``.
+
+    Every app is migrated everywhere: shards keep empty copies of the other tables.
+    """
+
+    def db_for_read(self, model: type[models.Model], **hints: Any) -> str | None:
+        """Route reads."""
+        return self._route(model, hints)
+
+    def db_for_write(self, model: type[models.Model], **hints: Any) -> str | None:
+        """Route writes."""
+        return self._route(model, hints)
+
+    def allow_relation(self, obj1: models.Model, obj2: models.Model, **hints: Any) -> bool | None:
+        """Allow valuations to reference bricksets and users held by ``default``."""
+        crosses_shards = _is_sharded(type(obj1)) != _is_sharded(type(obj2))
+        if enabled() and crosses_shards:
+            return True
+        return None
+
+    def _route(self, model: type[models.Model], hints: Hints) -> str | None:
+        if not enabled():
+            return None
+        if not _is_sharded(model):
+            # Without this, Django would follow the instance hint of e.g.
+            # ``valuation.brickset`` to the shard the valuation came from.
+            return DEFAULT_DB_ALIAS
+        return _hinted_shard(hints) or _instance_shard(hints.get(INSTANCE_HINT), model)
+
+
+def _is_sharded(model: type[models.Model]) -> bool:
+    return model._meta.label_lower in SHARDED_MODELS
+
+
+def _hinted_shard(hints: Hints) -> str | None:
+    brickset_id = hints.get(BRICKSET_HINT)
+    if brickset_id is not None:
+        return shard_for_brickset(brickset_id)
+    row_id = hints.get(VALUATION_HINT, hints.get(PK_HINT))
+    if row_id is not None:
+        return shard_for_id(row_id)
+    return None
+
+
+def _instance_shard(instance: models.Model | None, model: type[models.Model]) -> str:
+    if instance is None:
+        raise UnroutableQuery(model._meta.label)
+    if instance._state.db in shard_aliases():
+        return instance._state.db
+    label = instance._meta.label_lower
+    if label == _BRICKSET_LABEL:
+        return shard_for_brickset(instance.pk)
+    if label == _VALUATION_LABEL:
+        return shard_for_brickset(instance.brickset_id)
+    if label in SHARDED_MODELS:
+        return shard_for_id(instance.valuation_id)
+    # E.g. ``user.valuations``: a user's valuations span every shard.
+    raise UnroutableQuery(model._meta.label)
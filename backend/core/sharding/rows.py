@@ -0,0 +1,89 @@
+"""An ordered query run on every shard and merged like one QuerySet."""
+from __future__ import annotations
+
+import heapq
+from collections.abc import Callable, Iterator
+from functools import cmp_to_key, partial
+from typing import Any
+
+from django.db import models
+
+from core.sharding.aliases import databases
+
+_OrderField = tuple[str, bool]  # (attribute, descending)
+
+
+class ShardedRows:
+    """One ordered query run on every shard, merged like a single QuerySet.
+
+    Paginated like a QuerySet (``count()`` and slicing). A slice
+    ``[start:stop]`` reads the first ``stop`` rows of every shard and merges
+    them in the queryset's ``order_by`` order, so deep pages cost
+    ``stop`` rows per shard. ``related`` forward relations to models on
+    ``default`` are prefetched from there for the returned rows.
+    """
+
+    def __init__(self, queryset: models.QuerySet, related: tuple[str, ...] = ()) -> None:
+        """Keep the unrouted query; each shard gets its own copy."""
+        self._queryset = queryset
+        self._related = related
+        self._order_key = _order_key(queryset.query.order_by)
+
+    def count(self) -> int:
+        """Return the number of matching rows on all shards."""
+        return sum(self._queryset.using(alias).count() for alias in databases())
+
+    def __len__(self) -> int:
+        """Return the number of matching rows on all shards."""
+        return self.count()
+
+    def __getitem__(self, key: int | slice) -> Any:
+        """Return the row at ``key``, or a list of rows for a slice."""
+        if isinstance(key, slice):
+            start = key.start or 0
+            if start < 0 or (key.stop or 0) < 0:
+                raise ValueError("Negative indexing is not supported.")
+            return self._fetch(start, key.stop, key.step)
+        return self._fetch(key, key + 1, None)[0]
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over all matching rows in order."""
+        return iter(self._fetch(0, None, None))
+
+    def _fetch(self, start: int, stop: int | None, step: int | None) -> list[Any]:
+        per_shard = [self._shard_rows(alias, stop) for alias in databases()]
+        if self._order_key is None:
+            merged = [row for rows in per_shard for row in rows]
+        else:
+            merged = list(heapq.merge(*per_shard, key=self._order_key))
+        rows = merged[start:stop:step]
+        if self._related:
+            models.prefetch_related_objects(rows, *self._related)
+        return rows
+
+    def _shard_rows(self, alias: str, stop: int | None) -> list[Any]:
+        return list(self._queryset.using(alias)[:stop])
+
+
+def _order_key(order_by: tuple[str, ...]) -> Callable[[Any], Any] | None:
+    """Build a merge key comparing rows like ``ORDER BY order_by`` does."""
+    if not order_by:
+        return None
+    fields = tuple(_order_field(name) for name in order_by)
+    return cmp_to_key(partial(_compare, fields))
+
+
+def _order_field(name: str) -> _OrderField:
+    return name.lstrip("-"), name.startswith("-")
+
+
+def _compare(fields: tuple[_OrderField, ...], left: Any, right: Any) -> int:
+    for name, descending in fields:
+        order = _compare_values(getattr(left, name), getattr(right, name))
+        if order:
+            return -order if descending else order
+    return 0
+
+
+def _compare_values(left: Any, right: Any) -> int:
+    return int(left > right) - int(left < right)
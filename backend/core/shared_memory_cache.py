@@ -0,0 +1,441 @@
+"""Django cache backend shared by all worker processes of a host.
+
+Entries live in a memory-mapped file (by default under ``/dev/shm``), so
+every process that opens the same ``LOCATION`` sees the same cache without a
+network hop, and a worker started later finds it already warm.
+
+The file name is ``LOCATION`` plus the table geometry (buckets, ways, slot
+size and stripes), so workers started with other ``OPTIONS`` during a rolling
+deploy get a file of their own. A file is formatted under a temporary name
+and linked into place, and is never resized or reformatted while other
+processes may have it mapped. Files of geometries no longer in use are not
+removed.
+
+The file is a set-associative hash table: a key hashes to one bucket of
+``WAYS`` fixed-size slots. A bucket evicts its least recently used slot when
+it is full, which bounds the file to ``SIZE`` bytes and approximates LRU
+across the whole cache. Values whose pickled form does not fit in a slot
+(``SLOT_SIZE`` minus a small header) are not cached.
+
+Writers take one of ``STRIPES`` locks, each a thread lock plus an ``fcntl``
+byte-range lock so it also excludes other processes. Reads take no lock:
+every bucket carries a sequence number that writers make odd while they
+modify it, and a reader retries its copy if the number was odd or changed
+meanwhile (a seqlock). ``incr``/``decr`` and ``add`` are atomic across
+processes.
+
+Example::
+
+    CACHES = {
+        "default": {
+            "BACKEND": "core.shared_memory_cache.SharedMemoryCache",
+            "LOCATION": "/dev/shm/bricks-valuation-default",
+            "OPTIONS": {"SIZE": 64 * 1024 * 1024, "SLOT_SIZE": 1024},
+        },
+    }
+"""
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, NamedTuple
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+_MAGIC = b"BVSHMC01"
+_HEADER = struct.Struct("<8sQQQQ")  # magic, buckets, ways, slot_size, stripes
+_HEADER_SIZE = 64
+_SEQ = struct.Struct("<Q")
+# key hash, expiry (Unix seconds, 0 = never), last use (ns), key length, value length
+_SLOT = struct.Struct("<QdQHI")
+_SLOT_HEADER_SIZE = 32
+_EXPIRES = struct.Struct("<d")
+_EXPIRES_OFFSET = 8
+_LAST_USED = struct.Struct("<Q")
+_LAST_USED_OFFSET = 16
+_NEVER = 0
+_READ_RETRIES = 64
+
+DEFAULT_SIZE = 67_108_864  # 64 MiB
+DEFAULT_SLOT_SIZE = 1024
+DEFAULT_WAYS = 8
+DEFAULT_STRIPES = 64
+
+
+class _Located(NamedTuple):
+    """A key with its hash and the bucket it hashes to."""
+
+    key: bytes
+    key_hash: int
+    bucket: int
+
+
+class _SlotHeader(NamedTuple):
+    key_hash: int
+    expires: float
+    last_used: int
+    key_len: int
+    value_len: int
+
+    def is_expired(self, now: float) -> bool:
+        return self.expires != _NEVER and self.expires <= now
+
+
+_EMPTY_SLOT = _SlotHeader(0, _NEVER, 0, 0, 0)
+
+
+class SharedMemoryTable:
+    """Bytes-to-bytes table in a memory-mapped file, safe across processes."""
+
+    def __init__(
+        self,
+        path: str,
+        size: int = DEFAULT_SIZE,
+        slot_size: int = DEFAULT_SLOT_SIZE,
+        ways: int = DEFAULT_WAYS,
+        stripes: int = DEFAULT_STRIPES,
+    ) -> None:
+        """Open (or create and format) the table of this geometry next to ``path``."""
+        if slot_size <= _SLOT_HEADER_SIZE or slot_size % 8:
+            raise ValueError("SLOT_SIZE must be a multiple of 8 larger than 32.")
+        self.slot_size = slot_size
+        self.ways = ways
+        self.stripes = stripes
+        self.bucket_size = _SEQ.size + ways * slot_size
+        self.buckets = max(1, (size - _HEADER_SIZE) // self.bucket_size)
+        self.path = f"{path}.{self.buckets}x{ways}x{slot_size}x{stripes}"
+        self._thread_locks = [threading.Lock() for _ in range(stripes)]
+        self._fd = self._open_file()
+        self._map = self._open_map()
+
+    @property
+    def max_value_size(self) -> int:
+        """Largest key plus value, in bytes, that fits in one slot."""
+        return self.slot_size - _SLOT_HEADER_SIZE
+
+    def get(self, key: bytes, now: float) -> bytes | None:
+        """Return the value of ``key`` unless it is missing or expired."""
+        located = self._locate(key)
+        for _ in range(_READ_RETRIES):
+            seq = self._seq(located.bucket)
+            if seq % 2:
+                continue
+            found = self._read(located, now)
+            if self._seq(located.bucket) == seq:
+                return self._used(located.bucket, found)
+        with self._locked(located.bucket):
+            found = self._read(located, now)
+        return None if found is None else found[1]
+
+    def set(self, key: bytes, payload: bytes, expires: float, now: float, only_new: bool = False) -> bool:
+        """Store ``payload``; with ``only_new``, keep an existing live entry.
+
+        Returns ``False`` if nothing was stored (too large, or ``only_new``
+        and the key exists).
+        """
+        if len(key) + len(payload) > self.max_value_size:
+            return False
+        located = self._locate(key)
+        with self._locked(located.bucket), self._writing(located.bucket):
+            way = self._find(located)
+            if way is None:
+                way = self._victim(located.bucket, now)
+            elif only_new and not self._slot(located.bucket, way).is_expired(now):
+                return False
+            self._write(located, way, payload, expires)
+        return True
+
+    def update(
+        self,
+        key: bytes,
+        transform: Callable[[bytes], bytes],
+        now: float,
+    ) -> bytes | None:
+        """Atomically replace the value of a live ``key`` with ``transform(value)``.
+
+        Returns the new value, or ``None`` if the key is missing. ``transform``
+        may raise to abort without changes.
+        """
+        located = self._locate(key)
+        with self._locked(located.bucket):
+            found = self._read(located, now)
+            if found is None:
+                return None
+            way = found[0]
+            new_payload = transform(found[1])
+            if len(key) + len(new_payload) > self.max_value_size:
+                raise ValueError("Updated value does not fit in a slot.")
+            with self._writing(located.bucket):
+                self._write(located, way, new_payload, self._slot(located.bucket, way).expires)
+        return new_payload
+
+    def touch(self, key: bytes, expires: float, now: float) -> bool:
+        """Change the expiry of a live ``key``."""
+        located = self._locate(key)
+        with self._locked(located.bucket):
+            found = self._read(located, now)
+            if found is None:
+                return False
+            offset = self._slot_offset(located.bucket, found[0]) + _EXPIRES_OFFSET
+            with self._writing(located.bucket):
+                _EXPIRES.pack_into(self._map, offset, expires)
+        return True
+
+    def delete(self, key: bytes) -> bool:
+        """Remove ``key``; return whether it was present."""
+        located = self._locate(key)
+        with self._locked(located.bucket):
+            way = self._find(located)
+            if way is None:
+                return False
+            with self._writing(located.bucket):
+                self._clear_slot(located.bucket, way)
+        return True
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        for bucket in range(self.buckets):
+            with self._locked(bucket), self._writing(bucket):
+                for way in range(self.ways):
+                    self._clear_slot(bucket, way)
+
+    def close(self) -> None:
+        """Unmap the file (other processes keep their mappings)."""
+        self._map.close()
+        os.close(self._fd)
+
+    @property
+    def _length(self) -> int:
+        return _HEADER_SIZE + self.buckets * self.bucket_size
+
+    @property
+    def _header(self) -> bytes:
+        return _HEADER.pack(_MAGIC, self.buckets, self.ways, self.slot_size, self.stripes)
+
+    def _open_file(self) -> int:
+        """Open the table file, creating it formatted if it does not exist yet."""
+        try:
+            return os.open(self.path, os.O_RDWR)
+        except FileNotFoundError:
+            directory, name = os.path.split(self.path)
+        fd, temporary = tempfile.mkstemp(prefix=f"{name}.", dir=directory)
+        try:
+            self._format_and_link(fd, temporary)
+        except FileExistsError:
+            os.close(fd)
+            return os.open(self.path, os.O_RDWR)
+        finally:
+            os.unlink(temporary)
+        return fd
+
+    def _format_and_link(self, fd: int, temporary: str) -> None:
+        """Format the ``temporary`` file, then link it into place as the table file."""
+        os.ftruncate(fd, self._length)
+        os.pwrite(fd, self._header, 0)
+        # Unlike rename, link never replaces a file another process created meanwhile.
+        os.link(temporary, self.path)
+
+    def _open_map(self) -> mmap.mmap:
+        """Map the file after checking it holds a table of this geometry."""
+        size = os.fstat(self._fd).st_size
+        header = os.pread(self._fd, _HEADER.size, 0)
+        if size != self._length or header != self._header:
+            os.close(self._fd)
+            raise ValueError(f"{self.path} is not a shared-memory cache table of this geometry.")
+        return mmap.mmap(self._fd, self._length)
+
+    def _locate(self, key: bytes) -> _Located:
+        key_hash = int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+        return _Located(key, key_hash, key_hash % self.buckets)
+
+    def _bucket_offset(self, bucket: int) -> int:
+        return _HEADER_SIZE + bucket * self.bucket_size
+
+    def _slot_offset(self, bucket: int, way: int) -> int:
+        return self._bucket_offset(bucket) + _SEQ.size + way * self.slot_size
+
+    def _seq(self, bucket: int) -> int:
+        return _SEQ.unpack_from(self._map, self._bucket_offset(bucket))[0]
+
+    def _slot(self, bucket: int, way: int) -> _SlotHeader:
+        return _SlotHeader._make(_SLOT.unpack_from(self._map, self._slot_offset(bucket, way)))
+
+    def _find(self, located: _Located) -> int | None:
+        for way in range(self.ways):
+            slot = self._slot(located.bucket, way)
+            if not slot.key_len or slot.key_hash != located.key_hash:
+                continue
+            if self._key_at(located.bucket, way) == located.key:
+                return way
+        return None
+
+    def _read(self, located: _Located, now: float) -> tuple[int, bytes] | None:
+        way = self._find(located)
+        if way is None:
+            return None
+        slot = self._slot(located.bucket, way)
+        if slot.is_expired(now):
+            return None
+        start = self._slot_offset(located.bucket, way) + _SLOT_HEADER_SIZE + slot.key_len
+        return way, self._map[start:start + slot.value_len]
+
+    def _used(self, bucket: int, found: tuple[int, bytes] | None) -> bytes | None:
+        if found is None:
+            return None
+        way, payload = found
+        self._mark_used(bucket, way)
+        return payload
+
+    def _key_at(self, bucket: int, way: int) -> bytes:
+        start = self._slot_offset(bucket, way) + _SLOT_HEADER_SIZE
+        return self._map[start:start + self._slot(bucket, way).key_len]
+
+    def _victim(self, bucket: int, now: float) -> int:
+        """Pick an empty or expired slot, else the least recently used one."""
+        slots = [self._slot(bucket, way) for way in range(self.ways)]
+        for way, slot in enumerate(slots):
+            if not slot.key_len or slot.is_expired(now):
+                return way
+        return min(range(self.ways), key=lambda index: slots[index].last_used)
+
+    def _write(self, located: _Located, way: int, payload: bytes, expires: float) -> None:
+        offset = self._slot_offset(located.bucket, way)
+        slot = _SlotHeader(
+            key_hash=located.key_hash,
+            expires=expires,
+            last_used=time.time_ns(),
+            key_len=len(located.key),
+            value_len=len(payload),
+        )
+        _SLOT.pack_into(self._map, offset, *slot)
+        entry = located.key + payload
+        size = len(entry)
+        struct.pack_into(f"{size}s", self._map, offset + _SLOT_HEADER_SIZE, entry)
+
+    def _clear_slot(self, bucket: int, way: int) -> None:
+        _SLOT.pack_into(self._map, self._slot_offset(bucket, way), *_EMPTY_SLOT)
+
+    def _mark_used(self, bucket: int, way: int) -> None:
+        # Unlocked and racy on purpose: recency only steers eviction.
+        offset = self._slot_offset(bucket, way) + _LAST_USED_OFFSET
+        _LAST_USED.pack_into(self._map, offset, time.time_ns())
+
+    @contextmanager
+    def _locked(self, bucket: int) -> Iterator[None]:
+        stripe = bucket % self.stripes
+        with self._thread_locks[stripe], self._file_lock(stripe):
+            yield
+
+    @contextmanager
+    def _file_lock(self, offset: int) -> Iterator[None]:
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, 1, offset)
+        try:
+            yield
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, 1, offset)
+
+    @contextmanager
+    def _writing(self, bucket: int) -> Iterator[None]:
+        """Make the bucket's sequence odd for the duration of a write."""
+        offset = self._bucket_offset(bucket)
+        seq = self._seq(bucket)
+        _SEQ.pack_into(self._map, offset, seq + 1)
+        try:
+            yield
+        finally:
+            _SEQ.pack_into(self._map, offset, seq + 2)
+
+
+class SharedMemoryCache(BaseCache):
+    """Django cache backend over :class:`SharedMemoryTable`."""
+
+    pickle_protocol = pickle.HIGHEST_PROTOCOL
+
+    def __init__(self, location: str, params: dict[str, Any]) -> None:
+        """Open the table at ``location`` sized by ``OPTIONS``."""
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self._table = SharedMemoryTable(
+            location,
+            size=options.get("SIZE", DEFAULT_SIZE),
+            slot_size=options.get("SLOT_SIZE", DEFAULT_SLOT_SIZE),
+            ways=options.get("WAYS", DEFAULT_WAYS),
+            stripes=options.get("STRIPES", DEFAULT_STRIPES),
+        )
+
+    def add(self, key: str, value: Any, timeout: Any = DEFAULT_TIMEOUT, version: int | None = None) -> bool:
+        """Store ``value`` only if ``key`` is not already cached."""
+        return self._store(key, value, timeout, version, only_new=True)
+
+    def get(self, key: str, default: Any = None, version: int | None = None) -> Any:
+        """Return the cached value or ``default``."""
+        payload = self._table.get(self._key(key, version), time.time())
+        if payload is None:
+            return default
+        return pickle.loads(payload)
+
+    def set(self, key: str, value: Any, timeout: Any = DEFAULT_TIMEOUT, version: int | None = None) -> None:
+        """Store ``value`` (silently skipped if it does not fit in a slot)."""
+        self._store(key, value, timeout, version, only_new=False)
+
+    def touch(self, key: str, timeout: Any = DEFAULT_TIMEOUT, version: int | None = None) -> bool:
+        """Reset the expiry of ``key``."""
+        expires = self._expiry(timeout)
+        return self._table.touch(self._key(key, version), expires, time.time())
+
+    def delete(self, key: str, version: int | None = None) -> bool:
+        """Remove ``key``."""
+        return self._table.delete(self._key(key, version))
+
+    def has_key(self, key: str, version: int | None = None) -> bool:
+        """Whether a live entry for ``key`` exists."""
+        payload = self._table.get(self._key(key, version), time.time())
+        return payload is not None
+
+    def incr(self, key: str, delta: int = 1, version: int | None = None) -> int:
+        """Atomically add ``delta`` to a cached integer.
+
+        Raises:
+            ValueError: If the key is missing.
+        """
+        cache_key = self._key(key, version)
+        increment = partial(_incremented, delta=delta, protocol=self.pickle_protocol)
+        new_payload = self._table.update(cache_key, increment, time.time())
+        if new_payload is None:
+            raise ValueError(f"Key '{key}' not found")
+        return pickle.loads(new_payload)
+
+    def clear(self) -> None:
+        """Remove every entry of this cache."""
+        self._table.clear()
+
+    def _store(self, key: str, value: Any, timeout: Any, version: int | None, only_new: bool) -> bool:
+        cache_key = self._key(key, version)
+        expires = self._expiry(timeout)
+        now = time.time()
+        if expires != _NEVER and expires <= now:
+            self._table.delete(cache_key)
+            return False
+        payload = pickle.dumps(value, self.pickle_protocol)
+        return self._table.set(cache_key, payload, expires, now, only_new=only_new)
+
+    def _key(self, key: str, version: int | None) -> bytes:
+        return self.make_and_validate_key(key, version=version).encode()
+
+    def _expiry(self, timeout: Any) -> float:
+        expires = self.get_backend_timeout(timeout)
+        return _NEVER if expires is None else expires
+
+
+def _incremented(payload: bytes, delta: int, protocol: int) -> bytes:
+    return pickle.dumps(pickle.loads(payload) + delta, protocol)
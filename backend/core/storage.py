@@ -0,0 +1,124 @@
+"""Per-table PostgreSQL storage parameters driven by settings.
+
+``settings.TABLE_STORAGE_PARAMETERS`` maps model labels
+(``"valuation.Valuation"``) to table storage parameters such as
+``fillfactor`` and the ``autovacuum_*`` thresholds. Migrations apply them
+with :class:`AlterStorageParameters`; after changing the settings,
+``manage.py apply_storage_parameters`` re-applies them without a migration.
+
+``ALTER TABLE ... SET`` only takes a brief lock and rewrites nothing: a new
+fillfactor applies to pages filled from then on, so existing pages keep
+their free space until they are rewritten (``VACUUM FULL``, ``pg_repack``).
+"""
+from __future__ import annotations
+
+import itertools
+
+from django.conf import settings
+from django.db import connection
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.operations.base import Operation
+from django.db.migrations.state import ProjectState
+
+StorageParameters = dict[str, int | float]
+
+
+def storage_parameters(label: str) -> StorageParameters:
+    """Return the configured parameters of the model ``label``."""
+    return dict(getattr(settings, "TABLE_STORAGE_PARAMETERS", {}).get(label, {}))
+
+
+def set_storage_parameters(schema_editor: BaseDatabaseSchemaEditor, table: str, parameters: StorageParameters) -> None:
+    """Set ``parameters`` on ``table`` (no-op when empty)."""
+    if not parameters:
+        return
+    quoted = schema_editor.quote_name(table)
+    assignments = ", ".join(itertools.starmap(_assignment, sorted(parameters.items())))
+    schema_editor.execute(f"ALTER TABLE {quoted} SET ({assignments})")
+
+
+def reset_storage_parameters(schema_editor: BaseDatabaseSchemaEditor, table: str, names: list[str]) -> None:
+    """Reset ``names`` on ``table`` to the server defaults (no-op when empty)."""
+    if not names:
+        return
+    quoted = schema_editor.quote_name(table)
+    resets = ", ".join(sorted(names))
+    schema_editor.execute(f"ALTER TABLE {quoted} RESET ({resets})")
+
+
+def current_storage_parameters(table: str) -> StorageParameters:
+    """Read the parameters currently set on ``table`` from ``pg_class``."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reloptions FROM pg_class WHERE oid = to_regclass(%s)",
+            [connection.ops.quote_name(table)],
+        )
+        row = cursor.fetchone()
+    if row is None or not row[0]:
+        return {}
+    return dict(_parse_option(option) for option in row[0])
+
+
+def _assignment(name: str, setting: int | float) -> str:
+    number = float(setting)
+    literal = str(int(number)) if number.is_integer() else repr(number)
+    return f"{name} = {literal}"
+
+
+def _parse_option(option: str) -> tuple[str, float]:
+    name, setting = option.split("=", 1)
+    return name, float(setting)
+
+
+class AlterStorageParameters(Operation):
+    """Apply the configured storage parameters of a model's table.
+
+    The parameters are read from settings when the migration runs, so each
+    deployment applies its own values. Reversing resets them.
+    """
+
+    reduces_to_sql = True
+    reversible = True
+
+    def __init__(self, model_name: str) -> None:
+        """Target the table of ``model_name`` in the migration's app."""
+        self.model_name = model_name
+
+    def deconstruct(self) -> tuple[str, list, dict]:
+        """Serialize the operation for migration files."""
+        return self.__class__.__qualname__, [], {"model_name": self.model_name}
+
+    def state_forwards(self, app_label: str, state: ProjectState) -> None:
+        """Storage parameters are not part of the model state."""
+
+    def database_forwards(
+        self,
+        app_label: str,
+        schema_editor: BaseDatabaseSchemaEditor,
+        from_state: ProjectState,
+        to_state: ProjectState,
+    ) -> None:
+        """Set the configured parameters on the table."""
+        model = to_state.apps.get_model(app_label, self.model_name)
+        set_storage_parameters(schema_editor, model._meta.db_table, storage_parameters(model._meta.label))
+
+    def database_backwards(
+        self,
+        app_label: str,
+        schema_editor: BaseDatabaseSchemaEditor,
+        from_state: ProjectState,
+        to_state: ProjectState,
+    ) -> None:
+        """Reset the configured parameters to the server defaults."""
+        model = from_state.apps.get_model(app_label, self.model_name)
+        reset_storage_parameters(schema_editor, model._meta.db_table, list(storage_parameters(model._meta.label)))
+
+    def describe(self) -> str:
+        """Describe the operation for ``migrate`` output."""
+        return f"Apply configured storage parameters to {self.model_name}"
+
+    @property
+    def migration_name_fragment(self) -> str:
+        """Name fragment for generated migration names."""
+        model_name = self.model_name.lower()
+        return f"{model_name}_storage_parameters"
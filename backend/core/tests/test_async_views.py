@@ -0,0 +1,109 @@
+"""Tests for AsyncReadView and async_get_route."""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from asgiref.sync import async_to_sync
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from rest_framework.exceptions import ValidationError
+
+from account.services.token_provider import TokenProvider
+from config import jwt_config
+from core.async_views import AsyncReadView, async_get_route
+
+
+class _EchoView(AsyncReadView):
+    async def build_payload(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+        return {"user_id": request.user.id}
+
+
+class _InvalidView(AsyncReadView):
+    requires_authentication = False
+
+    async def build_payload(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+        raise ValidationError({"ordering": ["Invalid choice."]})
+
+
+def _sync_view(request: HttpRequest) -> HttpResponse:
+    return HttpResponse("sync")
+
+
+class AsyncReadViewTests(TestCase):
+    """Test authentication and error rendering of AsyncReadView."""
+
+    def setUp(self) -> None:
+        """Create request factory."""
+        self.factory = RequestFactory()
+
+    def test_anonymous_request_is_rejected_when_authentication_required(self) -> None:
+        """Missing cookie returns DRF's 401 body and WWW-Authenticate header."""
+        response = async_to_sync(_EchoView.as_view())(self.factory.get("/echo"))
+
+        assert response.status_code == 401
+        assert response["WWW-Authenticate"] == "Bearer"
+        assert json.loads(response.content) == {
+            "detail": "Authentication credentials were not provided.",
+        }
+
+    def test_invalid_token_is_rejected(self) -> None:
+        """Invalid JWT cookie returns authentication failure."""
+        request = self.factory.get("/echo")
+        request.COOKIES[jwt_config.COOKIE_NAME] = "not-a-token"
+
+        response = async_to_sync(_EchoView.as_view())(request)
+
+        assert response.status_code == 401
+
+    def test_valid_token_authenticates_user(self) -> None:
+        """Valid JWT cookie sets request.user for build_payload."""
+        from account.models import User
+
+        user = User.objects.create_user(username="asyncuser", email="a@example.com", password="pass12345")
+        request = self.factory.get("/echo")
+        request.COOKIES[jwt_config.COOKIE_NAME] = TokenProvider().generate_token(user.id, user.username)
+
+        response = async_to_sync(_EchoView.as_view())(request)
+
+        assert response.status_code == 200
+        assert json.loads(response.content) == {"user_id": user.id}
+
+    def test_validation_error_renders_field_errors(self) -> None:
+        """ValidationError detail is rendered without a detail wrapper."""
+        response = async_to_sync(_InvalidView.as_view())(self.factory.get("/invalid"))
+
+        assert response.status_code == 400
+        assert json.loads(response.content) == {"ordering": ["Invalid choice."]}
+
+
+class AsyncGetRouteTests(TestCase):
+    """Test method routing between async and sync views."""
+
+    def setUp(self) -> None:
+        """Create request factory."""
+        self.factory = RequestFactory()
+
+    @override_settings(ASYNC_LIST_VIEWS=False)
+    def test_returns_sync_view_when_disabled(self) -> None:
+        """Without the flag the DRF view is mounted unchanged."""
+        assert async_get_route(_sync_view, _InvalidView.as_view()) is _sync_view
+
+    @override_settings(ASYNC_LIST_VIEWS=True)
+    def test_routes_get_to_async_view(self) -> None:
+        """GET requests reach the async view."""
+        route = async_get_route(_sync_view, _InvalidView.as_view())
+
+        response = async_to_sync(route)(self.factory.get("/invalid"))
+
+        assert response.status_code == 400
+        assert route.csrf_exempt is True
+
+    @override_settings(ASYNC_LIST_VIEWS=True)
+    def test_routes_other_methods_to_sync_view(self) -> None:
+        """Non-GET requests are delegated to the sync view."""
+        route = async_get_route(_sync_view, _InvalidView.as_view())
+
+        response = async_to_sync(route)(self.factory.post("/invalid"))
+
+        assert response.content == b"sync"
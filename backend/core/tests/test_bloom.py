@@ -0,0 +1,37 @@
+"""Tests for the Bloom filter."""
+from __future__ import annotations
+
+from django.test import SimpleTestCase
+
+from core.bloom import BloomFilter
+
+_KEYS = 2000
+
+
+class BloomFilterTests(SimpleTestCase):
+    """Test membership guarantees and sizing."""
+
+    def setUp(self) -> None:
+        """Fill a filter to capacity."""
+        self.bloom = BloomFilter(capacity=_KEYS, error_rate=0.01)
+        for index in range(_KEYS):
+            self.bloom.add(f"key-{index}")
+
+    def test_added_keys_are_always_found(self) -> None:
+        """There are no false negatives."""
+        assert all(self.bloom.might_contain(f"key-{index}") for index in range(_KEYS))
+
+    def test_false_positive_rate_is_near_target(self) -> None:
+        """At capacity, absent keys are reported present about 1% of the time."""
+        false_positives = sum(
+            self.bloom.might_contain(f"other-{index}") for index in range(_KEYS * 5)
+        )
+
+        # Target is 1% of 10000 probes; allow generous slack.
+        assert false_positives < 300
+
+    def test_count_ignores_repeated_keys(self) -> None:
+        """Re-adding present keys does not use up capacity."""
+        self.bloom.add("key-0")
+
+        assert self.bloom.count <= _KEYS
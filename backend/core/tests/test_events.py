@@ -0,0 +1,97 @@
+"""Tests for the post-commit domain event bus."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from unittest import mock
+
+from django.db import transaction
+from django.test import TestCase
+
+from core.events import DELIVER_EVENTS_JOB, DomainEvent, EventBus
+from core.job_queue import JobRunner
+from core.models import Job
+
+
+@dataclass(frozen=True, slots=True)
+class Pinged(DomainEvent):
+    """Test event."""
+
+    number: int
+
+
+@dataclass(frozen=True, slots=True)
+class Ponged(DomainEvent):
+    """Another test event."""
+
+    number: int
+
+
+class EventBusTests(TestCase):
+    """Test post-commit batching, rollback and delivery modes."""
+
+    def setUp(self) -> None:
+        """Install a fresh bus with a recording subscriber."""
+        self.bus = EventBus()
+        patcher = mock.patch("core.events.bus", self.bus)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.batches: list[list[DomainEvent]] = []
+        self.bus.subscribe(Pinged)(self.batches.append)
+
+    def test_events_wait_for_commit_and_arrive_as_one_batch(self) -> None:
+        """Handlers run once after commit with every event in publish order."""
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                self.bus.publish(Pinged(1))
+                self.bus.publish(Ponged(2))
+                self.bus.publish(Pinged(3))
+                assert not self.batches
+
+        assert self.batches == [[Pinged(1), Pinged(3)]]
+
+    def test_rollback_drops_events(self) -> None:
+        """Events of a rolled back transaction are never delivered."""
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertRaises(RuntimeError):
+                with transaction.atomic():
+                    self.bus.publish(Pinged(1))
+                    raise RuntimeError
+            self.bus.publish(Pinged(2))
+
+        assert self.batches == [[Pinged(2)]]
+
+    def test_rolled_back_savepoint_drops_only_its_events(self) -> None:
+        """Events published in a rolled back savepoint are discarded."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.bus.publish(Pinged(1))
+            with self.assertRaises(RuntimeError):
+                with transaction.atomic():
+                    self.bus.publish(Pinged(2))
+                    raise RuntimeError
+
+        assert self.batches == [[Pinged(1)]]
+
+    def test_failing_handler_does_not_block_others(self) -> None:
+        """An exception in one subscriber is logged and others still run."""
+        failing = mock.Mock(side_effect=RuntimeError("boom"), __qualname__="failing")
+        self.bus.subscribe(Pinged)(failing)
+
+        with self.assertLogs("core.events", level="ERROR"):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.bus.publish(Pinged(1))
+
+        failing.assert_called_once()
+        assert self.batches == [[Pinged(1)]]
+
+    def test_deferred_subscriber_runs_in_worker(self) -> None:
+        """Deferred delivery enqueues a job that rebuilds the events."""
+        deferred: list[list[DomainEvent]] = []
+        self.bus.subscribe(Ponged, deferred=True)(deferred.append)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.bus.publish(Ponged(7))
+
+        assert Job.objects.get().name == DELIVER_EVENTS_JOB
+        assert not deferred
+        assert JobRunner().run_next()
+        assert deferred == [[Ponged(7)]]
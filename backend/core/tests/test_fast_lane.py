@@ -0,0 +1,115 @@
+"""Tests for FastLaneMiddleware and fast-lane BrickSet handlers."""
+from __future__ import annotations
+
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from model_bakery import baker
+
+from catalog.models import BrickSet
+from config import jwt_config
+from core.fast_lane import FastLaneMiddleware
+from valuation.models import Valuation
+
+
+class FastLaneContractTests(TestCase):
+    """Fast-lane responses must equal the full-stack responses."""
+
+    def setUp(self) -> None:
+        """Create a brickset with a valuation."""
+        self.brickset = baker.make(BrickSet, number=10001)
+        baker.make(Valuation, brickset=self.brickset, value=100)
+        baker.make(BrickSet, number=10002)
+
+    def _assert_same_response(self, path: str, query: dict | None = None) -> None:
+        with override_settings(FAST_LANE_ENABLED=False):
+            expected = self.client.get(path, query)
+        with override_settings(FAST_LANE_ENABLED=True):
+            actual = self.client.get(path, query)
+        assert actual.status_code == expected.status_code
+        assert actual.content == expected.content
+        assert dict(actual.headers) == dict(expected.headers)
+
+    def test_list_matches_full_stack(self) -> None:
+        """Paginated list is identical."""
+        self._assert_same_response(reverse("catalog:brickset-list"), {"page_size": "1", "page": "2"})
+
+    def test_list_validation_error_matches_full_stack(self) -> None:
+        """Invalid filter 400 body is identical."""
+        self._assert_same_response(reverse("catalog:brickset-list"), {"ordering": "bogus"})
+
+    def test_list_invalid_page_matches_full_stack(self) -> None:
+        """Out of range page 404 body is identical."""
+        self._assert_same_response(reverse("catalog:brickset-list"), {"page": "7"})
+
+    def test_detail_matches_full_stack(self) -> None:
+        """Detail body and headers are identical."""
+        self._assert_same_response(reverse("catalog:brickset-detail", kwargs={"pk": self.brickset.id}))
+
+    def test_detail_not_found_matches_full_stack(self) -> None:
+        """Missing brickset 404 body is identical."""
+        self._assert_same_response(reverse("catalog:brickset-detail", kwargs={"pk": 999999}))
+
+
+@override_settings(FAST_LANE_ENABLED=True)
+class FastLaneEligibilityTests(TestCase):
+    """Requests the fast lane cannot answer fall through to the full stack."""
+
+    def setUp(self) -> None:
+        """Create middleware whose downstream chain returns a marker response."""
+        self.factory = RequestFactory()
+        self.url = reverse("catalog:brickset-list")
+        self.full_stack_response = HttpResponse("full stack")
+        self.middleware = FastLaneMiddleware(lambda request: self.full_stack_response)
+        baker.make(BrickSet, number=10001)
+
+    def test_anonymous_json_get_uses_fast_lane(self) -> None:
+        """Plain GET on a registered route is answered by the fast lane."""
+        response = self.middleware(self.factory.get(self.url, HTTP_ACCEPT="application/json, */*"))
+
+        assert response is not self.full_stack_response
+        assert response.status_code == 200
+
+    def test_jwt_cookie_uses_full_stack(self) -> None:
+        """Requests carrying the JWT cookie go through DRF authentication."""
+        request = self.factory.get(self.url)
+        request.COOKIES[jwt_config.COOKIE_NAME] = "token"
+
+        assert self.middleware(request) is self.full_stack_response
+
+    def test_html_accept_uses_full_stack(self) -> None:
+        """Browsers keep getting the browsable API."""
+        request = self.factory.get(self.url, HTTP_ACCEPT="text/html,application/xhtml+xml")
+
+        assert self.middleware(request) is self.full_stack_response
+
+    def test_accept_parameters_use_full_stack(self) -> None:
+        """Renderer parameters such as indent are left to DRF."""
+        request = self.factory.get(self.url, HTTP_ACCEPT="application/json; indent=2")
+
+        assert self.middleware(request) is self.full_stack_response
+
+    def test_format_override_uses_full_stack(self) -> None:
+        """The format query parameter is left to DRF."""
+        request = self.factory.get(self.url, {"format": "api"})
+
+        assert self.middleware(request) is self.full_stack_response
+
+    def test_post_uses_full_stack(self) -> None:
+        """Non-GET methods reach the DRF view."""
+        assert self.middleware(self.factory.post(self.url)) is self.full_stack_response
+
+    def test_unregistered_route_uses_full_stack(self) -> None:
+        """Routes not listed in FAST_LANE_ROUTES are untouched."""
+        request = self.factory.get(reverse("catalog:owned-brickset-list"))
+
+        assert self.middleware(request) is self.full_stack_response
+
+    def test_unknown_path_uses_full_stack(self) -> None:
+        """Unresolvable paths are left to the URL resolver's 404 handling."""
+        assert self.middleware(self.factory.get("/missing")) is self.full_stack_response
+
+    @override_settings(FAST_LANE_ENABLED=False)
+    def test_disabled_setting_uses_full_stack(self) -> None:
+        """FAST_LANE_ENABLED=False turns the fast lane off."""
+        assert self.middleware(self.factory.get(self.url)) is self.full_stack_response
@@ -0,0 +1,87 @@
+"""Tests for the request-scoped identity map."""
+from __future__ import annotations
+
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+from model_bakery import baker
+
+from account.services.user_profile_service import UserProfileService
+from catalog.models import BrickSet
+from core.identity_map import IdentityMapMiddleware, identity_map
+from valuation.models import Valuation
+from valuation.services.like_counter import LikeCounter
+
+
+def _scope_view(request: object) -> HttpResponse:
+    return HttpResponse(str(identity_map.active))
+
+
+class IdentityMapTests(TestCase):
+    """Test reuse within a scope and invalidation by writes."""
+
+    def setUp(self) -> None:
+        """Create a brickset with a valuation."""
+        self.brickset = baker.make(BrickSet, number=10001)
+        self.valuation = baker.make(Valuation, brickset=self.brickset, value=100)
+
+    def test_load_reuses_instance_within_scope(self) -> None:
+        """The second load of the same row issues no query."""
+        with identity_map.scope():
+            first = identity_map.load(BrickSet, self.brickset.pk)
+            with self.assertNumQueries(0):
+                second = identity_map.load(BrickSet, str(self.brickset.pk))
+
+        assert second is first
+
+    def test_load_outside_scope_always_queries(self) -> None:
+        """Without a scope nothing is cached."""
+        identity_map.load(BrickSet, self.brickset.pk)
+
+        with self.assertNumQueries(1):
+            identity_map.load(BrickSet, self.brickset.pk)
+
+    def test_scope_is_cleared_on_exit(self) -> None:
+        """A new scope starts empty."""
+        with identity_map.scope():
+            identity_map.load(BrickSet, self.brickset.pk)
+
+        with identity_map.scope(), self.assertNumQueries(1):
+            identity_map.load(BrickSet, self.brickset.pk)
+
+    def test_save_and_delete_evict(self) -> None:
+        """Writes through the ORM drop the cached row."""
+        with identity_map.scope():
+            identity_map.load(Valuation, self.valuation.pk)
+            Valuation.valuations.get(pk=self.valuation.pk).save()
+            with self.assertNumQueries(1):
+                identity_map.load(Valuation, self.valuation.pk)
+
+            self.valuation.delete()
+            with self.assertRaises(Valuation.DoesNotExist):
+                identity_map.load(Valuation, self.valuation.pk)
+
+    def test_like_counter_update_evicts(self) -> None:
+        """Bulk counter updates are not served stale."""
+        with identity_map.scope():
+            identity_map.load(Valuation, self.valuation.pk)
+            LikeCounter("sync").record(self.valuation.pk, 1)
+
+            assert identity_map.load(Valuation, self.valuation.pk).likes_count == 1
+
+    def test_profile_reuses_authenticated_user(self) -> None:
+        """UserProfileService does not reload the user loaded by auth."""
+        user = baker.make("account.User")
+
+        with identity_map.scope():
+            identity_map.load(type(user), user.pk)
+            with self.assertNumQueries(0):
+                profile = UserProfileService().execute(user.pk)
+
+        assert profile.id == user.pk
+
+    def test_middleware_opens_scope_per_request(self) -> None:
+        """The view runs inside a scope that is gone afterwards."""
+        response = IdentityMapMiddleware(_scope_view)(RequestFactory().get("/"))
+
+        assert response.content == b"True"
+        assert not identity_map.active
@@ -0,0 +1,119 @@
+"""Tests for the LISTEN/NOTIFY cache invalidation bus."""
+from __future__ import annotations
+
+import datetime
+import json
+import threading
+from contextlib import closing
+from unittest import mock
+
+from django.db import connection, transaction
+from django.test import TransactionTestCase
+from django.utils import timezone
+
+from core.invalidation import CHANNEL, InvalidationListener, invalidate, invalidation_handler
+from core.models import CacheInvalidation
+
+_NAMESPACE = "tests"
+
+
+def _listen(listener: InvalidationListener, stop: threading.Event) -> None:
+    with closing(connection):  # the thread's own connection
+        listener.listen(stop)
+
+
+class InvalidationBusTests(TransactionTestCase):
+    """Test publishing, batching, catch-up and the listener loop."""
+
+    def setUp(self) -> None:
+        """Register a handler recording the keys it is given."""
+        self.calls: list[list[str] | None] = []
+        patcher = mock.patch.dict("core.invalidation._handlers")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        invalidation_handler(_NAMESPACE)(self.calls.append)
+
+    def test_invalidate_outside_transaction_applies_and_logs(self) -> None:
+        """Keys are evicted locally and written to the log once."""
+        invalidate(_NAMESPACE, [1, 2])
+
+        assert self.calls == [["1", "2"]]
+        assert CacheInvalidation.objects.get().messages == {_NAMESPACE: ["1", "2"]}
+
+    def test_transaction_is_broadcast_as_one_batch_after_commit(self) -> None:
+        """All keys of a transaction share one log row."""
+        with transaction.atomic():
+            invalidate(_NAMESPACE, [1])
+            invalidate(_NAMESPACE, [2])
+            assert not CacheInvalidation.objects.exists()
+
+        assert CacheInvalidation.objects.get().messages == {_NAMESPACE: ["1", "2"]}
+
+    def test_rollback_broadcasts_nothing(self) -> None:
+        """Rolled-back writes are not announced to other nodes."""
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            invalidate(_NAMESPACE, [1])
+            raise RuntimeError
+
+        invalidate(_NAMESPACE, [2])
+
+        logged = CacheInvalidation.objects.values_list("messages", flat=True)
+        assert list(logged) == [{_NAMESPACE: ["2"]}]
+
+    def test_notifications_from_other_nodes_are_merged(self) -> None:
+        """Payloads are merged per namespace; own-node payloads are skipped."""
+        listener = InvalidationListener()
+        logged = CacheInvalidation.objects.create(messages={_NAMESPACE: ["3"]})
+
+        with mock.patch("core.invalidation.node_id", return_value="self"):
+            listener.apply_notifications([
+                json.dumps({"id": 1, "node": "other", "messages": {_NAMESPACE: ["1"]}}),
+                json.dumps({"id": 2, "node": "other", "messages": {_NAMESPACE: ["2", "1"]}}),
+                json.dumps({"id": logged.id, "node": "other"}),
+                json.dumps({"id": 4, "node": "self", "messages": {_NAMESPACE: ["4"]}}),
+            ])
+
+        assert self.calls == [["1", "2", "3"]]
+
+    def test_first_catch_up_resets_namespaces(self) -> None:
+        """A node without sync history drops everything."""
+        InvalidationListener().catch_up()
+
+        assert self.calls == [None]
+
+    def test_catch_up_replays_log_since_last_sync(self) -> None:
+        """Invalidations logged while disconnected are applied on reconnect."""
+        listener = InvalidationListener()
+        listener._synced_at = timezone.now()
+        CacheInvalidation.objects.create(messages={_NAMESPACE: ["missed"]})
+        old = CacheInvalidation.objects.create(messages={_NAMESPACE: ["old"]})
+        CacheInvalidation.objects.filter(pk=old.pk).update(
+            created_at=timezone.now() - datetime.timedelta(hours=1),
+        )
+
+        listener.catch_up()
+
+        assert self.calls == [["missed"]]
+
+    def test_listener_applies_notifications(self) -> None:
+        """A NOTIFY on the channel reaches the handler of a running listener."""
+        listener = InvalidationListener(batch_window=0, poll_timeout=0.1)
+        listener._synced_at = timezone.now()
+        stop = threading.Event()
+        thread = threading.Thread(target=_listen, args=(listener, stop))
+        thread.start()
+        payload = json.dumps({
+            "id": 0,
+            "node": "other",
+            "messages": {_NAMESPACE: ["live"]},
+        })
+        for _ in range(50):
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_notify(%s, %s)", [CHANNEL, payload])
+            if self.calls:
+                break
+            stop.wait(0.1)
+        stop.set()
+        thread.join()
+
+        assert ["live"] in self.calls
@@ -0,0 +1,20 @@
+"""Tests for the iterable helpers."""
+from __future__ import annotations
+
+from django.test import SimpleTestCase
+
+from core.iterables import batched
+
+
+class BatchedTests(SimpleTestCase):
+    """Test splitting iterables into batches."""
+
+    def test_last_batch_holds_the_rest(self) -> None:
+        """Batches are consecutive and only the last one is short."""
+        batches = batched(iter(range(5)), 2)
+
+        assert list(batches) == [[0, 1], [2, 3], [4]]
+
+    def test_empty_iterable_yields_nothing(self) -> None:
+        """No items give no batches, not one empty batch."""
+        assert not list(batched([], 3))
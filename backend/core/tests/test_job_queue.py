@@ -0,0 +1,129 @@
+"""Tests for the PostgreSQL-backed job queue."""
+from __future__ import annotations
+
+import datetime
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from core.job_queue import RETRY_MAX_SECONDS, JobRunner, enqueue, job_handler
+from core.models import Job, JobStatus
+
+_OK_JOB = "tests.ok"
+_FAILING_JOB = "tests.failing"
+
+
+class JobQueueTests(TestCase):
+    """Test enqueue, claiming, retries and leases."""
+
+    def setUp(self) -> None:
+        """Register test handlers recording their payloads."""
+        self.calls: list[dict] = []
+        patcher = mock.patch.dict("core.job_queue._handlers")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        job_handler(_OK_JOB)(self.calls.append)
+        job_handler(_FAILING_JOB)(self._fail)
+        self.runner = JobRunner(lease_seconds=60)
+
+    def test_enqueue_drops_pending_duplicates(self) -> None:
+        """Only one pending job exists per dedup key."""
+        enqueue(_OK_JOB, dedup_key="same")
+        enqueue(_OK_JOB, dedup_key="same")
+        enqueue(_OK_JOB)
+        enqueue(_OK_JOB)
+
+        assert Job.objects.filter(dedup_key="same").count() == 1
+        assert Job.objects.count() == 3
+
+    def test_run_next_runs_handler_and_deletes_job(self) -> None:
+        """A successful job is removed from the queue."""
+        enqueue(_OK_JOB, {"answer": 42})
+
+        assert self.runner.run_next()
+
+        assert self.calls == [{"answer": 42}]
+        assert not Job.objects.exists()
+
+    def test_run_next_returns_false_when_idle(self) -> None:
+        """No due job means nothing ran."""
+        enqueue(_OK_JOB, delay=datetime.timedelta(minutes=5))
+
+        assert not self.runner.run_next()
+        assert not self.calls
+
+    def test_failure_schedules_retry_with_backoff(self) -> None:
+        """A failed attempt returns the job to PENDING with a later run_after."""
+        enqueue(_FAILING_JOB)
+        before = timezone.now()
+
+        assert self.runner.run_next()
+
+        job = Job.objects.get()
+        assert job.status == JobStatus.PENDING
+        assert job.attempts == 1
+        assert job.run_after >= before + JobRunner.retry_delay(1)
+        assert "boom" in job.last_error
+
+    def test_failure_after_max_attempts_marks_failed(self) -> None:
+        """The last failed attempt keeps the job as FAILED for inspection."""
+        enqueue(_FAILING_JOB, max_attempts=1)
+
+        self.runner.run_next()
+
+        job = Job.objects.get()
+        assert job.status == JobStatus.FAILED
+        assert not self.runner.run_next()
+
+    def test_retry_collapses_into_newer_duplicate(self) -> None:
+        """A retry is dropped if an identical job was enqueued meanwhile."""
+        enqueue(_FAILING_JOB, dedup_key="dup")
+        job = self.runner._claim()
+        enqueue(_FAILING_JOB, dedup_key="dup")
+
+        self.runner._schedule_retry(job, RuntimeError("boom"))
+
+        assert Job.objects.count() == 1
+        assert Job.objects.get().attempts == 0
+
+    def test_unregistered_handler_counts_as_failure(self) -> None:
+        """Jobs without a handler are retried and eventually fail."""
+        enqueue("tests.unknown", max_attempts=1)
+
+        self.runner.run_next()
+
+        job = Job.objects.get()
+        assert job.status == JobStatus.FAILED
+        assert "No handler registered" in job.last_error
+
+    def test_expired_lease_is_reclaimed(self) -> None:
+        """A job whose worker died is claimed again after the lease."""
+        enqueue(_OK_JOB)
+        claimed = self.runner._claim()
+        assert not self.runner.run_next()
+
+        Job.objects.filter(pk=claimed.pk).update(run_after=timezone.now())
+
+        assert self.runner.run_next()
+        assert len(self.calls) == 1
+
+    def test_expired_lease_on_last_attempt_marks_failed(self) -> None:
+        """A job that crashed its worker on the last attempt is not rerun."""
+        enqueue(_OK_JOB, max_attempts=1)
+        claimed = self.runner._claim()
+        Job.objects.filter(pk=claimed.pk).update(run_after=timezone.now())
+
+        assert not self.runner.run_next()
+
+        assert Job.objects.get().status == JobStatus.FAILED
+        assert not self.calls
+
+    def test_retry_delay_is_capped(self) -> None:
+        """Backoff doubles per attempt up to the maximum."""
+        assert JobRunner.retry_delay(2) == 2 * JobRunner.retry_delay(1)
+        assert JobRunner.retry_delay(50).total_seconds() == RETRY_MAX_SECONDS
+
+    @staticmethod
+    def _fail(payload: dict) -> None:
+        raise RuntimeError("boom")
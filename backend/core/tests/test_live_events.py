@@ -0,0 +1,70 @@
+"""Tests for the per-process live event hub."""
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+
+from asgiref.sync import sync_to_async
+from django.test import TransactionTestCase
+
+from core.live_events import LiveEvent, LiveEventHub, _QUEUE_SIZE, notify
+
+_LISTEN_TIMEOUT = 5
+
+
+class LiveEventHubTests(TransactionTestCase):
+    """Test fan-out, overflow handling and the LISTEN loop."""
+
+    def setUp(self) -> None:
+        """Use a private hub whose listener is stopped after each test."""
+        self.hub = LiveEventHub(poll_timeout=0.1)
+        self.addCleanup(self.hub.stop)
+
+    async def test_dispatch_reaches_only_subscribers_of_topic(self) -> None:
+        """Events are delivered to the topic's subscribers only."""
+        with self.hub.subscribe("brickset:1") as first, self.hub.subscribe("brickset:2") as second:
+            self.hub.dispatch("brickset:1", LiveEvent("likes_count", {"likes_count": 1}))
+            received = await anext(first.events(heartbeat=1))
+            await asyncio.sleep(0)
+            other_empty = second.queue.empty()
+
+        assert received == LiveEvent("likes_count", {"likes_count": 1})
+        assert other_empty
+        assert self.hub.subscriber_count() == 0
+
+    async def test_idle_subscription_yields_heartbeat(self) -> None:
+        """None is yielded when nothing arrives within the heartbeat."""
+        with self.hub.subscribe("brickset:1") as subscription:
+            received = await anext(subscription.events(heartbeat=0.01))
+
+        assert received is None
+
+    async def test_overflowing_subscription_is_closed(self) -> None:
+        """A client that stops reading is dropped instead of buffering forever."""
+        with self.hub.subscribe("brickset:1") as subscription:
+            for number in range(_QUEUE_SIZE + 1):
+                self.hub.dispatch("brickset:1", LiveEvent("likes_count", {"n": number}))
+            await asyncio.sleep(0)
+
+            assert subscription.closed
+
+    async def test_notification_reaches_subscriber_through_listener(self) -> None:
+        """A NOTIFY from any connection is fanned out by the listener thread."""
+        with self.hub.subscribe("brickset:7") as subscription:
+            await sync_to_async(self._wait_until_listening)()
+            await sync_to_async(notify)("brickset:7", "likes_count", {"likes_count": 3})
+            received = await anext(subscription.events(heartbeat=_LISTEN_TIMEOUT))
+
+        assert received == LiveEvent("likes_count", {"likes_count": 3})
+
+    def test_event_is_encoded_as_server_sent_event(self) -> None:
+        """Name and JSON data are rendered as one SSE message."""
+        encoded = LiveEvent("likes_count", {"valuation_id": 7}).encode()
+
+        assert encoded == f"event: likes_count\ndata: {json.dumps({'valuation_id': 7})}\n\n"
+
+    def _wait_until_listening(self) -> None:
+        deadline = time.monotonic() + _LISTEN_TIMEOUT
+        while not self.hub._listened and time.monotonic() < deadline:
+            time.sleep(0.01)
@@ -0,0 +1,102 @@
+"""Tests for PageWindowPaginator."""
+from __future__ import annotations
+
+from django.test import RequestFactory, TestCase
+from model_bakery import baker
+from rest_framework import serializers
+from rest_framework.exceptions import NotFound
+
+from catalog.models import BrickSet
+from catalog.views.brickset_list import BrickSetPagination
+from core.pagination import PageRequest, PageWindowPaginator
+
+
+class PageWindowPaginatorParseTests(TestCase):
+    """Test query parameter parsing mirrors DRF PageNumberPagination."""
+
+    def setUp(self) -> None:
+        """Create paginator configured like the brickset list."""
+        self.paginator = PageWindowPaginator(BrickSetPagination)
+
+    def test_parse_defaults_to_first_page_and_configured_size(self) -> None:
+        """Missing parameters resolve to page 1 with default page size."""
+        page_request = self.paginator.parse({})
+
+        assert page_request == PageRequest(number=1, size=20)
+
+    def test_parse_caps_page_size_at_max(self) -> None:
+        """page_size above max_page_size is capped."""
+        page_request = self.paginator.parse({"page_size": "500"})
+
+        assert page_request.size == 100
+
+    def test_parse_ignores_invalid_page_size(self) -> None:
+        """Non-numeric or non-positive page_size falls back to default."""
+        assert self.paginator.parse({"page_size": "abc"}).size == 20
+        assert self.paginator.parse({"page_size": "0"}).size == 20
+
+    def test_parse_last_page_string(self) -> None:
+        """page=last defers page resolution until count is known."""
+        page_request = self.paginator.parse({"page": "last"})
+
+        assert page_request.number is None
+
+    def test_parse_rejects_non_integer_page(self) -> None:
+        """Non-integer page raises NotFound like DRF."""
+        with self.assertRaises(NotFound) as exc_context:
+            self.paginator.parse({"page": "abc"})
+
+        assert str(exc_context.exception.detail) == "Invalid page."
+
+    def test_parse_rejects_zero_page(self) -> None:
+        """Page numbers below one raise NotFound."""
+        with self.assertRaises(NotFound):
+            self.paginator.parse({"page": "0"})
+
+    def test_num_pages_reports_one_page_for_empty_result(self) -> None:
+        """Empty results still have a single (empty) page."""
+        assert PageWindowPaginator.num_pages(0, 20) == 1
+        assert PageWindowPaginator.num_pages(41, 20) == 3
+
+
+class _IdSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+
+
+class PageWindowPaginatorPaginateTests(TestCase):
+    """Test synchronous pagination against a real queryset."""
+
+    def setUp(self) -> None:
+        """Create five bricksets and a paginator."""
+        self.factory = RequestFactory()
+        self.paginator = PageWindowPaginator(BrickSetPagination)
+        baker.make(BrickSet, number=iter(range(10001, 10006)), _quantity=5)
+        self.queryset = BrickSet.bricksets.order_by("id")
+
+    def test_paginate_builds_links_for_middle_page(self) -> None:
+        """Middle page has next and previous links without page=1."""
+        request = self.factory.get("/api/v1/bricksets", {"page": "2", "page_size": "2"})
+
+        payload = self.paginator.paginate(request, self.queryset, lambda row: row, _IdSerializer)
+
+        assert payload["count"] == 5
+        assert len(payload["results"]) == 2
+        assert "page=3" in payload["next"]
+        assert "page=" not in payload["previous"]
+
+    def test_paginate_resolves_last_page(self) -> None:
+        """page=last returns the trailing page."""
+        request = self.factory.get("/api/v1/bricksets", {"page": "last", "page_size": "2"})
+
+        payload = self.paginator.paginate(request, self.queryset, lambda row: row, _IdSerializer)
+
+        assert len(payload["results"]) == 1
+        assert payload["next"] is None
+        assert "page=2" in payload["previous"]
+
+    def test_paginate_rejects_page_beyond_last(self) -> None:
+        """Page numbers past the end raise NotFound."""
+        request = self.factory.get("/api/v1/bricksets", {"page": "9"})
+
+        with self.assertRaises(NotFound):
+            self.paginator.paginate(request, self.queryset, lambda row: row, _IdSerializer)
@@ -0,0 +1,100 @@
+"""Tests for monthly created_at partitioning of the like table.
+
+Every conversion runs inside the test transaction and is rolled back with it.
+"""
+from __future__ import annotations
+
+import datetime
+
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+from model_bakery import baker
+
+from account.models import User
+from core.partitioning import (
+    add_months,
+    is_partitioned,
+    maintain_partitions,
+    month_start,
+    partition_model,
+    partition_name,
+    partitions,
+)
+from datastore.domains.valuation_dto import CreateLikeCommand
+from valuation.exceptions import LikeDuplicateError
+from valuation.models import Like, Valuation
+from valuation.services.like_list_service import LikeListService
+from valuation.services.like_valuation_service import LikeValuationService
+
+TABLE = Like._meta.db_table
+LEGACY = f"{TABLE}_legacy"
+
+
+class LikePartitioningTests(TestCase):
+    """Test converting valuation_like in place and using it afterwards."""
+
+    def setUp(self) -> None:
+        """Store a like before the conversion."""
+        self.valuation = baker.make(Valuation, brickset__number=10001, value=100)
+        self.like = baker.make(Like, valuation=self.valuation)
+        # ALTER TABLE refuses to run while deferred foreign key checks are pending.
+        connection.check_constraints()
+        self.cutover = add_months(month_start(timezone.now()), 1)
+
+    def test_conversion_keeps_rows_in_legacy_partition(self) -> None:
+        """Existing rows stay readable; monthly partitions follow the cutover."""
+        created = partition_model(Like, months_ahead=2)
+
+        assert is_partitioned(TABLE)
+        assert created == [
+            partition_name(TABLE, self.cutover),
+            partition_name(TABLE, add_months(self.cutover, 1)),
+        ]
+        names = [partition.name for partition in partitions(TABLE)]
+        assert names == sorted([LEGACY, *created])
+        ids = list(Like.objects.values_list("id", flat=True))
+        assert ids == [self.like.id]
+        like = Like.objects.create(user=baker.make(User), valuation=self.valuation)
+        assert like.id > self.like.id
+
+    def test_unique_constraint_holds_across_partitions(self) -> None:
+        """A pair stored in a later partition still rejects a second like."""
+        partition_model(Like, months_ahead=1)
+        # Move the like into the first monthly partition.
+        moved_at = self.cutover + datetime.timedelta(days=1)
+        Like.objects.filter(pk=self.like.pk).update(created_at=moved_at)
+
+        command = CreateLikeCommand(valuation_id=self.valuation.id, user_id=self.like.user_id)
+
+        with self.assertRaises(LikeDuplicateError):
+            LikeValuationService().execute(command)
+
+    def test_maintenance_creates_missing_months_once(self) -> None:
+        """Maintenance fills the horizon and is a no-op when up to date."""
+        partition_model(Like, months_ahead=1)
+        later = add_months(self.cutover, 2)
+
+        with self.settings(PARTITION_MONTHS_AHEAD=1):
+            created = maintain_partitions(now=later)
+            repeated = maintain_partitions(now=later)
+
+        assert created == {"valuation.Like": [
+            partition_name(TABLE, add_months(self.cutover, 1)),
+            partition_name(TABLE, later),
+            partition_name(TABLE, add_months(later, 1)),
+        ]}
+        assert repeated == {"valuation.Like": []}
+
+    def test_like_list_skips_partitions_older_than_valuation(self) -> None:
+        """The valuation's creation bounds the scan to later partitions."""
+        partition_model(Like, months_ahead=2)
+        Valuation.valuations.filter(pk=self.valuation.pk).update(
+            created_at=add_months(self.cutover, 1) + datetime.timedelta(days=3),
+        )
+
+        plan = LikeListService().build_queryset(self.valuation.id).explain(analyze=True)
+
+        pruned = [line for line in plan.splitlines() if f"on {LEGACY}" in line]
+        assert pruned
+        assert all("never executed" in line for line in pruned)
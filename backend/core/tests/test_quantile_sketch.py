@@ -0,0 +1,60 @@
+"""Tests for the mergeable quantile sketch."""
+from __future__ import annotations
+
+import random
+
+from django.test import SimpleTestCase
+
+from core.quantile_sketch import QuantileSketch
+
+
+class QuantileSketchTests(SimpleTestCase):
+    """Test accuracy, merging and removal."""
+
+    def setUp(self) -> None:
+        """Draw a reproducible sample spanning the valuation range."""
+        rng = random.Random(7)
+        self.values = [rng.randint(1, 999_999) for _ in range(2001)]
+
+    def test_quantiles_are_within_relative_accuracy(self) -> None:
+        """p10, p50 and p90 are within 1% of the exact order statistics."""
+        sketch = QuantileSketch.of(self.values)
+        ordered = sorted(self.values)
+
+        for fraction in (0.1, 0.5, 0.9):
+            exact = ordered[round(fraction * (len(ordered) - 1))]
+            assert abs(sketch.quantile(fraction) - exact) <= 0.01 * exact, fraction
+
+    def test_merged_sketch_equals_sketch_of_all_values(self) -> None:
+        """Merging per-part sketches, also through JSON, loses nothing."""
+        left = QuantileSketch.of(self.values[:500])
+        saved = QuantileSketch.of(self.values[500:]).to_dict()
+        right = QuantileSketch.from_dict(saved)
+
+        left.merge(right)
+
+        assert left.to_dict() == QuantileSketch.of(self.values).to_dict()
+        assert left.count == len(self.values)
+
+    def test_removed_values_leave_no_buckets(self) -> None:
+        """Adding a negative count undoes an add."""
+        sketch = QuantileSketch.of([100, 200])
+
+        sketch.add(200, -1)
+
+        assert sketch.to_dict() == QuantileSketch.of([100]).to_dict()
+        assert QuantileSketch().quantile(0.5) is None
+
+    def test_small_samples_round_the_rank_up(self) -> None:
+        """Each quantile of a few values is one of those values."""
+        sketch = QuantileSketch.of([100, 200, 600])
+
+        estimates = [sketch.quantile(fraction) for fraction in (0, 0.1, 0.5, 0.9, 1)]
+
+        rounded = [round(estimate, -2) for estimate in estimates]
+        assert rounded == [100, 100, 200, 600, 600]
+
+    def test_non_positive_values_are_rejected(self) -> None:
+        """Logarithmic buckets cannot hold zero."""
+        with self.assertRaises(ValueError):
+            QuantileSketch().add(0)
@@ -0,0 +1,115 @@
+"""Tests for the shared sliding-window rate limiter."""
+from __future__ import annotations
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from core.models import Job, RateLimitCounter
+from core.rate_limit import (
+    PURGE_RATE_LIMITS_JOB,
+    Rate,
+    SlidingWindowLimiter,
+    purge_expired_counters,
+)
+
+_KEY = "tests:client"
+_RATE = Rate(limit=3, window=60)
+_WINDOW_START = 6000
+
+
+class SlidingWindowLimiterTests(TestCase):
+    """Test counting, sliding-window decisions and purging."""
+
+    def setUp(self) -> None:
+        """Drive the limiter from a controllable clock."""
+        self.now = float(_WINDOW_START)
+        self.limiter = SlidingWindowLimiter(clock=lambda: self.now)
+
+    def test_allows_up_to_limit_then_rejects(self) -> None:
+        """The hit past the limit is rejected with a positive retry_after."""
+        results = [self.limiter.hit(_KEY, _RATE) for _ in range(4)]
+
+        assert [result.allowed for result in results] == [True, True, True, False]
+        assert results[-1].retry_after > 0
+
+    def test_hits_are_counted_in_shared_table(self) -> None:
+        """Every process sees the same counter row."""
+        self.limiter.hit(_KEY, _RATE)
+        SlidingWindowLimiter(clock=lambda: self.now).hit(_KEY, _RATE)
+
+        counter = RateLimitCounter.objects.get(key=_KEY)
+        assert counter.hits == 2
+        assert counter.window_start == _WINDOW_START
+
+    def test_blocked_key_is_rejected_without_counting(self) -> None:
+        """Once blocked, further hits do not touch the database."""
+        for _ in range(4):
+            self.limiter.hit(_KEY, _RATE)
+
+        with self.assertNumQueries(0):
+            assert not self.limiter.hit(_KEY, _RATE).allowed
+
+    def test_previous_window_weight_decays(self) -> None:
+        """Hits of the previous window count less as the current one advances."""
+        for _ in range(3):
+            self.limiter.hit(_KEY, _RATE)
+
+        self.now = _WINDOW_START + _RATE.window + 1
+        assert not self.limiter.hit(_KEY, _RATE).allowed
+
+        self.limiter.reset()
+        self.now = _WINDOW_START + _RATE.window * 2 - 1
+        assert self.limiter.hit(_KEY, _RATE).allowed
+
+    def test_keys_are_limited_independently(self) -> None:
+        """One client over its limit does not affect another."""
+        for _ in range(4):
+            self.limiter.hit(_KEY, _RATE)
+
+        assert self.limiter.hit("tests:other", _RATE).allowed
+
+    def test_allowed_hit_schedules_purge_once(self) -> None:
+        """Purging is enqueued at most once per interval."""
+        self.limiter.hit(_KEY, _RATE)
+        self.limiter.hit(_KEY, _RATE)
+
+        assert Job.objects.filter(name=PURGE_RATE_LIMITS_JOB).count() == 1
+
+    def test_purge_deletes_only_expired_counters(self) -> None:
+        """Counters still inside the sliding window survive."""
+        self.limiter.hit(_KEY, _RATE)
+        self.now += _RATE.window * 3
+        self.limiter.hit(_KEY, _RATE)
+
+        deleted = purge_expired_counters(now=self.now)
+
+        assert deleted == 1
+        assert RateLimitCounter.objects.get(key=_KEY).window_start > _WINDOW_START
+
+
+@override_settings(RATE_LIMIT_STORE="cache")
+class CacheStoreTests(TestCase):
+    """Test counting in the shared cache instead of the database."""
+
+    def setUp(self) -> None:
+        """Start from an empty cache."""
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.now = float(_WINDOW_START)
+        self.limiter = SlidingWindowLimiter(clock=lambda: self.now)
+
+    def test_limits_without_queries(self) -> None:
+        """Hits are counted in the cache only."""
+        with self.assertNumQueries(0):
+            results = [self.limiter.hit(_KEY, _RATE).allowed for _ in range(4)]
+
+        assert results == [True, True, True, False]
+        assert not RateLimitCounter.objects.exists()
+
+    def test_previous_window_is_taken_into_account(self) -> None:
+        """The sliding estimate also works with cached counters."""
+        for _ in range(3):
+            self.limiter.hit(_KEY, _RATE)
+
+        self.now = _WINDOW_START + _RATE.window + 1
+        assert not self.limiter.hit(_KEY, _RATE).allowed
@@ -0,0 +1,142 @@
+"""Tests for the anonymous response cache and surrogate-key purging."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from functools import partial
+from unittest import mock
+
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from model_bakery import baker
+
+from catalog.models import BrickSet
+from catalog.surrogate_keys import brickset_key
+from config import jwt_config
+from core.events import publish
+from core.response_cache import ResponseCacheMiddleware, purge, response_cache
+from valuation.events import LikeAdded
+from valuation.models import Valuation
+
+
+@override_settings(RESPONSE_CACHE_ENABLED=True)
+class ResponseCacheTests(TestCase):
+    """Test caching, purging and stale serving of catalog reads."""
+
+    def setUp(self) -> None:
+        """Create two bricksets and start from an empty cache."""
+        response_cache.backend.clear()
+        self.addCleanup(response_cache.backend.clear)
+        self.brickset = baker.make(BrickSet, number=10001)
+        self.valuation = baker.make(Valuation, brickset=self.brickset, value=100)
+        self.other = baker.make(BrickSet, number=10002)
+        self.detail_url = reverse("catalog:brickset-detail", kwargs={"pk": self.brickset.pk})
+        self.other_url = reverse("catalog:brickset-detail", kwargs={"pk": self.other.pk})
+        self.list_url = reverse("catalog:brickset-list")
+
+    def test_repeated_get_is_served_without_queries(self) -> None:
+        """The second identical request does not touch the database."""
+        first = self.client.get(self.detail_url)
+
+        with self.assertNumQueries(0):
+            second = self.client.get(self.detail_url)
+
+        assert second.status_code == first.status_code
+        assert second.content == first.content
+        assert second["Content-Type"] == first["Content-Type"]
+
+    def test_query_parameter_order_is_normalized(self) -> None:
+        """Reordered query strings share one entry."""
+        self.client.get(f"{self.list_url}?page_size=1&page=2")
+
+        with self.assertNumQueries(0):
+            self.client.get(f"{self.list_url}?page=2&page_size=1")
+
+    def test_scheme_is_part_of_the_key(self) -> None:
+        """Absolute page links are not served to requests under another scheme."""
+        self.client.get(self.list_url, {"page_size": 1})
+
+        response = self.client.get(self.list_url, {"page_size": 1}, secure=True)
+
+        assert response.json()["next"].startswith("https://")
+
+    def test_authenticated_requests_bypass_cache(self) -> None:
+        """Requests carrying the JWT cookie are never served from cache."""
+        self.client.get(self.detail_url)
+        self.client.cookies[jwt_config.COOKIE_NAME] = "token"
+
+        response = self.client.get(self.detail_url)
+
+        assert response.status_code == 401
+
+    def test_event_purges_touched_detail_and_list_only(self) -> None:
+        """A like purges its brickset and the list, not other bricksets."""
+        for url in (self.detail_url, self.other_url, self.list_url):
+            self.client.get(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            publish(LikeAdded(
+                valuation_id=self.valuation.pk,
+                user_id=self.valuation.user_id,
+                brickset_id=self.brickset.pk,
+            ))
+
+        with self.assertNumQueries(0):
+            self.client.get(self.other_url)
+        refreshed = self.client.get(self.detail_url).json()
+        assert refreshed["valuations"][0]["likes_count"] == 1
+        with self.assertNumQueries(0):
+            self.client.get(self.detail_url)
+        assert self.client.get(self.list_url).json()["results"]
+
+    def test_response_cached_right_after_like_purge_shows_new_count(self) -> None:
+        """A like purges only after its counters are written, so a GET right after caches the new count."""
+        self.client.get(self.detail_url)
+        cached_counts: list[int] = []
+        purge_then_get = partial(self._purge_then_get, response_cache.purge, cached_counts)
+
+        with mock.patch.object(response_cache, "purge", side_effect=purge_then_get):
+            with self.captureOnCommitCallbacks(execute=True):
+                publish(LikeAdded(
+                    valuation_id=self.valuation.pk,
+                    user_id=self.valuation.user_id,
+                    brickset_id=self.brickset.pk,
+                ))
+
+        assert cached_counts
+        assert set(cached_counts) == {1}
+        with self.assertNumQueries(0):
+            detail = self.client.get(self.detail_url).json()
+        assert detail["valuations"][0]["likes_count"] == 1
+
+    def test_stale_entry_served_when_rebuild_fails(self) -> None:
+        """An expired entry is returned if the rebuild errors out."""
+        request = RequestFactory().get(self.detail_url)
+        ResponseCacheMiddleware(lambda req: HttpResponse(b"cached"))(request)
+
+        with mock.patch.object(response_cache, "_clock", return_value=2e10):
+            response = ResponseCacheMiddleware(lambda req: HttpResponse(status=503))(request)
+
+        assert response.status_code == 200
+        assert response.content == b"cached"
+
+    def test_purged_entry_is_not_served_stale(self) -> None:
+        """Purging wins over stale serving."""
+        request = RequestFactory().get(self.detail_url)
+        ResponseCacheMiddleware(lambda req: HttpResponse(b"cached"))(request)
+        purge([brickset_key(self.brickset.pk)])
+
+        response = ResponseCacheMiddleware(lambda req: HttpResponse(status=503))(request)
+
+        assert response.status_code == 503
+
+    def _purge_then_get(
+        self,
+        purge: Callable[[Iterable[str]], None],
+        cached_counts: list[int],
+        surrogate_keys: Iterable[str],
+    ) -> None:
+        """Purge, then cache the detail page as an anonymous GET landing right after would."""
+        purge(surrogate_keys)
+        detail = self.client.get(self.detail_url).json()
+        cached_counts.append(detail["valuations"][0]["likes_count"])
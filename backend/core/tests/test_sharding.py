@@ -0,0 +1,154 @@
+"""Tests for routing valuations and likes to shards."""
+from __future__ import annotations
+
+from unittest import skipUnless
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+from model_bakery import baker
+
+from catalog.models import BrickSet
+from catalog.services.brickset_list_service import BrickSetListService
+from core import sharding
+from valuation.models import Like, LikeCountDelta, Valuation
+from valuation.services.brickset_statistics import BrickSetStatisticsService
+from valuation.services.counter_reconciliation import reconcile_range, split_id_space
+from valuation.services.like_list_service import LikeListService
+from valuation.services.owned_valuation_list_service import OwnedValuationListService
+from valuation.services.valuation_list_service import ValuationListService
+
+User = get_user_model()
+
+SHARDS = ("shard_0", "shard_1", "shard_2")
+
+
+@override_settings(VALUATION_SHARDS=SHARDS)
+class ShardRouterTests(SimpleTestCase):
+    """Test shard selection from hints and instances."""
+
+    def setUp(self) -> None:
+        """Create the router."""
+        self.router = sharding.ShardRouter()
+
+    def test_brickset_hint_picks_shard_by_modulo(self) -> None:
+        """Valuations of brickset 4 live on shards[4 % 3]."""
+        assert self.router.db_for_read(Valuation, **sharding.for_brickset(4)) == "shard_1"
+        assert self.router.db_for_write(Valuation, **sharding.for_brickset(6)) == "shard_0"
+
+    def test_ids_encode_their_shard(self) -> None:
+        """Ids 1, 65, 129... belong to shard 0; ids 3, 67... to shard 2."""
+        assert self.router.db_for_read(Valuation, **sharding.for_pk(65)) == "shard_0"
+        assert self.router.db_for_read(Like, **sharding.for_valuation(67)) == "shard_2"
+        grouped = sharding.group_by_shard([1, 2, 66, 3])
+        assert grouped == {"shard_0": [1], "shard_1": [2, 66], "shard_2": [3]}
+
+    def test_instances_route_their_related_rows(self) -> None:
+        """Bricksets, valuations and likes route by the brickset they belong to."""
+        assert self.router.db_for_read(Valuation, instance=BrickSet(pk=5)) == "shard_2"
+        assert self.router.db_for_write(Valuation, instance=Valuation(brickset_id=7)) == "shard_1"
+        assert self.router.db_for_write(LikeCountDelta, instance=Like(valuation_id=3)) == "shard_2"
+
+    def test_unsharded_models_stay_on_default(self) -> None:
+        """A valuation's brickset is read from default, not from the valuation's shard."""
+        valuation = Valuation(brickset_id=7)
+        valuation._state.db = "shard_1"
+
+        assert self.router.db_for_read(BrickSet, instance=valuation) == "default"
+        assert self.router.allow_relation(valuation, BrickSet(pk=7)) is True
+
+    def test_query_without_hint_is_rejected(self) -> None:
+        """A valuation query spanning shards must say so explicitly."""
+        with self.assertRaises(sharding.UnroutableQuery):
+            self.router.db_for_read(Valuation)
+        with self.assertRaises(sharding.UnroutableQuery):
+            self.router.db_for_read(Valuation, instance=User(pk=1))
+
+    @override_settings(VALUATION_SHARDS=())
+    def test_router_steps_aside_without_shards(self) -> None:
+        """Without shards Django's default routing applies."""
+        assert self.router.db_for_read(Valuation) is None
+        assert sharding.databases() == ("default",)
+        assert sharding.shard_for_brickset(4) == "default"
+
+
+@skipUnless(len(settings.VALUATION_SHARDS) >= 2, "needs VALUATION_SHARD_HOSTS with two or more shards")
+class ShardedServicesTests(TransactionTestCase):
+    """Run the list services against real shard databases."""
+
+    databases = "__all__"
+
+    def setUp(self) -> None:
+        """Create one user's valuations on bricksets of different shards."""
+        self.user = baker.make(User)
+        numbers = range(20000, 20004)
+        self.bricksets = [baker.make(BrickSet, number=number) for number in numbers]
+        self.valuations = [
+            Valuation.valuations.db_manager(hints=sharding.for_brickset(brickset.id)).create(
+                user_id=self.user.id,
+                brickset_id=brickset.id,
+                value=100 + index,
+                currency="PLN",
+            )
+            for index, brickset in enumerate(self.bricksets)
+        ]
+
+    def test_valuations_are_written_to_their_brickset_shard(self) -> None:
+        """Each valuation lands on its brickset's shard with an id of that shard."""
+        for valuation in self.valuations:
+            alias = sharding.shard_for_brickset(valuation.brickset_id)
+
+            assert valuation._state.db == alias
+            assert sharding.shard_for_id(valuation.id) == alias
+            assert not Valuation.valuations.using("default").filter(pk=valuation.pk).exists()
+
+    def test_per_brickset_lists_read_one_shard(self) -> None:
+        """Valuation and like lists query only the owning shard."""
+        valuation = self.valuations[1]
+        liker = baker.make(User)
+        Like.objects.db_manager(hints=sharding.for_valuation(valuation.id)).create(
+            user_id=liker.id,
+            valuation_id=valuation.id,
+        )
+
+        valuations = ValuationListService().build_queryset(valuation.brickset_id)
+        likes = LikeListService().build_queryset(valuation.id)
+
+        assert valuations.db == likes.db == sharding.shard_for_id(valuation.id)
+        assert [row.id for row in valuations] == [valuation.id]
+        assert [like.user_id for like in likes] == [liker.id]
+
+    def test_owned_valuations_are_merged_across_shards(self) -> None:
+        """The owner's list gathers every shard in the requested order."""
+        rows = OwnedValuationListService().get_queryset(self.user.id, "-value")
+
+        assert rows.count() == len(self.valuations)
+        assert [row.value for row in rows[1:3]] == [102, 101]
+        assert [row.brickset.number for row in rows[:1]] == [20003]
+
+    def test_brickset_list_counts_come_from_every_shard(self) -> None:
+        """Counts and top valuations of the catalog list are read per shard."""
+        valuation = self.valuations[1]
+        hinted = Valuation.valuations.db_manager(hints=sharding.for_pk(valuation.id))
+        hinted.filter(pk=valuation.pk).update(likes_count=3)
+        BrickSetStatisticsService().rebuild()
+
+        queryset = BrickSetListService().build_queryset({})
+        bricksets = list(queryset.filter(number__in=[20000, 20001]))
+        counts = {brickset.number: (brickset.valuations_count, brickset.total_likes) for brickset in bricksets}
+
+        assert counts == {20000: (1, 0), 20001: (1, 3)}
+        assert BrickSetListService.top_valuation_ids(bricksets)[valuation.brickset_id] == valuation.id
+
+    def test_reconciliation_repairs_every_shard(self) -> None:
+        """Id ranges carry their shard, and drift is repaired where it is stored."""
+        drifted = self.valuations[2]
+        hinted = Valuation.valuations.db_manager(hints=sharding.for_pk(drifted.id))
+        hinted.filter(pk=drifted.pk).update(likes_count=5)
+
+        id_ranges = split_id_space(chunk_size=1000)
+        reports = [reconcile_range(id_range, dry_run=False) for id_range in id_ranges]
+
+        assert {id_range.database for id_range in id_ranges} == set(sharding.databases())
+        assert [drift.valuation_id for report in reports for drift in report.drifts] == [drifted.id]
+        assert hinted.get(pk=drifted.pk).likes_count == 0
@@ -0,0 +1,118 @@
+"""Tests for the shared-memory cache backend."""
+from __future__ import annotations
+
+import multiprocessing
+import os
+import tempfile
+
+from django.test import SimpleTestCase
+
+from core.shared_memory_cache import SharedMemoryCache
+
+_INCREMENTS = 200
+_PROCESSES = 4
+_KEYS = 5000
+
+
+def _open(path: str, **options: int) -> SharedMemoryCache:
+    return SharedMemoryCache(path, {"OPTIONS": {"SIZE": 64 * 1024, "SLOT_SIZE": 256, **options}})
+
+
+def _increment(path: str) -> None:
+    cache = _open(path)
+    for _ in range(_INCREMENTS):
+        cache.incr("counter")
+
+
+class SharedMemoryCacheTests(SimpleTestCase):
+    """Test the Django cache API, bounds and sharing between processes."""
+
+    def setUp(self) -> None:
+        """Open a cache in a fresh file."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "cache")
+        self.cache = _open(self.path)
+
+    def test_basic_operations(self) -> None:
+        """get/set/add/delete/touch follow the Django cache contract."""
+        self.cache.set("key", {"value": 1})
+        assert self.cache.get("key") == {"value": 1}
+        assert not self.cache.add("key", "other")
+        assert self.cache.add("new", "value")
+        assert self.cache.touch("key", timeout=None)
+        assert self.cache.delete("key")
+        assert self.cache.get("key", "missing") == "missing"
+
+    def test_expired_entries_are_not_returned(self) -> None:
+        """A zero timeout expires immediately."""
+        self.cache.set("key", "value", timeout=0)
+
+        assert not self.cache.has_key("key")
+        assert self.cache.add("key", "fresh")
+
+    def test_incr_and_decr(self) -> None:
+        """Counters change atomically; missing keys raise ValueError."""
+        self.cache.set("counter", 5)
+
+        assert self.cache.incr("counter", 3) == 8
+        assert self.cache.decr("counter") == 7
+        with self.assertRaises(ValueError):
+            self.cache.incr("missing")
+
+    def test_values_larger_than_a_slot_are_skipped(self) -> None:
+        """Oversized values are not stored rather than truncated."""
+        self.cache.set("big", "x" * 1000)
+
+        assert self.cache.get("big") is None
+
+    def test_size_is_bounded_and_recent_entries_survive(self) -> None:
+        """Writing far more keys than fit evicts, but keeps the latest ones."""
+        keys = [f"key-{index}" for index in range(_KEYS)]
+        for position, key in enumerate(keys):
+            self.cache.set(key, position)
+
+        stored = [stored_key for stored_key in keys if self.cache.has_key(stored_key)]
+        assert 0 < len(stored) < 500
+        assert self.cache.get(keys[-1]) == _KEYS - 1
+
+    def test_entries_are_shared_between_instances(self) -> None:
+        """Another handle on the same file sees the same entries."""
+        self.cache.set("key", "value")
+
+        assert _open(self.path).get("key") == "value"
+
+    def test_other_geometry_leaves_open_handles_working(self) -> None:
+        """A handle opened with other OPTIONS on the same location gets a file of its own."""
+        self.cache.set("key", "value")
+
+        other = _open(self.path, SLOT_SIZE=512, WAYS=4)
+        other.set("key", "other")
+        self.cache.set("next", "value")
+
+        assert self.cache.get("key") == "value"
+        assert self.cache.get("next") == "value"
+        assert other.get("key") == "other"
+
+    def test_incr_is_atomic_across_processes(self) -> None:
+        """Concurrent increments from several processes are all counted."""
+        self.cache.set("counter", 0)
+        context = multiprocessing.get_context("fork")
+        workers = [
+            context.Process(target=_increment, args=(self.path,))
+            for _ in range(_PROCESSES)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert self.cache.get("counter") == _INCREMENTS * _PROCESSES
+
+    def test_clear_removes_everything(self) -> None:
+        """clear() empties the shared table."""
+        self.cache.set("key", "value")
+
+        self.cache.clear()
+
+        assert self.cache.get("key") is None
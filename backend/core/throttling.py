@@ -0,0 +1,77 @@
+"""DRF throttles backed by the shared sliding-window limiter.
+
+Subclasses set ``scope`` (the key of ``DEFAULT_THROTTLE_RATES``) and implement
+``get_ident_key``. Unlike DRF's ``SimpleRateThrottle``, which keeps its
+history in the per-process cache, counters are shared by every worker and
+updated atomically. Safe (read-only) methods are not limited unless
+``limit_safe_methods`` is set.
+"""
+from __future__ import annotations
+
+import hashlib
+from abc import ABC, abstractmethod
+from typing import Any
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle, SimpleRateThrottle
+
+from core.models.rate_limit import RATE_LIMIT_KEY_MAX_LENGTH
+from core.rate_limit import Rate, limiter
+
+
+class SlidingWindowThrottle(BaseThrottle, ABC):
+    """Limit requests per key to the rate configured for ``scope``."""
+
+    scope: str = ""
+    limit_safe_methods = False
+
+    def __init__(self) -> None:
+        """Resolve the configured rate for ``scope``."""
+        configured = api_settings.DEFAULT_THROTTLE_RATES.get(self.scope)
+        if configured is None:
+            raise ImproperlyConfigured(f"No throttle rate set for scope {self.scope!r}.")
+        num_requests, duration = SimpleRateThrottle.parse_rate(None, configured)
+        self.rate = Rate(limit=num_requests, window=duration)
+        self._wait: float | None = None
+
+    @abstractmethod
+    def get_ident_key(self, request: Request, view: Any) -> str | None:
+        """Return what to count requests by, or ``None`` to skip limiting."""
+
+    def allow_request(self, request: Request, view: Any) -> bool:
+        """Count the request and reject it once the key is over its rate."""
+        if not settings.RATE_LIMIT_ENABLED:
+            return True
+        if request.method in SAFE_METHODS and not self.limit_safe_methods:
+            return True
+        ident = self.get_ident_key(request, view)
+        if ident is None:
+            return True
+        result = limiter.hit(self._cache_key(ident), self.rate)
+        self._wait = result.retry_after
+        return result.allowed
+
+    def wait(self) -> float | None:
+        """Seconds until the next request may pass (sent as Retry-After)."""
+        return self._wait
+
+    def _cache_key(self, ident: str) -> str:
+        key = f"{self.scope}:{ident}"
+        if len(key) <= RATE_LIMIT_KEY_MAX_LENGTH:
+            return key
+        digest = hashlib.sha256(ident.encode()).hexdigest()
+        return f"{self.scope}:sha256:{digest}"
+
+
+class UserRateThrottle(SlidingWindowThrottle):
+    """Limit per authenticated user; anonymous requests are left to auth."""
+
+    def get_ident_key(self, request: Request, view: Any) -> str | None:
+        """Count by user id."""
+        if not request.user or not request.user.is_authenticated:
+            return None
+        return str(request.user.pk)
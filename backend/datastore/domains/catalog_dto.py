@@ -66,12 +66,30 @@ class TopValuationSummaryDTO:
     user_id: int
 
 
+@dataclass(slots=True)
+class ValuationStatisticsDTO:
+    """Running statistics of a brickset's valuations (`BrickSetStatistics`).
+
+    `consensus_value` is the mean weighted by 1 + likes_count; percentiles
+    are sketch estimates within 1% of the exact value.
+    """
+
+    mean_value: float
+    consensus_value: int
+    min_value: int
+    max_value: int
+    p10_value: int
+    median_value: int
+    p90_value: int
+
+
 @dataclass(slots=True)
 class BrickSetListItemDTO:
     """BrickSet item in list responses (`GET /bricksets`).
 
-    Includes aggregate metrics `valuations_count`, `total_likes` and optional
-    `top_valuation` summary for quick glance.
+    Includes aggregate metrics `valuations_count`, `total_likes`, optional
+    `top_valuation` summary for quick glance and valuation `statistics`
+    (None until the set is valued).
     """
 
     source_model: ClassVar[type[BrickSet]] = BrickSet
@@ -88,6 +106,7 @@ class BrickSetListItemDTO:
     valuations_count: int  # derived COUNT
     total_likes: int       # derived SUM(likes_count)
     top_valuation: Optional[TopValuationSummaryDTO]
+    statistics: Optional[ValuationStatisticsDTO] = None
 
 
 @dataclass(slots=True)
@@ -131,6 +150,7 @@ class BrickSetDetailDTO:
     total_likes: int
     created_at: datetime
     updated_at: datetime
+    statistics: Optional[ValuationStatisticsDTO] = None
 
 
 @dataclass(slots=True)
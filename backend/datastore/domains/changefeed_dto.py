@@ -0,0 +1,59 @@
+"""Change feed domain DTO & command models.
+
+Encapsulates the payload structures of ``GET /api/v1/changes``.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+# --------------------------- Command Models ---------------------------
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeCursor:
+    """Position in the change log: the last ``(txid, id)`` a client has seen."""
+
+    txid: int
+    id: int  # noqa: WPS125 - mirrors the model field
+
+    def encode(self) -> str:
+        """Return the opaque string form used in the API."""
+        return f"{self.txid}-{self.id}"
+
+
+@dataclass(slots=True)
+class ChangeFeedQuery:
+    """Input for ``GET /changes``; ``since`` is ``None`` to get the current head."""
+
+    since: Optional[ChangeCursor]
+    limit: int
+
+
+# --------------------------- Response DTOs ---------------------------
+
+
+@dataclass(slots=True)
+class ChangeDTO:
+    """One entry of the change feed.
+
+    ``likes_count`` is the current count for ``likes_changed`` entries of
+    valuations that still exist, otherwise ``None``.
+    """
+
+    entity: str
+    entity_id: int
+    operation: str
+    brickset_id: int
+    changed_at: datetime
+    likes_count: Optional[int] = None
+
+
+@dataclass(slots=True)
+class ChangeFeedPageDTO:
+    """Changes after the requested cursor plus the cursor to poll with next."""
+
+    changes: list[ChangeDTO]
+    next_cursor: str
+    has_more: bool
@@ -6,10 +6,10 @@ related endpoints as per API plan.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
 from typing import ClassVar, Optional
 
-from valuation.models import Like, SystemMetrics, Valuation
+from valuation.models import Like, SystemMetrics, Valuation, ValuationAnalysis, ValuationHistory
 
 # --------------------------- Command Models ---------------------------
 
@@ -180,6 +180,78 @@ class LikeListItemDTO:
     user_id: int
     created_at: datetime
 
+# ----------------------------- History DTOs ---------------------------
+
+
+@dataclass(slots=True)
+class ValuationHistoryPointDTO:
+    """One bucket of `GET /bricksets/{brickset_id}/valuation-history`.
+
+    Buckets without valuations are included with a zero count and null
+    values, so the series can be charted as is. `weighted_value` is the
+    like-weighted mean of the bucket's non-outlier valuations.
+    """
+
+    source_model: ClassVar[type[ValuationHistory]] = ValuationHistory
+
+    period_start: date
+    valuations_count: int
+    mean_value: Optional[float]
+    min_value: Optional[int]
+    max_value: Optional[int]
+    weighted_value: Optional[int]
+
+
+@dataclass(slots=True)
+class ValuationHistoryDTO:
+    """Response of `GET /bricksets/{brickset_id}/valuation-history`.
+
+    `points` hold one bucket per day or week from `since` to `until`,
+    oldest first.
+    """
+
+    brickset_id: int
+    period: str
+    since: date
+    until: date
+    points: list[ValuationHistoryPointDTO]
+
+# ---------------------------- Analysis DTOs ---------------------------
+
+
+@dataclass(slots=True)
+class ValuationAnalysisGroupDTO:
+    """Valuation statistics of one group of `GET /valuations/analysis`.
+
+    `premium` is set on non-reference variants only (e.g. RETIRED, not
+    ACTIVE) when both sides had enough valuations.
+    """
+
+    source_model: ClassVar[type[ValuationAnalysis]] = ValuationAnalysis
+
+    dimension: str
+    variant: str
+    valuations_count: int
+    mean_value: float
+    p10_value: float
+    median_value: float
+    p90_value: float
+    premium: Optional[float]
+    premium_sample: int
+
+
+@dataclass(slots=True)
+class ValuationAnalysisDTO:
+    """Response of `GET /valuations/analysis` for a set number or the catalog.
+
+    `number` is None for catalog-wide results.
+    """
+
+    number: Optional[int]
+    computed_at: datetime
+    overall: ValuationAnalysisGroupDTO
+    conditions: list[ValuationAnalysisGroupDTO]
+
 # ----------------------------- Metrics DTO ----------------------------
 
 
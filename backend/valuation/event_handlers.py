@@ -0,0 +1,95 @@
+"""Subscribers of the valuation app to domain events (see ``core.events``).
+
+All run after the publishing transaction has committed: the like counter,
+BrickSet statistics and valuation history updates hold their row locks only
+for their own short transactions, metrics are refreshed by a deduplicated background job,
+and the catalog read model, cached responses and live events are refreshed
+once the counters are up to date.
+"""
+from __future__ import annotations
+
+from django.conf import settings
+from django.db import transaction
+
+from catalog.events import BrickSetDeleted
+from catalog.read_model import read_model
+from catalog.surrogate_keys import LIST_KEY, brickset_key
+from core import sharding
+from core.events import subscribe
+from core.invalidation import invalidate
+from core.job_queue import enqueue
+from core.response_cache import SURROGATE_NAMESPACE
+from valuation.events import LikeAdded, LikeRemoved, ValuationCreated, created_and_like_deltas
+from valuation.jobs import REFRESH_METRICS_JOB
+from valuation.live_updates import push_valuation_changes
+from valuation.services.brickset_statistics import BrickSetStatisticsService
+from valuation.services.like_counter import LikeCounter
+from valuation.services.valuation_history import ValuationHistoryService
+
+
+@subscribe(LikeAdded, LikeRemoved)
+def apply_like_counts(events: list[LikeAdded | LikeRemoved]) -> None:
+    """Fold a batch of likes/unlikes into one counter change per valuation."""
+    _, totals = created_and_like_deltas(events)
+    counter = LikeCounter()
+    for alias, valuation_ids in sharding.group_by_shard(sorted(totals)).items():
+        with transaction.atomic(using=alias):
+            # Id order keeps lock ordering consistent with LikeCounter.flush.
+            for valuation_id in valuation_ids:
+                if totals[valuation_id]:
+                    counter.record(valuation_id, totals[valuation_id])
+
+
+@subscribe(LikeAdded, LikeRemoved, ValuationCreated)
+def update_brickset_statistics(events: list[LikeAdded | LikeRemoved | ValuationCreated]) -> None:
+    """Fold new valuations and net like changes into their BrickSet statistics."""
+    BrickSetStatisticsService().apply(*created_and_like_deltas(events))
+
+
+@subscribe(LikeAdded, LikeRemoved, ValuationCreated)
+def update_valuation_history(events: list[LikeAdded | LikeRemoved | ValuationCreated]) -> None:
+    """Fold new valuations and net like changes into their daily and weekly rollups."""
+    ValuationHistoryService().apply(*created_and_like_deltas(events))
+
+
+@subscribe(LikeAdded, LikeRemoved, ValuationCreated)
+def refresh_catalog_read_model(events: list[LikeAdded | LikeRemoved | ValuationCreated]) -> None:
+    """Reload the touched bricksets into this worker's catalog read model.
+
+    Registered after ``apply_like_counts`` and ``update_brickset_statistics``:
+    their counters are written after the change log entry of the batch, which
+    a list query in another thread may already have synced.
+    """
+    if settings.CATALOG_READ_MODEL_ENABLED:
+        read_model.mark_stale(event.brickset_id for event in events)
+
+
+@subscribe(LikeAdded, LikeRemoved, ValuationCreated)
+def purge_cached_responses(events: list[LikeAdded | LikeRemoved | ValuationCreated]) -> None:
+    """Purge the list generation and the detail pages of the touched bricksets on all nodes.
+
+    Registered after the counter, statistics and history updates and after
+    ``refresh_catalog_read_model``: an anonymous GET arriving right after the
+    purge caches its response for the full ``RESPONSE_CACHE_TTL``, so it must
+    already render this batch.
+    """
+    if settings.RESPONSE_CACHE_ENABLED:
+        invalidate(SURROGATE_NAMESPACE, [LIST_KEY, *(brickset_key(event.brickset_id) for event in events)])
+
+
+@subscribe(LikeAdded, LikeRemoved, ValuationCreated)
+def push_live_updates(events: list[LikeAdded | LikeRemoved | ValuationCreated]) -> None:
+    """Push new valuations and like counts to SSE subscribers of their BrickSet.
+
+    Registered after ``apply_like_counts``, so the pushed counts include
+    this batch.
+    """
+    created = [event.valuation_id for event in events if isinstance(event, ValuationCreated)]
+    liked = [event.valuation_id for event in events if not isinstance(event, ValuationCreated)]
+    push_valuation_changes(created, liked)
+
+
+@subscribe(LikeAdded, LikeRemoved, ValuationCreated, BrickSetDeleted)
+def schedule_metrics_refresh(events: list) -> None:
+    """Enqueue one SystemMetrics refresh per batch of metric-relevant changes."""
+    enqueue(REFRESH_METRICS_JOB, dedup_key=REFRESH_METRICS_JOB)
@@ -0,0 +1,48 @@
+"""Domain events published by valuation services (see ``core.events``)."""
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+
+from core.events import DomainEvent
+
+
+@dataclass(frozen=True, slots=True)
+class LikeAdded(DomainEvent):
+    """A user liked a valuation."""
+
+    valuation_id: int
+    user_id: int
+    brickset_id: int
+
+
+@dataclass(frozen=True, slots=True)
+class LikeRemoved(DomainEvent):
+    """A user withdrew their like from a valuation."""
+
+    valuation_id: int
+    user_id: int
+    brickset_id: int
+
+
+@dataclass(frozen=True, slots=True)
+class ValuationCreated(DomainEvent):
+    """A user valued a BrickSet."""
+
+    valuation_id: int
+    brickset_id: int
+    user_id: int
+
+
+def created_and_like_deltas(
+    events: list[LikeAdded | LikeRemoved | ValuationCreated],
+) -> tuple[list[int], dict[int, int]]:
+    """Split a batch into created valuation ids and net like changes per valuation."""
+    created = [event.valuation_id for event in events if isinstance(event, ValuationCreated)]
+    like_deltas: dict[int, int] = defaultdict(int)
+    for event in events:
+        if isinstance(event, LikeAdded):
+            like_deltas[event.valuation_id] += 1
+        elif isinstance(event, LikeRemoved):
+            like_deltas[event.valuation_id] -= 1
+    return created, like_deltas
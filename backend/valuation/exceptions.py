@@ -75,3 +75,13 @@ class LikeNotFoundError(Exception):
         self.message = (
             f"Like for valuation {valuation_id} by user {user_id} not found."
         )
+
+
+class ValuationAnalysisNotFoundError(Exception):
+    """Raised when no analysis exists for a set number (or the job never ran)."""
+
+    def __init__(self, number: int | None) -> None:
+        scope = "the catalog" if number is None else f"set number {number}"
+        super().__init__(f"No valuation analysis for {scope}.")
+        self.number = number
+        self.message = f"No valuation analysis for {scope}."
@@ -0,0 +1,15 @@
+"""Background job handlers of the valuation app (see ``core.job_queue``)."""
+from __future__ import annotations
+
+from typing import Any
+
+from core.job_queue import job_handler
+from valuation.services.system_metrics_service import SystemMetricsService
+
+REFRESH_METRICS_JOB = "valuation.refresh_metrics"
+
+
+@job_handler(REFRESH_METRICS_JOB)
+def refresh_metrics(payload: dict[str, Any]) -> None:
+    """Recompute the SystemMetrics singleton."""
+    SystemMetricsService().execute()
@@ -0,0 +1,65 @@
+"""Live valuation events pushed to the SSE subscribers of a BrickSet.
+
+Subscribers of ``brickset:<id>`` (see ``core.live_events``) receive:
+
+- ``valuation_created`` with the new valuation, shaped like the entries of
+  ``valuations`` in the BrickSet detail response;
+- ``likes_count`` with ``valuation_id`` and its current ``likes_count``.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from rest_framework import serializers
+
+from core import sharding
+from core.live_events import notify
+from valuation.models import Valuation
+from valuation.services.like_counter import LikeCounter
+
+VALUATION_CREATED = "valuation_created"
+LIKES_COUNT = "likes_count"
+_DATETIME = serializers.DateTimeField()
+
+
+def brickset_topic(brickset_id: int) -> str:
+    """Return the live events topic of a BrickSet."""
+    return f"brickset:{brickset_id}"
+
+
+def push_valuation_changes(created_ids: Iterable[int], liked_ids: Iterable[int]) -> None:
+    """Notify subscribers of new valuations and changed like counts.
+
+    Loads all affected valuations with one query per shard; counts include like
+    deltas not yet flushed in buffered mode.
+    """
+    created_ids = set(created_ids)
+    liked_ids = set(liked_ids) - created_ids
+    if not created_ids and not liked_ids:
+        return
+    counter = LikeCounter()
+    valuations = sharding.filter_ids(
+        counter.annotate_valuations(Valuation.valuations.order_by("id")),
+        created_ids | liked_ids,
+    )
+    for valuation in valuations:
+        _push(valuation, counter.live_likes(valuation), liked=valuation.id in liked_ids)
+
+
+def _push(valuation: Valuation, likes_count: int, *, liked: bool) -> None:
+    topic = brickset_topic(valuation.brickset_id)
+    if liked:
+        notify(topic, LIKES_COUNT, {"valuation_id": valuation.id, "likes_count": likes_count})
+        return
+    payload = {
+        "id": valuation.id,
+        "user_id": valuation.user_id,
+        "value": valuation.value,
+        "currency": valuation.currency,
+        "comment": valuation.comment,
+        "likes_count": likes_count,
+        "created_at": _DATETIME.to_representation(valuation.created_at),
+    }
+    if not notify(topic, VALUATION_CREATED, payload):
+        # Very long comments exceed the NOTIFY limit; clients fetch the valuation.
+        notify(topic, VALUATION_CREATED, {"id": valuation.id})
@@ -0,0 +1,40 @@
+"""Recompute catalog-wide valuation analytics (``ValuationAnalysis``).
+
+Streams every non-outlier valuation with the attributes of its BrickSet into
+NumPy arrays, computes statistics per set number and condition and the
+condition premiums (e.g. RETIRED vs ACTIVE), and replaces the analysis
+table served by ``GET /api/v1/valuations/analysis``. Run it periodically,
+e.g. nightly:
+
+    python manage.py analyze_valuations --chunk-size 20000
+"""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from valuation.services.valuation_analysis import DEFAULT_CHUNK_SIZE, ValuationAnalysisService
+
+
+class Command(BaseCommand):
+    """Rebuild the valuation analysis table."""
+
+    help = "Compute valuation statistics and condition premiums per set number with NumPy."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command options."""
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="Rows fetched from the database per chunk.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Run the analysis and report how many rows were written."""
+        started = time.perf_counter()
+        written = ValuationAnalysisService().run(chunk_size=options["chunk_size"])
+        elapsed = time.perf_counter() - started
+        self.stdout.write(f"Wrote {written} analysis rows in {elapsed:.1f}s.")
@@ -0,0 +1,202 @@
+"""Compare HOT updates and bloat of the valuation table before and after tuning.
+
+Two scratch copies of the valuation table (temporary tables with the same
+columns and indexes, dropped afterwards) get ``--rows`` valuations each and
+then the same like-heavy workload: ``--updates`` single-row updates, each in
+its own transaction. Most increment ``likes_count`` of a small hot set of
+valuations; ``--edit-ratio`` of them edit the value (and ``updated_at``).
+
+- before: server defaults (fillfactor 100) plus the former ``updated_at`` index;
+- after: ``TABLE_STORAGE_PARAMETERS["valuation.Valuation"]`` and the current indexes.
+
+For each the share of heap-only-tuple (HOT) updates, the dead row versions
+and the growth of the table and its indexes are reported. ``likes_count`` is
+a key column of ``valuation_brickset_likes_idx``, so like updates cannot be
+HOT in either run; they still benefit from page free space, which keeps new
+row versions on their page instead of extending the table.
+
+Usage:
+    python manage.py benchmark_storage --rows 20000 --updates 50000
+"""
+from __future__ import annotations
+
+import random
+import time
+from collections.abc import Iterator
+from contextlib import ExitStack
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connection
+from django.db.backends.utils import CursorWrapper
+
+from core.storage import StorageParameters, set_storage_parameters, storage_parameters
+from valuation.models import Valuation
+
+_DEFAULT_ROWS = 5000
+_DEFAULT_UPDATES = 20000
+_DEFAULT_EDIT_RATIO = 0.1
+_HOT_SHARE = 0.02  # share of valuations receiving most likes
+_HOT_TRAFFIC = 0.8  # share of likes going to them
+_BRICKSETS_PER_ROW = 10
+_MAX_EDITED_VALUE = 999
+_MICROSECONDS = 1_000_000
+_KIB = 1024
+_UNTUNED = "server defaults, updated_at indexed"
+
+_SEED_SQL = """
+INSERT INTO {table} (id, user_id, brickset_id, value, currency, likes_count, created_at, updated_at)
+SELECT g, g, g / %s + 1, 100 + g %% 900, 'PLN', 0, now(), now()
+FROM generate_series(1, %s) AS g
+"""
+_LIKE_SQL = "UPDATE {table} SET likes_count = likes_count + 1 WHERE id = %s"
+_EDIT_SQL = "UPDATE {table} SET value = %s, updated_at = now() WHERE id = %s"
+_SIZES_SQL = "SELECT pg_table_size(%s::regclass), pg_indexes_size(%s::regclass)"
+_STATS_SQL = """
+SELECT n_tup_upd, n_tup_hot_upd, n_dead_tup
+FROM pg_stat_user_tables
+WHERE relid = %s::regclass
+"""
+_Update = tuple[str, list[int]]  # statement template, parameters
+_RESULT_TEMPLATE = (
+    "  HOT updates: {run.hot_updates}/{run.updates} ({run.hot_ratio:.1%})  dead rows: {run.dead_rows}\n"
+    "  table growth: {table_kib} KiB  index growth: {index_kib} KiB  "
+    "{run.microseconds_per_update:.0f} us per update"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class RunResult:
+    """Measurements of one storage profile."""
+
+    updates: int
+    hot_updates: int
+    dead_rows: int
+    table_growth: int
+    index_growth: int
+    microseconds_per_update: float
+
+    @property
+    def hot_ratio(self) -> float:
+        """Share of updates that were heap-only."""
+        if not self.updates:
+            return 0
+        return self.hot_updates / self.updates
+
+
+class _Profile(NamedTuple):
+    label: str
+    parameters: StorageParameters
+    updated_at_index: bool  # the index dropped by the tuning migration
+
+
+class _Sizes(NamedTuple):
+    table: int
+    indexes: int
+
+
+class Command(BaseCommand):
+    """Run one like-heavy workload against untuned and tuned copies of the valuation table."""
+
+    help = "Report HOT update ratios and bloat of the valuation table before and after storage tuning."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command options."""
+        parser.add_argument("--rows", type=int, default=_DEFAULT_ROWS, help="Valuations per table copy.")
+        parser.add_argument("--updates", type=int, default=_DEFAULT_UPDATES, help="Updates per table copy.")
+        parser.add_argument(
+            "--edit-ratio",
+            type=float,
+            default=_DEFAULT_EDIT_RATIO,
+            help="Share of updates editing the value instead of adding a like.",
+        )
+        parser.add_argument("--seed", type=int, default=0, help="Seed of the random workload.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Run both profiles and print their measurements side by side."""
+        profiles = (
+            _Profile("before", {}, updated_at_index=True),
+            _Profile("after", storage_parameters(Valuation._meta.label), updated_at_index=False),
+        )
+        for profile in profiles:
+            table = f"benchmark_valuation_{profile.label}"
+            with ExitStack() as cleanup:
+                cleanup.callback(self._drop, table)
+                self._create(table, profile, rows=options["rows"])
+                result = self._run(table, options)
+            self._report(profile, result)
+
+    @staticmethod
+    def _create(table: str, profile: _Profile, *, rows: int) -> None:
+        quoted = connection.ops.quote_name(table)
+        source = connection.ops.quote_name(Valuation._meta.db_table)
+        with connection.schema_editor() as schema_editor:
+            schema_editor.execute(f"DROP TABLE IF EXISTS {quoted}")
+            schema_editor.execute(
+                f"CREATE TEMPORARY TABLE {quoted} (LIKE {source} INCLUDING DEFAULTS INCLUDING INDEXES)",
+            )
+            set_storage_parameters(schema_editor, table, profile.parameters)
+            if profile.updated_at_index:
+                schema_editor.execute(f"CREATE INDEX ON {quoted} (updated_at)")
+            schema_editor.execute(_SEED_SQL.format(table=quoted), [_BRICKSETS_PER_ROW, rows])
+            schema_editor.execute(f"ANALYZE {quoted}")
+
+    @staticmethod
+    def _drop(table: str) -> None:
+        quoted = connection.ops.quote_name(table)
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {quoted}")
+
+    def _run(self, table: str, options: dict[str, Any]) -> RunResult:
+        with connection.cursor() as cursor:
+            start = self._sizes(cursor, table)
+            elapsed = self._timed_updates(cursor, table, options)
+            # Statistics reach the shared views once the backend is idle.
+            cursor.execute("SELECT pg_stat_force_next_flush()")
+            cursor.execute(_STATS_SQL, [table])
+            statistics = cursor.fetchone()
+            end = self._sizes(cursor, table)
+        return RunResult(
+            *statistics,
+            table_growth=end.table - start.table,
+            index_growth=end.indexes - start.indexes,
+            microseconds_per_update=elapsed * _MICROSECONDS / max(1, options["updates"]),
+        )
+
+    @staticmethod
+    def _sizes(cursor: CursorWrapper, table: str) -> _Sizes:
+        cursor.execute(_SIZES_SQL, [table, table])
+        return _Sizes(*cursor.fetchone())
+
+    def _timed_updates(self, cursor: CursorWrapper, table: str, options: dict[str, Any]) -> float:
+        """Run the workload on ``table``, one update per transaction; return the seconds taken."""
+        quoted = connection.ops.quote_name(table)
+        started = time.perf_counter()
+        for sql, params in self._workload(options):
+            cursor.execute(sql.format(table=quoted), params)
+        return time.perf_counter() - started
+
+    @staticmethod
+    def _workload(options: dict[str, Any]) -> Iterator[_Update]:
+        """Yield the statement template and parameters of each update."""
+        rng = random.Random(options["seed"])
+        rows = options["rows"]
+        hot_rows = max(1, int(rows * _HOT_SHARE))
+        for _ in range(options["updates"]):
+            valuation_id = rng.randint(1, hot_rows if rng.random() < _HOT_TRAFFIC else rows)
+            if rng.random() < options["edit_ratio"]:
+                yield _EDIT_SQL, [rng.randint(1, _MAX_EDITED_VALUE), valuation_id]
+            else:
+                yield _LIKE_SQL, [valuation_id]
+
+    def _report(self, profile: _Profile, result: RunResult) -> None:
+        assignments = sorted(profile.parameters.items())
+        settings_text = ", ".join(f"{name}={setting}" for name, setting in assignments)
+        description = settings_text or _UNTUNED
+        self.stdout.write(f"{profile.label}: {description}")
+        self.stdout.write(_RESULT_TEMPLATE.format(
+            run=result,
+            table_kib=result.table_growth // _KIB,
+            index_kib=result.index_growth // _KIB,
+        ))
@@ -0,0 +1,57 @@
+"""Fold buffered like deltas into ``Valuation.likes_count``.
+
+Only needed when ``LIKE_COUNTER_MODE=buffered``. Run once (e.g. from cron)
+or as a long-lived process with ``--interval``:
+
+    python manage.py flush_like_deltas --interval 2
+"""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from valuation.services.like_counter import LikeCounter
+
+_DEFAULT_BATCH_SIZE = 5000
+
+
+class Command(BaseCommand):
+    """Drain the LikeCountDelta buffer in batches."""
+
+    help = "Fold buffered like deltas into Valuation.likes_count."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Register command options."""
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=_DEFAULT_BATCH_SIZE,
+            help="Maximum deltas folded per transaction.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0,
+            help="Seconds between passes; 0 drains the buffer once and exits.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Drain the buffer once, or repeatedly every ``--interval`` seconds."""
+        while True:
+            folded = self._drain(options["batch_size"])
+            self.stdout.write(f"Folded {folded} like deltas.")
+            if options["interval"] <= 0:
+                return
+            time.sleep(options["interval"])
+
+    @staticmethod
+    def _drain(batch_size: int) -> int:
+        counter = LikeCounter()
+        folded = 0
+        while True:
+            batch_folded = counter.flush(batch_size)
+            folded += batch_folded
+            if batch_folded < batch_size:
+                return folded
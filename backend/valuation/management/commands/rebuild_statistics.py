@@ -0,0 +1,31 @@
+"""Recompute BrickSetStatistics and ValuationHistory from the valuations.
+
+Both are maintained incrementally as valuations are created and liked.
+Run this once to backfill them, or to repair them after event handlers failed.
+It also rescores every valuation as if they had been created one by one, which
+backfills the outlier scores of valuations created before scoring existed:
+
+    python manage.py rebuild_statistics
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from valuation.services.brickset_statistics import BrickSetStatisticsService
+from valuation.services.valuation_history import ValuationHistoryService
+
+
+class Command(BaseCommand):
+    """Rebuild the valuation statistics and history of every BrickSet."""
+
+    help = "Recompute per-BrickSet valuation statistics and history from the valuations."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Rebuild all rows and report how many were written."""
+        rebuilt = BrickSetStatisticsService().rebuild()
+        self.stdout.write(f"Rebuilt statistics of {rebuilt} bricksets.")
+        # After the statistics: history weights depend on the outlier scores they set.
+        buckets = ValuationHistoryService().rebuild()
+        self.stdout.write(f"Rebuilt {buckets} valuation history buckets.")
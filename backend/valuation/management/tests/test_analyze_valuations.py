@@ -0,0 +1,29 @@
+"""Tests for analyze_valuations management command."""
+from __future__ import annotations
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from model_bakery import baker
+
+from catalog.models import BrickSet
+from valuation.models import AnalysisDimension, Valuation, ValuationAnalysis
+
+
+class AnalyzeValuationsCommandTests(TestCase):
+    """Test analyze_valuations in-process."""
+
+    def test_replaces_analysis_rows(self) -> None:
+        """Each run replaces the previous results."""
+        brickset = baker.make(BrickSet, number=10001)
+        baker.make(Valuation, brickset=brickset, value=100)
+        out = StringIO()
+
+        call_command("analyze_valuations", "--chunk-size", "1", stdout=out)
+        call_command("analyze_valuations", stdout=out)
+
+        # Per number and catalog-wide: ALL plus one variant of each of five dimensions.
+        assert ValuationAnalysis.objects.count() == 12
+        assert ValuationAnalysis.objects.get(number=10001, dimension=AnalysisDimension.ALL).median_value == 100
+        assert "Wrote 12 analysis rows" in out.getvalue()
@@ -0,0 +1,28 @@
+"""Tests for benchmark_storage management command."""
+from __future__ import annotations
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TransactionTestCase, override_settings
+
+
+class BenchmarkStorageCommandTests(TransactionTestCase):
+    """Test benchmark_storage output (updates must commit one by one)."""
+
+    @override_settings(TABLE_STORAGE_PARAMETERS={"valuation.Valuation": {"fillfactor": 70}})
+    def test_reports_both_profiles(self) -> None:
+        """Output lists HOT ratio and growth before and after tuning, and drops the copies."""
+        out = StringIO()
+
+        call_command("benchmark_storage", "--rows", "200", "--updates", "300", "--edit-ratio", "0.5", stdout=out)
+
+        output = out.getvalue()
+        assert "before: server defaults, updated_at indexed" in output
+        assert "after: fillfactor=70" in output
+        assert output.count("HOT updates: ") == 2
+        assert output.count("index growth: ") == 2
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT to_regclass('benchmark_valuation_after')")
+            assert cursor.fetchone()[0] is None
@@ -0,0 +1,32 @@
+"""Tests for flush_like_deltas management command."""
+from __future__ import annotations
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from model_bakery import baker
+
+from catalog.models import BrickSet
+from valuation.models import LikeCountDelta, Valuation
+from valuation.services.like_counter import BUFFERED_MODE, LikeCounter
+
+
+class FlushLikeDeltasCommandTests(TestCase):
+    """Test flush_like_deltas drains the buffer."""
+
+    def test_drains_buffer_in_batches(self) -> None:
+        """All deltas are folded even when they exceed one batch."""
+        brickset = baker.make(BrickSet, number=10001)
+        valuation = baker.make(Valuation, brickset=brickset, value=100)
+        counter = LikeCounter(BUFFERED_MODE)
+        for _ in range(5):
+            counter.record(valuation.id, 1)
+        out = StringIO()
+
+        call_command("flush_like_deltas", "--batch-size", "2", stdout=out)
+
+        valuation.refresh_from_db()
+        assert valuation.likes_count == 5
+        assert not LikeCountDelta.objects.exists()
+        assert "Folded 5 like deltas." in out.getvalue()
@@ -0,0 +1,61 @@
+"""Tests for reconcile_counters management command."""
+from __future__ import annotations
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase
+from model_bakery import baker
+
+from account.models import User
+from catalog.models import BrickSet
+from valuation.models import Like, Valuation
+
+
+def _make_drifted_valuations(count: int) -> list[Valuation]:
+    brickset = baker.make(BrickSet, number=10001)
+    valuations = baker.make(Valuation, brickset=brickset, value=100, _quantity=count)
+    liker = baker.make(User)
+    Like.objects.bulk_create(Like(user=liker, valuation=valuation) for valuation in valuations)
+    return valuations
+
+
+class ReconcileCountersCommandTests(TestCase):
+    """Test reconcile_counters in-process."""
+
+    def test_dry_run_prints_diff_report(self) -> None:
+        """Dry run lists drifted valuations and repairs nothing."""
+        valuation = _make_drifted_valuations(1)[0]
+        out = StringIO()
+
+        call_command("reconcile_counters", "--dry-run", "--workers", "1", stdout=out)
+
+        valuation.refresh_from_db()
+        assert f"valuation {valuation.id}: stored=0 expected=1" in out.getvalue()
+        assert "Found 1 drifted counters in 1 ranges." in out.getvalue()
+        assert valuation.likes_count == 0
+
+    def test_limit_truncates_listing_but_not_totals(self) -> None:
+        """--limit caps listed rows while the summary counts everything."""
+        _make_drifted_valuations(3)
+        out = StringIO()
+
+        call_command("reconcile_counters", "--workers", "1", "--limit", "1", stdout=out)
+
+        assert out.getvalue().count("stored=0 expected=1") == 1
+        assert "Repaired 3 drifted counters" in out.getvalue()
+        assert not Valuation.valuations.filter(likes_count=0).exists()
+
+
+class ReconcileCountersParallelTests(TransactionTestCase):
+    """Test reconcile_counters with a worker process pool."""
+
+    def test_workers_repair_all_ranges(self) -> None:
+        """Ranges processed in worker processes are all repaired."""
+        _make_drifted_valuations(4)
+        out = StringIO()
+
+        call_command("reconcile_counters", "--workers", "2", "--chunk-size", "2", stdout=out)
+
+        assert "Repaired 4 drifted counters in 2 ranges." in out.getvalue()
+        assert not Valuation.valuations.filter(likes_count=0).exists()
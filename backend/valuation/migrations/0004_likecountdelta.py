@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('valuation', '0003_fix_user_foreign_key'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LikeCountDelta',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('delta', models.SmallIntegerField(help_text='+1 for like, -1 for unlike.')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('valuation', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='like_deltas', to='valuation.valuation')),
+            ],
+            options={
+                'verbose_name': 'Like count delta',
+                'verbose_name_plural': 'Like count deltas',
+            },
+        ),
+    ]
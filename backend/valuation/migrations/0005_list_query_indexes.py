@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:05
+
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block.
+    atomic = False
+
+    dependencies = [
+        ('valuation', '0004_likecountdelta'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='valuation',
+            index=models.Index(
+                fields=['brickset', '-likes_count', 'created_at'],
+                include=['id'],
+                name='valuation_brickset_likes_idx',
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='valuation',
+            index=models.Index(fields=['user', '-created_at'], name='valuation_user_created_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='like',
+            index=models.Index(
+                fields=['valuation', '-created_at'],
+                include=['user'],
+                name='like_valuation_created_idx',
+            ),
+        ),
+        # Leading columns of the composite indexes above.
+        RemoveIndexConcurrently(
+            model_name='valuation',
+            name='valuation_brickset_idx',
+        ),
+        RemoveIndexConcurrently(
+            model_name='valuation',
+            name='valuation_user_idx',
+        ),
+        RemoveIndexConcurrently(
+            model_name='like',
+            name='like_valuation_idx',
+        ),
+    ]
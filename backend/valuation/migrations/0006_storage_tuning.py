@@ -0,0 +1,57 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:10
+
+from django.db import migrations, models
+
+from core.storage import AlterStorageParameters
+
+UPDATED_AT_TABLES = ('valuation_valuation', 'valuation_like')
+
+
+def _updated_at_index(schema_editor, table):
+    # Name Django gave the db_index=True index of the column.
+    return schema_editor.quote_name(schema_editor._create_index_name(table, ['updated_at']))
+
+
+def drop_updated_at_indexes(apps, schema_editor):
+    for table in UPDATED_AT_TABLES:
+        schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {_updated_at_index(schema_editor, table)}')
+
+
+def create_updated_at_indexes(apps, schema_editor):
+    for table in UPDATED_AT_TABLES:
+        schema_editor.execute(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {_updated_at_index(schema_editor, table)} '
+            f'ON {schema_editor.quote_name(table)} ("updated_at")',
+        )
+
+
+class Migration(migrations.Migration):
+
+    # DROP/CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    atomic = False
+
+    dependencies = [
+        ('valuation', '0005_list_query_indexes'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name='valuation',
+                    name='updated_at',
+                    field=models.DateTimeField(auto_now=True),
+                ),
+                migrations.AlterField(
+                    model_name='like',
+                    name='updated_at',
+                    field=models.DateTimeField(auto_now=True),
+                ),
+            ],
+            database_operations=[
+                migrations.RunPython(drop_updated_at_indexes, create_updated_at_indexes),
+            ],
+        ),
+        AlterStorageParameters(model_name='valuation'),
+        AlterStorageParameters(model_name='like'),
+    ]
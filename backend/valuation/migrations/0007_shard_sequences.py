@@ -0,0 +1,66 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:40
+
+from django.db import migrations
+
+from core.sharding import SHARD_ID_STRIDE, shard_aliases, shard_index
+
+SHARDED_TABLES = ('valuation_valuation', 'valuation_like', 'valuation_likecountdelta')
+
+_IDENTITY_SQL = """
+SELECT a.attidentity <> ''
+FROM pg_attribute a
+WHERE a.attrelid = %s::regclass AND a.attname = 'id'
+"""
+
+_FOREIGN_KEYS_SQL = """
+SELECT rel.relname, con.conname
+FROM pg_constraint con
+JOIN pg_class rel ON rel.oid = con.conrelid
+JOIN pg_class ref ON ref.oid = con.confrelid
+WHERE con.contype = 'f' AND rel.relname = ANY(%s) AND NOT ref.relname = ANY(%s)
+"""
+
+
+def prepare_shard(apps, schema_editor):
+    """Give the shard's ids their residue and drop references to default-only tables."""
+    alias = schema_editor.connection.alias
+    if alias not in shard_aliases():
+        return
+    residue = shard_index(alias) + 1
+    with schema_editor.connection.cursor() as cursor:
+        for table in SHARDED_TABLES:
+            quoted = schema_editor.quote_name(table)
+            cursor.execute(f'SELECT COALESCE(MAX(id), 0) FROM {quoted}')
+            highest = cursor.fetchone()[0]
+            # First id above the existing rows that belongs to this shard.
+            start = highest + (residue - highest - 1) % SHARD_ID_STRIDE + 1
+            cursor.execute(_IDENTITY_SQL, [quoted])
+            if cursor.fetchone()[0]:
+                schema_editor.execute(
+                    f'ALTER TABLE {quoted} ALTER COLUMN id '
+                    f'SET INCREMENT BY {SHARD_ID_STRIDE} RESTART WITH {start}',
+                )
+            else:
+                cursor.execute('SELECT pg_get_serial_sequence(%s, %s)', [quoted, 'id'])
+                sequence = cursor.fetchone()[0]
+                schema_editor.execute(f'ALTER SEQUENCE {sequence} INCREMENT BY {SHARD_ID_STRIDE} RESTART WITH {start}')
+        # Users and bricksets live on default; the shard's copies stay empty.
+        cursor.execute(_FOREIGN_KEYS_SQL, [list(SHARDED_TABLES), list(SHARDED_TABLES)])
+        foreign_keys = cursor.fetchall()
+    for table, constraint in foreign_keys:
+        schema_editor.execute(
+            f'ALTER TABLE {schema_editor.quote_name(table)} DROP CONSTRAINT {schema_editor.quote_name(constraint)}',
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('valuation', '0006_storage_tuning'),
+    ]
+
+    operations = [
+        # Only acts on shard databases (`migrate --database shard_N`); a no-op
+        # on default. Not reversed: a shard cannot go back to holding users.
+        migrations.RunPython(prepare_shard, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-19 17:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0004_brickset_owner_created_idx'),
+        ('valuation', '0007_shard_sequences'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BrickSetStatistics',
+            fields=[
+                ('brickset', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='statistics', serialize=False, to='catalog.brickset')),
+                ('valuations_count', models.PositiveIntegerField(default=0)),
+                ('value_sum', models.BigIntegerField(default=0, help_text='Sum of valuation values.')),
+                ('weighted_sum', models.BigIntegerField(default=0, help_text='Sum of value * (1 + likes_count).')),
+                ('weight_total', models.BigIntegerField(default=0, help_text='Sum of 1 + likes_count.')),
+                ('min_value', models.PositiveIntegerField(null=True)),
+                ('max_value', models.PositiveIntegerField(null=True)),
+                ('mean_value', models.FloatField(null=True)),
+                ('consensus_value', models.PositiveIntegerField(help_text='Like-weighted mean, rounded.', null=True)),
+                ('p10_value', models.PositiveIntegerField(null=True)),
+                ('median_value', models.PositiveIntegerField(null=True)),
+                ('p90_value', models.PositiveIntegerField(null=True)),
+                ('sketch', models.JSONField(default=dict, help_text='QuantileSketch bucket counts of the values.')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'BrickSet statistics',
+                'verbose_name_plural': 'BrickSet statistics',
+                'indexes': [models.Index(fields=['consensus_value'], name='statistics_consensus_idx')],
+            },
+        ),
+    ]
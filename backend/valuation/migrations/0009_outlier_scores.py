@@ -0,0 +1,66 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:20
+
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block.
+    atomic = False
+
+    dependencies = [
+        ('valuation', '0008_brickset_statistics'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='valuation',
+            name='outlier_score',
+            field=models.FloatField(blank=True, help_text='Distance from earlier valuations of the set in standard deviations of ln(value); null if unscored.', null=True),
+        ),
+        migrations.AddField(
+            model_name='bricksetstatistics',
+            name='outliers_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='bricksetstatistics',
+            name='log_mean',
+            field=models.FloatField(default=0, help_text='Running mean of ln(value) of inliers.'),
+        ),
+        migrations.AddField(
+            model_name='bricksetstatistics',
+            name='log_m2',
+            field=models.FloatField(default=0, help_text='Running sum of squared deviations of ln(value) of inliers.'),
+        ),
+        migrations.AlterField(
+            model_name='bricksetstatistics',
+            name='weighted_sum',
+            field=models.BigIntegerField(default=0, help_text='Sum of value * (1 + likes_count) of inliers.'),
+        ),
+        migrations.AlterField(
+            model_name='bricksetstatistics',
+            name='weight_total',
+            field=models.BigIntegerField(default=0, help_text='Sum of 1 + likes_count of inliers.'),
+        ),
+        # Swap in the covering index with outlier_score without a window in
+        # which the list aggregates have no index to read.
+        AddIndexConcurrently(
+            model_name='valuation',
+            index=models.Index(
+                fields=['brickset', '-likes_count', 'created_at'],
+                include=['id', 'outlier_score'],
+                name='valuation_brickset_likes_new',
+            ),
+        ),
+        RemoveIndexConcurrently(
+            model_name='valuation',
+            name='valuation_brickset_likes_idx',
+        ),
+        migrations.RenameIndex(
+            model_name='valuation',
+            new_name='valuation_brickset_likes_idx',
+            old_name='valuation_brickset_likes_new',
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0004_brickset_owner_created_idx'),
+        ('valuation', '0009_outlier_scores'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ValuationHistory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.CharField(choices=[('DAY', 'Day'), ('WEEK', 'Week')], max_length=4)),
+                ('period_start', models.DateField(help_text='First day of the bucket (a Monday for weeks).')),
+                ('valuations_count', models.PositiveIntegerField(default=0)),
+                ('value_sum', models.BigIntegerField(default=0, help_text='Sum of valuation values.')),
+                ('min_value', models.PositiveIntegerField(null=True)),
+                ('max_value', models.PositiveIntegerField(null=True)),
+                ('weighted_sum', models.BigIntegerField(default=0, help_text='Sum of value * (1 + likes_count) of inliers.')),
+                ('weight_total', models.BigIntegerField(default=0, help_text='Sum of 1 + likes_count of inliers.')),
+                ('brickset', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='valuation_history', to='catalog.brickset')),
+            ],
+            options={
+                'verbose_name': 'Valuation history',
+                'verbose_name_plural': 'Valuation history',
+                'constraints': [models.UniqueConstraint(fields=('brickset', 'period', 'period_start'), name='valuation_history_unique_bucket')],
+            },
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-19 20:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('valuation', '0010_valuation_history'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ValuationAnalysis',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('number', models.PositiveIntegerField(help_text='Set number; null for the whole catalog.', null=True)),
+                ('dimension', models.CharField(choices=[('ALL', 'All valuations'), ('PRODUCTION_STATUS', 'Production status'), ('COMPLETENESS', 'Completeness'), ('FACTORY_SEALED', 'Factory sealed'), ('BOX', 'Box'), ('INSTRUCTIONS', 'Instructions')], max_length=20)),
+                ('variant', models.CharField(blank=True, help_text='Attribute value; empty for ALL.', max_length=24)),
+                ('valuations_count', models.PositiveIntegerField()),
+                ('mean_value', models.FloatField()),
+                ('p10_value', models.FloatField()),
+                ('median_value', models.FloatField()),
+                ('p90_value', models.FloatField()),
+                ('premium', models.FloatField(help_text='Median relative to the reference variant, minus one.', null=True)),
+                ('premium_sample', models.PositiveIntegerField(default=0, help_text='Set numbers a catalog premium is taken over.')),
+                ('computed_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Valuation analysis',
+                'verbose_name_plural': 'Valuation analyses',
+                'constraints': [models.UniqueConstraint(fields=('number', 'dimension', 'variant'), name='valuation_analysis_unique_group', nulls_distinct=False)],
+            },
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-19 22:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('valuation', '0011_valuation_analysis'),
+    ]
+
+    operations = [
+        # Existing rows are backfilled by `manage.py rebuild_statistics`.
+        migrations.AddField(
+            model_name='bricksetstatistics',
+            name='likes_count',
+            field=models.PositiveIntegerField(default=0, help_text='Net likes of all valuations.'),
+        ),
+    ]
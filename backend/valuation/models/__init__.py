@@ -1,3 +1,7 @@
+from valuation.models.analysis import AnalysisDimension, ValuationAnalysis
+from valuation.models.history import HistoryPeriod, ValuationHistory
 from valuation.models.like import Like
+from valuation.models.like_delta import LikeCountDelta
 from valuation.models.metrics import SystemMetrics
+from valuation.models.statistics import BrickSetStatistics
 from valuation.models.valuation import Valuation
@@ -0,0 +1,59 @@
+"""ValuationAnalysis model.
+
+Catalog-wide valuation analytics written by ``manage.py analyze_valuations``
+(see ``ValuationAnalysisService``) and served by the valuation analysis
+endpoint. Each run replaces the whole table.
+
+Rows are keyed by set number (null: the whole catalog), a condition
+dimension and its variant. For a set number, ``ALL`` covers every valuation
+of every BrickSet with that number, and each dimension splits them by one
+attribute, e.g. ``PRODUCTION_STATUS``/``RETIRED`` and ``/ACTIVE``. The
+``premium`` of the non-reference variant (RETIRED, COMPLETE, SEALED,
+WITH_BOX, WITH_INSTRUCTIONS) is its median relative to the reference
+variant's median; on catalog rows it is the median of the per-number
+premiums, taken over ``premium_sample`` set numbers.
+"""
+
+from __future__ import annotations
+
+from django.db import models
+
+DIMENSION_LENGTH = 20
+VARIANT_LENGTH = 24
+
+
+class AnalysisDimension(models.TextChoices):
+    ALL = "ALL", "All valuations"
+    PRODUCTION_STATUS = "PRODUCTION_STATUS", "Production status"
+    COMPLETENESS = "COMPLETENESS", "Completeness"
+    FACTORY_SEALED = "FACTORY_SEALED", "Factory sealed"
+    BOX = "BOX", "Box"
+    INSTRUCTIONS = "INSTRUCTIONS", "Instructions"
+
+
+class ValuationAnalysis(models.Model):
+    number = models.PositiveIntegerField(null=True, help_text="Set number; null for the whole catalog.")
+    dimension = models.CharField(max_length=DIMENSION_LENGTH, choices=AnalysisDimension.choices)
+    variant = models.CharField(max_length=VARIANT_LENGTH, blank=True, help_text="Attribute value; empty for ALL.")
+    valuations_count = models.PositiveIntegerField()
+    mean_value = models.FloatField()
+    p10_value = models.FloatField()
+    median_value = models.FloatField()
+    p90_value = models.FloatField()
+    premium = models.FloatField(null=True, help_text="Median relative to the reference variant, minus one.")
+    premium_sample = models.PositiveIntegerField(default=0, help_text="Set numbers a catalog premium is taken over.")
+    computed_at = models.DateTimeField()
+
+    class Meta:
+        verbose_name = "Valuation analysis"
+        verbose_name_plural = "Valuation analyses"
+        constraints = [
+            models.UniqueConstraint(
+                fields=("number", "dimension", "variant"),
+                name="valuation_analysis_unique_group",
+                nulls_distinct=False,
+            ),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - trivial
+        return f"{self.dimension} {self.variant} of set {self.number}: median {self.median_value}"
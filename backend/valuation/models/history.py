@@ -0,0 +1,53 @@
+"""ValuationHistory model.
+
+Daily and weekly rollups of the valuations of a BrickSet, keyed by the UTC
+day (or ISO week, starting Monday) the valuations were created in. Maintained
+incrementally by ``ValuationHistoryService`` as valuations are created and
+liked, so a chart of a set's valuations over time is one range scan of the
+``valuation_history_unique_bucket`` index. Like the consensus value in
+``BrickSetStatistics``, the like-weighted sums leave outliers out.
+
+Lives on the default database even when valuations are sharded.
+"""
+
+from __future__ import annotations
+
+from django.db import models
+
+from catalog.models import BrickSet
+
+
+class HistoryPeriod(models.TextChoices):
+    DAY = "DAY", "Day"
+    WEEK = "WEEK", "Week"
+
+
+class ValuationHistory(models.Model):
+    brickset = models.ForeignKey(
+        BrickSet,
+        on_delete=models.CASCADE,
+        related_name="valuation_history",
+        # Leading column of valuation_history_unique_bucket.
+        db_index=False,
+    )
+    period = models.CharField(max_length=4, choices=HistoryPeriod.choices)
+    period_start = models.DateField(help_text="First day of the bucket (a Monday for weeks).")
+    valuations_count = models.PositiveIntegerField(default=0)
+    value_sum = models.BigIntegerField(default=0, help_text="Sum of valuation values.")
+    min_value = models.PositiveIntegerField(null=True)
+    max_value = models.PositiveIntegerField(null=True)
+    weighted_sum = models.BigIntegerField(default=0, help_text="Sum of value * (1 + likes_count) of inliers.")
+    weight_total = models.BigIntegerField(default=0, help_text="Sum of 1 + likes_count of inliers.")
+
+    class Meta:
+        verbose_name = "Valuation history"
+        verbose_name_plural = "Valuation history"
+        constraints = [
+            models.UniqueConstraint(
+                fields=("brickset", "period", "period_start"),
+                name="valuation_history_unique_bucket",
+            ),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - trivial
+        return f"{self.period} {self.period_start} of set {self.brickset_id}: {self.valuations_count} valuations"
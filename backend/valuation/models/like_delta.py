@@ -0,0 +1,33 @@
+"""LikeCountDelta model.
+
+Append-only write-behind buffer for ``Valuation.likes_count``. In buffered
+counter mode every like/unlike inserts a +1/-1 row here instead of updating
+the (possibly hot) valuation row; ``flush_like_deltas`` periodically folds the
+rows into ``likes_count`` and deletes them. No FK constraint is declared so
+inserts stay cheap and rows of deleted valuations are simply discarded on the
+next flush.
+"""
+
+from __future__ import annotations
+
+from django.db import models
+
+from .valuation import Valuation  # noqa: WPS300
+
+
+class LikeCountDelta(models.Model):
+    valuation = models.ForeignKey(
+        Valuation,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="like_deltas",
+    )
+    delta = models.SmallIntegerField(help_text="+1 for like, -1 for unlike.")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Like count delta"
+        verbose_name_plural = "Like count deltas"
+
+    def __str__(self) -> str:  # pragma: no cover - trivial
+        return "{0:+d} likes on valuation {1}".format(self.delta, self.valuation_id)
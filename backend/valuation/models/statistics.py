@@ -0,0 +1,77 @@
+"""BrickSetStatistics model.
+
+Running statistics of the valuations of one BrickSet, maintained
+incrementally by ``BrickSetStatisticsService`` as valuations are created and
+liked, so lists can show, sort and filter by them without aggregating. The
+consensus value is the mean weighted by ``1 + likes_count``: every valuation
+counts once and each like counts as one more vote for it. Percentiles come
+from a mergeable quantile sketch (``core.quantile_sketch``) kept in ``sketch``.
+
+``log_mean`` and ``log_m2`` are Welford running moments of ``ln(value)`` over
+the valuations not flagged as outliers; new valuations are scored against
+them. Outliers count towards the count, mean, extremes and percentiles, but
+not towards the consensus value.
+
+Lives on the default database next to its BrickSet even when valuations are
+sharded (see ``core.sharding``); the catalog lists then read
+``valuations_count`` and ``likes_count`` here, as the valuations cannot be
+joined.
+"""
+
+from __future__ import annotations
+
+from django.db import models
+
+from catalog.models import BrickSet
+
+
+class BrickSetStatistics(models.Model):
+    brickset = models.OneToOneField(
+        BrickSet,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="statistics",
+    )
+    valuations_count = models.PositiveIntegerField(default=0)
+    likes_count = models.PositiveIntegerField(default=0, help_text="Net likes of all valuations.")
+    value_sum = models.BigIntegerField(default=0, help_text="Sum of valuation values.")
+    weighted_sum = models.BigIntegerField(default=0, help_text="Sum of value * (1 + likes_count) of inliers.")
+    weight_total = models.BigIntegerField(default=0, help_text="Sum of 1 + likes_count of inliers.")
+    outliers_count = models.PositiveIntegerField(default=0)
+    log_mean = models.FloatField(default=0, help_text="Running mean of ln(value) of inliers.")
+    log_m2 = models.FloatField(default=0, help_text="Running sum of squared deviations of ln(value) of inliers.")
+    min_value = models.PositiveIntegerField(null=True)
+    max_value = models.PositiveIntegerField(null=True)
+    mean_value = models.FloatField(null=True)
+    consensus_value = models.PositiveIntegerField(null=True, help_text="Like-weighted mean, rounded.")
+    p10_value = models.PositiveIntegerField(null=True)
+    median_value = models.PositiveIntegerField(null=True)
+    p90_value = models.PositiveIntegerField(null=True)
+    sketch = models.JSONField(default=dict, help_text="QuantileSketch bucket counts of the values.")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "BrickSet statistics"
+        verbose_name_plural = "BrickSet statistics"
+        indexes = [
+            # Catalog list ordered or filtered by consensus value.
+            models.Index(fields=["consensus_value"], name="statistics_consensus_idx"),
+        ]
+
+    @property
+    def inliers_count(self) -> int:
+        """Number of valuations not flagged as outliers."""
+        return self.valuations_count - self.outliers_count
+
+    def clamp(self, estimate: float | None) -> int | None:
+        """Round a quantile estimate into the observed range (None stays None).
+
+        E.g. the estimate of a single valuation's percentiles is its bucket's
+        midpoint, not its value.
+        """
+        if estimate is None:
+            return None
+        return min(max(round(estimate), self.min_value), self.max_value)
+
+    def __str__(self) -> str:  # pragma: no cover - trivial
+        return f"Statistics of set {self.brickset_id}: {self.valuations_count} valuations"
@@ -2,7 +2,11 @@
 
 Represents a user's valuation of a BrickSet (FR-10..FR-11). One valuation per
 user-set pair (unique constraint). ``likes_count`` is denormalized for fast
-ordering and will be maintained by signals (or DB triggers later) (FR-12).
+ordering and is maintained by LikeAdded/LikeRemoved event handlers (FR-12).
+``outlier_score`` is set once, at creation, by scoring the value against the
+BrickSet's earlier valuations (see ``BrickSetStatisticsService.score``);
+outliers still list like any valuation but are left out of consensus values
+and top valuations.
 """
 
 from __future__ import annotations
@@ -21,8 +25,19 @@ class ValuationQuerySet(models.QuerySet):
     def for_user(self, user) -> "ValuationQuerySet":  # type: ignore[override]
         return self.filter(user=user)
 
+    def inliers(self) -> "ValuationQuerySet":
+        unscored = models.Q(outlier_score__isnull=True)
+        return self.filter(unscored | models.Q(outlier_score__lte=OUTLIER_THRESHOLD))
+
 
 MAX_VALUATION = 999_999
+# Scores above this (log-space standard deviations) mark a valuation as an outlier.
+OUTLIER_THRESHOLD = 4.0
+
+
+def is_outlier(score: float | None) -> bool:
+    """Whether an outlier score (None: not scored) marks an outlier."""
+    return score is not None and score > OUTLIER_THRESHOLD
 
 
 class Valuation(models.Model):
@@ -46,8 +61,15 @@ class Valuation(models.Model):
     currency = models.CharField(max_length=3, default="PLN")
     comment = models.TextField(null=True, blank=True)
     likes_count = models.PositiveIntegerField(default=0, help_text="Denormalized likes count >=0.")
+    outlier_score = models.FloatField(
+        null=True,
+        blank=True,
+        help_text="Distance from earlier valuations of the set in standard deviations of ln(value); null if unscored.",
+    )
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
-    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    # Not indexed: every index is rewritten on a non-HOT update, and no query
+    # filters or orders by it (see core.storage).
+    updated_at = models.DateTimeField(auto_now=True)
 
     valuations = ValuationQuerySet.as_manager()  # custom manager name
 
@@ -68,9 +90,21 @@ class Valuation(models.Model):
             ),
         ]
         indexes = [
-            models.Index(fields=["brickset"], name="valuation_brickset_idx"),
-            models.Index(fields=["user"], name="valuation_user_idx"),
+            # Valuations of a BrickSet by likes; covers the list aggregates
+            # and the top valuation, which skips outliers.
+            models.Index(
+                fields=["brickset", "-likes_count", "created_at"],
+                include=["id", "outlier_score"],
+                name="valuation_brickset_likes_idx",
+            ),
+            # Owned valuations, newest first.
+            models.Index(fields=["user", "-created_at"], name="valuation_user_created_idx"),
         ]
 
+    @property
+    def is_outlier(self) -> bool:
+        """Whether the valuation was scored as an outlier when created."""
+        return is_outlier(self.outlier_score)
+
     def __str__(self) -> str:  # pragma: no cover - trivial
         return f"Valuation {self.value} {self.currency} by {self.user_id} for set {self.brickset_id}"
@@ -0,0 +1,22 @@
+"""Query shapes of the valuation services, audited by ``manage.py index_report``."""
+from __future__ import annotations
+
+from core.index_advisor import register_query_shape
+from valuation.models import (
+    BrickSetStatistics,
+    Like,
+    LikeCountDelta,
+    Valuation,
+    ValuationAnalysis,
+    ValuationHistory,
+)
+
+register_query_shape("valuation.brickset_valuations", Valuation, "brickset", "-likes_count", "created_at")
+register_query_shape("valuation.owned_valuations", Valuation, "user", "-created_at")
+register_query_shape("valuation.user_brickset_valuation", Valuation, "user", "brickset")
+register_query_shape("valuation.valuation_likes", Like, "valuation", "-created_at")
+register_query_shape("valuation.user_valuation_like", Like, "user", "valuation")
+register_query_shape("valuation.pending_like_deltas", LikeCountDelta, "valuation")
+register_query_shape("valuation.bricksets_by_consensus", BrickSetStatistics, "consensus_value")
+register_query_shape("valuation.brickset_history", ValuationHistory, "brickset", "period", "period_start")
+register_query_shape("valuation.valuation_analysis", ValuationAnalysis, "number", "dimension", "variant")
@@ -1,6 +1,8 @@
 """Valuation serializers package."""
 from valuation.serializers.like_list import LikeListItemSerializer
 from valuation.serializers.owned_valuation_list import OwnedValuationListItemSerializer
+from valuation.serializers.valuation_analysis import ValuationAnalysisQuerySerializer, ValuationAnalysisSerializer
 from valuation.serializers.valuation_create import CreateValuationSerializer
 from valuation.serializers.valuation_detail import ValuationSerializer
+from valuation.serializers.valuation_history import ValuationHistoryQuerySerializer, ValuationHistorySerializer
 from valuation.serializers.valuation_list import ValuationListItemSerializer
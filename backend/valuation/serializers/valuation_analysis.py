@@ -0,0 +1,53 @@
+"""Serializers for the valuation analysis endpoint."""
+from __future__ import annotations
+
+from rest_framework import serializers
+
+from catalog.models.brickset import MAX_SET_NUMBER
+
+
+class ValuationAnalysisQuerySerializer(serializers.Serializer):
+    """Validate query parameters for GET /valuations/analysis."""
+
+    number = serializers.IntegerField(
+        min_value=0,
+        max_value=MAX_SET_NUMBER,
+        required=False,
+        help_text="Set number; omit for catalog-wide results.",
+    )
+
+
+class ValuationAnalysisGroupSerializer(serializers.Serializer):
+    """Read-only serializer for ValuationAnalysisGroupDTO."""
+
+    dimension = serializers.CharField(
+        read_only=True,
+        help_text="ALL or the condition split by (e.g. PRODUCTION_STATUS).",
+    )
+    variant = serializers.CharField(
+        read_only=True,
+        help_text="Condition variant (e.g. RETIRED); empty for ALL.",
+    )
+    valuations_count = serializers.IntegerField(read_only=True)
+    mean_value = serializers.FloatField(read_only=True)
+    p10_value = serializers.FloatField(read_only=True)
+    median_value = serializers.FloatField(read_only=True)
+    p90_value = serializers.FloatField(read_only=True)
+    premium = serializers.FloatField(
+        read_only=True,
+        allow_null=True,
+        help_text="Median relative to the reference variant minus one (0.25: 25% higher).",
+    )
+    premium_sample = serializers.IntegerField(
+        read_only=True,
+        help_text="Set numbers a catalog-wide premium is the median of.",
+    )
+
+
+class ValuationAnalysisSerializer(serializers.Serializer):
+    """Read-only serializer for ValuationAnalysisDTO."""
+
+    number = serializers.IntegerField(read_only=True, allow_null=True)
+    computed_at = serializers.DateTimeField(read_only=True)
+    overall = ValuationAnalysisGroupSerializer(read_only=True)
+    conditions = ValuationAnalysisGroupSerializer(many=True, read_only=True)
@@ -0,0 +1,81 @@
+"""Serializers for the valuation history endpoint."""
+from __future__ import annotations
+
+from rest_framework import serializers
+
+from valuation.models import HistoryPeriod
+from valuation.services.valuation_history import history_window
+
+
+class ValuationHistoryQuerySerializer(serializers.Serializer):
+    """Validate query parameters for GET /bricksets/{brickset_id}/valuation-history.
+
+    Resolves the window to bucket starts, applying the defaults (the last 90
+    days or 52 weeks) and the size limit of the service.
+    """
+
+    period = serializers.ChoiceField(
+        choices=HistoryPeriod.choices,
+        default=HistoryPeriod.DAY,
+        help_text="Bucket size: DAY or WEEK (ISO weeks starting Monday).",
+    )
+    since = serializers.DateField(
+        required=False,
+        help_text="First day of the series (default: 89 days or 51 weeks before until).",
+    )
+    until = serializers.DateField(
+        required=False,
+        help_text="Last day of the series (default: today).",
+    )
+
+    def validate(self, attrs: dict) -> dict:
+        """Fill in and align the window."""
+        requested = (attrs.get("since"), attrs.get("until"))
+        try:
+            since, until = history_window(attrs["period"], *requested)
+        except ValueError as exc:
+            raise serializers.ValidationError(str(exc)) from exc
+        return {**attrs, "since": since, "until": until}
+
+
+class ValuationHistoryPointSerializer(serializers.Serializer):
+    """Read-only serializer for ValuationHistoryPointDTO."""
+
+    period_start = serializers.DateField(
+        read_only=True,
+        help_text="First day of the bucket.",
+    )
+    valuations_count = serializers.IntegerField(
+        read_only=True,
+        help_text="Valuations created in the bucket.",
+    )
+    mean_value = serializers.FloatField(
+        read_only=True,
+        allow_null=True,
+        help_text="Mean value of the bucket's valuations (null when empty).",
+    )
+    min_value = serializers.IntegerField(
+        read_only=True,
+        allow_null=True,
+        help_text="Lowest value in the bucket (null when empty).",
+    )
+    max_value = serializers.IntegerField(
+        read_only=True,
+        allow_null=True,
+        help_text="Highest value in the bucket (null when empty).",
+    )
+    weighted_value = serializers.IntegerField(
+        read_only=True,
+        allow_null=True,
+        help_text="Like-weighted mean of the bucket's non-outlier valuations.",
+    )
+
+
+class ValuationHistorySerializer(serializers.Serializer):
+    """Read-only serializer for ValuationHistoryDTO."""
+
+    brickset_id = serializers.IntegerField(read_only=True)
+    period = serializers.CharField(read_only=True)
+    since = serializers.DateField(read_only=True)
+    until = serializers.DateField(read_only=True)
+    points = ValuationHistoryPointSerializer(many=True, read_only=True)
@@ -0,0 +1,291 @@
+"""Incremental maintenance of ``BrickSetStatistics``.
+
+:meth:`BrickSetStatisticsService.apply` folds new valuations and like count
+changes into the statistics row of their BrickSet: sums, extremes and the
+quantile sketch are updated in place, then mean, consensus value and
+percentiles are derived from them. Each row is locked while it is updated,
+in brickset id order, so concurrent batches never lose an update. The cost
+per batch is one valuation query per shard plus one row per touched
+BrickSet, independent of how many valuations a BrickSet already has.
+
+:meth:`BrickSetStatisticsService.score` rates a new valuation before it is
+saved: the distance of ``ln(value)`` from the running mean of the BrickSet's
+inliers, in standard deviations (Welford moments on the statistics row, so
+one primary key read). Log space suits prices, where a typo is off by a
+factor. Outliers are left out of the moments and the consensus value, so a
+burst of bad valuations cannot widen the spread that would catch them.
+
+:meth:`BrickSetStatisticsService.rebuild` recomputes every row from the
+valuations (backfill, or repair after a failed event handler), replaying
+them in creation order and rescoring each one as it goes. Changes
+committed while it runs may be overwritten; run it again if in doubt.
+"""
+from __future__ import annotations
+
+import itertools
+import math
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+
+from django.db import models, transaction
+from django.db.models.functions import Coalesce
+
+from core import sharding
+from core.iterables import batched
+from core.quantile_sketch import QuantileSketch
+from datastore.domains.catalog_dto import ValuationStatisticsDTO
+from valuation.models import BrickSetStatistics, Valuation
+from valuation.services.like_counter import LikeCounter
+
+_P10 = 0.1
+_P50 = 0.5
+_P90 = 0.9
+_REBUILD_BATCH_SIZE = 1000
+_REBUILD_CHUNK_SIZE = 5000  # valuations fetched per round trip while replaying
+_RESCORED_FIELDS = ("outlier_score",)
+_SCORED_FIELDS = ("id", "brickset_id", "value", *_RESCORED_FIELDS)
+# Fewer inliers than this give no meaningful spread; such valuations stay unscored.
+MIN_SCORED_VALUATIONS = 5
+# Floor of the spread (about 10%), so agreeing valuations still tolerate small differences.
+_MIN_LOG_DEVIATION = 0.1
+_DERIVED_FIELDS = (
+    "valuations_count",
+    "likes_count",
+    "value_sum",
+    "weighted_sum",
+    "weight_total",
+    "outliers_count",
+    "log_mean",
+    "log_m2",
+    "min_value",
+    "max_value",
+    "mean_value",
+    "consensus_value",
+    "p10_value",
+    "median_value",
+    "p90_value",
+    "sketch",
+    "updated_at",
+)
+
+
+@dataclass(slots=True)
+class _Change:
+    """What one batch adds to the statistics of one BrickSet."""
+
+    values: list[int] = field(default_factory=list)  # noqa: WPS110 - values of new valuations
+    inliers: list[int] = field(default_factory=list)  # values of new valuations that are not outliers
+    likes: int = 0  # net likes of all valuations
+    weight: int = 0  # net likes of inliers
+    weighted: int = 0  # sum of value * net likes of inliers
+
+    def add(self, valuation: Valuation, created: bool, likes: int) -> None:
+        """Count ``valuation`` if it is new, and its net ``likes``."""
+        if created:
+            self.values.append(valuation.value)
+            if not valuation.is_outlier:
+                self.inliers.append(valuation.value)
+        self.likes += likes
+        if not valuation.is_outlier:
+            self.weight += likes
+            self.weighted += valuation.value * likes
+
+
+_Changes = dict[int, _Change]  # brickset id -> change
+
+
+class BrickSetStatisticsService:
+    """Keep per-BrickSet valuation statistics current."""
+
+    def apply(self, created_ids: Iterable[int], like_deltas: Mapping[int, int]) -> None:
+        """Fold new valuations and net like changes (valuation id -> delta) in.
+
+        A new valuation weighs 1 regardless of its current ``likes_count``:
+        its likes arrive as deltas of their own. Outliers and their likes
+        carry no weight.
+        """
+        changes = self._changes(set(created_ids), like_deltas)
+        if not changes:
+            return
+        with transaction.atomic():
+            for brickset_id in sorted(changes):
+                self._fold(brickset_id, changes[brickset_id])
+
+    def score(self, brickset_id: int, value: int) -> float | None:  # noqa: WPS110
+        """Return the outlier score of a new valuation of ``brickset_id``.
+
+        None while the BrickSet has fewer than ``MIN_SCORED_VALUATIONS``
+        inliers.
+        """
+        return outlier_score(BrickSetStatistics.objects.filter(brickset_id=brickset_id).first(), value)
+
+    def rebuild(self) -> int:
+        """Recompute the statistics of every valued BrickSet; return how many."""
+        rebuilt = 0
+        for batch in batched(self._recomputed(), _REBUILD_BATCH_SIZE):
+            BrickSetStatistics.objects.bulk_create(
+                batch,
+                update_conflicts=True,
+                unique_fields=["brickset"],
+                update_fields=list(_DERIVED_FIELDS),
+            )
+            rebuilt += len(batch)
+        return rebuilt
+
+    @staticmethod
+    def to_dto(statistics: BrickSetStatistics | None) -> ValuationStatisticsDTO | None:
+        """Map a statistics row (None for an unvalued BrickSet) to its DTO."""
+        if statistics is None or not statistics.valuations_count:
+            return None
+        return ValuationStatisticsDTO(
+            mean_value=statistics.mean_value,
+            consensus_value=statistics.consensus_value,
+            min_value=statistics.min_value,
+            max_value=statistics.max_value,
+            p10_value=statistics.p10_value,
+            median_value=statistics.median_value,
+            p90_value=statistics.p90_value,
+        )
+
+    @classmethod
+    def annotate_counts(cls, queryset: models.QuerySet) -> models.QuerySet:
+        """Annotate ``valuations_count`` and ``total_likes`` on a BrickSet queryset.
+
+        Aggregated over the joined valuations, or read from the statistics
+        rows when valuations are sharded and cannot be joined.
+        """
+        if sharding.enabled():
+            return queryset.annotate(
+                valuations_count=cls._count_of("statistics__valuations_count"),
+                total_likes=cls._count_of("statistics__likes_count"),
+            )
+        queryset = queryset.annotate(
+            valuations_count=models.Count("valuations", distinct=True),
+            total_likes=cls._count_of(models.Sum("valuations__likes_count")),
+        )
+        return LikeCounter().annotate_bricksets(queryset)
+
+    @staticmethod
+    def of(brickset: models.Model) -> BrickSetStatistics | None:
+        """Return the (select_related) statistics of ``brickset``, if any."""
+        try:
+            return brickset.statistics
+        except BrickSetStatistics.DoesNotExist:
+            return None
+
+    @staticmethod
+    def _count_of(expression: str | models.Expression) -> Coalesce:
+        return Coalesce(expression, models.Value(0), output_field=models.IntegerField())
+
+    @staticmethod
+    def _changes(created_ids: set[int], like_deltas: Mapping[int, int]) -> _Changes:
+        """Read the valuations of a batch and group what they add by BrickSet."""
+        # The new valuations and those with a non-zero like delta.
+        valuation_ids = created_ids.union(filter(like_deltas.get, like_deltas))
+        changes: _Changes = defaultdict(_Change)
+        valuations = Valuation.valuations.only(*_SCORED_FIELDS)
+        for valuation in sharding.filter_ids(valuations, valuation_ids):
+            likes = like_deltas.get(valuation.id, 0)
+            changes[valuation.brickset_id].add(valuation, valuation.id in created_ids, likes)
+        return changes
+
+    def _fold(self, brickset_id: int, change: _Change) -> None:
+        statistics, _ = BrickSetStatistics.objects.select_for_update().get_or_create(brickset_id=brickset_id)
+        sketch = QuantileSketch.from_dict(statistics.sketch)
+        _add_change(statistics, sketch, change)
+        statistics.sketch = sketch.to_dict()
+        _derive(statistics, sketch)
+        statistics.save()
+
+    @classmethod
+    def _recomputed(cls) -> Iterator[BrickSetStatistics]:
+        counter = LikeCounter()
+        for alias in sharding.databases():
+            yield from cls._recomputed_on(alias, counter)
+
+    @staticmethod
+    def _recomputed_on(alias: str, counter: LikeCounter) -> Iterator[BrickSetStatistics]:
+        """Replay the valuations of one database, saving changed scores as it goes."""
+        valuations = Valuation.valuations.using(alias)
+        queryset = counter.annotate_valuations(valuations.order_by("brickset_id", "created_at", "id"))
+        rescored: list[Valuation] = []
+        for brickset_id, group in itertools.groupby(
+            queryset.only(*_SCORED_FIELDS, "likes_count").iterator(chunk_size=_REBUILD_CHUNK_SIZE),
+            key=lambda valuation: valuation.brickset_id,
+        ):
+            yield _replay(brickset_id, group, counter, rescored)
+            if len(rescored) >= _REBUILD_BATCH_SIZE:
+                valuations.bulk_update(rescored, _RESCORED_FIELDS)
+                rescored.clear()
+        if rescored:
+            valuations.bulk_update(rescored, _RESCORED_FIELDS)
+
+
+def outlier_score(statistics: BrickSetStatistics | None, value: int) -> float | None:  # noqa: WPS110
+    """Score ``value`` against the inliers of ``statistics`` (None: too few of them)."""
+    if statistics is None or statistics.inliers_count < MIN_SCORED_VALUATIONS:
+        return None
+    variance = max(statistics.log_m2, 0) / (statistics.inliers_count - 1)
+    deviation = max(math.sqrt(variance), _MIN_LOG_DEVIATION)
+    distance = abs(math.log(value) - statistics.log_mean)
+    return round(distance / deviation, 3)
+
+
+def _add_change(statistics: BrickSetStatistics, sketch: QuantileSketch, change: _Change) -> None:
+    """Add ``change`` to the running state of ``statistics`` and ``sketch``."""
+    for value in change.values:  # noqa: WPS110
+        sketch.add(value)
+        statistics.min_value = value if statistics.min_value is None else min(statistics.min_value, value)
+        statistics.max_value = value if statistics.max_value is None else max(statistics.max_value, value)
+    for inlier in change.inliers:
+        # Welford update of the log moments, before counting the valuation.
+        log_value = math.log(inlier)
+        delta = log_value - statistics.log_mean
+        statistics.log_mean += delta / (statistics.inliers_count + 1)
+        statistics.log_m2 += delta * (log_value - statistics.log_mean)
+        statistics.valuations_count += 1
+    outliers = len(change.values) - len(change.inliers)
+    statistics.valuations_count += outliers
+    statistics.outliers_count += outliers
+    statistics.likes_count += change.likes
+    statistics.value_sum += sum(change.values)
+    statistics.weighted_sum += sum(change.inliers) + change.weighted
+    statistics.weight_total += len(change.inliers) + change.weight
+
+
+def _replay(
+    brickset_id: int,
+    valuations: Iterable[Valuation],
+    counter: LikeCounter,
+    rescored: list[Valuation],
+) -> BrickSetStatistics:
+    """Fold ``valuations`` (in creation order) into fresh statistics, rescoring each.
+
+    Valuations whose score changed are appended to ``rescored``.
+    """
+    statistics = BrickSetStatistics(brickset_id=brickset_id)
+    sketch = QuantileSketch()
+    for valuation in valuations:
+        score = outlier_score(statistics, valuation.value)
+        if score != valuation.outlier_score:
+            valuation.outlier_score = score
+            rescored.append(valuation)
+        change = _Change()
+        change.add(valuation, created=True, likes=counter.live_likes(valuation))
+        _add_change(statistics, sketch, change)
+    statistics.sketch = sketch.to_dict()
+    _derive(statistics, sketch)
+    return statistics
+
+
+def _derive(statistics: BrickSetStatistics, sketch: QuantileSketch) -> None:
+    """Set mean, consensus value and percentiles from the running state."""
+    count = statistics.valuations_count
+    weight = statistics.weight_total
+    statistics.mean_value = statistics.value_sum / count if count else None
+    weighted = count and weight > 0
+    statistics.consensus_value = round(statistics.weighted_sum / weight) if weighted else None
+    statistics.p10_value = statistics.clamp(sketch.quantile(_P10))
+    statistics.median_value = statistics.clamp(sketch.quantile(_P50))
+    statistics.p90_value = statistics.clamp(sketch.quantile(_P90))
@@ -0,0 +1,146 @@
+"""Detect and repair drift in the denormalized ``Valuation.likes_count``.
+
+The valuation id space of every database holding valuations (each shard, see
+``core.sharding``) is split into half-open ``[start, stop)`` ranges that are
+checked independently with one set-based statement each, so ranges can be
+spread over worker processes. The expected value of ``likes_count`` is the
+number of ``Like`` rows minus deltas still buffered in ``LikeCountDelta``
+(see ``LikeCounter``), so reconciliation is correct in both counter modes.
+
+Repairs lock the valuation rows of a range (in id order, like
+``LikeCounter.flush``) before counting. A like committed concurrently either
+is counted or blocks on the lock and applies its increment afterwards, so no
+update is lost.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import Max, Min
+
+from core import sharding
+from valuation.models import Like, LikeCountDelta, Valuation
+
+_DRIFT_SQL = """
+    WITH likes AS (
+        SELECT valuation_id, COUNT(*) AS total
+        FROM {like}
+        WHERE valuation_id >= %(start)s AND valuation_id < %(stop)s
+        GROUP BY valuation_id
+    ),
+    pending AS (
+        SELECT valuation_id, SUM(delta) AS total
+        FROM {delta}
+        WHERE valuation_id >= %(start)s AND valuation_id < %(stop)s
+        GROUP BY valuation_id
+    ),
+    drift AS (
+        SELECT
+            v.id,
+            v.likes_count AS stored,
+            GREATEST(COALESCE(l.total, 0) - COALESCE(p.total, 0), 0) AS expected
+        FROM {valuation} v
+        LEFT JOIN likes l ON l.valuation_id = v.id
+        LEFT JOIN pending p ON p.valuation_id = v.id
+        WHERE v.id >= %(start)s AND v.id < %(stop)s
+    )
+"""
+
+_SELECT_DRIFT_SQL = """
+    SELECT id, stored, expected FROM drift WHERE stored <> expected ORDER BY id
+"""
+
+_REPAIR_DRIFT_SQL = """
+    UPDATE {valuation} v
+    SET likes_count = drift.expected
+    FROM drift
+    WHERE v.id = drift.id AND drift.stored <> drift.expected
+    RETURNING v.id, drift.stored, drift.expected
+"""
+
+_LOCK_RANGE_SQL = """
+    SELECT COUNT(*) FROM (
+        SELECT id FROM {valuation}
+        WHERE id >= %(start)s AND id < %(stop)s
+        ORDER BY id
+        FOR UPDATE
+    ) locked
+"""
+
+
+@dataclass(slots=True, frozen=True)
+class IdRange:
+    """Half-open range of valuation ids ``[start, stop)`` on one database."""
+
+    start: int
+    stop: int
+    database: str = DEFAULT_DB_ALIAS
+
+
+@dataclass(slots=True, frozen=True)
+class CounterDrift:
+    """A valuation whose stored ``likes_count`` differs from the expected one."""
+
+    valuation_id: int
+    stored: int
+    expected: int
+
+
+@dataclass(slots=True)
+class RangeReport:
+    """Drift found (and repaired unless dry-run) in one id range."""
+
+    id_range: IdRange
+    drifts: list[CounterDrift] = field(default_factory=list)
+
+
+def split_id_space(chunk_size: int) -> list[IdRange]:
+    """Split the current valuation id space of every database into ranges of ``chunk_size`` ids."""
+    return [
+        id_range
+        for alias in sharding.databases()
+        for id_range in _split_database(alias, chunk_size)
+    ]
+
+
+def reconcile_range(id_range: IdRange, dry_run: bool) -> RangeReport:
+    """Report and, unless ``dry_run``, repair drifted counters in one range.
+
+    Module-level so it can be submitted to a process pool.
+    """
+    params = {"start": id_range.start, "stop": id_range.stop}
+    database = id_range.database
+    if dry_run:
+        rows = _fetch(database, _DRIFT_SQL + _SELECT_DRIFT_SQL, params)
+    else:
+        with transaction.atomic(using=database):
+            _fetch(database, _LOCK_RANGE_SQL, params)
+            rows = _fetch(database, _DRIFT_SQL + _REPAIR_DRIFT_SQL, params)
+    return RangeReport(
+        id_range=id_range,
+        drifts=[CounterDrift(*row) for row in sorted(rows)],
+    )
+
+
+def _split_database(alias: str, chunk_size: int) -> list[IdRange]:
+    valuations = Valuation.valuations.using(alias)
+    bounds = valuations.aggregate(low=Min("id"), high=Max("id"))
+    if bounds["low"] is None:
+        return []
+    stop = bounds["high"] + 1
+    return [
+        IdRange(start, min(start + chunk_size, stop), alias)
+        for start in range(bounds["low"], stop, chunk_size)
+    ]
+
+
+def _fetch(database: str, sql: str, params: dict[str, int]) -> list[tuple]:
+    statement = sql.format(
+        like=Like._meta.db_table,
+        delta=LikeCountDelta._meta.db_table,
+        valuation=Valuation._meta.db_table,
+    )
+    with connections[database].cursor() as cursor:
+        cursor.execute(statement, params)
+        return cursor.fetchall()
@@ -0,0 +1,170 @@
+"""Maintenance and reads of the denormalized ``Valuation.likes_count``.
+
+Two modes, selected by ``settings.LIKE_COUNTER_MODE``:
+
+- ``sync`` (default): every like/unlike updates ``likes_count`` in place.
+- ``buffered``: every like/unlike appends a ``LikeCountDelta`` row, so a
+  trending valuation no longer serializes writers on its row lock.
+  ``flush_like_deltas`` folds the deltas into ``likes_count`` in batches.
+
+Reads go through :meth:`LikeCounter.live_likes` (or the ``annotate_*``
+helpers for querysets), which add pending deltas so displayed counts stay
+exact in buffered mode. Orderings by ``likes_count`` use the folded value and
+converge after the next flush.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models, transaction
+from django.db.models.functions import Coalesce, Greatest
+
+from core import identity_map, sharding
+from valuation.models import LikeCountDelta, Valuation
+
+SYNC_MODE = "sync"
+BUFFERED_MODE = "buffered"
+PENDING_LIKES = "pending_likes"
+PENDING_TOTAL_LIKES = "pending_total_likes"
+_TOTAL = "total"
+_VALUATION_ID = "valuation_id"
+
+
+class LikeCounter:
+    """Record like deltas and read exact like counts in the configured mode."""
+
+    def __init__(self, mode: str | None = None) -> None:
+        """Use ``mode`` or fall back to ``settings.LIKE_COUNTER_MODE``.
+
+        Raises:
+            ImproperlyConfigured: If the mode is not ``sync`` or ``buffered``.
+        """
+        self.mode = mode or getattr(settings, "LIKE_COUNTER_MODE", SYNC_MODE)
+        if self.mode not in {SYNC_MODE, BUFFERED_MODE}:
+            raise ImproperlyConfigured(f"Unknown LIKE_COUNTER_MODE: {self.mode!r}.")
+
+    @property
+    def buffered(self) -> bool:
+        """Whether like deltas are buffered instead of applied in place."""
+        return self.mode == BUFFERED_MODE
+
+    def record(self, valuation_id: int, delta: int) -> None:
+        """Apply (sync) or append (buffered) a like count change."""
+        if self.buffered:
+            LikeCountDelta.objects.create(valuation_id=valuation_id, delta=delta)
+            return
+        _add_likes(Valuation.valuations.db_manager(hints=sharding.for_pk(valuation_id)), valuation_id, delta)
+
+    def live_likes(self, valuation: Valuation) -> int:
+        """Return ``likes_count`` including deltas not yet flushed.
+
+        Uses the ``pending_likes`` annotation added by
+        :meth:`annotate_valuations` when present, otherwise queries the buffer.
+        """
+        if not self.buffered:
+            return valuation.likes_count
+        pending = getattr(valuation, PENDING_LIKES, None)
+        if pending is None:
+            pending = self.pending_for_valuations([valuation.pk]).get(valuation.pk, 0)
+        return max(0, valuation.likes_count + pending)
+
+    def live_total_likes(self, brickset: models.Model) -> int:
+        """Return the ``total_likes`` annotation of a BrickSet plus pending deltas.
+
+        Expects the queryset to be annotated with ``total_likes`` and, in
+        buffered mode, :meth:`annotate_bricksets`.
+        """
+        total_likes = getattr(brickset, "total_likes", 0) or 0
+        if not self.buffered:
+            return total_likes
+        return max(0, total_likes + getattr(brickset, PENDING_TOTAL_LIKES, 0))
+
+    def prefetch_valuations(self) -> models.Prefetch:
+        """Return a ``valuations`` prefetch carrying pending likes annotations."""
+        return models.Prefetch(
+            "valuations",
+            queryset=self.annotate_valuations(Valuation.valuations.all()),
+        )
+
+    def annotate_valuations(self, queryset: models.QuerySet) -> models.QuerySet:
+        """Annotate ``pending_likes`` on a Valuation queryset (buffered mode only)."""
+        if not self.buffered:
+            return queryset
+        pending = LikeCountDelta.objects.filter(valuation_id=models.OuterRef("pk"))
+        return queryset.annotate(**{PENDING_LIKES: self._sum_subquery(pending, _VALUATION_ID)})
+
+    def annotate_bricksets(self, queryset: models.QuerySet) -> models.QuerySet:
+        """Annotate ``pending_total_likes`` on a BrickSet queryset (buffered mode only)."""
+        if not self.buffered:
+            return queryset
+        pending = LikeCountDelta.objects.filter(valuation__brickset_id=models.OuterRef("pk"))
+        return queryset.annotate(
+            **{PENDING_TOTAL_LIKES: self._sum_subquery(pending, "valuation__brickset_id")},
+        )
+
+    def pending_for_valuations(self, valuation_ids: Iterable[int]) -> dict[int, int]:
+        """Return the sum of buffered deltas per valuation id."""
+        if not self.buffered:
+            return {}
+        pending: dict[int, int] = {}
+        for alias, ids in sharding.group_by_shard(valuation_ids).items():
+            deltas = LikeCountDelta.objects.using(alias)
+            rows = (
+                deltas.filter(valuation_id__in=ids)
+                .values(_VALUATION_ID)
+                .annotate(**{_TOTAL: models.Sum("delta")})
+                .values_list(_VALUATION_ID, _TOTAL)
+            )
+            pending.update(rows)
+        return pending
+
+    @classmethod
+    def flush(cls, batch_size: int) -> int:
+        """Fold up to ``batch_size`` buffered deltas per database into ``likes_count``.
+
+        Each database holding valuations (every shard, see ``core.sharding``)
+        is flushed in its own transaction. Returns the number of deltas folded.
+        """
+        return sum(cls._flush_database(alias, batch_size) for alias in sharding.databases())
+
+    @staticmethod
+    def _flush_database(alias: str, batch_size: int) -> int:
+        """Fold up to ``batch_size`` deltas of one database.
+
+        Rows are claimed with ``FOR UPDATE SKIP LOCKED`` so concurrent flushers
+        never fold the same delta twice. Valuations are updated in id order to
+        keep lock ordering consistent.
+        """
+        with transaction.atomic(using=alias):
+            batch = list(
+                LikeCountDelta.objects.using(alias).select_for_update(skip_locked=True)
+                .order_by("id")
+                .values_list("id", "valuation_id", "delta")[:batch_size],
+            )
+            totals: dict[int, int] = defaultdict(int)
+            for _, valuation_id, delta in batch:
+                totals[valuation_id] += delta
+            for valuation_id in sorted(totals):
+                _add_likes(Valuation.valuations.using(alias), valuation_id, totals[valuation_id])
+            claimed = [row[0] for row in batch]
+            LikeCountDelta.objects.using(alias).filter(id__in=claimed).delete()
+        return len(batch)
+
+    @staticmethod
+    def _sum_subquery(pending: models.QuerySet, group_by: str) -> Coalesce:
+        grouped = pending.values(group_by)
+        total = grouped.annotate(total=models.Sum("delta")).values(_TOTAL)
+        return Coalesce(
+            models.Subquery(total, output_field=models.IntegerField()),
+            models.Value(0),
+        )
+
+
+def _add_likes(valuations: models.QuerySet, valuation_id: int, delta: int) -> None:
+    """Add ``delta`` to the like count of one valuation, never below zero."""
+    likes_count = Greatest(models.F("likes_count") + delta, 0)
+    valuations.filter(pk=valuation_id).update(likes_count=likes_count)
+    identity_map.evict(Valuation, valuation_id)
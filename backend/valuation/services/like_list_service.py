@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from django.db.models import QuerySet
 
+from core import identity_map, sharding
 from datastore.domains.valuation_dto import LikeListItemDTO
 from valuation.exceptions import ValuationNotFoundError
 from valuation.models import Like, Valuation
@@ -33,13 +34,23 @@ class LikeListService:
         Raises:
             ValuationNotFoundError: When Valuation with given ID does not exist.
         """
-        self._verify_valuation_exists(valuation_id)
+        self.verify_valuation_exists(valuation_id)
+        return self.build_queryset(valuation_id)
 
-        queryset = Like.objects.filter(
-            valuation_id=valuation_id,
-        ).order_by("-created_at")
+    def build_queryset(self, valuation_id: int) -> QuerySet:
+        """Build the ordered Like QuerySet without the existence check.
 
-        return queryset
+        Async views run :meth:`verify_valuation_exists` concurrently with the
+        count and page queries instead of before them.
+
+        Args:
+            valuation_id: Valuation identifier from URL path parameter.
+
+        Returns:
+            QuerySet of Like objects ordered by -created_at (newest first).
+        """
+        likes = Like.objects.db_manager(hints=sharding.for_valuation(valuation_id))
+        return likes.for_valuation(valuation_id).order_by("-created_at")
 
     def map_to_dto(self, like: Like) -> LikeListItemDTO:
         """Map Like model instance to LikeListItemDTO.
@@ -59,7 +70,7 @@ class LikeListService:
             created_at=like.created_at,
         )
 
-    def _verify_valuation_exists(self, valuation_id: int) -> None:
+    def verify_valuation_exists(self, valuation_id: int) -> None:
         """Verify that Valuation with given ID exists.
 
         Args:
@@ -69,6 +80,6 @@ class LikeListService:
             ValuationNotFoundError: When Valuation does not exist.
         """
         try:
-            Valuation.valuations.get(pk=valuation_id)
+            identity_map.load(Valuation, valuation_id)
         except Valuation.DoesNotExist:
             raise ValuationNotFoundError(valuation_id)
@@ -1,14 +1,19 @@
 """Service implementing Like creation flow for valuations."""
 from __future__ import annotations
 
-from django.db import IntegrityError, transaction
+from django.db import IntegrityError
 
+from changefeed.models import ChangeEntity, ChangeOperation
+from changefeed.services.change_log import record_change
+from core import identity_map, sharding
+from core.events import publish
 from datastore.domains.valuation_dto import CreateLikeCommand, LikeDTO
 from valuation.exceptions import (
     LikeDuplicateError,
     LikeOwnValuationError,
     ValuationNotFoundError,
 )
+from valuation.events import LikeAdded
 from valuation.models import Like, Valuation
 
 
@@ -36,7 +41,7 @@ class LikeValuationService:
         """
         valuation = self._verify_valuation_exists(command.valuation_id)
         self._verify_not_own_valuation(valuation, command.user_id)
-        like = self._persist_like(command.valuation_id, command.user_id)
+        like = self._persist_like(valuation, command.user_id)
 
         return self._build_dto(like)
 
@@ -53,7 +58,7 @@ class LikeValuationService:
             ValuationNotFoundError: If Valuation does not exist
         """
         try:
-            return Valuation.valuations.get(pk=valuation_id)
+            return identity_map.load(Valuation, valuation_id)
         except Valuation.DoesNotExist as exc:
             raise ValuationNotFoundError(valuation_id) from exc
 
@@ -76,16 +81,18 @@ class LikeValuationService:
 
     def _persist_like(
         self,
-        valuation_id: int,
+        valuation: Valuation,
         user_id: int,
     ) -> Like:
         """Build and persist Like to database within transaction.
 
+        Logs a likes change and publishes LikeAdded; counters are updated
+        after commit.
         Catches IntegrityError for unique constraint violations.
         Other IntegrityError types (foreign key, check constraints) are re-raised.
 
         Args:
-            valuation_id: ID of valuation being liked
+            valuation: Valuation being liked
             user_id: ID of user creating the like
 
         Returns:
@@ -95,14 +102,26 @@ class LikeValuationService:
             LikeDuplicateError: If uniqueness constraint is violated
             IntegrityError: For other integrity constraint violations
         """
+        valuation_id = valuation.id
         try:
-            with transaction.atomic():
+            with sharding.atomic(sharding.shard_for_id(valuation_id)):
                 # Use explicit valuation_id and user_id to avoid proxy object issues
                 # Use default 'objects' manager (Like does not have custom manager)
                 like = Like.objects.create(
                     user_id=user_id,
                     valuation_id=valuation_id,
                 )
+                record_change(
+                    ChangeEntity.VALUATION,
+                    valuation_id,
+                    ChangeOperation.LIKES_CHANGED,
+                    valuation.brickset_id,
+                )
+                publish(LikeAdded(
+                    valuation_id=valuation_id,
+                    user_id=user_id,
+                    brickset_id=valuation.brickset_id,
+                ))
                 return like
         except IntegrityError as exc:
             # Check which constraint was violated by examining error message
@@ -7,8 +7,10 @@ from __future__ import annotations
 
 from django.db.models import QuerySet
 
+from core import sharding
 from datastore.domains.valuation_dto import OwnedValuationListItemDTO
 from valuation.models import Valuation
+from valuation.services.like_counter import LikeCounter
 
 
 class OwnedValuationListService:  # noqa: WPS338
@@ -29,7 +31,7 @@ class OwnedValuationListService:  # noqa: WPS338
 
     DEFAULT_ORDERING = "-created_at"
 
-    def get_queryset(self, user_id: int, ordering: str | None = None) -> QuerySet:
+    def get_queryset(self, user_id: int, ordering: str | None = None) -> QuerySet | sharding.ShardedRows:
         """Build and return optimized QuerySet for user's valuations.
 
         Flow:
@@ -37,23 +39,30 @@ class OwnedValuationListService:  # noqa: WPS338
         2. Optimize with select_related("brickset") to avoid N+1 queries
         3. Apply ordering (with validation)
 
+        A user's valuations span every shard when valuations are sharded
+        (see ``core.sharding``): the query then runs on each shard, pages are
+        merged in the requested order and bricksets are prefetched from the
+        default database.
+
         Args:
             user_id: ID of the authenticated user (valuation owner)
             ordering: Ordering field from ALLOWED_ORDERINGS (optional)
 
         Returns:
-            QuerySet of Valuation objects with brickset joined
+            QuerySet of Valuation objects with brickset joined, or ShardedRows
+            over all shards
         """
         queryset = Valuation.valuations.filter(user_id=user_id)
-
-        # Optimize with select_related to prevent N+1 queries
-        queryset = queryset.select_related("brickset")
+        queryset = LikeCounter().annotate_valuations(queryset)
 
         # Apply ordering with validation
         ordering = ordering or self.DEFAULT_ORDERING
         queryset = self._apply_ordering(queryset, ordering)
 
-        return queryset
+        if sharding.enabled():
+            return sharding.ShardedRows(queryset, related=("brickset",))
+        # Optimize with select_related to prevent N+1 queries
+        return queryset.select_related("brickset")
 
     @staticmethod
     def _apply_ordering(queryset: QuerySet, ordering: str) -> QuerySet:
@@ -101,6 +110,6 @@ class OwnedValuationListService:  # noqa: WPS338
             brickset=brickset_dict,
             value=valuation.value,
             currency=valuation.currency,
-            likes_count=valuation.likes_count,
+            likes_count=LikeCounter().live_likes(valuation),
             created_at=valuation.created_at,
         )
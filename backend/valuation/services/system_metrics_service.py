@@ -0,0 +1,54 @@
+"""Service recomputing the SystemMetrics singleton."""
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.db import models
+
+from catalog.models import BrickSet
+from valuation.models import SystemMetrics, Valuation
+
+METRICS_PK = 1
+
+
+class SystemMetricsService:
+    """Recompute ``total_sets``, ``active_users`` and ``serviced_sets``.
+
+    A full recompute with aggregate queries. It runs in the background job
+    ``valuation.refresh_metrics`` (see ``valuation/jobs.py``) rather than in
+    the request that changed the data.
+    """
+
+    def execute(self) -> SystemMetrics:
+        """Refresh and save the metrics row, creating it if missing."""
+        metrics, _ = SystemMetrics.objects.get_or_create(pk=METRICS_PK)
+        metrics.total_sets = BrickSet.objects.count()
+        metrics.active_users = self._count_active_users()
+        metrics.serviced_sets = self._count_serviced_sets()
+        metrics.save(update_fields=["total_sets", "active_users", "serviced_sets", "updated_at"])
+        return metrics
+
+    @staticmethod
+    def _count_active_users() -> int:
+        """Users with at least one brickset or valuation."""
+        return get_user_model().objects.filter(
+            models.Q(bricksets__isnull=False) | models.Q(valuations__isnull=False),
+        ).distinct().count()
+
+    @staticmethod
+    def _count_serviced_sets() -> int:
+        """Sets valued by someone other than the owner, or whose owner valuation has likes."""
+        val_not_owner = (
+            Valuation.valuations.filter(brickset_id=models.OuterRef("pk"))
+            .exclude(user_id=models.F("brickset__owner_id"))
+        )
+        val_owner_liked = Valuation.valuations.filter(
+            brickset_id=models.OuterRef("pk"),
+            user_id=models.F("brickset__owner_id"),
+            likes_count__gt=0,
+        )
+        return BrickSet.objects.annotate(
+            has_external=models.Exists(val_not_owner),
+            has_owner_liked=models.Exists(val_owner_liked),
+        ).filter(
+            models.Q(has_external=True) | models.Q(has_owner_liked=True),
+        ).count()
@@ -0,0 +1,172 @@
+"""Tests for incrementally maintained BrickSet statistics."""
+from __future__ import annotations
+
+from django.test import TestCase
+from model_bakery import baker
+
+from account.models import User
+from catalog.models import BrickSet
+from catalog.services.brickset_detail_service import BrickSetDetailService
+from catalog.services.brickset_list_service import BrickSetListService
+from datastore.domains.valuation_dto import CreateLikeCommand, CreateValuationCommand
+from valuation.models import BrickSetStatistics, Valuation
+from valuation.models.valuation import OUTLIER_THRESHOLD
+from valuation.services.brickset_statistics import BrickSetStatisticsService
+from valuation.services.like_valuation_service import LikeValuationService
+from valuation.services.valuation_create_service import CreateValuationService
+
+
+class BrickSetStatisticsServiceTests(TestCase):
+    """Test folding valuations and likes, rebuilding and list access."""
+
+    def setUp(self) -> None:
+        """Create a brickset with three valuations."""
+        self.service = BrickSetStatisticsService()
+        self.brickset = baker.make(BrickSet, number=10001)
+        self.valuations = [
+            baker.make(Valuation, brickset=self.brickset, value=value)
+            for value in (100, 200, 600)
+        ]
+
+    def _statistics(self) -> BrickSetStatistics:
+        return BrickSetStatistics.objects.get(brickset=self.brickset)
+
+    def test_new_valuations_update_running_statistics(self) -> None:
+        """Count, mean, extremes and percentiles follow the valuations."""
+        self.service.apply([valuation.id for valuation in self.valuations], {})
+
+        statistics = self._statistics()
+        assert statistics.valuations_count == 3
+        assert statistics.mean_value == 300
+        assert statistics.consensus_value == 300
+        assert (statistics.min_value, statistics.max_value) == (100, 600)
+        assert abs(statistics.median_value - 200) <= 2
+        assert abs(statistics.p10_value - 100) <= 1
+        assert abs(statistics.p90_value - 600) <= 6
+
+    def test_likes_weight_the_consensus_value(self) -> None:
+        """Each like counts as one more vote for its valuation."""
+        self.service.apply([valuation.id for valuation in self.valuations], {})
+
+        self.service.apply([], {self.valuations[2].id: 3})
+        statistics = self._statistics()
+        votes = 100 + 200 + 600 * 4
+        assert statistics.consensus_value == round(votes / 6)
+        assert statistics.mean_value == 300
+
+        self.service.apply([], {self.valuations[2].id: -3})
+        assert self._statistics().consensus_value == 300
+
+    def test_rebuild_matches_incremental_statistics(self) -> None:
+        """Recomputing from the valuations gives the same row."""
+        liked = self.valuations[0]
+        Valuation.valuations.filter(pk=liked.pk).update(likes_count=2)
+        valuation_ids = [valuation.id for valuation in self.valuations]
+        self.service.apply(valuation_ids, {liked.id: 2})
+        incremental = self._statistics()
+        BrickSetStatistics.objects.all().delete()
+
+        assert self.service.rebuild() == 1
+
+        rebuilt = self._statistics()
+        for name in ("valuations_count", "weighted_sum", "weight_total", "consensus_value", "median_value", "sketch"):
+            assert getattr(rebuilt, name) == getattr(incremental, name), name
+
+    def test_events_keep_statistics_current(self) -> None:
+        """Creating and liking valuations through the services updates the row after commit."""
+        brickset = baker.make(BrickSet, number=20002)
+        author = baker.make(User)
+        with self.captureOnCommitCallbacks(execute=True):
+            dto = CreateValuationService().execute(
+                CreateValuationCommand(brickset_id=brickset.id, value=500),
+                author,
+            )
+        liker = baker.make(User)
+        with self.captureOnCommitCallbacks(execute=True):
+            LikeValuationService().execute(CreateLikeCommand(valuation_id=dto.id, user_id=liker.id))
+
+        statistics = BrickSetStatistics.objects.get(brickset=brickset)
+        assert statistics.valuations_count == 1
+        assert statistics.weight_total == 2
+        assert BrickSetDetailService().execute(brickset.id).statistics.median_value == 500
+
+    def test_list_orders_and_filters_by_consensus_value(self) -> None:
+        """Unvalued sets sort last and never match a value filter."""
+        self.service.apply([valuation.id for valuation in self.valuations], {})
+        cheap = baker.make(BrickSet, number=30003)
+        cheap_valuation = baker.make(Valuation, brickset=cheap, value=50)
+        self.service.apply([cheap_valuation.id], {})
+        unvalued = baker.make(BrickSet, number=40004)
+        service = BrickSetListService()
+
+        ascending = service.build_queryset({"ordering": "consensus_value"})
+        descending = service.build_queryset({"ordering": "-consensus_value"})
+        filtered = service.build_queryset({"min_consensus_value": 100})
+
+        expected = [cheap.id, self.brickset.id, unvalued.id]
+        assert [brickset.id for brickset in ascending] == expected
+        descending_ids = [brickset.id for brickset in descending]
+        assert descending_ids == [self.brickset.id, cheap.id, unvalued.id]
+        assert [brickset.id for brickset in filtered] == [self.brickset.id]
+        assert service.map_to_dto(descending[0]).statistics.consensus_value == 300
+        assert service.map_to_dto(descending[2]).statistics is None
+
+    def test_far_off_values_score_as_outliers(self) -> None:
+        """Scores measure the distance from the inliers; too few valuations give none."""
+        brickset = baker.make(BrickSet, number=50005)
+        agreeing = [
+            baker.make(Valuation, brickset=brickset, value=value)
+            for value in (480, 500, 520, 490)
+        ]
+        self.service.apply([valuation.id for valuation in agreeing], {})
+        assert self.service.score(brickset.id, 50_000) is None
+
+        fifth = baker.make(Valuation, brickset=brickset, value=510)
+        self.service.apply([fifth.id], {})
+
+        assert self.service.score(brickset.id, 505) < 1
+        assert self.service.score(brickset.id, 50_000) > OUTLIER_THRESHOLD
+        unvalued = baker.make(BrickSet, number=60006)
+        assert self.service.score(unvalued.id, 500) is None
+
+    def test_outliers_are_left_out_of_consensus_and_top_valuation(self) -> None:
+        """A liked typo neither moves the consensus value nor becomes the top valuation."""
+        brickset = baker.make(BrickSet, number=70007)
+        for value in (480, 500, 520, 490, 510):
+            with self.captureOnCommitCallbacks(execute=True):
+                CreateValuationService().execute(
+                    CreateValuationCommand(brickset_id=brickset.id, value=value),
+                    baker.make(User),
+                )
+        with self.captureOnCommitCallbacks(execute=True):
+            typo = CreateValuationService().execute(
+                CreateValuationCommand(brickset_id=brickset.id, value=500_000),
+                baker.make(User),
+            )
+        with self.captureOnCommitCallbacks(execute=True):
+            liker = baker.make(User)
+            LikeValuationService().execute(CreateLikeCommand(valuation_id=typo.id, user_id=liker.id))
+
+        statistics = BrickSetStatistics.objects.get(brickset=brickset)
+        listed = BrickSetListService().build_queryset({}).get(pk=brickset.id)
+        assert Valuation.valuations.get(pk=typo.id).is_outlier
+        assert (statistics.valuations_count, statistics.outliers_count) == (6, 1)
+        assert statistics.consensus_value == 500
+        assert statistics.max_value == 500_000
+        assert listed.top_valuation_id != typo.id
+
+    def test_rebuild_rescores_valuations_in_creation_order(self) -> None:
+        """Unscored valuations get the scores online scoring would have given them."""
+        brickset = baker.make(BrickSet, number=80008)
+        for value in (480, 500, 520, 490, 510, 50_000):
+            baker.make(Valuation, brickset=brickset, value=value)
+
+        self.service.rebuild()
+
+        valuations = Valuation.valuations.filter(brickset=brickset).order_by("id")
+        scores = list(valuations.values_list("outlier_score", flat=True))
+        assert scores[:5] == [None, None, None, None, None]
+        assert scores[5] > OUTLIER_THRESHOLD
+        statistics = BrickSetStatistics.objects.get(brickset=brickset)
+        assert statistics.outliers_count == 1
+        assert statistics.consensus_value == 500
@@ -0,0 +1,73 @@
+"""Tests for likes_count drift detection and repair."""
+from __future__ import annotations
+
+from django.test import TestCase
+from model_bakery import baker
+
+from account.models import User
+from catalog.models import BrickSet
+from valuation.models import Like, Valuation
+from valuation.services.counter_reconciliation import (
+    CounterDrift,
+    IdRange,
+    reconcile_range,
+    split_id_space,
+)
+from valuation.services.like_counter import BUFFERED_MODE, LikeCounter
+
+
+class CounterReconciliationTests(TestCase):
+    """Test reconcile_range and split_id_space."""
+
+    def setUp(self) -> None:
+        """Create valuations whose likes bypassed the like services."""
+        brickset = baker.make(BrickSet, number=10001)
+        self.valuation = baker.make(Valuation, brickset=brickset, value=100)
+        self.consistent = baker.make(Valuation, brickset=brickset, value=200)
+        users = baker.make(User, _quantity=3)
+        likes = [Like(user=user, valuation=self.valuation) for user in users]
+        Like.objects.bulk_create(likes)
+        self.id_range = IdRange(self.valuation.id, self.consistent.id + 1)
+
+    def test_dry_run_reports_drift_without_repairing(self) -> None:
+        """Dry run lists the drifted valuation and leaves it unchanged."""
+        report = reconcile_range(self.id_range, dry_run=True)
+
+        self.valuation.refresh_from_db()
+        assert report.drifts == [CounterDrift(self.valuation.id, stored=0, expected=3)]
+        assert self.valuation.likes_count == 0
+
+    def test_repair_sets_expected_count(self) -> None:
+        """Repair writes the Like count and a second pass finds nothing."""
+        report = reconcile_range(self.id_range, dry_run=False)
+
+        self.valuation.refresh_from_db()
+        assert report.drifts == [CounterDrift(self.valuation.id, stored=0, expected=3)]
+        assert self.valuation.likes_count == 3
+        assert not reconcile_range(self.id_range, dry_run=True).drifts
+
+    def test_repair_accounts_for_buffered_deltas(self) -> None:
+        """Pending deltas are subtracted so the next flush lands on the exact count."""
+        counter = LikeCounter(BUFFERED_MODE)
+        counter.record(self.valuation.id, 1)
+
+        reconcile_range(self.id_range, dry_run=False)
+        counter.flush(batch_size=100)
+
+        self.valuation.refresh_from_db()
+        assert self.valuation.likes_count == 3
+
+    def test_split_id_space_covers_all_ids(self) -> None:
+        """Ranges are contiguous, half-open and cover min..max id."""
+        id_ranges = split_id_space(chunk_size=1)
+
+        assert id_ranges[0].start == self.valuation.id
+        assert id_ranges[-1].stop == self.consistent.id + 1
+        starts = [id_range.start for id_range in id_ranges[1:]]
+        assert [id_range.stop for id_range in id_ranges[:-1]] == starts
+
+    def test_split_id_space_without_valuations(self) -> None:
+        """No valuations means no ranges."""
+        Valuation.valuations.all().delete()
+
+        assert split_id_space(chunk_size=10) == []
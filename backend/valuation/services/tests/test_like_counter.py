@@ -0,0 +1,210 @@
+"""Tests for LikeCounter sync and buffered modes."""
+from __future__ import annotations
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.test import TestCase, override_settings
+from model_bakery import baker
+
+from account.models import User
+from catalog.exceptions import BrickSetEditForbiddenError
+from catalog.models import BrickSet
+from catalog.services.brickset_delete_service import DeleteBrickSetService
+from catalog.services.brickset_detail_service import BrickSetDetailService
+from catalog.services.brickset_list_service import BrickSetListService
+from datastore.domains.valuation_dto import CreateLikeCommand, UnlikeValuationCommand
+from valuation.models import LikeCountDelta, Valuation
+from valuation.services.like_counter import BUFFERED_MODE, SYNC_MODE, LikeCounter
+from valuation.services.like_valuation_service import LikeValuationService
+from valuation.services.unlike_valuation_service import UnlikeValuationService
+from valuation.services.valuation_detail_service import ValuationDetailService
+from valuation.services.valuation_list_service import ValuationListService
+
+
+class LikeCounterSyncModeTests(TestCase):
+    """Test the default in-place counter mode."""
+
+    def setUp(self) -> None:
+        """Create a valuation."""
+        brickset = baker.make(BrickSet, number=10001)
+        self.valuation = baker.make(Valuation, brickset=brickset, value=100)
+        self.counter = LikeCounter(SYNC_MODE)
+
+    def test_record_updates_likes_count_in_place(self) -> None:
+        """Deltas are applied directly and never buffered."""
+        self.counter.record(self.valuation.id, 1)
+
+        self.valuation.refresh_from_db()
+        assert self.valuation.likes_count == 1
+        assert not LikeCountDelta.objects.exists()
+
+    def test_record_never_goes_below_zero(self) -> None:
+        """Decrement on zero keeps likes_count at zero."""
+        self.counter.record(self.valuation.id, -1)
+
+        self.valuation.refresh_from_db()
+        assert self.valuation.likes_count == 0
+
+    def test_default_mode_is_sync(self) -> None:
+        """Without configuration the counter is synchronous."""
+        assert not LikeCounter().buffered
+
+    def test_unknown_mode_raises(self) -> None:
+        """Typos in LIKE_COUNTER_MODE fail loudly."""
+        with self.assertRaises(ImproperlyConfigured):
+            LikeCounter("eventual")
+
+
+class LikeCounterBufferedModeTests(TestCase):
+    """Test buffered deltas, exact reads and flushing."""
+
+    def setUp(self) -> None:
+        """Create a valuation with a folded count of two."""
+        self.brickset = baker.make(BrickSet, number=10001)
+        self.valuation = baker.make(Valuation, brickset=self.brickset, value=100, likes_count=2)
+        self.counter = LikeCounter(BUFFERED_MODE)
+
+    def test_record_appends_delta_without_touching_valuation(self) -> None:
+        """Buffered likes leave the valuation row alone."""
+        self.counter.record(self.valuation.id, 1)
+
+        self.valuation.refresh_from_db()
+        assert self.valuation.likes_count == 2
+        assert LikeCountDelta.objects.filter(valuation=self.valuation, delta=1).count() == 1
+
+    def test_live_likes_merges_pending_deltas(self) -> None:
+        """live_likes adds unflushed deltas with or without annotation."""
+        self.counter.record(self.valuation.id, 1)
+        self.counter.record(self.valuation.id, 1)
+        self.counter.record(self.valuation.id, -1)
+
+        queryset = Valuation.valuations.filter(pk=self.valuation.pk)
+        annotated = self.counter.annotate_valuations(queryset).get()
+        assert self.counter.live_likes(self.valuation) == 3
+        assert self.counter.live_likes(annotated) == 3
+
+    def test_annotate_bricksets_adds_pending_total(self) -> None:
+        """Brickset annotation sums deltas over all its valuations."""
+        other = baker.make(Valuation, brickset=self.brickset, value=50)
+        self.counter.record(self.valuation.id, 1)
+        self.counter.record(other.id, 1)
+
+        queryset = BrickSet.bricksets.filter(pk=self.brickset.pk)
+        brickset = self.counter.annotate_bricksets(queryset).get()
+
+        assert brickset.pending_total_likes == 2
+
+    def test_flush_folds_deltas_and_empties_buffer(self) -> None:
+        """flush applies the net delta per valuation and deletes folded rows."""
+        for delta in (1, 1, -1, 1):
+            self.counter.record(self.valuation.id, delta)
+
+        folded = self.counter.flush(batch_size=100)
+
+        self.valuation.refresh_from_db()
+        assert folded == 4
+        assert self.valuation.likes_count == 4
+        assert not LikeCountDelta.objects.exists()
+
+    def test_flush_respects_batch_size(self) -> None:
+        """Only batch_size rows are folded per call."""
+        for _ in range(3):
+            self.counter.record(self.valuation.id, 1)
+
+        assert self.counter.flush(batch_size=2) == 2
+        assert LikeCountDelta.objects.count() == 1
+
+    def test_flush_discards_deltas_of_deleted_valuations(self) -> None:
+        """Deltas without a valuation are dropped on flush."""
+        self.counter.record(self.valuation.id, 1)
+        Valuation.valuations.filter(pk=self.valuation.pk).delete()
+
+        assert self.counter.flush(batch_size=100) == 1
+        assert not LikeCountDelta.objects.exists()
+
+
+@override_settings(LIKE_COUNTER_MODE=BUFFERED_MODE)
+class BufferedLikeReadsTests(TestCase):
+    """Services report exact counts while likes are still buffered."""
+
+    def setUp(self) -> None:
+        """Create an owner-only brickset and like the owner's valuation."""
+        self.owner = baker.make(User)
+        self.brickset = baker.make(BrickSet, owner=self.owner, number=10001)
+        self.valuation = baker.make(
+            Valuation,
+            brickset=self.brickset,
+            user=self.owner,
+            value=100,
+        )
+        liker = baker.make(User)
+        with self.captureOnCommitCallbacks(execute=True):
+            LikeValuationService().execute(
+                CreateLikeCommand(valuation_id=self.valuation.id, user_id=liker.id),
+            )
+
+    def test_like_event_buffers_delta(self) -> None:
+        """A committed like appends a delta instead of updating the row."""
+        self.valuation.refresh_from_db()
+
+        assert self.valuation.likes_count == 0
+        assert LikeCountDelta.objects.filter(valuation=self.valuation).count() == 1
+
+    def test_valuation_reads_include_pending_like(self) -> None:
+        """Detail and list DTOs include the buffered like."""
+        service = ValuationListService()
+        rows = [service.map_to_dto(row) for row in service.build_queryset(self.brickset.id)]
+
+        assert ValuationDetailService().execute(self.valuation.id).likes_count == 1
+        assert rows[0].likes_count == 1
+
+    def test_brickset_reads_include_pending_like(self) -> None:
+        """BrickSet detail and list totals include the buffered like."""
+        service = BrickSetListService()
+        list_item = service.map_to_dto(service.get_queryset({}).get())
+
+        assert BrickSetDetailService().execute(self.brickset.id).total_likes == 1
+        assert list_item.total_likes == 1
+        assert list_item.top_valuation.likes_count == 1
+
+    def test_rb01_counts_pending_like(self) -> None:
+        """Owner valuation with a buffered like blocks deletion."""
+        with self.assertRaises(BrickSetEditForbiddenError):
+            DeleteBrickSetService().execute(self.brickset.id, self.owner)
+
+
+class LikeEventCounterTests(TestCase):
+    """Counters follow committed LikeAdded/LikeRemoved events."""
+
+    def setUp(self) -> None:
+        """Create a valuation and two likers."""
+        brickset = baker.make(BrickSet, number=10001)
+        self.valuation = baker.make(Valuation, brickset=brickset, value=100)
+        self.likers = baker.make(User, _quantity=2)
+
+    def test_batch_of_likes_is_applied_after_commit(self) -> None:
+        """Likes in one transaction become one counter update after commit."""
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                for liker in self.likers:
+                    LikeValuationService().execute(
+                        CreateLikeCommand(valuation_id=self.valuation.id, user_id=liker.id),
+                    )
+            self.valuation.refresh_from_db()
+            assert self.valuation.likes_count == 0
+
+        self.valuation.refresh_from_db()
+        assert self.valuation.likes_count == 2
+
+    def test_unlike_decrements_after_commit(self) -> None:
+        """A committed unlike lowers the counter."""
+        command = CreateLikeCommand(valuation_id=self.valuation.id, user_id=self.likers[0].id)
+        with self.captureOnCommitCallbacks(execute=True):
+            LikeValuationService().execute(command)
+        with self.captureOnCommitCallbacks(execute=True):
+            UnlikeValuationService().execute(
+                UnlikeValuationCommand(valuation_id=self.valuation.id, user_id=self.likers[0].id),
+            )
+
+        self.valuation.refresh_from_db()
+        assert self.valuation.likes_count == 0
@@ -0,0 +1,89 @@
+"""EXPLAIN-based regression tests for the list query indexes.
+
+Test tables are tiny, so PostgreSQL would pick sequential scans for any of
+them. Sequential and bitmap scans are disabled for each test; the planner
+then uses an index whenever one fits, and still sorts if no index provides
+the requested order. Each query must name its index and, where the index
+matches the ORDER BY, must not sort its result. Queries checked for their
+order are planned with sorts penalized as well, so that statistics left
+behind by earlier tests cannot make an unordered index plus a sort look
+cheaper.
+"""
+from __future__ import annotations
+
+from django.db import connection
+from django.db.models import QuerySet
+from django.test import TestCase
+from model_bakery import baker
+
+from catalog.models import BrickSet
+from catalog.services.brickset_list_service import BrickSetListService
+from catalog.services.owned_brickset_list_service import OwnedBrickSetListService
+from valuation.models import Like, Valuation
+from valuation.services.like_list_service import LikeListService
+from valuation.services.owned_valuation_list_service import OwnedValuationListService
+from valuation.services.valuation_list_service import ValuationListService
+
+
+class ListQueryPlanTests(TestCase):
+    """Each list query shape is served by its composite index."""
+
+    def setUp(self) -> None:
+        """Create a little data and steer the planner away from table scans."""
+        self.valuation = baker.make(Valuation, brickset__number=10001, value=100, likes_count=3)
+        baker.make(Like, valuation=self.valuation, _quantity=2)
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute("SET LOCAL enable_bitmapscan = off")
+
+    @staticmethod
+    def _plan(queryset: QuerySet) -> str:
+        return queryset.explain()
+
+    @classmethod
+    def _ordered_plan(cls, queryset: QuerySet) -> str:
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_sort = off")
+        return cls._plan(queryset)
+
+    def test_brickset_valuations_are_index_ordered(self) -> None:
+        """filter(brickset).order_by(-likes_count, created_at) needs no sort."""
+        plan = self._ordered_plan(ValuationListService().build_queryset(self.valuation.brickset_id))
+
+        assert "valuation_brickset_likes_idx" in plan
+        assert "Sort" not in plan
+
+    def test_valuation_likes_are_index_ordered(self) -> None:
+        """filter(valuation).order_by(-created_at) needs no sort."""
+        plan = self._ordered_plan(LikeListService().build_queryset(self.valuation.id))
+
+        assert "like_valuation_created_idx" in plan
+        assert "Sort" not in plan
+
+    def test_valuation_likers_are_read_from_covering_index(self) -> None:
+        """User ids of a valuation's likes need no heap access."""
+        likers = Like.objects.filter(valuation_id=self.valuation.id).values("user_id")
+        plan = self._plan(likers)
+
+        assert "Index Only Scan using like_valuation_created_idx" in plan
+
+    def test_owned_valuations_are_index_ordered(self) -> None:
+        """filter(user).order_by(-created_at) needs no sort."""
+        plan = self._ordered_plan(OwnedValuationListService().get_queryset(self.valuation.user_id))
+
+        assert "valuation_user_created_idx" in plan
+        assert "Sort" not in plan
+
+    def test_owned_bricksets_use_owner_index(self) -> None:
+        """The owner filter of the owned brickset list uses the composite index."""
+        brickset = BrickSet.bricksets.get(pk=self.valuation.brickset_id)
+
+        plan = self._plan(OwnedBrickSetListService().get_queryset(brickset.owner_id))
+
+        assert "brickset_owner_created_idx" in plan
+
+    def test_catalog_aggregates_use_covering_index(self) -> None:
+        """Counts, like sums and the top valuation read the covering index."""
+        plan = self._ordered_plan(BrickSetListService().build_queryset({}))
+
+        assert "Index Only Scan using valuation_brickset_likes_idx" in plan
@@ -0,0 +1,60 @@
+"""Tests for SystemMetricsService and the metrics refresh job."""
+from __future__ import annotations
+
+from django.test import TestCase
+from model_bakery import baker
+
+from account.models import User
+from catalog.models import BrickSet
+from catalog.services.brickset_delete_service import DeleteBrickSetService
+from core.job_queue import JobRunner
+from core.models import Job
+from datastore.domains.valuation_dto import CreateLikeCommand, UnlikeValuationCommand
+from valuation.jobs import REFRESH_METRICS_JOB
+from valuation.models import SystemMetrics, Valuation
+from valuation.services.like_valuation_service import LikeValuationService
+from valuation.services.system_metrics_service import SystemMetricsService
+from valuation.services.unlike_valuation_service import UnlikeValuationService
+
+
+class SystemMetricsServiceTests(TestCase):
+    """Test metrics recompute and its scheduling from domain events."""
+
+    def setUp(self) -> None:
+        """Create a set valued by its owner and by another user."""
+        self.owner = baker.make(User)
+        self.other = baker.make(User)
+        self.brickset = baker.make(BrickSet, number=10001, owner=self.owner)
+        self.spare = baker.make(BrickSet, number=10002, owner=self.owner)
+        self.valuation = baker.make(
+            Valuation, brickset=self.brickset, user=self.other, value=100,
+        )
+
+    def test_execute_recomputes_metrics(self) -> None:
+        """All three counters reflect current data."""
+        metrics = SystemMetricsService().execute()
+
+        assert metrics.total_sets == 2
+        assert metrics.active_users == 2
+        assert metrics.serviced_sets == 1
+
+    def test_like_and_unlike_enqueue_single_refresh(self) -> None:
+        """Likes only enqueue a deduplicated job instead of recomputing."""
+        like = CreateLikeCommand(valuation_id=self.valuation.id, user_id=self.owner.id)
+        unlike = UnlikeValuationCommand(valuation_id=self.valuation.id, user_id=self.owner.id)
+        with self.captureOnCommitCallbacks(execute=True):
+            LikeValuationService().execute(like)
+        with self.captureOnCommitCallbacks(execute=True):
+            UnlikeValuationService().execute(unlike)
+
+        assert Job.objects.filter(name=REFRESH_METRICS_JOB).count() == 1
+        assert not SystemMetrics.objects.filter(total_sets=2).exists()
+
+    def test_refresh_job_updates_metrics(self) -> None:
+        """Running the queued job recomputes the singleton."""
+        with self.captureOnCommitCallbacks(execute=True):
+            DeleteBrickSetService().execute(self.spare.id, self.owner)
+
+        assert JobRunner().run_next()
+
+        assert SystemMetrics.objects.get(pk=1).total_sets == 1
@@ -0,0 +1,95 @@
+"""Tests for the NumPy valuation analysis job."""
+from __future__ import annotations
+
+import numpy as np
+from django.test import SimpleTestCase, TestCase
+from model_bakery import baker
+
+from catalog.models import BrickSet, Completeness, ProductionStatus
+from valuation.exceptions import ValuationAnalysisNotFoundError
+from valuation.models import AnalysisDimension, Valuation, ValuationAnalysis
+from valuation.services.valuation_analysis import ValuationAnalysisService, grouped_statistics
+
+
+class GroupedStatisticsTests(SimpleTestCase):
+    """Test the vectorized group-by against NumPy's own reductions."""
+
+    def test_matches_per_group_numpy_statistics(self) -> None:
+        """Counts, means and percentiles equal those of each group on its own."""
+        rng = np.random.default_rng(7)
+        keys = rng.integers(0, 20, size=2000)
+        values = rng.integers(1, 1000, size=2000).astype(np.float64)
+
+        groups = grouped_statistics(keys, values)
+
+        assert groups.keys.tolist() == sorted(set(keys.tolist()))
+        for index, key in enumerate(groups.keys):
+            members = values[keys == key]
+            assert groups.counts[index] == len(members)
+            assert np.isclose(groups.means[index], members.mean())
+            assert np.allclose(
+                (groups.p10[index], groups.medians[index], groups.p90[index]),
+                np.percentile(members, [10, 50, 90]),
+            )
+
+
+class ValuationAnalysisServiceTests(TestCase):
+    """Test running the analysis and reading its results."""
+
+    def _brickset(self, number: int, status: str, values: tuple[int, ...]) -> BrickSet:
+        brickset = baker.make(
+            BrickSet,
+            number=number,
+            production_status=status,
+            completeness=Completeness.COMPLETE,
+            has_instructions=True,
+            has_box=True,
+            is_factory_sealed=False,
+        )
+        for value in values:
+            baker.make(Valuation, brickset=brickset, value=value)
+        return brickset
+
+    def test_premium_compares_variants_within_a_set_number(self) -> None:
+        """RETIRED vs ACTIVE medians of one number give its premium and the catalog's."""
+        self._brickset(10001, ProductionStatus.ACTIVE, (100, 110, 120))
+        retired = self._brickset(10001, ProductionStatus.RETIRED, (150, 160, 170))
+        baker.make(Valuation, brickset=retired, value=900_000, outlier_score=50.0)
+        self._brickset(20002, ProductionStatus.ACTIVE, (300,))
+
+        ValuationAnalysisService().run(chunk_size=2)
+
+        row = ValuationAnalysis.objects.get(
+            number=10001,
+            dimension=AnalysisDimension.PRODUCTION_STATUS,
+            variant="RETIRED",
+        )
+        assert (row.valuations_count, row.median_value) == (3, 160)
+        assert row.premium == 160 / 110 - 1
+        catalog = ValuationAnalysis.objects.get(
+            number=None,
+            dimension=AnalysisDimension.PRODUCTION_STATUS,
+            variant="RETIRED",
+        )
+        assert (catalog.premium, catalog.premium_sample) == (row.premium, 1)
+        assert ValuationAnalysis.objects.get(number=20002, dimension=AnalysisDimension.ALL).valuations_count == 1
+        assert not ValuationAnalysis.objects.filter(dimension=AnalysisDimension.COMPLETENESS, premium__isnull=False)
+
+    def test_for_number_serves_last_run(self) -> None:
+        """Results are read per number or catalog-wide; missing ones raise."""
+        service = ValuationAnalysisService()
+        with self.assertRaises(ValuationAnalysisNotFoundError):
+            service.for_number(None)
+        self._brickset(10001, ProductionStatus.ACTIVE, (100, 200))
+        service.run()
+
+        analysis = service.for_number(10001)
+
+        assert analysis.overall.valuations_count == 2
+        assert analysis.overall.median_value == 150
+        assert {group.dimension for group in analysis.conditions} == {
+            dimension for dimension in AnalysisDimension.values if dimension != AnalysisDimension.ALL
+        }
+        assert service.for_number(None).overall.valuations_count == 2
+        with self.assertRaises(ValuationAnalysisNotFoundError):
+            service.for_number(30003)
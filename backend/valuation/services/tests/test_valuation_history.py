@@ -0,0 +1,109 @@
+"""Tests for the daily and weekly valuation rollups."""
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from model_bakery import baker
+
+from account.models import User
+from catalog.exceptions import BrickSetNotFoundError
+from catalog.models import BrickSet
+from datastore.domains.valuation_dto import CreateLikeCommand, CreateValuationCommand
+from valuation.models import HistoryPeriod, Valuation, ValuationHistory
+from valuation.services.like_valuation_service import LikeValuationService
+from valuation.services.valuation_create_service import CreateValuationService
+from valuation.services.valuation_history import MAX_POINTS, ValuationHistoryService, history_window
+
+
+class ValuationHistoryServiceTests(TestCase):
+    """Test maintaining, reading and rebuilding valuation history buckets."""
+
+    def setUp(self) -> None:
+        """Create a brickset."""
+        self.service = ValuationHistoryService()
+        self.brickset = baker.make(BrickSet, number=10001)
+
+    def _bucket(self, period: str, start: date) -> ValuationHistory:
+        return ValuationHistory.objects.get(brickset=self.brickset, period=period, period_start=start)
+
+    def test_events_fold_valuations_into_day_and_week_buckets(self) -> None:
+        """New valuations and likes update today's bucket and this week's."""
+        dtos = []
+        for value in (400, 500):
+            with self.captureOnCommitCallbacks(execute=True):
+                dtos.append(CreateValuationService().execute(
+                    CreateValuationCommand(brickset_id=self.brickset.id, value=value),
+                    baker.make(User),
+                ))
+        with self.captureOnCommitCallbacks(execute=True):
+            liker = baker.make(User)
+            like = CreateLikeCommand(valuation_id=dtos[1].id, user_id=liker.id)
+            LikeValuationService().execute(like)
+
+        today = timezone.localdate()
+        monday = today - timedelta(days=today.weekday())
+        day = self._bucket(HistoryPeriod.DAY, today)
+        week = self._bucket(HistoryPeriod.WEEK, monday)
+        for bucket in (day, week):
+            assert (bucket.valuations_count, bucket.value_sum) == (2, 900)
+            assert (bucket.min_value, bucket.max_value) == (400, 500)
+            assert (bucket.weighted_sum, bucket.weight_total) == (400 + 500 * 2, 3)
+
+    def test_series_fills_empty_buckets(self) -> None:
+        """Every day of the window has a point, empty ones with null values."""
+        start = date(2026, 10, 5)
+        baker.make(
+            ValuationHistory,
+            brickset=self.brickset,
+            period=HistoryPeriod.DAY,
+            period_start=start,
+            valuations_count=2,
+            value_sum=900,
+            min_value=400,
+            max_value=500,
+            weighted_sum=1400,
+            weight_total=3,
+        )
+
+        until = start + timedelta(days=2)
+        series = self.service.series(self.brickset.id, HistoryPeriod.DAY, start, until)
+
+        assert [point.valuations_count for point in series.points] == [2, 0, 0]
+        assert series.points[0].mean_value == 450
+        assert series.points[0].weighted_value == 467
+        assert series.points[1].weighted_value is None
+        with self.assertRaises(BrickSetNotFoundError):
+            self.service.series(999_999, HistoryPeriod.DAY, start, start)
+
+    def test_rebuild_buckets_valuations_by_creation_day(self) -> None:
+        """Recomputing groups valuations by the UTC day and ISO week they were created in."""
+        now = timezone.now()
+        monday = now.replace(year=2026, month=10, day=5, hour=12)
+        for offset, value in ((0, 100), (0, 300), (2, 200)):
+            valuation = baker.make(Valuation, brickset=self.brickset, value=value, likes_count=offset)
+            created_at = monday + timedelta(days=offset)
+            Valuation.valuations.filter(pk=valuation.pk).update(created_at=created_at)
+
+        assert self.service.rebuild() == 3
+
+        assert self._bucket(HistoryPeriod.DAY, monday.date()).value_sum == 400
+        week = self._bucket(HistoryPeriod.WEEK, monday.date())
+        assert week.valuations_count == 3
+        assert (week.min_value, week.max_value) == (100, 300)
+        weighted_sum = 100 + 300 + 200 * 3
+        assert (week.weighted_sum, week.weight_total) == (weighted_sum, 5)
+
+    def test_window_defaults_align_and_limit(self) -> None:
+        """Windows align to bucket starts and cannot exceed MAX_POINTS buckets."""
+        until = date(2026, 10, 15)  # a Thursday
+
+        since = until - timedelta(days=89)
+        assert history_window(HistoryPeriod.DAY, None, until) == (since, until)
+        weeks = history_window(HistoryPeriod.WEEK, None, until)
+        assert weeks == (date(2025, 10, 20), date(2026, 10, 12))
+        with self.assertRaises(ValueError):
+            history_window(HistoryPeriod.DAY, until - timedelta(days=MAX_POINTS), until)
+        with self.assertRaises(ValueError):
+            history_window(HistoryPeriod.DAY, until, until - timedelta(days=1))
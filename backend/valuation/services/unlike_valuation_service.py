@@ -1,9 +1,12 @@
 """Service implementing Like deletion (DELETE) flow for valuations."""
 from __future__ import annotations
 
-from django.db import transaction
-
+from changefeed.models import ChangeEntity, ChangeOperation
+from changefeed.services.change_log import record_change
+from core import sharding
+from core.events import publish
 from datastore.domains.valuation_dto import UnlikeValuationCommand
+from valuation.events import LikeRemoved
 from valuation.exceptions import LikeNotFoundError
 from valuation.models import Like
 
@@ -34,7 +37,8 @@ class UnlikeValuationService:
         Attempts to retrieve and delete the Like. If Like.DoesNotExist is caught,
         raises domain exception LikeNotFoundError.
 
-        Wrapped in transaction.atomic() for atomicity.
+        Wrapped in sharding.atomic() for atomicity; logs a likes change and
+        publishes LikeRemoved.
 
         Args:
             valuation_id: ID of valuation the like is on
@@ -43,13 +47,23 @@ class UnlikeValuationService:
         Raises:
             LikeNotFoundError: If Like does not exist for the given pair
         """
+        likes = Like.objects.db_manager(hints=sharding.for_valuation(valuation_id))
         try:
-            like = Like.objects.get(
-                valuation_id=valuation_id,
-                user_id=user_id,
-            )
+            like = likes.for_valuation(valuation_id).select_related("valuation").get(user_id=user_id)
         except Like.DoesNotExist as exc:
             raise LikeNotFoundError(valuation_id, user_id) from exc
 
-        with transaction.atomic():
-            like.delete()
+        with sharding.atomic(likes.db):
+            # Filtering on created_at as well confines the delete to one partition.
+            likes.filter(pk=like.pk, created_at=like.created_at).delete()
+            record_change(
+                ChangeEntity.VALUATION,
+                valuation_id,
+                ChangeOperation.LIKES_CHANGED,
+                like.valuation.brickset_id,
+            )
+            publish(LikeRemoved(
+                valuation_id=valuation_id,
+                user_id=user_id,
+                brickset_id=like.valuation.brickset_id,
+            ))
@@ -0,0 +1,19 @@
+"""Catalog-wide valuation analytics computed with NumPy (``ValuationAnalysis``).
+
+:meth:`ValuationAnalysisService.run` reads the attributes of every BrickSet,
+then every non-outlier valuation, into NumPy arrays ``chunk_size`` rows at a
+time and one database (shard) after another. Memory holds the arrays (about
+16 bytes per valuation) plus one chunk of Python rows. Each grouping (set
+number, set number and condition, condition) is one ``lexsort`` followed by
+``reduceat`` and index arithmetic on the group boundaries, with no Python
+loop over groups. The results replace the ``ValuationAnalysis`` table in one
+transaction, so readers see either the previous run or this one.
+
+Condition premiums compare the two variants of a condition within each set
+number (e.g. the median of RETIRED versus ACTIVE valuations of set 10001);
+the catalog premium is the median of those per-number premiums, which keeps
+expensive sets from dominating it.
+"""
+from valuation.services.valuation_analysis.groups import Groups, grouped_statistics
+from valuation.services.valuation_analysis.premiums import MIN_PREMIUM_VALUATIONS
+from valuation.services.valuation_analysis.service import DEFAULT_CHUNK_SIZE, ValuationAnalysisService
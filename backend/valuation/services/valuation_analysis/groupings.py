@@ -0,0 +1,106 @@
+"""The groupings of one analysis run and their ``ValuationAnalysis`` rows."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime
+
+import numpy as np
+
+from valuation.models import AnalysisDimension, ValuationAnalysis
+from valuation.services.valuation_analysis.groups import Groups, grouped_statistics
+from valuation.services.valuation_analysis.premiums import Premiums
+
+# Dimension, BrickSet array column, variant when the column is unset, variant when it is set.
+_DIMENSIONS = (
+    (AnalysisDimension.PRODUCTION_STATUS, "retired", "ACTIVE", "RETIRED"),
+    (AnalysisDimension.COMPLETENESS, "complete", "INCOMPLETE", "COMPLETE"),
+    (AnalysisDimension.FACTORY_SEALED, "sealed", "UNSEALED", "SEALED"),
+    (AnalysisDimension.BOX, "box", "WITHOUT_BOX", "WITH_BOX"),
+    (AnalysisDimension.INSTRUCTIONS, "instructions", "WITHOUT_INSTRUCTIONS", "WITH_INSTRUCTIONS"),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Grouping:
+    """The groups of one dimension and what labels them; ``numbers`` None means catalog-wide."""
+
+    dimension: str
+    groups: Groups
+    numbers: np.ndarray | None = None
+    variants: np.ndarray | None = None
+    premiums: np.ndarray | None = None
+    samples: np.ndarray | None = None
+
+    def rows(self, computed_at: datetime) -> Iterator[ValuationAnalysis]:
+        """Turn the groups into rows."""
+        groups = self.groups
+        for index, count in enumerate(groups.counts):
+            premium = np.nan if self.premiums is None else self.premiums[index]
+            yield ValuationAnalysis(
+                number=None if self.numbers is None else int(self.numbers[index]),
+                dimension=self.dimension,
+                variant="" if self.variants is None else self.variants[index],
+                valuations_count=int(count),
+                mean_value=float(groups.means[index]),
+                p10_value=float(groups.p10[index]),
+                median_value=float(groups.medians[index]),
+                p90_value=float(groups.p90[index]),
+                premium=None if np.isnan(premium) else float(premium),
+                premium_sample=0 if self.samples is None else int(self.samples[index]),
+                computed_at=computed_at,
+            )
+
+
+def analysis_rows(
+    bricksets: np.ndarray,
+    values: np.ndarray,  # noqa: WPS110
+    computed_at: datetime,
+) -> Iterator[ValuationAnalysis]:
+    """Build the rows of every grouping; ``bricksets[i]`` holds the set of ``values[i]``."""
+    for grouping in _groupings(bricksets, values):
+        yield from grouping.rows(computed_at)
+
+
+def _groupings(bricksets: np.ndarray, values: np.ndarray) -> Iterator[Grouping]:  # noqa: WPS110
+    numbers = bricksets["number"]
+    yield from _overall(numbers, values)
+    for dimension, column, *labels in _DIMENSIONS:
+        flags = bricksets[column].astype(np.int64)
+        yield from _by_condition(dimension, numbers, flags, values, labels)
+
+
+def _overall(numbers: np.ndarray, values: np.ndarray) -> Iterator[Grouping]:  # noqa: WPS110
+    """Group by set number, then the whole catalog as one group."""
+    by_number = grouped_statistics(numbers, values)
+    yield Grouping(AnalysisDimension.ALL, by_number, numbers=by_number.keys)
+    yield Grouping(AnalysisDimension.ALL, grouped_statistics(np.zeros_like(numbers), values))
+
+
+def _by_condition(
+    dimension: str,
+    numbers: np.ndarray,
+    flags: np.ndarray,
+    values: np.ndarray,  # noqa: WPS110
+    labels: list[str],
+) -> Iterator[Grouping]:
+    """Group by set number and variant, then by variant alone with the median premium."""
+    variants = np.array(labels, dtype=object)
+    split = grouped_statistics(numbers * 2 + flags, values)
+    premiums = Premiums.of(split)
+    yield Grouping(
+        dimension,
+        split,
+        numbers=split.keys // 2,
+        variants=variants[split.keys % 2],
+        premiums=premiums.spread(split),
+    )
+    catalog = grouped_statistics(flags, values)
+    with_variant = catalog.keys == 1
+    yield Grouping(
+        dimension,
+        catalog,
+        variants=variants[catalog.keys],
+        premiums=np.where(with_variant, premiums.median(), np.nan),
+        samples=np.where(with_variant, premiums.count, 0),
+    )
@@ -0,0 +1,69 @@
+"""Vectorized count, mean and percentiles per group of equal keys."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+_P10 = 0.1
+_P50 = 0.5
+_P90 = 0.9
+
+
+@dataclass(frozen=True, slots=True)
+class Groups:
+    """Statistics of the groups of equal keys, ordered by key."""
+
+    keys: np.ndarray
+    counts: np.ndarray
+    means: np.ndarray
+    p10: np.ndarray
+    medians: np.ndarray
+    p90: np.ndarray
+
+    @classmethod
+    def empty(cls) -> Groups:
+        """Return the statistics of no groups at all."""
+        keys = np.empty(0, dtype=np.int64)
+        nothing = np.empty(0)
+        return cls(keys, nothing, nothing, nothing, nothing, nothing)
+
+
+def grouped_statistics(keys: np.ndarray, values: np.ndarray) -> Groups:  # noqa: WPS110
+    """Return count, mean and percentiles of ``values`` per distinct key.
+
+    Percentiles interpolate linearly between ranks, like ``np.percentile``.
+    """
+    if not len(keys):
+        return Groups.empty()
+    order = np.lexsort((values, keys))
+    return _sorted_statistics(keys[order], values[order])
+
+
+def _sorted_statistics(keys: np.ndarray, values: np.ndarray) -> Groups:  # noqa: WPS110
+    """``grouped_statistics`` of ``keys`` and ``values`` sorted by key, then value."""
+    changed = keys[1:] != keys[:-1]
+    starts = np.flatnonzero(np.append(True, changed))
+    counts = np.diff(np.append(starts, len(keys)))
+    return Groups(
+        keys=keys[starts],
+        counts=counts,
+        means=np.add.reduceat(values, starts) / counts,
+        p10=_percentile(values, starts, counts, _P10),
+        medians=_percentile(values, starts, counts, _P50),
+        p90=_percentile(values, starts, counts, _P90),
+    )
+
+
+def _percentile(
+    values: np.ndarray,  # noqa: WPS110
+    starts: np.ndarray,
+    counts: np.ndarray,
+    fraction: float,
+) -> np.ndarray:
+    """Interpolate the value at ``fraction`` of every sorted group."""
+    position = starts + (counts - 1) * fraction
+    lower = np.floor(position).astype(np.int64)
+    upper = np.ceil(position).astype(np.int64)
+    gap = values[upper] - values[lower]
+    return values[lower] + gap * (position - lower)
@@ -0,0 +1,70 @@
+"""Condition premiums per set number, from groups keyed ``number * 2 + variant``."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from valuation.services.valuation_analysis.groups import Groups
+
+# Fewer valuations on either side of a set number make its premium noise.
+MIN_PREMIUM_VALUATIONS = 3
+
+
+@dataclass(frozen=True, slots=True)
+class Premiums:
+    """Premium of variant 1 over variant 0 (median ratio minus one) per set number."""
+
+    numbers: np.ndarray  # sorted
+    premiums: np.ndarray
+
+    @classmethod
+    def of(cls, split: Groups) -> Premiums:
+        """Compare the variants of every number with ``MIN_PREMIUM_VALUATIONS`` valuations on both sides."""
+        enough = split.counts >= MIN_PREMIUM_VALUATIONS
+        keys, medians = split.keys[enough], split.medians[enough]
+        with_variant = keys % 2 == 1
+        return cls._matched(
+            keys[with_variant] // 2,
+            medians[with_variant],
+            keys[~with_variant] // 2,
+            medians[~with_variant],
+        )
+
+    @property
+    def count(self) -> int:
+        """Number of set numbers with a premium."""
+        return len(self.numbers)
+
+    def median(self) -> float:
+        """Return the median premium (NaN without any)."""
+        return float(np.median(self.premiums)) if self.count else np.nan
+
+    def spread(self, split: Groups) -> np.ndarray:
+        """Spread the premiums onto the variant-1 groups of ``split`` (NaN elsewhere)."""
+        spread = np.full(len(split.keys), np.nan)
+        with_variant = np.flatnonzero(split.keys % 2 == 1)
+        _, in_split, in_premiums = np.intersect1d(
+            split.keys[with_variant] // 2,
+            self.numbers,
+            assume_unique=True,
+            return_indices=True,
+        )
+        spread[with_variant[in_split]] = self.premiums[in_premiums]
+        return spread
+
+    @classmethod
+    def _matched(
+        cls,
+        numbers: np.ndarray,
+        medians: np.ndarray,
+        reference_numbers: np.ndarray,
+        reference_medians: np.ndarray,
+    ) -> Premiums:
+        common, in_variant, in_reference = np.intersect1d(
+            numbers,
+            reference_numbers,
+            assume_unique=True,
+            return_indices=True,
+        )
+        return cls(common, medians[in_variant] / reference_medians[in_reference] - 1)
@@ -0,0 +1,123 @@
+"""Running the analysis over the database and serving its results."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+import numpy as np
+from django.db import models, transaction
+from django.utils import timezone
+
+from catalog.models import BrickSet, Completeness, ProductionStatus
+from core import sharding
+from core.iterables import batched
+from datastore.domains.valuation_dto import ValuationAnalysisDTO, ValuationAnalysisGroupDTO
+from valuation.exceptions import ValuationAnalysisNotFoundError
+from valuation.models import AnalysisDimension, Valuation, ValuationAnalysis
+from valuation.services.valuation_analysis.groupings import analysis_rows
+
+DEFAULT_CHUNK_SIZE = 10_000
+_WRITE_BATCH_SIZE = 1000
+
+_ID = "id"
+_BRICKSET_ID = "brickset_id"
+_BRICKSET_DTYPE = np.dtype([
+    (_ID, np.int64),
+    ("number", np.int64),
+    ("retired", np.bool_),
+    ("complete", np.bool_),
+    ("sealed", np.bool_),
+    ("box", np.bool_),
+    ("instructions", np.bool_),
+])
+_VALUATION_DTYPE = np.dtype([(_BRICKSET_ID, np.int64), ("value", np.int64)])
+
+
+class ValuationAnalysisService:
+    """Compute and serve valuation statistics by set number and condition."""
+
+    def run(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """Recompute the analysis from all valuations; return how many rows were written."""
+        bricksets = self._bricksets(chunk_size)
+        bricksets, values = self._join(bricksets, self._valuations(chunk_size))
+        rows = list(analysis_rows(bricksets, values, timezone.now()))
+        with transaction.atomic():
+            ValuationAnalysis.objects.all().delete()
+            ValuationAnalysis.objects.bulk_create(rows, batch_size=_WRITE_BATCH_SIZE)
+        return len(rows)
+
+    def for_number(self, number: int | None) -> ValuationAnalysisDTO:
+        """Return the analysis of set ``number``, or of the catalog when None.
+
+        Raises:
+            ValuationAnalysisNotFoundError: If the number has no valuations or
+                the analysis never ran.
+        """
+        rows = list(ValuationAnalysis.objects.filter(number=number).order_by("dimension", "variant"))
+        overall = next((row for row in rows if row.dimension == AnalysisDimension.ALL), None)
+        if overall is None:
+            raise ValuationAnalysisNotFoundError(number)
+        return ValuationAnalysisDTO(
+            number=number,
+            computed_at=overall.computed_at,
+            overall=self._to_group_dto(overall),
+            conditions=[self._to_group_dto(row) for row in rows if row is not overall],
+        )
+
+    @staticmethod
+    def _bricksets(chunk_size: int) -> np.ndarray:
+        """Read the id, number and condition flags of every BrickSet, ordered by id."""
+        is_retired = models.Q(production_status=ProductionStatus.RETIRED)
+        is_complete = models.Q(completeness=Completeness.COMPLETE)
+        queryset = BrickSet.bricksets.order_by(_ID).annotate(
+            retired=models.ExpressionWrapper(is_retired, output_field=models.BooleanField()),
+            complete=models.ExpressionWrapper(is_complete, output_field=models.BooleanField()),
+        )
+        rows = queryset.values_list(
+            _ID, "number", "retired", "complete", "is_factory_sealed", "has_box", "has_instructions",
+        )
+        return _load(rows.iterator(chunk_size=chunk_size), _BRICKSET_DTYPE, chunk_size)
+
+    @staticmethod
+    def _valuations(chunk_size: int) -> np.ndarray:
+        """Read the brickset id and value of every non-outlier valuation, one database after another."""
+        shards = []
+        for alias in sharding.databases():
+            rows = Valuation.valuations.using(alias).inliers().values_list(_BRICKSET_ID, "value")
+            shards.append(_load(rows.iterator(chunk_size=chunk_size), _VALUATION_DTYPE, chunk_size))
+        return np.concatenate(shards)
+
+    @staticmethod
+    def _join(bricksets: np.ndarray, valuations: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return the BrickSet and the value of each valuation.
+
+        Valuations of bricksets deleted meanwhile drop out.
+        """
+        ids = bricksets[_ID]
+        referenced = valuations[_BRICKSET_ID]
+        positions = np.searchsorted(ids, referenced)
+        known = positions < len(ids)
+        known[known] = ids[positions[known]] == referenced[known]
+        values = valuations["value"][known].astype(np.float64)
+        return bricksets[positions[known]], values
+
+    @staticmethod
+    def _to_group_dto(row: ValuationAnalysis) -> ValuationAnalysisGroupDTO:
+        return ValuationAnalysisGroupDTO(
+            dimension=row.dimension,
+            variant=row.variant,
+            valuations_count=row.valuations_count,
+            mean_value=row.mean_value,
+            p10_value=row.p10_value,
+            median_value=row.median_value,
+            p90_value=row.p90_value,
+            premium=row.premium,
+            premium_sample=row.premium_sample,
+        )
+
+
+def _load(rows: Iterable[tuple], dtype: np.dtype, chunk_size: int) -> np.ndarray:
+    """Read ``rows`` into a structured array, ``chunk_size`` rows at a time."""
+    chunks = [np.empty(0, dtype=dtype)]
+    for batch in batched(rows, chunk_size):
+        chunks.append(np.fromiter(batch, dtype=dtype, count=len(batch)))
+    return np.concatenate(chunks)
@@ -2,13 +2,19 @@
 from __future__ import annotations
 
 from django.contrib.auth import get_user_model
-from django.db import IntegrityError, transaction
+from django.db import IntegrityError
 
 from catalog.exceptions import BrickSetNotFoundError
 from catalog.models import BrickSet
+from changefeed.models import ChangeEntity, ChangeOperation
+from changefeed.services.change_log import record_change
+from core import identity_map, sharding
+from core.events import publish
 from datastore.domains.valuation_dto import CreateValuationCommand, ValuationDTO
+from valuation.events import ValuationCreated
 from valuation.exceptions import ValuationDuplicateError
 from valuation.models import Valuation
+from valuation.services.brickset_statistics import BrickSetStatisticsService
 
 User = get_user_model()
 
@@ -21,7 +27,10 @@ class CreateValuationService:
         command: CreateValuationCommand,
         user: User,
     ) -> ValuationDTO:
-        """Validate input, persist the new Valuation, and return DTO.
+        """Validate input, score and persist the new Valuation, and return DTO.
+
+        The value is scored against the BrickSet's running statistics (one
+        primary key read) before the insert; see ``BrickSetStatisticsService``.
 
         Args:
             command: CreateValuationCommand with brickset_id, value, currency, comment
@@ -35,7 +44,8 @@ class CreateValuationService:
             ValuationDuplicateError: If user already has valuation for this BrickSet
         """
         brickset = self._verify_brickset_exists(command.brickset_id)
-        valuation = self._persist_valuation(command, user, brickset)
+        outlier_score = BrickSetStatisticsService().score(brickset.id, command.value)
+        valuation = self._persist_valuation(command, user, brickset, outlier_score)
 
         return self._build_dto(valuation)
 
@@ -52,7 +62,7 @@ class CreateValuationService:
             BrickSetNotFoundError: If BrickSet does not exist
         """
         try:
-            return BrickSet.bricksets.get(pk=brickset_id)
+            return identity_map.load(BrickSet, brickset_id)
         except BrickSet.DoesNotExist as exc:
             raise BrickSetNotFoundError(brickset_id) from exc
 
@@ -61,6 +71,7 @@ class CreateValuationService:
         command: CreateValuationCommand,
         user: User,
         brickset: BrickSet,
+        outlier_score: float | None,
     ) -> Valuation:
         """Build and persist Valuation to database within transaction.
 
@@ -71,6 +82,7 @@ class CreateValuationService:
             command: CreateValuationCommand with value, currency, comment
             user: User creating the valuation
             brickset: BrickSet instance being valued
+            outlier_score: Score of the value, None if the set has too few valuations
 
         Returns:
             Saved Valuation instance with id and timestamps
@@ -80,7 +92,7 @@ class CreateValuationService:
             IntegrityError: For other integrity constraint violations
         """
         try:
-            with transaction.atomic():
+            with sharding.atomic(sharding.shard_for_brickset(brickset.id)):
                 # Use explicit user_id and brickset_id to avoid DRF proxy object issues
                 # Use custom manager 'valuations' (not 'objects')
                 valuation = Valuation.valuations.create(
@@ -89,7 +101,14 @@ class CreateValuationService:
                     value=command.value,
                     currency=command.currency or "PLN",
                     comment=command.comment,
+                    outlier_score=outlier_score,
                 )
+                record_change(ChangeEntity.VALUATION, valuation.id, ChangeOperation.CREATED, brickset.id)
+                publish(ValuationCreated(
+                    valuation_id=valuation.id,
+                    brickset_id=brickset.id,
+                    user_id=user.id,
+                ))
 
                 return valuation
         except IntegrityError as exc:
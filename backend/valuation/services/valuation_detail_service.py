@@ -1,9 +1,11 @@
 """Service implementing Valuation detail retrieval."""
 from __future__ import annotations
 
+from core import identity_map
 from datastore.domains.valuation_dto import ValuationDetailDTO
 from valuation.exceptions import ValuationNotFoundError
 from valuation.models import Valuation
+from valuation.services.like_counter import LikeCounter
 
 
 class ValuationDetailService:  # noqa: WPS338
@@ -28,7 +30,7 @@ class ValuationDetailService:  # noqa: WPS338
             ValuationNotFoundError: If Valuation with given id doesn't exist
         """
         try:
-            valuation = Valuation.valuations.get(pk=valuation_id)
+            valuation = identity_map.load(Valuation, valuation_id)
         except Valuation.DoesNotExist as exc:
             raise ValuationNotFoundError(valuation_id) from exc
 
@@ -50,7 +52,7 @@ class ValuationDetailService:  # noqa: WPS338
             value=valuation.value,
             currency=valuation.currency,
             comment=valuation.comment,
-            likes_count=valuation.likes_count,
+            likes_count=LikeCounter().live_likes(valuation),
             created_at=valuation.created_at,
             updated_at=valuation.updated_at,
         )
@@ -0,0 +1,247 @@
+"""Daily and weekly valuation rollups per BrickSet (``ValuationHistory``).
+
+:meth:`ValuationHistoryService.apply` folds new valuations and like count
+changes into the day and week buckets of the days the valuations were
+created, locking each touched bucket in key order like
+``BrickSetStatisticsService`` does with its rows. :meth:`series` reads the
+buckets of one BrickSet in a window with one range scan and fills the gaps,
+so clients can chart it as is. :meth:`rebuild` recomputes every bucket from
+the valuations.
+"""
+from __future__ import annotations
+
+import itertools
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from operator import attrgetter
+from types import MappingProxyType
+
+from django.db import transaction
+from django.utils import timezone
+
+from catalog.exceptions import BrickSetNotFoundError
+from catalog.models import BrickSet
+from core import identity_map, sharding
+from core.iterables import batched
+from datastore.domains.valuation_dto import ValuationHistoryDTO, ValuationHistoryPointDTO
+from valuation.models import HistoryPeriod, Valuation, ValuationHistory
+from valuation.services.like_counter import LikeCounter
+
+MAX_POINTS = 400
+DEFAULT_POINTS = MappingProxyType({HistoryPeriod.DAY: 90, HistoryPeriod.WEEK: 52})
+_REBUILD_BATCH_SIZE = 1000
+_REBUILD_CHUNK_SIZE = 5000  # valuations fetched per round trip while rebuilding
+_ROLLUP_FIELDS = ("valuations_count", "value_sum", "min_value", "max_value", "weighted_sum", "weight_total")
+_SOURCE_FIELDS = ("id", "brickset_id", "value", "outlier_score", "created_at")
+
+BucketKey = tuple[int, str, date]  # brickset id, period, period start
+Window = tuple[date, date]  # starts of the first and last bucket
+
+
+@dataclass(slots=True)
+class _Change:
+    """What one batch adds to one bucket."""
+
+    values: list[int] = field(default_factory=list)  # noqa: WPS110 - values of new valuations
+    weight: int = 0  # new inliers plus net likes of inliers
+    weighted: int = 0  # sum of value * weight
+
+    def add(self, valuation: Valuation, created: bool, likes: int) -> None:
+        """Count ``valuation`` if it is new, and its net ``likes``."""
+        if created:
+            self.values.append(valuation.value)
+        if not valuation.is_outlier:
+            weight = int(created) + likes
+            self.weight += weight
+            self.weighted += valuation.value * weight
+
+
+_Changes = dict[BucketKey, _Change]
+
+
+def period_start(period: str, day: date) -> date:
+    """Return the first day of the bucket of ``period`` holding ``day``."""
+    if period == HistoryPeriod.WEEK:
+        return day - timedelta(days=day.weekday())
+    return day
+
+
+def history_window(period: str, since: date | None, until: date | None) -> Window:
+    """Resolve the requested window to the starts of its first and last bucket.
+
+    ``until`` defaults to today and ``since`` to ``DEFAULT_POINTS`` buckets
+    before it.
+
+    Raises:
+        ValueError: If ``since`` is after ``until`` or the window holds more
+            than ``MAX_POINTS`` buckets.
+    """
+    step = _step(period)
+    until = period_start(period, until or timezone.localdate())
+    if since:
+        since = period_start(period, since)
+    else:
+        since = until - step * (DEFAULT_POINTS[period] - 1)
+    if since > until:
+        raise ValueError("since must not be after until.")
+    points = (until - since) // step + 1
+    if points > MAX_POINTS:
+        raise ValueError(f"At most {MAX_POINTS} points can be requested.")
+    return since, until
+
+
+class ValuationHistoryService:
+    """Maintain and serve per-BrickSet valuation time series."""
+
+    def apply(self, created_ids: Iterable[int], like_deltas: Mapping[int, int]) -> None:
+        """Fold new valuations and net like changes (valuation id -> delta) in.
+
+        Likes count towards the buckets of the valuation's creation day, not
+        of the day they were given; outliers and their likes carry no weight.
+        """
+        changes = self._changes(set(created_ids), like_deltas)
+        if not changes:
+            return
+        with transaction.atomic():
+            for key in sorted(changes):
+                self._fold(key, changes[key])
+
+    def series(self, brickset_id: int, period: str, since: date, until: date) -> ValuationHistoryDTO:
+        """Return one point per bucket from ``since`` to ``until`` (see :func:`history_window`).
+
+        Raises:
+            BrickSetNotFoundError: When BrickSet with given ID does not exist.
+        """
+        try:
+            identity_map.load(BrickSet, brickset_id)
+        except BrickSet.DoesNotExist as exc:
+            raise BrickSetNotFoundError(brickset_id) from exc
+        rows = {
+            row.period_start: row
+            for row in ValuationHistory.objects.filter(
+                brickset_id=brickset_id,
+                period=period,
+                period_start__range=(since, until),
+            ).order_by("period_start")
+        }
+        step = _step(period)
+        points = []
+        day = since
+        while day <= until:
+            points.append(self._to_point(day, rows.get(day)))
+            day += step
+        return ValuationHistoryDTO(brickset_id=brickset_id, period=period, since=since, until=until, points=points)
+
+    def rebuild(self) -> int:
+        """Recompute every bucket from the valuations; return how many were written."""
+        rebuilt = 0
+        for batch in batched(self._recomputed(), _REBUILD_BATCH_SIZE):
+            ValuationHistory.objects.bulk_create(
+                batch,
+                update_conflicts=True,
+                unique_fields=["brickset", "period", "period_start"],
+                update_fields=list(_ROLLUP_FIELDS),
+            )
+            rebuilt += len(batch)
+        return rebuilt
+
+    @staticmethod
+    def _changes(created_ids: set[int], like_deltas: Mapping[int, int]) -> _Changes:
+        """Read the valuations of a batch and group what they add by bucket."""
+        # The new valuations and those with a non-zero like delta.
+        valuation_ids = created_ids.union(filter(like_deltas.get, like_deltas))
+        changes: _Changes = defaultdict(_Change)
+        for valuation in sharding.filter_ids(Valuation.valuations.only(*_SOURCE_FIELDS), valuation_ids):
+            likes = like_deltas.get(valuation.id, 0)
+            for key in _bucket_keys(valuation):
+                changes[key].add(valuation, valuation.id in created_ids, likes)
+        return changes
+
+    @staticmethod
+    def _fold(key: BucketKey, change: _Change) -> None:
+        brickset_id, period, start = key
+        bucket, _ = ValuationHistory.objects.select_for_update().get_or_create(
+            brickset_id=brickset_id,
+            period=period,
+            period_start=start,
+        )
+        _add_change(bucket, change)
+        bucket.save()
+
+    @classmethod
+    def _recomputed(cls) -> Iterator[ValuationHistory]:
+        counter = LikeCounter()
+        for alias in sharding.databases():
+            yield from cls._recomputed_on(alias, counter)
+
+    @classmethod
+    def _recomputed_on(cls, alias: str, counter: LikeCounter) -> Iterator[ValuationHistory]:
+        """Roll up the valuations of one database, one BrickSet at a time."""
+        queryset = counter.annotate_valuations(Valuation.valuations.using(alias).order_by("brickset_id"))
+        valuations = queryset.only(*_SOURCE_FIELDS, "likes_count").iterator(chunk_size=_REBUILD_CHUNK_SIZE)
+        for _, group in itertools.groupby(valuations, key=attrgetter("brickset_id")):
+            yield from cls._rolled_up(group, counter)
+
+    @classmethod
+    def _rolled_up(cls, valuations: Iterable[Valuation], counter: LikeCounter) -> Iterator[ValuationHistory]:
+        """Compute the buckets of ``valuations`` from scratch."""
+        changes: _Changes = defaultdict(_Change)
+        for valuation in valuations:
+            likes = counter.live_likes(valuation)
+            for key in _bucket_keys(valuation):
+                changes[key].add(valuation, created=True, likes=likes)
+        for key, change in changes.items():
+            yield cls._new_bucket(key, change)
+
+    @staticmethod
+    def _new_bucket(key: BucketKey, change: _Change) -> ValuationHistory:
+        brickset_id, period, start = key
+        bucket = ValuationHistory(brickset_id=brickset_id, period=period, period_start=start)
+        _add_change(bucket, change)
+        return bucket
+
+    @staticmethod
+    def _to_point(day: date, bucket: ValuationHistory | None) -> ValuationHistoryPointDTO:
+        if bucket is None or not bucket.valuations_count:
+            return ValuationHistoryPointDTO(
+                period_start=day,
+                valuations_count=0,
+                mean_value=None,
+                min_value=None,
+                max_value=None,
+                weighted_value=None,
+            )
+        weight = bucket.weight_total
+        return ValuationHistoryPointDTO(
+            period_start=day,
+            valuations_count=bucket.valuations_count,
+            mean_value=bucket.value_sum / bucket.valuations_count,
+            min_value=bucket.min_value,
+            max_value=bucket.max_value,
+            weighted_value=round(bucket.weighted_sum / weight) if weight > 0 else None,
+        )
+
+
+def _add_change(bucket: ValuationHistory, change: _Change) -> None:
+    """Add ``change`` to the running sums of ``bucket``."""
+    for value in change.values:  # noqa: WPS110
+        bucket.min_value = value if bucket.min_value is None else min(bucket.min_value, value)
+        bucket.max_value = value if bucket.max_value is None else max(bucket.max_value, value)
+    bucket.valuations_count += len(change.values)
+    bucket.value_sum += sum(change.values)
+    bucket.weighted_sum += change.weighted
+    bucket.weight_total += change.weight
+
+
+def _bucket_keys(valuation: Valuation) -> list[BucketKey]:
+    day = timezone.localdate(valuation.created_at)
+    return [
+        (valuation.brickset_id, period, period_start(period, day))
+        for period in (HistoryPeriod.DAY, HistoryPeriod.WEEK)
+    ]
+
+
+def _step(period: str) -> timedelta:
+    return timedelta(days=7 if period == HistoryPeriod.WEEK else 1)
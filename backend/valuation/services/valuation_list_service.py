@@ -5,8 +5,10 @@ from django.db.models import QuerySet
 
 from catalog.exceptions import BrickSetNotFoundError
 from catalog.models import BrickSet
+from core import identity_map, sharding
 from datastore.domains.valuation_dto import ValuationListItemDTO
 from valuation.models import Valuation
+from valuation.services.like_counter import LikeCounter
 
 
 class ValuationListService:
@@ -34,13 +36,24 @@ class ValuationListService:
         Raises:
             BrickSetNotFoundError: When BrickSet with given ID does not exist.
         """
-        self._verify_brickset_exists(brickset_id)
+        self.verify_brickset_exists(brickset_id)
+        return self.build_queryset(brickset_id)
 
-        queryset = Valuation.valuations.filter(
-            brickset_id=brickset_id,
-        ).order_by("-likes_count", "created_at")
+    def build_queryset(self, brickset_id: int) -> QuerySet:
+        """Build the ordered valuation QuerySet without the existence check.
 
-        return queryset
+        Async views run :meth:`verify_brickset_exists` concurrently with the
+        count and page queries instead of before them.
+
+        Args:
+            brickset_id: BrickSet identifier from URL path parameter.
+
+        Returns:
+            QuerySet of Valuation objects ordered by -likes_count, created_at.
+        """
+        valuations = Valuation.valuations.db_manager(hints=sharding.for_brickset(brickset_id))
+        queryset = valuations.filter(brickset_id=brickset_id).order_by("-likes_count", "created_at")
+        return LikeCounter().annotate_valuations(queryset)
 
     def map_to_dto(self, valuation: Valuation) -> ValuationListItemDTO:
         """Map Valuation model instance to ValuationListItemDTO.
@@ -60,11 +73,11 @@ class ValuationListService:
             value=valuation.value,
             currency=valuation.currency,
             comment=valuation.comment,
-            likes_count=valuation.likes_count,
+            likes_count=LikeCounter().live_likes(valuation),
             created_at=valuation.created_at,
         )
 
-    def _verify_brickset_exists(self, brickset_id: int) -> None:
+    def verify_brickset_exists(self, brickset_id: int) -> None:
         """Verify that BrickSet with given ID exists.
 
         Args:
@@ -74,6 +87,6 @@ class ValuationListService:
             BrickSetNotFoundError: When BrickSet does not exist.
         """
         try:
-            BrickSet.bricksets.get(pk=brickset_id)
+            identity_map.load(BrickSet, brickset_id)
         except BrickSet.DoesNotExist:
             raise BrickSetNotFoundError(brickset_id)
@@ -0,0 +1,21 @@
+"""Throttling classes for valuation write endpoints.
+
+Counters are shared by all worker processes (see ``core.throttling``); rates
+are configured in ``REST_FRAMEWORK['DEFAULT_THROTTLE_RATES']``. Reads are not
+limited.
+"""
+from __future__ import annotations
+
+from core.throttling import UserRateThrottle
+
+
+class ValuationCreateRateThrottle(UserRateThrottle):
+    """Limit valuations created per user (scope ``valuation_create``)."""
+
+    scope = "valuation_create"
+
+
+class LikeRateThrottle(UserRateThrottle):
+    """Limit likes and unlikes per user (scope ``like``)."""
+
+    scope = "like"
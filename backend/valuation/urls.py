@@ -1,18 +1,45 @@
 """URL configuration for valuation app."""
 from django.urls import path
 
+from core.async_views import async_get_route
+from valuation.views.async_lists import (
+    AsyncBrickSetValuationsView,
+    AsyncOwnedValuationListView,
+    AsyncValuationLikesView,
+)
 from valuation.views.brickset_valuations import BrickSetValuationsView
+from valuation.views.live_events import BrickSetLiveEventsView
 from valuation.views.owned_valuation_list import OwnedValuationListView
+from valuation.views.valuation_analysis import ValuationAnalysisView
 from valuation.views.valuation_detail import ValuationDetailView
+from valuation.views.valuation_history import BrickSetValuationHistoryView
 from valuation.views.valuation_like import ValuationLikeView
 
 app_name = "valuation"
 urlpatterns = [
     path(
         "bricksets/<int:brickset_id>/valuations",
-        BrickSetValuationsView.as_view(),
+        async_get_route(BrickSetValuationsView.as_view(), AsyncBrickSetValuationsView.as_view()),
         name="brickset-valuations",
     ),
+    # Server-Sent Events of new valuations and like counts (ASGI only)
+    path(
+        "bricksets/<int:brickset_id>/events",
+        BrickSetLiveEventsView.as_view(),
+        name="brickset-events",
+    ),
+    # Daily or weekly valuation rollups, chart-ready
+    path(
+        "bricksets/<int:brickset_id>/valuation-history",
+        BrickSetValuationHistoryView.as_view(),
+        name="brickset-valuation-history",
+    ),
+    # Statistics and condition premiums from `manage.py analyze_valuations`
+    path(
+        "valuations/analysis",
+        ValuationAnalysisView.as_view(),
+        name="valuation-analysis",
+    ),
     path(
         "valuations/<int:pk>",
         ValuationDetailView.as_view(),
@@ -20,13 +47,13 @@ urlpatterns = [
     ),
     path(
         "valuations/<int:valuation_id>/likes",
-        ValuationLikeView.as_view(),
+        async_get_route(ValuationLikeView.as_view(), AsyncValuationLikesView.as_view()),
         name="valuation-like",
     ),
     # GET owned valuations for authenticated user
     path(
         "users/me/valuations",
-        OwnedValuationListView.as_view(),
+        async_get_route(OwnedValuationListView.as_view(), AsyncOwnedValuationListView.as_view()),
         name="owned-valuation-list",
     ),
 ]
@@ -0,0 +1,92 @@
+"""Async variants of the valuation and like list endpoints.
+
+Served for GET when ``settings.ASYNC_LIST_VIEWS`` is enabled (ASGI). The
+parent existence check, the ``COUNT(*)`` and the page query are independent,
+so they run concurrently on separate connections.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from django.http import HttpRequest
+from rest_framework.exceptions import NotFound
+
+from catalog.exceptions import BrickSetNotFoundError
+from core.async_views import AsyncReadView
+from core.concurrency import gather_in_order, run_isolated
+from core.pagination import PageWindowPaginator
+from valuation.exceptions import ValuationNotFoundError
+from valuation.serializers.like_list import LikeListItemSerializer
+from valuation.serializers.owned_valuation_list import OwnedValuationListItemSerializer
+from valuation.serializers.valuation_list import ValuationListItemSerializer
+from valuation.services.like_list_service import LikeListService
+from valuation.services.owned_valuation_list_service import OwnedValuationListService
+from valuation.services.valuation_list_service import ValuationListService
+from valuation.views.brickset_valuations import ValuationPagination
+from valuation.views.owned_valuation_list import OwnedValuationPagination
+from valuation.views.valuation_like import LikePagination
+
+
+class AsyncBrickSetValuationsView(AsyncReadView):
+    """Handle GET /api/v1/bricksets/{brickset_id}/valuations asynchronously."""
+
+    paginator = PageWindowPaginator(ValuationPagination)
+
+    async def build_payload(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+        """Check the BrickSet, count and fetch the page concurrently."""
+        brickset_id = kwargs["brickset_id"]
+        service = ValuationListService()
+        try:
+            _, payload = await gather_in_order(
+                run_isolated(service.verify_brickset_exists, brickset_id),
+                self.paginator.paginate_async(
+                    request,
+                    service.build_queryset(brickset_id),
+                    service.map_to_dto,
+                    ValuationListItemSerializer,
+                ),
+            )
+        except BrickSetNotFoundError as exc:
+            raise NotFound(exc.message) from exc
+        return payload
+
+
+class AsyncValuationLikesView(AsyncReadView):
+    """Handle GET /api/v1/valuations/{valuation_id}/likes asynchronously."""
+
+    paginator = PageWindowPaginator(LikePagination)
+
+    async def build_payload(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+        """Check the Valuation, count and fetch the page concurrently."""
+        valuation_id = kwargs["valuation_id"]
+        service = LikeListService()
+        try:
+            _, payload = await gather_in_order(
+                run_isolated(service.verify_valuation_exists, valuation_id),
+                self.paginator.paginate_async(
+                    request,
+                    service.build_queryset(valuation_id),
+                    service.map_to_dto,
+                    LikeListItemSerializer,
+                ),
+            )
+        except ValuationNotFoundError as exc:
+            raise NotFound(exc.message) from exc
+        return payload
+
+
+class AsyncOwnedValuationListView(AsyncReadView):
+    """Handle GET /api/v1/users/me/valuations asynchronously."""
+
+    paginator = PageWindowPaginator(OwnedValuationPagination)
+
+    async def build_payload(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+        """Count and fetch the authenticated user's valuations concurrently."""
+        service = OwnedValuationListService()
+        queryset = service.get_queryset(request.user.id, request.GET.get("ordering"))
+        return await self.paginator.paginate_async(
+            request,
+            queryset,
+            service.map_to_dto,
+            OwnedValuationListItemSerializer,
+        )
@@ -19,6 +19,7 @@ from valuation.services import (
     CreateValuationService,
     ValuationListService,
 )
+from valuation.throttling import ValuationCreateRateThrottle
 
 
 class ValuationPagination(PageNumberPagination):
@@ -36,6 +37,7 @@ class BrickSetValuationsView(GenericAPIView):
     """
 
     permission_classes = [IsAuthenticated]
+    throttle_classes = [ValuationCreateRateThrottle]
     serializer_class = ValuationSerializer
     pagination_class = ValuationPagination
 
@@ -0,0 +1,70 @@
+"""Server-Sent Events stream of live valuation updates for one BrickSet.
+
+Served when ``settings.LIVE_EVENTS_ENABLED`` is set (``config/asgi.py``):
+each open stream is an idle coroutine fed by the process-wide listener of
+``core.live_events``. Under WSGI a stream would pin a worker thread for its
+whole lifetime, so the endpoint answers 404 there.
+"""
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from typing import Any
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from rest_framework import exceptions
+
+from catalog.exceptions import BrickSetNotFoundError
+from core.async_views import AsyncReadView
+from core.live_events import hub
+from valuation.live_updates import brickset_topic
+from valuation.services.valuation_list_service import ValuationListService
+
+_RETRY_MS = 3000
+
+
+class BrickSetLiveEventsView(AsyncReadView):
+    """Handle GET /api/v1/bricksets/{brickset_id}/events."""
+
+    requires_authentication = False
+
+    async def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        """Open a ``text/event-stream`` of the BrickSet's valuation events.
+
+        Events:
+        - valuation_created: the new valuation, shaped like the entries of
+          ``valuations`` in GET /api/v1/bricksets/{id}
+        - likes_count: {"valuation_id": 77, "likes_count": 9}
+        - resync: events may have been missed; re-fetch the BrickSet once
+
+        A comment line is sent every LIVE_EVENTS_HEARTBEAT seconds to keep
+        proxies from closing idle streams.
+        """
+        try:
+            await self._handle(request, *args, **kwargs)
+        except exceptions.APIException as exc:
+            return self._render_exception(exc)
+        response = StreamingHttpResponse(
+            self._stream(brickset_topic(kwargs["brickset_id"])),
+            content_type="text/event-stream",
+        )
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    async def build_payload(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+        """Check that streaming is available and the BrickSet exists."""
+        if not getattr(settings, "LIVE_EVENTS_ENABLED", False):
+            raise exceptions.NotFound("Live events are only served by the ASGI application.")
+        try:
+            await sync_to_async(ValuationListService().verify_brickset_exists)(kwargs["brickset_id"])
+        except BrickSetNotFoundError as exc:
+            raise exceptions.NotFound(exc.message) from exc
+
+    @staticmethod
+    async def _stream(topic: str) -> AsyncIterator[str]:
+        with hub.subscribe(topic) as subscription:
+            yield f"retry: {_RETRY_MS}\n\n"
+            async for event in subscription.events(settings.LIVE_EVENTS_HEARTBEAT):
+                yield ": keepalive\n\n" if event is None else event.encode()
@@ -0,0 +1,99 @@
+"""Tests for async valuation and like list views.
+
+TransactionTestCase is required: the existence check, count and page queries
+run on worker threads with their own connections.
+"""
+from __future__ import annotations
+
+import json
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.urls import reverse
+from model_bakery import baker
+from rest_framework.test import APITransactionTestCase
+
+from account.services.token_provider import TokenProvider
+from catalog.models import BrickSet
+from config import jwt_config
+from valuation.models import Like, Valuation
+from valuation.views.async_lists import (
+    AsyncBrickSetValuationsView,
+    AsyncOwnedValuationListView,
+    AsyncValuationLikesView,
+)
+
+User = get_user_model()
+
+
+class TestAsyncValuationListViews(APITransactionTestCase):
+    """Test async valuation list views return the DRF payloads."""
+
+    def setUp(self) -> None:
+        """Create a brickset with valuations and likes."""
+        self.factory = RequestFactory()
+        self.user = baker.make(User)
+        self.brickset = baker.make(BrickSet, owner=baker.make(User), number=10001)
+        self.valuation = baker.make(
+            Valuation,
+            brickset=self.brickset,
+            user=self.user,
+            value=100,
+        )
+        baker.make(Valuation, brickset=self.brickset, _quantity=2, value=50)
+        baker.make(Like, valuation=self.valuation, _quantity=3)
+        self.client.force_authenticate(user=self.user)
+
+    def _call(self, view, url: str, **kwargs) -> HttpResponse:
+        request = self.factory.get(url)
+        request.COOKIES[jwt_config.COOKIE_NAME] = TokenProvider().generate_token(
+            self.user.id, self.user.username,
+        )
+        return async_to_sync(view.as_view())(request, **kwargs)
+
+    def test_brickset_valuations_match_drf_view(self) -> None:
+        """Valuations for a brickset equal the DRF payload."""
+        url = reverse("valuation:brickset-valuations", kwargs={"brickset_id": self.brickset.id})
+
+        response = self._call(AsyncBrickSetValuationsView, url, brickset_id=self.brickset.id)
+
+        assert response.status_code == 200
+        assert json.loads(response.content) == self.client.get(url).json()
+
+    def test_missing_brickset_returns_not_found(self) -> None:
+        """Unknown brickset returns the same 404 body as the DRF view."""
+        url = reverse("valuation:brickset-valuations", kwargs={"brickset_id": 999999})
+
+        response = self._call(AsyncBrickSetValuationsView, url, brickset_id=999999)
+
+        assert response.status_code == 404
+        assert json.loads(response.content) == self.client.get(url).json()
+
+    def test_valuation_likes_match_drf_view(self) -> None:
+        """Likes for a valuation equal the DRF payload."""
+        url = reverse("valuation:valuation-like", kwargs={"valuation_id": self.valuation.id})
+
+        response = self._call(AsyncValuationLikesView, url, valuation_id=self.valuation.id)
+
+        assert response.status_code == 200
+        assert json.loads(response.content) == self.client.get(url).json()
+
+    def test_missing_valuation_returns_not_found(self) -> None:
+        """Unknown valuation returns 404."""
+        url = reverse("valuation:valuation-like", kwargs={"valuation_id": 999999})
+
+        response = self._call(AsyncValuationLikesView, url, valuation_id=999999)
+
+        assert response.status_code == 404
+
+    def test_owned_valuations_match_drf_view(self) -> None:
+        """Owned valuations equal the DRF payload."""
+        url = reverse("valuation:owned-valuation-list")
+
+        response = self._call(AsyncOwnedValuationListView, url)
+
+        assert response.status_code == 200
+        assert json.loads(response.content) == self.client.get(url).json()
+        assert json.loads(response.content)["count"] == 1
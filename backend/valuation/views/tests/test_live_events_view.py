@@ -0,0 +1,96 @@
+"""Tests for BrickSetLiveEventsView and the live valuation events it streams."""
+from __future__ import annotations
+
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from model_bakery import baker
+
+from account.models import User
+from catalog.models import BrickSet
+from core.events import publish
+from core.live_events import LiveEvent, hub
+from valuation.events import LikeAdded, ValuationCreated
+from valuation.live_updates import LIKES_COUNT, VALUATION_CREATED, brickset_topic
+from valuation.models import Valuation
+from valuation.views.live_events import BrickSetLiveEventsView
+
+
+@override_settings(LIVE_EVENTS_ENABLED=True)
+class BrickSetLiveEventsViewTests(TestCase):
+    """Test GET /api/v1/bricksets/{brickset_id}/events and event publishing."""
+
+    def setUp(self) -> None:
+        """Create a brickset with one valuation."""
+        self.factory = RequestFactory()
+        self.brickset = baker.make(BrickSet, number=10001)
+        self.valuation = baker.make(Valuation, brickset=self.brickset, value=100, likes_count=4)
+        self.url = reverse("valuation:brickset-events", kwargs={"brickset_id": self.brickset.id})
+        self.addCleanup(hub.stop)
+
+    def _open(self, brickset_id: int) -> HttpResponse:
+        request = self.factory.get(self.url)
+        return async_to_sync(BrickSetLiveEventsView.as_view())(request, brickset_id=brickset_id)
+
+    async def _read_two(self, response: HttpResponse) -> list[str]:
+        """Read the first chunk, dispatch a like count, then read the second."""
+        chunks = aiter(response.streaming_content)
+        first = await anext(chunks)
+        event = LiveEvent(LIKES_COUNT, {"likes_count": 5})
+        hub.dispatch(brickset_topic(self.brickset.id), event)
+        second = await anext(chunks)
+        await chunks.aclose()
+        return [bytes(first).decode(), bytes(second).decode()]
+
+    def test_stream_delivers_events_of_brickset(self) -> None:
+        """The stream announces its retry delay, then pushes dispatched events."""
+        response = self._open(self.brickset.id)
+
+        chunks = async_to_sync(self._read_two)(response)
+
+        assert response["Content-Type"] == "text/event-stream"
+        assert response["Cache-Control"] == "no-cache"
+        assert chunks[0].startswith("retry: ")
+        assert chunks[1] == 'event: likes_count\ndata: {"likes_count": 5}\n\n'
+
+    def test_unknown_brickset_returns_not_found(self) -> None:
+        """Streams are only opened for existing bricksets."""
+        response = self._open(self.brickset.id + 100)
+
+        assert response.status_code == 404
+
+    @override_settings(LIVE_EVENTS_ENABLED=False)
+    def test_disabled_outside_asgi(self) -> None:
+        """Without the ASGI application the endpoint is not available."""
+        response = self.client.get(self.url)
+
+        assert response.status_code == 404
+
+    def test_committed_like_and_valuation_are_pushed(self) -> None:
+        """After commit, subscribers get the new valuation and the like count."""
+        liker = baker.make(User)
+        new_valuation = baker.make(Valuation, brickset=self.brickset, value=250)
+
+        with mock.patch("valuation.live_updates.notify", return_value=True) as notify:
+            with self.captureOnCommitCallbacks(execute=True):
+                publish(ValuationCreated(
+                    valuation_id=new_valuation.id,
+                    brickset_id=self.brickset.id,
+                    user_id=new_valuation.user_id,
+                ))
+                publish(LikeAdded(
+                    valuation_id=self.valuation.id,
+                    user_id=liker.id,
+                    brickset_id=self.brickset.id,
+                ))
+            calls = [call.args for call in notify.call_args_list]
+
+        pushed = {event: payload for _, event, payload in calls}
+        topics = {topic for topic, _, _ in calls}
+        assert topics == {brickset_topic(self.brickset.id)}
+        assert pushed[LIKES_COUNT] == {"valuation_id": self.valuation.id, "likes_count": 5}
+        assert pushed[VALUATION_CREATED]["id"] == new_valuation.id
+        assert pushed[VALUATION_CREATED]["value"] == 250
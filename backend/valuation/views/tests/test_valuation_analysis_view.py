@@ -0,0 +1,43 @@
+"""Tests for the valuation analysis endpoint."""
+from __future__ import annotations
+
+from django.urls import reverse
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from account.models import User
+from catalog.models import BrickSet
+from valuation.models import Valuation
+from valuation.services.valuation_analysis import ValuationAnalysisService
+
+
+class ValuationAnalysisViewTests(APITestCase):
+    """Test cases for GET /valuations/analysis."""
+
+    def setUp(self) -> None:
+        """Analyze one valued brickset and authenticate."""
+        self.client = APIClient()
+        self.client.force_authenticate(user=baker.make(User))
+        baker.make(Valuation, brickset=baker.make(BrickSet, number=10001), value=400)
+        ValuationAnalysisService().run()
+        self.url = reverse("valuation:valuation-analysis")
+
+    def test_returns_number_and_catalog_results(self) -> None:
+        """The number parameter selects a set number; without it the catalog is returned."""
+        by_number = self.client.get(self.url, {"number": 10001})
+        catalog = self.client.get(self.url)
+
+        assert by_number.status_code == catalog.status_code == status.HTTP_200_OK
+        assert by_number.json()["number"] == 10001
+        assert by_number.json()["overall"]["median_value"] == 400
+        assert len(by_number.json()["conditions"]) == 5
+        assert catalog.json()["number"] is None
+
+    def test_unknown_number_returns_404(self) -> None:
+        """A number without valuations has no analysis."""
+        unknown = self.client.get(self.url, {"number": 20002})
+        invalid = self.client.get(self.url, {"number": -1})
+
+        assert unknown.status_code == status.HTTP_404_NOT_FOUND
+        assert invalid.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,69 @@
+"""Tests for the BrickSet valuation history endpoint."""
+from __future__ import annotations
+
+from datetime import date
+
+from django.urls import reverse
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from account.models import User
+from catalog.models import BrickSet
+from valuation.models import HistoryPeriod, ValuationHistory
+
+
+class BrickSetValuationHistoryViewTests(APITestCase):
+    """Test cases for GET /bricksets/{brickset_id}/valuation-history."""
+
+    def setUp(self) -> None:
+        """Create a brickset with one weekly bucket and authenticate."""
+        self.client = APIClient()
+        self.user = baker.make(User)
+        self.brickset = baker.make(BrickSet, number=70620)
+        baker.make(
+            ValuationHistory,
+            brickset=self.brickset,
+            period=HistoryPeriod.WEEK,
+            period_start=date(2026, 9, 28),
+            valuations_count=2,
+            value_sum=900,
+            min_value=400,
+            max_value=500,
+            weighted_sum=1400,
+            weight_total=3,
+        )
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("valuation:brickset-valuation-history", kwargs={"brickset_id": self.brickset.id})
+
+    def test_weekly_series_returns_one_point_per_week(self) -> None:
+        """The window is aligned to Mondays and empty weeks are included."""
+        query = {"period": "WEEK", "since": "2026-09-30", "until": "2026-10-14"}
+        response = self.client.get(self.url, query)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert (data["since"], data["until"]) == ("2026-09-28", "2026-10-12")
+        assert [point["period_start"] for point in data["points"]] == ["2026-09-28", "2026-10-05", "2026-10-12"]
+        assert data["points"][0]["weighted_value"] == 467
+        assert data["points"][1]["valuations_count"] == 0
+
+    def test_invalid_window_returns_400(self) -> None:
+        """Reversed or oversized windows are rejected."""
+        reversed_window = self.client.get(self.url, {"since": "2026-10-14", "until": "2026-10-01"})
+        oversized = self.client.get(self.url, {"since": "2020-01-01", "until": "2026-10-01"})
+
+        assert reversed_window.status_code == status.HTTP_400_BAD_REQUEST
+        assert oversized.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_unknown_brickset_returns_404(self) -> None:
+        """A missing brickset is reported as such."""
+        url = reverse("valuation:brickset-valuation-history", kwargs={"brickset_id": 999_999})
+
+        assert self.client.get(url).status_code == status.HTTP_404_NOT_FOUND
+
+    def test_anonymous_request_returns_401(self) -> None:
+        """The endpoint requires authentication like the other valuation endpoints."""
+        self.client.force_authenticate(user=None)
+
+        assert self.client.get(self.url).status_code == status.HTTP_401_UNAUTHORIZED
@@ -1,12 +1,16 @@
 """Tests for ValuationLikeView API endpoint."""
 from __future__ import annotations
 
+from unittest import mock
+
 from django.urls import reverse
 from rest_framework import status
+from rest_framework.settings import api_settings
 from rest_framework.test import APITestCase, APIClient
 
 from account.models import User
 from catalog.models import BrickSet, Completeness, ProductionStatus
+from core.rate_limit import limiter
 from valuation.models import Like, Valuation
 
 
@@ -445,3 +449,24 @@ class ValuationUnlikeViewTests(APITestCase):
         assert "detail" in data
         assert isinstance(data["detail"], str)
         assert len(data["detail"]) > 0
+
+    def test_like_and_unlike_share_per_user_limit(self) -> None:
+        """Toggling a like back and forth is throttled per user."""
+        self.addCleanup(limiter.reset)
+        url = reverse(
+            "valuation:valuation-like",
+            kwargs={"valuation_id": self.valuation.id},
+        )
+
+        with mock.patch.dict(api_settings.DEFAULT_THROTTLE_RATES, {"like": "2/min"}):
+            unliked = self.client.delete(url, format="json")
+            liked = self.client.post(url, format="json")
+            throttled = self.client.delete(url, format="json")
+            other_user = APIClient()
+            other_user.force_authenticate(user=self.other_user)
+            other_user_response = other_user.post(url, format="json")
+
+        assert unliked.status_code == status.HTTP_204_NO_CONTENT
+        assert liked.status_code == status.HTTP_201_CREATED
+        assert throttled.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert other_user_response.status_code == status.HTTP_201_CREATED
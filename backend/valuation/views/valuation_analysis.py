@@ -0,0 +1,58 @@
+"""API view for the catalog-wide valuation analysis."""
+from __future__ import annotations
+
+from rest_framework import status
+from rest_framework.generics import GenericAPIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from valuation.exceptions import ValuationAnalysisNotFoundError
+from valuation.serializers import ValuationAnalysisQuerySerializer, ValuationAnalysisSerializer
+from valuation.services.valuation_analysis import ValuationAnalysisService
+
+
+class ValuationAnalysisView(GenericAPIView):
+    """Handle GET /api/v1/valuations/analysis."""
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = ValuationAnalysisSerializer
+
+    def get(self, request: Request) -> Response:
+        """Return valuation statistics and condition premiums of a set number or the catalog.
+
+        Results are as of the last ``manage.py analyze_valuations`` run.
+
+        Query parameters:
+            - number (int): Set number; omitted for catalog-wide results
+
+        Returns:
+            Response: 200 OK with ValuationAnalysisDTO
+            - 400 Bad Request: Invalid number
+            - 401 Unauthorized: Not authenticated
+            - 404 Not Found: No valuations of the number, or no analysis yet
+
+        Response body (200 OK):
+            {
+                "number": 10001,
+                "computed_at": "2026-10-19T03:00:00Z",
+                "overall": {"dimension": "ALL", "variant": "", "valuations_count": 12, "median_value": 450.0, ...},
+                "conditions": [
+                    {"dimension": "PRODUCTION_STATUS", "variant": "RETIRED", "valuations_count": 5,
+                     "median_value": 560.0, "premium": 0.4, "premium_sample": 0, ...},
+                    ...
+                ]
+            }
+        """
+        query_serializer = ValuationAnalysisQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+
+        try:
+            analysis_dto = ValuationAnalysisService().for_number(query_serializer.validated_data.get("number"))
+        except ValuationAnalysisNotFoundError as exc:
+            return Response(
+                {"detail": exc.message},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        return Response(self.get_serializer(analysis_dto).data, status=status.HTTP_200_OK)
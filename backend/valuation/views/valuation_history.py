@@ -0,0 +1,70 @@
+"""API view for the valuation history of a BrickSet."""
+from __future__ import annotations
+
+from rest_framework import status
+from rest_framework.generics import GenericAPIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from catalog.exceptions import BrickSetNotFoundError
+from valuation.serializers import ValuationHistoryQuerySerializer, ValuationHistorySerializer
+from valuation.services.valuation_history import ValuationHistoryService
+
+
+class BrickSetValuationHistoryView(GenericAPIView):
+    """Handle GET /api/v1/bricksets/{brickset_id}/valuation-history."""
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = ValuationHistorySerializer
+
+    def get(self, request: Request, brickset_id: int) -> Response:
+        """Return the daily or weekly valuation series of a BrickSet.
+
+        Path parameter:
+            - brickset_id (int): BrickSet identifier [required]
+
+        Query parameters:
+            - period (DAY|WEEK): Bucket size (default DAY)
+            - since (date): First day (default: 90 days or 52 weeks of points)
+            - until (date): Last day (default today)
+
+        Returns:
+            Response: 200 OK with ValuationHistoryDTO, one point per bucket
+            - 400 Bad Request: Invalid period or window (over 400 points)
+            - 401 Unauthorized: Not authenticated
+            - 404 Not Found: BrickSet does not exist
+
+        Response body (200 OK):
+            {
+                "brickset_id": 10,
+                "period": "WEEK",
+                "since": "2026-09-28",
+                "until": "2026-10-12",
+                "points": [
+                    {"period_start": "2026-09-28", "valuations_count": 2, "mean_value": 450.0,
+                     "min_value": 400, "max_value": 500, "weighted_value": 467},
+                    {"period_start": "2026-10-05", "valuations_count": 0, "mean_value": null,
+                     "min_value": null, "max_value": null, "weighted_value": null},
+                    ...
+                ]
+            }
+        """
+        query_serializer = ValuationHistoryQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        query = query_serializer.validated_data
+
+        try:
+            history_dto = ValuationHistoryService().series(
+                brickset_id,
+                query["period"],
+                query["since"],
+                query["until"],
+            )
+        except BrickSetNotFoundError as exc:
+            return Response(
+                {"detail": exc.message},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        return Response(self.get_serializer(history_dto).data, status=status.HTTP_200_OK)
@@ -20,6 +20,7 @@ from valuation.serializers.like_list import LikeListItemSerializer
 from valuation.services.like_valuation_service import LikeValuationService
 from valuation.services.like_list_service import LikeListService
 from valuation.services.unlike_valuation_service import UnlikeValuationService
+from valuation.throttling import LikeRateThrottle
 
 
 _DETAIL_KEY = "detail"
@@ -37,6 +38,7 @@ class ValuationLikeView(GenericAPIView):  # noqa: WPS338
     """Handle GET, POST and DELETE /api/v1/valuations/{valuation_id}/likes endpoint."""
 
     permission_classes = [IsAuthenticated]
+    throttle_classes = [LikeRateThrottle]
     serializer_class = LikeSerializer
     pagination_class = LikePagination
 